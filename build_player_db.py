@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Build data/player_db.bin, the prebuilt binary player database the app loads
+at startup, from the local ADP file, Sleeper dump, stats and projections.
+
+The app rebuilds it automatically when a source file changes; run this after
+updating the data to take the cost up front.
+
+Usage:
+    python build_player_db.py [--output PATH]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.utils.player_data_fetcher import get_players_with_fallback
+from src.utils.player_database import DEFAULT_DB_PATH, build_player_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the binary player database")
+    parser.add_argument("--output", default=DEFAULT_DB_PATH)
+    args = parser.parse_args()
+
+    start = time.time()
+    players = get_players_with_fallback()
+    if not build_player_database(players, args.output):
+        sys.exit(1)
+    print(f"Done in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
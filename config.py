@@ -1,6 +1,7 @@
 num_teams = 10
 reversal_round = 3 # 0 would be no 3rd round reversal
 draft_type = "snake" # other option is linear
+dynamic_var = True # recalculate VAR against the remaining pool after every pick
 roster_spots = {
     "qb": 2,
     "rb": 2,
@@ -10,16 +10,19 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
 import config
-from src.models import Team, Player
+from src.models import Team, Player, AvailabilityIndex
+from src.models.team import COUNTED_POSITIONS
 from src.models.draft_preset import PlayerExclusion
-from src.core import DraftEngine, DraftPick
+from src.core import DraftEngine, DraftPick, DraftState
 from src.core.template_manager import TemplateManager
+from src.core.pick_policy import select_computer_pick
+from src.core.availability_forecast import AvailabilityForecaster
 from src.ui import DraftBoard, PlayerList, RosterView, GameHistory, DraftHistory, DraftHistoryPage
 from src.ui.cheat_sheet_page import CheatSheetPage
 from src.ui.theme import DARK_THEME
 from src.ui.styled_widgets import StyledFrame, StyledButton
 from src.utils import generate_mock_players
-from src.utils.player_extensions import format_name
+from src.utils.player_generator import VarCalculator
 from src.services.player_pool_service import PlayerPoolService
 from src.services.draft_save_manager import DraftSaveManager
 from src.services.draft_preset_manager import DraftPresetManager
@@ -66,9 +69,17 @@ class MockDraftApp:
             trade_service=self.trade_service
         )
         
+        # VAR against the remaining pool (set up when players load)
+        self.var_calculator = None
+        self._var_key = None
+        
+        # Background "available at my next pick" simulations
+        self.availability_forecaster = AvailabilityForecaster(config.num_teams)
+        self._forecast_key = None
+        
         # Initialize players as empty lists - will be loaded in background
         self.all_players = []
-        self.available_players = []
+        self.available_players = AvailabilityIndex()
         self.players_loaded = False
         
         # Initialize player pool service (will be populated when players load)
@@ -83,10 +94,8 @@ class MockDraftApp:
         
         # Draft reversion state
         self.draft_state_before_reversion = None
-        self.players_before_reversion = None
         
         # Performance optimization
-        self._position_counts_cache = {}  # Cache position counts per team
         
         # Cheat sheet data
         self.custom_rankings = {}
@@ -448,6 +457,7 @@ class MockDraftApp:
             image_service=self.image_service,
             on_draft_name_change=self.on_draft_name_change,
             trade_service=self.trade_service,
+            get_order_service=lambda: self.draft_engine.order_service,
             # on_draft_load removed - using templates instead
             get_draft_list=self.get_draft_list
         )
@@ -546,6 +556,9 @@ class MockDraftApp:
                 self.draft_button.config(state="disabled", bg=DARK_THEME['button_bg'])
         
         
+        # Keep VAR current with the remaining pool
+        self._update_dynamic_var()
+        
         # Update components
         if full_update:
             # Update draft context for BPA calculations
@@ -564,6 +577,9 @@ class MockDraftApp:
             # Update draft button states based on mode
             self.player_list.set_draft_enabled(self.manual_mode or self.user_team_id is not None)
         
+        # Refresh next-pick availability whenever the user is on the clock
+        self._update_availability_forecast(team_on_clock)
+        
         # Always update draft board with just the last pick
         self.draft_board.update_picks(
             self.draft_engine.get_draft_results(),
@@ -866,11 +882,6 @@ class MockDraftApp:
                     self.draft_engine.make_pick(current_team, selected_player)
                     self.available_players.remove(selected_player)
                     picks_made.append((pick_num, current_team, selected_player))
-                    
-                    # Update position count cache
-                    if current_team.id in self._position_counts_cache:
-                        if selected_player.position in self._position_counts_cache[current_team.id]:
-                            self._position_counts_cache[current_team.id][selected_player.position] += 1
                 except ValueError:
                     # Pick failed, try next player
                     continue
@@ -924,184 +935,72 @@ class MockDraftApp:
         # Check preset exclusions first
         active_preset = self.draft_preset_manager.get_active_preset()
         
-        # Calculate current round for round restrictions
-        current_round = ((pick_num - 1) // config.num_teams) + 1
-        
-        # Check for forced picks first
-        if active_preset:
-            forced_player_name = active_preset.get_forced_pick(team.name, pick_num)
-            if forced_player_name:
-                # Find and return the forced player
-                for player in self.available_players:
-                    if format_name(player.name).upper() == forced_player_name.upper():
-                        return player
-        
-        # Special logic for Luan in round 3 (pick 21)
-        if team.name.upper() == "LUAN" and pick_num == 21:
-            # Priority order: DRAKE LONDON > DERRICK HENRY > CHASE BROWN > any QB (NOT McBride)
-            priority_players = [
-                "DRAKE LONDON",
-                "DERRICK HENRY", 
-                "CHASE BROWN"
-            ]
-            
-            # Check for priority players first
-            for priority_name in priority_players:
-                for player in self.available_players:
-                    if format_name(player.name).upper() == priority_name:
-                        # 90% chance to take the priority player if available
-                        if random.random() < 0.9:
-                            return player
-            
-            # If none of the priority players are available or random didn't select them,
-            # look for any QB with 70% chance
-            for player in self.available_players[:15]:  # Look at top 15 available
-                if player.position == 'QB' and random.random() < 0.7:
-                    return player
-        
-        # Quick path for very early picks
-        if pick_num <= 3:
-            # Check preset exclusions and round restrictions even for early picks
-            for player in self.available_players:
-                if active_preset and active_preset.is_player_excluded(team.name, player.name):
-                    continue  # Skip excluded player
-                if active_preset and active_preset.is_player_restricted(team.name, player.name, current_round):
-                    continue  # Skip round-restricted player
-                return player  # Return first non-excluded player
-            return None
-        
-        # Get cached position counts or calculate
-        if team.id in self._position_counts_cache:
-            position_counts = self._position_counts_cache[team.id]
-        else:
-            position_counts = {'QB': 0, 'RB': 0, 'WR': 0, 'TE': 0, 'DEF': 0, 'K': 0, 'LB': 0, 'DB': 0}
-            for players in team.roster.values():
-                for player in players:
-                    if player.position in position_counts:
-                        position_counts[player.position] += 1
-            self._position_counts_cache[team.id] = position_counts
-        
-        # Early rounds (1-3) should be much tighter to ADP
-        is_early_round = pick_num <= (3 * config.num_teams)
-        
-        # Special handling for elite players that should never fall
-        for player in self.available_players[:5]:
-            # Elite players that must go by certain picks
-            if player.name == "JAMARR CHASE" and pick_num >= 2:
-                return player  # Chase must go by 1.02
-            elif player.adp <= 3 and pick_num >= player.adp + 1:
-                return player  # Top 3 players shouldn't fall more than 1 spot
-            elif player.adp <= 10 and pick_num >= player.adp + 3:
-                return player  # Top 10 players shouldn't fall more than 3 spots
-        
-        # Special handling for Joe Burrow - must be taken by pick 21
-        if pick_num >= 21:
-            for player in self.available_players:
-                if format_name(player.name) == "JOE BURROW":
-                    return player
-        
-        # Determine how many players to consider based on pick
-        if is_early_round:
-            # Early rounds: only consider players within reasonable ADP range
-            max_adp_reach = 5  # Won't reach more than 5 picks early
-            consider_range = 8  # Look at top 8 available
-        else:
-            max_adp_reach = 15  # More flexibility later
-            consider_range = 20  # Look at top 20 available
+        return select_computer_pick(
+            self.available_players,
+            team,
+            pick_num,
+            config.num_teams,
+            team.position_counts,
+            active_preset
+        )
+    
+    def _update_dynamic_var(self):
+        """Recalculate VAR against the remaining pool if a pick has changed it"""
+        if not config.dynamic_var or not self.var_calculator:
+            return
+        results = self.draft_engine.draft_results
+        last_player = results[-1].player if results else None
+        key = (len(results), id(last_player), id(self.available_players))
+        if key == self._var_key:
+            return
+        self._var_key = key
+        self.var_calculator.apply_var(self.available_players)
+        self.player_list.invalidate_sort_order('var')
+    
+    def _update_availability_forecast(self, team_on_clock):
+        """Start a forecast for the user's next pick, or clear a stale one"""
+        if (not self.players_loaded or self.manual_mode or self.user_team_id is None
+                or team_on_clock != self.user_team_id or self.draft_engine.is_draft_complete()):
+            if self._forecast_key is not None:
+                self._forecast_key = None
+                self.availability_forecaster.cancel()
+                self.player_list.set_availability_forecast(None)
+            return
         
-        # Filter players by position needs and ADP appropriateness
-        eligible_players = []
-        for i, player in enumerate(self.available_players[:consider_range]):
-            pos = player.position
-            
-            # Check preset exclusions
-            if active_preset and active_preset.is_player_excluded(team.name, player.name):
-                continue  # Skip excluded player
-            
-            # Check round restrictions
-            if active_preset and active_preset.is_player_restricted(team.name, player.name, current_round):
-                continue  # Skip round-restricted player
-            
-            # Check if pick is too much of a reach
-            if player.adp > pick_num + max_adp_reach:
-                continue  # Don't reach too far
-            
-            # Check position limits
-            if pos == 'QB' and position_counts.get('QB', 0) >= 2:
-                continue  # Max 2 QBs
-            elif pos == 'RB' and position_counts.get('RB', 0) >= 5:
-                continue  # Max 5 RBs
-            elif pos == 'WR' and position_counts.get('WR', 0) >= 5:
-                continue  # Max 5 WRs
-            elif pos == 'TE' and position_counts.get('TE', 0) >= 1:
-                continue  # Max 1 TE (special case)
-            elif pos == 'DEF' and position_counts.get('DEF', 0) >= 1:
-                continue  # Max 1 DEF
-            elif pos == 'K' and position_counts.get('K', 0) >= 1:
-                continue  # Max 1 K
-            elif pos == 'LB' and position_counts.get('LB', 0) >= 4:
-                continue  # Max 4 LBs
-            elif pos == 'DB' and position_counts.get('DB', 0) >= 4:
-                continue  # Max 4 DBs
-            
-            # Don't draft K/DEF/LB/DB before round 10
-            if pos in ['K', 'DEF', 'LB', 'DB'] and pick_num < (10 * config.num_teams):
-                continue
-            
-            eligible_players.append(player)
-        
-        if not eligible_players:
-            # If no eligible players, take best available non-K/DEF
-            for player in self.available_players:
-                # Check preset exclusions even in fallback
-                if active_preset and active_preset.is_player_excluded(team.name, player.name):
-                    continue  # Skip excluded player
-                # Check round restrictions even in fallback
-                if active_preset and active_preset.is_player_restricted(team.name, player.name, current_round):
-                    continue  # Skip round-restricted player
-                if player.position not in ['K', 'DEF'] or pick_num >= 120:
-                    return player
-            return self.available_players[0] if self.available_players else None
-        
-        # Simplified pick selection - use ADP-based probability
-        if is_early_round:
-            # Early rounds: pick mostly by ADP with small variance
-            if len(eligible_players) == 1:
-                return eligible_players[0]
-            
-            # 70% chance to take best ADP, 20% second best, 10% third
-            rand = random.random()
-            if rand < 0.7:
-                return eligible_players[0]
-            elif rand < 0.9 and len(eligible_players) > 1:
-                return eligible_players[1]
-            elif len(eligible_players) > 2:
-                return eligible_players[2]
-            else:
-                return eligible_players[0]
-        else:
-            # Later rounds: more randomness but still favor better ADP
-            if len(eligible_players) == 1:
-                return eligible_players[0]
-            
-            # 50% best, 30% second, 15% third, 5% fourth+
-            rand = random.random()
-            if rand < 0.5:
-                return eligible_players[0]
-            elif rand < 0.8 and len(eligible_players) > 1:
-                return eligible_players[1]
-            elif rand < 0.95 and len(eligible_players) > 2:
-                return eligible_players[2]
-            elif len(eligible_players) > 3:
-                return eligible_players[3]
-            else:
-                return eligible_players[0]
+        results = self.draft_engine.draft_results
+        last_player = results[-1].player if results else None
+        key = (len(results), id(last_player), self.user_team_id, id(self.available_players))
+        if key == self._forecast_key:
+            return
+        self._forecast_key = key
+        
+        def on_ready(forecast):
+            # Called on the forecaster's worker thread - hand off to the Tk loop
+            self.root.after(0, lambda: self._on_availability_forecast(forecast, key))
+        
+        self.availability_forecaster.request(
+            self._current_draft_state(),
+            self.user_team_id,
+            on_ready,
+            self.draft_preset_manager.get_active_preset()
+        )
+    
+    def _on_availability_forecast(self, forecast, key):
+        if key == self._forecast_key:
+            self.player_list.set_availability_forecast(forecast)
+    
+    def _sync_player_pool(self):
+        """Bring the player pool service in line with the current draft results"""
+        if not self.player_pool:
+            return
+        self.player_pool.reset()
+        self.player_pool.draft_multiple_players(pick.player for pick in self.draft_engine.draft_results)
     
     def get_top_available_players(self, count=5, pick_number=None):
         """Get the top N available players by ADP, or players drafted after given pick"""
         if pick_number is None:
             # Normal case - just return available players
-            return self.available_players[:count] if self.available_players else []
+            return self.available_players.top(count)
         
         # For change pick - include available players and players drafted after this pick
         eligible_players = []
@@ -1121,26 +1020,14 @@ class MockDraftApp:
     
     def _get_position_counts(self, team):
         """Get count of players by position for a team"""
-        position_counts = {'QB': 0, 'RB': 0, 'WR': 0, 'TE': 0, 'DEF': 0, 'K': 0}
-        
-        for pos_slot, players in team.roster.items():
-            for player in players:
-                if player.position in position_counts:
-                    position_counts[player.position] += 1
-        
-        return position_counts
+        return {pos: team.position_counts[pos] for pos in COUNTED_POSITIONS}
     
     def _get_team_needs(self, team):
         """Determine team's positional needs based on roster construction"""
         needs = []
         
         # Count players by position across all roster spots
-        position_counts = {'QB': 0, 'RB': 0, 'WR': 0, 'TE': 0, 'DEF': 0, 'K': 0}
-        
-        for pos_slot, players in team.roster.items():
-            for player in players:
-                if player.position in position_counts:
-                    position_counts[player.position] += 1
+        position_counts = self._get_position_counts(team)
         
         # Get counts
         qb_count = position_counts['QB']
@@ -1455,11 +1342,12 @@ class MockDraftApp:
             from src.services.custom_adp_manager import CustomADPManager
             adp_manager = CustomADPManager()
             adp_manager.apply_custom_adp_to_players(self.all_players)
-            # Sort by ADP for proper draft order
-            self.available_players = sorted(list(self.all_players), key=lambda p: p.adp if p.adp else 999)
+            # Index by ADP for proper draft order
+            self.available_players = AvailabilityIndex(self.all_players)
         else:
             # Still loading, wait for it to complete
-            self.available_players = []
+            self.available_players = AvailabilityIndex()
+        self._sync_player_pool()
         
         # Only start a new draft session if we're not loading a draft
         if not hasattr(self, 'loading_draft') or not self.loading_draft:
@@ -1468,9 +1356,6 @@ class MockDraftApp:
         # Restore user team selection
         self.user_team_id = saved_user_team
         
-        # Clear position count cache
-        self._position_counts_cache.clear()
-        
         # Reset draft board UI completely and efficiently
         self.draft_board.draft_results = []
         self.draft_board._last_pick_count = 0
@@ -1526,7 +1411,6 @@ class MockDraftApp:
         # Disable undo button
         self.undo_button.config(state='disabled')
         self.draft_state_before_reversion = None
-        self.players_before_reversion = None
         
         # Highlight pick 1 on the draft board
         self.draft_board.highlight_current_pick()
@@ -1556,18 +1440,16 @@ class MockDraftApp:
             from src.services.custom_adp_manager import CustomADPManager
             adp_manager = CustomADPManager()
             adp_manager.apply_custom_adp_to_players(self.all_players)
-            # Sort by ADP for proper draft order
-            self.available_players = sorted(list(self.all_players), key=lambda p: p.adp if p.adp else 999)
+            # Index by ADP for proper draft order
+            self.available_players = AvailabilityIndex(self.all_players)
         else:
             # Still loading, wait for it to complete
-            self.available_players = []
+            self.available_players = AvailabilityIndex()
+        self._sync_player_pool()
         
         # Clear user team selection - this is the key difference from restart_draft
         self.user_team_id = None
         
-        # Clear position count cache
-        self._position_counts_cache.clear()
-        
         # Reset draft board UI completely
         self.draft_board.draft_results = []
         self.draft_board._last_pick_count = 0
@@ -1629,7 +1511,6 @@ class MockDraftApp:
         # Disable undo button
         self.undo_button.config(state='disabled')
         self.draft_state_before_reversion = None
-        self.players_before_reversion = None
         
         # Highlight pick 1 on the draft board
         self.draft_board.highlight_current_pick()
@@ -1647,12 +1528,10 @@ class MockDraftApp:
         
         # Save current state for undo
         self.draft_state_before_reversion = {
-            'picks': list(self.draft_engine.draft_results),
-            'teams': self._save_team_state(),
+            'snapshot': self._current_draft_state().fork(),
             'current_pick': self.draft_engine.get_current_pick_info()[0],
             'watched_players': self._save_watch_list_state()
         }
-        self.players_before_reversion = list(self.available_players)
         
         # Revert the draft immediately - no confirmation
         self._revert_to_pick(pick_number)
@@ -1671,12 +1550,10 @@ class MockDraftApp:
         
         # Save current state for undo
         self.draft_state_before_reversion = {
-            'picks': list(self.draft_engine.draft_results),
-            'teams': self._save_team_state(),
+            'snapshot': self._current_draft_state().fork(),
             'current_pick': current_pick,
             'watched_players': self._save_watch_list_state()
         }
-        self.players_before_reversion = list(self.available_players)
         
         # Get the original pick details
         original_pick = self.draft_engine.draft_results[pick_number - 1]
@@ -1733,7 +1610,8 @@ class MockDraftApp:
         
         # Restore the draft state
         self._restore_draft_state(self.draft_state_before_reversion)
-        self.available_players = list(self.players_before_reversion)
+        self.available_players = self.draft_state_before_reversion['snapshot'].available_players.copy()
+        self._sync_player_pool()
         
         # Restore watch list state
         self._restore_watch_list_state(self.draft_state_before_reversion.get('watched_players', {}))
@@ -1747,23 +1625,13 @@ class MockDraftApp:
         # Disable undo button
         self.undo_button.config(state='disabled')
         self.draft_state_before_reversion = None
-        self.players_before_reversion = None
         
         # Check if we need to auto-draft
         self.check_auto_draft()
     
-    def _save_team_state(self):
-        """Save current state of all teams"""
-        state = {}
-        for team_id, team in self.teams.items():
-            # Deep copy roster with all players
-            roster_copy = {}
-            for pos, players in team.roster.items():
-                roster_copy[pos] = list(players)
-            state[team_id] = {
-                'roster': roster_copy
-            }
-        return state
+    def _current_draft_state(self):
+        """The live engine, teams and available players as a DraftState"""
+        return DraftState(self.draft_engine, self.teams, self.available_players)
     
     def _save_watch_list_state(self):
         """Save current state of watch list"""
@@ -1797,41 +1665,22 @@ class MockDraftApp:
     
     def _revert_to_pick(self, target_pick_number, skip_auto_draft=False):
         """Revert draft to specified pick number and auto-draft to user's turn"""
-        # Get picks to keep/remove
-        picks_to_keep = [p for p in self.draft_engine.draft_results if p.pick_number < target_pick_number]
-        picks_to_remove = [p for p in self.draft_engine.draft_results if p.pick_number >= target_pick_number]
-        
-        # Reset draft results
-        self.draft_engine.draft_results = picks_to_keep
-        
-        # Rebuild available players list from scratch to ensure consistency
-        # Start with all players
-        self.available_players = list(self.all_players)
-        
-        # Remove players that are still drafted (in picks_to_keep)
-        drafted_player_ids = {pick.player.player_id for pick in picks_to_keep}
-        self.available_players = [p for p in self.available_players if p.player_id not in drafted_player_ids]
-        
-        # Apply custom ADP values before sorting
-        from src.services.custom_adp_manager import CustomADPManager
-        adp_manager = CustomADPManager()
-        adp_manager.apply_custom_adp_to_players(self.available_players)
-        
-        # Sort by ADP for proper draft order
-        self.available_players.sort(key=lambda p: p.adp if p.adp else 999)
-        
-        # Reset team rosters in one pass
-        for team in self.teams.values():
-            team.roster = {pos: [] for pos in team.roster}
-        for pick in picks_to_keep:
-            self.teams[pick.team_id].add_player(pick.player)
+        # Undo the picks from the target onward: takes the players off their
+        # rosters and puts them back in the ADP index (custom ADP edits are
+        # applied to the players as they're made, so nothing to re-apply)
+        picks_to_remove = self.draft_engine.undo_last(
+            len(self.draft_engine.draft_results) - (target_pick_number - 1),
+            teams=self.teams,
+            available_players=self.available_players
+        )
+        picks_to_keep = self.draft_engine.draft_results
+        if self.player_pool:
+            for pick in picks_to_remove:
+                self.player_pool.undraft_player(pick.player)
         
         # Update draft history to remove reverted picks
         # self.draft_history_manager.remove_picks_after(target_pick_number - 1)  # Removed
         
-        # Clear position count cache since rosters changed
-        self._position_counts_cache.clear()
-        
         # Skip watch list update during reversion - do it at the end
         
         # Clear draft board picks
@@ -1868,11 +1717,6 @@ class MockDraftApp:
                     if selected_player in self.available_players:
                         self.available_players.remove(selected_player)
                     picks_made.append(selected_player)
-                    
-                    # Update position count cache
-                    if current_team.id in self._position_counts_cache:
-                        if selected_player.position in self._position_counts_cache[current_team.id]:
-                            self._position_counts_cache[current_team.id][selected_player.position] += 1
                 except ValueError:
                     continue
         
@@ -1922,15 +1766,8 @@ class MockDraftApp:
     
     def _restore_draft_state(self, state):
         """Restore a saved draft state"""
-        # Reset teams
-        for team_id, team_state in state['teams'].items():
-            team = self.teams[team_id]
-            # Deep copy the roster
-            for pos, players in team_state['roster'].items():
-                team.roster[pos] = list(players)
-        
-        # Restore picks
-        self.draft_engine.draft_results = list(state['picks'])
+        # Restore picks and team rosters
+        self._current_draft_state().restore(state['snapshot'])
         
         # Clear and redraw all picks
         for pick_widget in self.draft_board.pick_widgets.values():
@@ -2009,9 +1846,12 @@ class MockDraftApp:
         adp_manager = CustomADPManager()
         adp_manager.apply_custom_adp_to_players(players)
         
-        # Sort available players by ADP for proper draft order
-        self.available_players = sorted(list(players), key=lambda p: p.adp if p.adp else 999)
+        # Index available players by ADP for proper draft order
+        self.available_players = AvailabilityIndex(players)
         self.players_loaded = True
+        self.var_calculator = VarCalculator(players, config.num_teams)
+        # Replacement levels for this league size, dynamic VAR or not
+        self.var_calculator.apply_var()
         
         # Initialize player pool service
         self.player_pool = PlayerPoolService(players)
@@ -2071,7 +1911,8 @@ class MockDraftApp:
                 self.cheat_sheet = CheatSheetPage(
                     self.cheat_sheet_container,
                     self.all_players,
-                    draft_app=self
+                    draft_app=self,
+                    image_service=self.image_service
                 )
                 self.cheat_sheet.pack(fill='both', expand=True)
                 
@@ -2637,35 +2478,33 @@ class MockDraftApp:
         notes_text.pack(side='left', fill='both', expand=True)
         notes_scroll.config(command=notes_text.yview)
         
-        # Store template data
-        templates = self.template_manager.list_templates()
+        # Store template data - summaries come from the template catalog and full
+        # templates are only loaded when one is previewed or loaded
+        templates = self.template_manager.list_template_summaries()
         template_data = {}
         template_metadata = {}  # Store extra info about templates
         current_template_filename = None
         
-        def check_template_filter(template, filter_type):
+        def get_template_data(template_name):
+            """Load (once) the full template for a listed template name"""
+            if template_name not in template_data:
+                t = template_metadata.get(template_name)
+                template = self.template_manager.load_template(t['filename']) if t else None
+                if not template:
+                    return None
+                template_data[template_name] = template
+            return template_data[template_name]
+        
+        def check_template_filter(summary, filter_type):
             """Check if template matches the selected filter"""
             if filter_type == "All":
                 return True
             
-            user_team_id = template.user_settings.get('user_team_id')
-            
-            # Get player data
-            player_dict = {p['player_id']: p for p in template.player_pool['all_players']}
-            
             # Get user's first 3 picks
-            user_picks = []
-            for pick in template.draft_results:
-                if pick['team_id'] == user_team_id and pick['player_id']:
-                    if pick['player_id'] in player_dict:
-                        p = player_dict[pick['player_id']]
-                        user_picks.append({
-                            'round': pick['round'],
-                            'position': p['position'],
-                            'name': p['name']
-                        })
-                    if len(user_picks) >= 3:
-                        break
+            user_picks = [
+                {'round': round_num, 'position': position}
+                for round_num, position, _ in summary['user_picks'][:3]
+            ]
             
             if not user_picks:
                 return False
@@ -2722,39 +2561,23 @@ class MockDraftApp:
             temp_list = []
             
             for t in templates:
-                # Load template data
-                template = self.template_manager.load_template(t['filename'])
-                if template:
-                    should_include = True
-                    
-                    # Check if we should filter by player
-                    if filter_player and filter_player.player_id:
-                        # Get the user's team ID from this template
-                        user_team_id = template.user_settings.get('user_team_id')
-                        
-                        # Check if this player was drafted BY THE USER in this template
-                        player_on_user_team = False
-                        target_id = str(filter_player.player_id)
-                        
-                        # Check all draft picks by the user's team
-                        for pick in template.draft_results:
-                            # Only check picks made by the user's team
-                            if pick.get('team_id') == user_team_id and pick.get('player_id'):
-                                if str(pick['player_id']) == target_id:
-                                    player_on_user_team = True
-                                    break
-                        
-                        should_include = player_on_user_team
-                    
-                    # Apply position filter
-                    if should_include and current_filter != "All":
-                        should_include = check_template_filter(template, current_filter)
-                    
-                    if should_include:
-                        template_data[t['name']] = template
-                        template_metadata[t['name']] = t
-                        temp_list.append(t['name'])
-                        templates_found += 1
+                should_include = True
+                
+                # Check if we should filter by player
+                if filter_player and filter_player.player_id:
+                    # Check if this player was drafted BY THE USER in this template
+                    target_id = str(filter_player.player_id)
+                    should_include = any(str(player_id) == target_id
+                                         for _, _, player_id in t['user_picks'])
+                
+                # Apply position filter
+                if should_include and current_filter != "All":
+                    should_include = check_template_filter(t, current_filter)
+                
+                if should_include:
+                    template_metadata[t['name']] = t
+                    temp_list.append(t['name'])
+                    templates_found += 1
             
             # Use saved order if available, otherwise alphabetical
             if template_order:
@@ -2774,9 +2597,10 @@ class MockDraftApp:
             # Populate listbox with grade info
             for name in temp_list:
                 template = template_data.get(name)
-                if template and template.grade:
+                grade = template.grade if template else template_metadata[name]['grade']
+                if grade:
                     # Add grade to display
-                    display_name = f"{name} [Grade: {template.grade}]"
+                    display_name = f"{name} [Grade: {grade}]"
                 else:
                     display_name = name
                 template_listbox.insert('end', display_name)
@@ -2814,7 +2638,7 @@ class MockDraftApp:
                 template_name = display_name.split(' [Grade:')[0]
             else:
                 template_name = display_name
-            template = template_data.get(template_name)
+            template = get_template_data(template_name)
             
             # Get the filename for this template
             current_template_filename = None
@@ -3029,7 +2853,7 @@ class MockDraftApp:
                     template_name = display_name.split(' [Grade:')[0]
                 else:
                     template_name = display_name
-                template = template_data.get(template_name)
+                template = get_template_data(template_name)
                 if template:
                     dialog.destroy()  # Close dialog first
                     self.apply_template(template)
@@ -3054,7 +2878,7 @@ class MockDraftApp:
                 template_name = display_name.split(' [Grade:')[0]
             else:
                 template_name = display_name
-            template = template_data.get(template_name)
+            template = get_template_data(template_name)
             
             if template:
                 dialog.destroy()  # Close dialog first
@@ -3103,7 +2927,9 @@ class MockDraftApp:
                         if success:
                             # Remove from listbox and data
                             template_listbox.delete(selection[0])
-                            del template_data[template_name]
+                            template_data.pop(template_name, None)
+                            template_metadata.pop(template_name, None)
+                            templates.remove(t)
                             # Clear roster display
                             roster_text.config(state='normal')
                             roster_text.delete('1.0', 'end')
@@ -3202,22 +3028,25 @@ class MockDraftApp:
         selection_frame.pack(fill='x', padx=20, pady=10)
         
         # Get ALL templates for comparison view (not filtered)
-        all_templates = self.template_manager.list_templates()
+        all_templates = self.template_manager.list_template_summaries()
         template_names = []
-        all_template_data = {}
+        template_summaries = {}
+        all_template_data = {}  # Full templates, loaded when selected
         
-        # Load all template data - only include templates with at least 4 user picks
+        # Only include templates where user has made at least 4 picks
         for t in all_templates:
-            template = self.template_manager.load_template(t['filename'])
-            if template:
-                # Check if user has at least 4 picks
-                user_team_id = template.user_settings.get('user_team_id', 0)
-                user_picks = [pick for pick in template.draft_results if pick['team_id'] == user_team_id]
-                
-                # Only include templates where user has made at least 4 picks
-                if len(user_picks) >= 4:
-                    template_names.append(t['name'])
-                    all_template_data[t['name']] = template
+            if t['user_pick_count'] >= 4:
+                template_names.append(t['name'])
+                template_summaries[t['name']] = t
+        
+        def get_comparison_template(name):
+            """Load (once) the full template for a comparison column"""
+            if name not in all_template_data:
+                template = self.template_manager.load_template(template_summaries[name]['filename'])
+                if not template:
+                    return None
+                all_template_data[name] = template
+            return all_template_data[name]
         
         # Template dropdowns
         selected_templates = []
@@ -3255,21 +3084,14 @@ class MockDraftApp:
             filter_value = filter_var.get()
             filtered_names = []
             
-            for name, template in all_template_data.items():
+            for name, summary in template_summaries.items():
                 if filter_value == "All":
                     filtered_names.append(name)
                 else:
-                    # Check early picks for this template
-                    user_team_id = template.user_settings.get('user_team_id', 0)
-                    players = {p['player_id']: p for p in template.player_pool['all_players']}
-                    
                     # Get first 3 rounds of picks for user
-                    early_picks = []
-                    for pick in template.draft_results:
-                        if pick['team_id'] == user_team_id and pick['round'] <= 3:
-                            if pick['player_id'] in players:
-                                p = players[pick['player_id']]
-                                early_picks.append((pick['round'], p['position']))
+                    early_picks = [(round_num, position)
+                                   for round_num, position, _ in summary['user_picks']
+                                   if round_num <= 3]
                     
                     # Check if matches filter
                     if filter_value == "R1 RB" and len(early_picks) > 0 and early_picks[0][1] == 'RB':
@@ -3354,7 +3176,7 @@ class MockDraftApp:
                 return
             
             # Get current grade
-            current_grade = all_template_data[template_name].grade
+            current_grade = template_summaries[template_name]['grade']
             
             # Create dialog
             dialog = tk.Toplevel(self.root)
@@ -3408,7 +3230,9 @@ class MockDraftApp:
                         if 1 <= grade <= 100:
                             if self.template_manager.update_template_grade(template_filename, grade):
                                 # Update local data
-                                all_template_data[template_name].grade = grade
+                                template_summaries[template_name]['grade'] = grade
+                                if template_name in all_template_data:
+                                    all_template_data[template_name].grade = grade
                                 update_comparison()
                                 dialog.destroy()
                         else:
@@ -3418,7 +3242,9 @@ class MockDraftApp:
                 else:
                     # Clear grade
                     if self.template_manager.update_template_grade(template_filename, None):
-                        all_template_data[template_name].grade = None
+                        template_summaries[template_name]['grade'] = None
+                        if template_name in all_template_data:
+                            all_template_data[template_name].grade = None
                         update_comparison()
                         dialog.destroy()
             
@@ -3463,8 +3289,10 @@ class MockDraftApp:
             active_templates = []
             for var in selected_templates:
                 name = var.get()
-                if name and name != 'None' and name in all_template_data:
-                    active_templates.append((name, all_template_data[name]))
+                if name and name != 'None' and name in template_summaries:
+                    template = get_comparison_template(name)
+                    if template:
+                        active_templates.append((name, template))
             
             if not active_templates:
                 tk.Label(
@@ -3686,11 +3514,14 @@ class MockDraftApp:
             num_teams=config_data.get('num_teams', config.num_teams),
             roster_spots=config_data.get('roster_spots', config.roster_spots),
             draft_type=config_data.get('draft_type', config.draft_type),
-            reversal_round=config_data.get('reversal_round', config.reversal_round)
+            reversal_round=config_data.get('reversal_round', config.reversal_round),
+            trade_service=self.trade_service
         )
         
-        # Restore player pool
+        # Restore player pool, sharing weekly stats with the loaded players
         player_dict = {p['player_id']: p for p in template.player_pool['all_players']}
+        loaded_weekly_stats = {p.player_id: p.weekly_stats_2024 for p in self.all_players
+                               if p.weekly_stats_2024 is not None}
         self.all_players = []
         for p_data in template.player_pool['all_players']:
             player = Player(
@@ -3706,19 +3537,22 @@ class MockDraftApp:
                 games_2024=p_data.get('games_2024'),
                 position_rank_2024=p_data.get('position_rank_2024'),
                 position_rank_proj=p_data.get('position_rank_proj'),
-                weekly_stats_2024=p_data.get('weekly_stats_2024')
+                weekly_stats_2024=loaded_weekly_stats.get(p_data['player_id'], p_data.get('weekly_stats_2024'))
             )
             player.player_id = p_data['player_id']
             self.all_players.append(player)
         
+        self.var_calculator = VarCalculator(self.all_players, config_data.get('num_teams', config.num_teams))
+        
         # Create player lookup
         player_lookup = {p.player_id: p for p in self.all_players}
         
         # Restore available players
-        self.available_players = [
-            player_lookup[pid] for pid in template.player_pool['available_player_ids']
-            if pid in player_lookup
-        ]
+        self.available_players = AvailabilityIndex(
+            self.all_players,
+            available=[player_lookup[pid] for pid in template.player_pool['available_player_ids']
+                       if pid in player_lookup]
+        )
         
         # Restore team names and rosters
         for team_id_str, team_data in template.team_states.items():
@@ -3728,15 +3562,14 @@ class MockDraftApp:
                 team.name = team_data['name']
                 
                 # Clear and restore roster
-                for pos in team.roster:
-                    team.roster[pos] = []
-                
+                roster = {pos: [] for pos in team.roster}
                 for position, player_ids in team_data['roster'].items():
-                    if position in team.roster:
-                        team.roster[position] = [
+                    if position in roster:
+                        roster[position] = [
                             player_lookup[pid] for pid in player_ids
                             if pid in player_lookup
                         ]
+                team.set_roster(roster)
         
         # Clear and restore ALL draft picks from template
         self.draft_engine.draft_results = []
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Rewrite saved templates in the current template format.
+
+Version 2 templates store the player pool by reference to a shared player
+universe (templates/universes/) instead of embedding every player's record.
+Older templates still load as-is and are migrated whenever they're re-saved;
+run this to migrate them all at once.
+
+Usage:
+    python migrate_templates.py [--templates-dir DIR]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.core.template_manager import TemplateManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate templates to the current format")
+    parser.add_argument("--templates-dir", default=os.path.join(current_dir, "templates"))
+    args = parser.parse_args()
+
+    start = time.time()
+    migrated = TemplateManager(args.templates_dir).migrate_templates()
+    print(f"Migrated {migrated} templates in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Run thousands of computer-drafted mock drafts without the GUI and report
+how often each player is still available at a given team's picks.
+
+Usage:
+    python simulate_drafts.py [num_drafts] [--team TEAM_ID] [--seed SEED] [--top N] [--workers N] [--scalar]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import config
+from src.core.draft_simulator import DraftSimulator, player_key
+from src.services.custom_adp_manager import CustomADPManager
+from src.services.draft_preset_manager import DraftPresetManager
+from src.services.draft_trade_service import DraftTradeService
+from src.utils import generate_mock_players
+
+
+def build_simulator() -> DraftSimulator:
+    """Build a simulator with the same players, preset and trades as the app"""
+    players = generate_mock_players()
+    CustomADPManager().apply_custom_adp_to_players(players)
+
+    preset = DraftPresetManager().get_active_preset()
+
+    # Same default trade the app sets up between Johnson and Eric
+    trade_service = DraftTradeService()
+    trade_service.add_trade(4, [6, 8], 9, [6, 8])
+
+    return DraftSimulator(
+        players,
+        num_teams=config.num_teams,
+        roster_spots=config.roster_spots,
+        draft_type=config.draft_type,
+        reversal_round=config.reversal_round,
+        trade_service=trade_service,
+        preset=preset
+    )
+
+
+def print_report(simulator: DraftSimulator, result, team_id: int, top: int):
+    """Print availability odds at each of the team's picks"""
+    team_name = simulator.team_names.get(team_id, f"Team {team_id}")
+    team_picks = simulator.get_team_picks(team_id)
+    players = {player_key(p): p for p in simulator.players}
+
+    for pick_number in team_picks[:4]:
+        print(f"\n{team_name} - pick {pick_number}: chance each player is still available")
+        rows = result.availability_table(pick_number, limit=len(result.pick_counts))
+        rows = [r for r in rows if r['availability'] > 0]
+        for row in rows[:top]:
+            player = players.get(row['player_key'])
+            position = player.position if player else ''
+            print(f"  {row['name']:<28} {position:<4} avg pick {row['average_pick']:6.1f}"
+                  f"   available {row['availability'] * 100:5.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Monte Carlo mock draft simulator")
+    parser.add_argument("num_drafts", nargs="?", type=int, default=1000)
+    parser.add_argument("--team", type=int, default=None,
+                        help="Team ID to report on (defaults to the preset's user team)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (defaults to one per CPU, 1 disables multiprocessing)")
+    parser.add_argument("--scalar", action="store_true",
+                        help="Simulate draft by draft instead of with the batched NumPy policy")
+    args = parser.parse_args()
+
+    simulator = build_simulator()
+
+    team_id = args.team
+    if team_id is None:
+        preset = simulator.preset
+        team_id = preset.user_position + 1 if preset and preset.enabled else 1
+
+    start = time.time()
+    result = simulator.run_parallel(args.num_drafts, seed=args.seed, max_workers=args.workers,
+                                    vectorized=not args.scalar)
+    elapsed = time.time() - start
+    print(f"\nSimulated {result.num_drafts} drafts in {elapsed:.2f}s")
+
+    print_report(simulator, result, team_id, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
 from .draft_logic import DraftEngine, DraftPick
+from .draft_state import DraftState
+from .draft_simulator import DraftSimulator, SimulationResult
 
-__all__ = ['DraftEngine', 'DraftPick']
\ No newline at end of file
+__all__ = ['DraftEngine', 'DraftPick', 'DraftState', 'DraftSimulator', 'SimulationResult']
@@ -0,0 +1,170 @@
+"""Chance each available player is still there at the user's next pick"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from ..models import Player
+from ..models.draft_preset import DraftPreset
+from .draft_state import DraftState
+from .pick_policy import POLICY_POSITIONS, VectorizedAdpLadderPolicy
+
+# Simulations per forecast, and how long one may run before it is given up
+DEFAULT_MAX_SIMULATIONS = 200
+DEFAULT_TIME_BUDGET = 2.0
+
+
+@dataclass
+class AvailabilityForecast:
+    """How often each player was taken before the user's next pick
+
+    next_pick is None when the user has no later pick. Players that never
+    went in any simulation are absent from taken_counts.
+    """
+    current_pick: int
+    next_pick: Optional[int]
+    num_simulations: int = 0
+    taken_counts: Dict[Player, int] = field(default_factory=dict)
+
+    def probability(self, player: Player) -> Optional[float]:
+        """Chance the player is still available at next_pick"""
+        if self.next_pick is None:
+            return None
+        if not self.num_simulations:
+            return 1.0
+        return 1.0 - self.taken_counts.get(player, 0) / self.num_simulations
+
+
+class AvailabilityForecaster:
+    """Simulates computer picks up to the user's next pick on a background worker
+
+    Every forecast runs max_simulations drafts in lockstep with
+    VectorizedAdpLadderPolicy, so the worker spends a few NumPy calls per
+    pick instead of holding the GIL against Tk for a pure Python loop.
+    Simulations are seeded by the pick number, so asking again at the same
+    pick gives the same numbers however busy the machine is.
+
+    request() forks the live draft on the caller's thread, so the worker
+    never reads state the UI is changing, and drops any forecast that a
+    newer request has superseded.
+    """
+
+    def __init__(self, num_teams: int, time_budget: float = DEFAULT_TIME_BUDGET,
+                 max_simulations: int = DEFAULT_MAX_SIMULATIONS, max_workers: int = 1):
+        self.num_teams = num_teams
+        self.time_budget = time_budget
+        self.max_simulations = max_simulations
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='availability-forecast')
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._policy = None
+        self._policy_key = None
+
+    def _get_policy(self, state: DraftState, num_picks: int,
+                    preset: Optional[DraftPreset]) -> VectorizedAdpLadderPolicy:
+        """Batch policy over the pool's whole universe, rebuilt only when it changes"""
+        universe = state.available_players.all_players
+        team_ids = sorted(state.teams)
+        key = ([id(p) for p in universe], team_ids, id(preset))
+        if self._policy is None or self._policy_key != key:
+            self._policy = VectorizedAdpLadderPolicy(
+                universe,
+                [state.teams[team_id].name for team_id in team_ids],
+                self.num_teams,
+                -(-num_picks // self.num_teams),
+                preset
+            )
+            self._policy_key = key
+        return self._policy
+
+    def forecast(self, state: DraftState, user_team_id: int,
+                 preset: Optional[DraftPreset] = None, seed=None,
+                 is_cancelled: Optional[Callable[[], bool]] = None) -> Optional[AvailabilityForecast]:
+        """Run max_simulations simulations; returns None if cancelled or over the time budget"""
+        pick_table = state.engine.get_pick_table()
+        current_pick = len(state.engine.draft_results) + 1
+
+        # On the clock, the question is whether a player lasts to the pick after this one
+        start = current_pick
+        if current_pick <= len(pick_table) and pick_table[current_pick - 1][2] == user_team_id:
+            start += 1
+        next_pick = next((pick_number for pick_number in range(start, len(pick_table) + 1)
+                          if pick_table[pick_number - 1][2] == user_team_id), None)
+
+        result = AvailabilityForecast(current_pick, next_pick)
+        if next_pick is None or next_pick == start or state.available_players is None:
+            return result
+
+        deadline = time.perf_counter() + self.time_budget
+        policy = self._get_policy(state, len(pick_table), preset)
+        team_ids = sorted(state.teams)
+        team_index = {team_id: i for i, team_id in enumerate(team_ids)}
+        num_simulations = self.max_simulations
+        rows = np.arange(num_simulations)
+        rng = np.random.default_rng(current_pick if seed is None else seed)
+
+        pool = state.available_players
+        available = np.tile(np.fromiter((p in pool for p in policy.players), dtype=bool,
+                                        count=len(policy.players)), (num_simulations, 1))
+        other = len(POLICY_POSITIONS)
+        position_counts = np.zeros((len(team_ids), num_simulations, other + 1), dtype=np.int16)
+        for t, team_id in enumerate(team_ids):
+            for position, count in state.teams[team_id].position_counts.items():
+                code = POLICY_POSITIONS.index(position) if position in POLICY_POSITIONS else other
+                position_counts[t, :, code] += count
+        draws = rng.random((next_pick - start, num_simulations))
+
+        taken = np.zeros(len(policy.players), dtype=np.int64)
+        for pick_number in range(start, next_pick):
+            if (is_cancelled and is_cancelled()) or time.perf_counter() > deadline:
+                return None
+            t = team_index[pick_table[pick_number - 1][2]]
+            chosen = policy.select(pick_number, t, available, position_counts[t],
+                                   draws[pick_number - start], rng)
+            picked = chosen >= 0
+            live, chosen = rows[picked], chosen[picked]
+            available[live, chosen] = False
+            position_counts[t, live, policy.position_codes[chosen]] += 1
+            taken += np.bincount(chosen, minlength=len(taken))
+
+        result.num_simulations = num_simulations
+        result.taken_counts = {policy.players[i]: int(taken[i]) for i in np.flatnonzero(taken)}
+        return result
+
+    def request(self, state: DraftState, user_team_id: int,
+                on_ready: Callable[[AvailabilityForecast], None],
+                preset: Optional[DraftPreset] = None):
+        """Forecast in the background; on_ready is called from the worker thread"""
+        snapshot = state.fork()
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        def is_cancelled():
+            return generation != self._generation
+
+        def run():
+            if is_cancelled():
+                return
+            try:
+                forecast = self.forecast(snapshot, user_team_id, preset, is_cancelled=is_cancelled)
+            except Exception as e:
+                print(f"Error forecasting availability: {e}")
+                return
+            if forecast is not None and not is_cancelled():
+                on_ready(forecast)
+
+        self._executor.submit(run)
+
+    def cancel(self):
+        """Drop any forecast still running or queued"""
+        with self._lock:
+            self._generation += 1
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False)
@@ -1,7 +1,9 @@
+import copy
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from ..models import Player, Team
 from ..services.draft_trade_service import DraftTradeService
+from ..services.draft_order_service import DraftOrderService
 
 
 @dataclass
@@ -25,34 +27,20 @@ class DraftEngine:
         self.total_picks = self.total_rounds * num_teams
         self.trade_service = trade_service
         
-        self.draft_order = self._generate_draft_order()
+        # Pick ownership lives in one table, rebuilt only when trades change
+        self.order_service = DraftOrderService(num_teams, reversal_round, trade_service, draft_type)
+        self.draft_order = self.order_service.get_original_order(self.total_rounds)
         self.draft_results: List[DraftPick] = []
+        self.redo_stack: List[DraftPick] = []  # Most recently undone pick last
+        self.teams: Dict[int, Team] = {}  # Teams seen in make_pick, for undo/redo
         
-    def _generate_draft_order(self) -> List[int]:
-        order = []
-        
-        for round_num in range(1, self.total_rounds + 1):
-            if self.draft_type == "snake":
-                if round_num == 1:
-                    round_order = list(range(1, self.num_teams + 1))  # 1→10
-                elif round_num == 2:
-                    round_order = list(range(self.num_teams, 0, -1))  # 10→1
-                elif self.reversal_round > 0 and round_num == self.reversal_round:
-                    # 3rd round reversal: use same order as round 2 (reverse)
-                    round_order = list(range(self.num_teams, 0, -1))  # 10→1
-                else:
-                    # After round 3, normal snake draft resumes
-                    # Round 4 should go forward (1→10) since round 3 went reverse
-                    if (round_num - 3) % 2 == 1:  # 4-3=1 (odd), so forward
-                        round_order = list(range(1, self.num_teams + 1))
-                    else:  # 5-3=2 (even), so reverse
-                        round_order = list(range(self.num_teams, 0, -1))
-            else:  # linear draft
-                round_order = list(range(1, self.num_teams + 1))
-            
-            order.extend(round_order)
-        
-        return order
+    def get_pick_table(self) -> List[Tuple[int, int, int]]:
+        """(round, pick_in_round, team_id) for every overall pick, trades applied"""
+        return self.order_service.get_pick_table(self.total_rounds)
+    
+    def get_team_picks(self, team_id: int) -> List[int]:
+        """Overall pick numbers owned by a team, trades applied"""
+        return self.order_service.get_team_picks(team_id, self.total_rounds)
     
     def get_current_pick_info(self) -> Tuple[int, int, int, int]:
         pick_number = len(self.draft_results) + 1
@@ -60,16 +48,7 @@ class DraftEngine:
         if pick_number > self.total_picks:
             return 0, 0, 0, 0
         
-        current_round = ((pick_number - 1) // self.num_teams) + 1
-        pick_in_round = ((pick_number - 1) % self.num_teams) + 1
-        original_team_on_clock = self.draft_order[pick_number - 1]
-        
-        # Check if this pick has been traded
-        if self.trade_service:
-            team_on_clock = self.trade_service.get_pick_owner(original_team_on_clock, current_round)
-        else:
-            team_on_clock = original_team_on_clock
-        
+        current_round, pick_in_round, team_on_clock = self.get_pick_table()[pick_number - 1]
         return pick_number, current_round, pick_in_round, team_on_clock
     
     def make_pick(self, team: Team, player: Player) -> DraftPick:
@@ -79,6 +58,8 @@ class DraftEngine:
             raise ValueError(f"Team {team.name} cannot draft {player.name}")
         
         team.add_player(player)
+        self.teams[team.id] = team
+        self.redo_stack.clear()  # A new pick ends the redo history
         
         pick = DraftPick(
             pick_number=pick_number,
@@ -91,6 +72,56 @@ class DraftEngine:
         self.draft_results.append(pick)
         return pick
     
+    def undo_last(self, n: int = 1, teams: Optional[Dict[int, Team]] = None,
+                  available_players=None) -> List[DraftPick]:
+        """Undo the last n picks, newest first
+        
+        Each player is removed from their team's roster (teams defaults to the
+        teams seen in make_pick) and, if given, added back to available_players.
+        Undone picks can be replayed with redo(). Returns the undone picks.
+        """
+        teams = teams if teams is not None else self.teams
+        undone = []
+        for _ in range(min(n, len(self.draft_results))):
+            pick = self.draft_results.pop()
+            team = teams.get(pick.team_id)
+            if team is not None:
+                team.remove_player(pick.player)
+            if available_players is not None:
+                available_players.append(pick.player)
+            self.redo_stack.append(pick)
+            undone.append(pick)
+        return undone
+    
+    def redo(self, n: int = 1, teams: Optional[Dict[int, Team]] = None,
+             available_players=None) -> List[DraftPick]:
+        """Replay up to n undone picks. Returns the replayed picks"""
+        teams = teams if teams is not None else self.teams
+        redone = []
+        while len(redone) < n and self.redo_stack:
+            pick = self.redo_stack[-1]
+            team = teams.get(pick.team_id)
+            # The draft moved on some other way since the undo
+            if (pick.pick_number != len(self.draft_results) + 1 or team is None
+                    or not team.can_draft_player(pick.player)):
+                self.redo_stack.clear()
+                break
+            self.redo_stack.pop()
+            team.add_player(pick.player)
+            if available_players is not None and pick.player in available_players:
+                available_players.remove(pick.player)
+            self.draft_results.append(pick)
+            redone.append(pick)
+        return redone
+    
+    def copy(self) -> 'DraftEngine':
+        """Copy with its own pick history; config and the order service are shared"""
+        clone = copy.copy(self)
+        clone.draft_results = list(self.draft_results)
+        clone.redo_stack = list(self.redo_stack)
+        clone.teams = {}
+        return clone
+    
     def is_draft_complete(self) -> bool:
         return len(self.draft_results) >= self.total_picks
     
@@ -0,0 +1,391 @@
+"""Headless Monte Carlo draft simulator built on DraftEngine"""
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..models import Player, Team
+from ..models.draft_preset import DraftPreset
+from ..services.draft_trade_service import DraftTradeService
+from .draft_logic import DraftEngine, DraftPick
+from .draft_state import DraftState
+from .pick_policy import AdpLadderPolicy, POLICY_POSITIONS, VectorizedAdpLadderPolicy
+
+# Drafts per work unit handed to a worker process. Shards (not workers) own
+# the RNG seeds, so results do not depend on how many workers are used.
+DEFAULT_SHARD_SIZE = 500
+
+
+def player_key(player: Player) -> str:
+    """Stable key used to identify a player across simulated drafts"""
+    return player.player_id or f"{player.name}|{player.position}"
+
+
+@dataclass
+class SimulationResult:
+    """Aggregated pick histograms from a batch of simulated drafts
+
+    pick_counts maps player key -> overall pick number -> times drafted there,
+    team_counts maps player key -> team id -> times drafted by that team.
+    """
+    num_drafts: int = 0
+    pick_counts: Dict[str, Dict[int, int]] = field(default_factory=dict)
+    team_counts: Dict[str, Dict[int, int]] = field(default_factory=dict)
+    player_names: Dict[str, str] = field(default_factory=dict)
+
+    def record_pick(self, pick: DraftPick):
+        """Add a single draft pick to the histograms"""
+        key = player_key(pick.player)
+        self.player_names[key] = pick.player.name
+
+        picks = self.pick_counts.setdefault(key, {})
+        picks[pick.pick_number] = picks.get(pick.pick_number, 0) + 1
+
+        teams = self.team_counts.setdefault(key, {})
+        teams[pick.team_id] = teams.get(pick.team_id, 0) + 1
+
+    def merge(self, other: 'SimulationResult') -> 'SimulationResult':
+        """Fold another result's histograms into this one and return self"""
+        self.num_drafts += other.num_drafts
+        self.player_names.update(other.player_names)
+        for target, source in ((self.pick_counts, other.pick_counts),
+                               (self.team_counts, other.team_counts)):
+            for key, counts in source.items():
+                merged = target.setdefault(key, {})
+                for bucket, count in counts.items():
+                    merged[bucket] = merged.get(bucket, 0) + count
+        return self
+
+    def pick_probability(self, key: str, pick_number: int) -> float:
+        """Fraction of drafts where the player went at exactly this pick"""
+        if not self.num_drafts:
+            return 0.0
+        return self.pick_counts.get(key, {}).get(pick_number, 0) / self.num_drafts
+
+    def team_probability(self, key: str, team_id: int) -> float:
+        """Fraction of drafts where the player was drafted by this team"""
+        if not self.num_drafts:
+            return 0.0
+        return self.team_counts.get(key, {}).get(team_id, 0) / self.num_drafts
+
+    def availability(self, key: str, pick_number: int) -> float:
+        """Fraction of drafts where the player was still on the board at this pick"""
+        if not self.num_drafts:
+            return 0.0
+        taken_before = sum(count for pick, count in self.pick_counts.get(key, {}).items()
+                           if pick < pick_number)
+        return 1.0 - taken_before / self.num_drafts
+
+    def average_pick(self, key: str) -> Optional[float]:
+        """Mean overall pick for the player across drafts where he was drafted"""
+        counts = self.pick_counts.get(key)
+        if not counts:
+            return None
+        total = sum(counts.values())
+        return sum(pick * count for pick, count in counts.items()) / total
+
+    def availability_table(self, pick_number: int, limit: int = 25) -> List[Dict]:
+        """The first limit players by average draft position, with their availability
+
+        Rows are in average-pick order; each row's availability is the
+        chance the player is still there at pick_number.
+        """
+        rows = []
+        for key in self.pick_counts:
+            rows.append({
+                'player_key': key,
+                'name': self.player_names.get(key, key),
+                'average_pick': self.average_pick(key),
+                'availability': self.availability(key, pick_number),
+            })
+        rows.sort(key=lambda r: r['average_pick'] if r['average_pick'] is not None else 999)
+        return rows[:limit]
+
+
+class DraftSimulator:
+    """Runs complete computer-drafted mock drafts without any UI"""
+
+    def __init__(self, players: List[Player], num_teams: int, roster_spots: Dict[str, int],
+                 draft_type: str = "snake", reversal_round: int = 0,
+                 trade_service: Optional[DraftTradeService] = None,
+                 preset: Optional[DraftPreset] = None,
+                 team_names: Optional[Dict[int, str]] = None,
+                 policy=None):
+        self.num_teams = num_teams
+        self.roster_spots = roster_spots
+        self.draft_type = draft_type
+        self.reversal_round = reversal_round
+        self.trade_service = trade_service
+        self.preset = preset
+
+        # Same ordering the app uses for available_players
+        self.players = sorted(players, key=lambda p: p.adp if p.adp else 999)
+
+        if team_names is None:
+            team_names = {}
+            for i in range(1, num_teams + 1):
+                if preset and preset.enabled:
+                    team_names[i] = preset.get_team_name(i - 1)
+                else:
+                    team_names[i] = f"Team {i}"
+        self.team_names = team_names
+
+        # Any object with AdpLadderPolicy's select() signature can drive the picks
+        self.policy = policy or AdpLadderPolicy(num_teams, preset)
+        self._batch_policy: Optional[VectorizedAdpLadderPolicy] = None
+
+    def _create_engine(self) -> DraftEngine:
+        return DraftEngine(
+            num_teams=self.num_teams,
+            roster_spots=self.roster_spots,
+            draft_type=self.draft_type,
+            reversal_round=self.reversal_round,
+            trade_service=self.trade_service
+        )
+
+    def _create_teams(self) -> Dict[int, Team]:
+        return {
+            team_id: Team(team_id=team_id, name=name, roster_spots=self.roster_spots)
+            for team_id, name in self.team_names.items()
+        }
+
+    def run_draft(self, rng: Optional[random.Random] = None) -> List[DraftPick]:
+        """Run one full draft with every team using the computer pick policy"""
+        return self._finish_draft(self._create_engine(), self._create_teams(),
+                                  list(self.players), rng)
+
+    def run_from(self, state: DraftState, rng: Optional[random.Random] = None) -> List[DraftPick]:
+        """Finish a fork of a live draft with computer picks; state is left untouched
+
+        Returns every pick of the finished draft, including those already made.
+        """
+        fork = state.fork()
+        available = fork.available_players
+        if available is None:
+            drafted = {pick.player for pick in fork.engine.draft_results}
+            available = [p for p in self.players if p not in drafted]
+        return self._finish_draft(fork.engine, fork.teams, available, rng)
+
+    def _finish_draft(self, engine: DraftEngine, teams: Dict[int, Team], available,
+                      rng: Optional[random.Random] = None) -> List[DraftPick]:
+        rng = rng or random.Random()
+        while not engine.is_draft_complete() and available:
+            pick_num, _, _, team_on_clock = engine.get_current_pick_info()
+            team = teams[team_on_clock]
+            counts = team.position_counts
+
+            player = self.policy.select(available, team, pick_num, counts, rng)
+            if player is None or not team.can_draft_player(player):
+                # Policy had nothing legal to offer - take the best player that fits
+                player = next((p for p in available if team.can_draft_player(p)), None)
+                if player is None:
+                    break
+
+            engine.make_pick(team, player)
+            available.remove(player)
+
+        return engine.get_draft_results()
+
+    def run(self, num_drafts: int, seed: Optional[int] = None) -> SimulationResult:
+        """Run num_drafts independent drafts and aggregate where each player went"""
+        rng = random.Random(seed)
+        result = SimulationResult()
+        for _ in range(num_drafts):
+            for pick in self.run_draft(rng):
+                result.record_pick(pick)
+            result.num_drafts += 1
+        return result
+
+    def _pick_owners(self) -> List[int]:
+        """Team ID on the clock for every overall pick, with trades applied"""
+        return [team_id for _, _, team_id in self._create_engine().get_pick_table()]
+
+    def get_team_picks(self, team_id: int) -> List[int]:
+        """Overall pick numbers owned by a team, with trades applied"""
+        return self._create_engine().get_team_picks(team_id)
+
+    def get_batch_policy(self) -> VectorizedAdpLadderPolicy:
+        if self._batch_policy is None:
+            team_ids = sorted(self.team_names)
+            self._batch_policy = VectorizedAdpLadderPolicy(
+                self.players,
+                [self.team_names[team_id] for team_id in team_ids],
+                self.num_teams,
+                sum(self.roster_spots.values()),
+                self.preset
+            )
+        return self._batch_policy
+
+    def run_vectorized(self, num_drafts: int, seed: Optional[int] = None) -> SimulationResult:
+        """Run num_drafts drafts in lockstep with VectorizedAdpLadderPolicy
+
+        Every draft advances one pick at a time together; availability,
+        position counts and roster slot fills are kept as arrays with one row
+        per draft. Statistically equivalent to run(), but not draw-for-draw.
+        """
+        policy = self.get_batch_policy()
+        rng = np.random.default_rng(seed)
+        team_ids = sorted(self.team_names)
+        team_index = {team_id: i for i, team_id in enumerate(team_ids)}
+        owners = self._pick_owners()
+        num_players = len(self.players)
+        num_teams = len(team_ids)
+        rows = np.arange(num_drafts)
+
+        # Roster slot layout mirroring Team.can_draft_player / Team.add_player
+        starter_positions = ['qb', 'rb', 'wr', 'te']
+        starter_spots = np.array([self.roster_spots.get(pos, 0) for pos in starter_positions] + [0])
+        starter_slot = np.array([starter_positions.index(p.position.lower())
+                                 if p.position.lower() in starter_positions else len(starter_positions)
+                                 for p in self.players], dtype=np.intp)
+        flex_eligible = np.array([p.position in ['RB', 'WR', 'TE'] for p in self.players])
+        flex_spots = self.roster_spots.get('flex', 0)
+        bench_spots = self.roster_spots.get('bn', 0)
+        roster_size = sum(self.roster_spots.values())
+
+        available = np.ones((num_drafts, num_players), dtype=bool)
+        alive = np.ones(num_drafts, dtype=bool)
+        position_counts = np.zeros((num_teams, num_drafts, len(POLICY_POSITIONS) + 1), dtype=np.int16)
+        starters = np.zeros((num_teams, num_drafts, len(starter_positions) + 1), dtype=np.int16)
+        flex = np.zeros((num_teams, num_drafts), dtype=np.int16)
+        bench = np.zeros((num_teams, num_drafts), dtype=np.int16)
+        team_pick_count = [0] * num_teams
+        draws = rng.random((len(owners), num_drafts))
+        chosen_by_pick = np.full((len(owners), num_drafts), -1, dtype=np.intp)
+
+        for pick_index, team_id in enumerate(owners):
+            t = team_index[team_id]
+            if team_pick_count[t] >= roster_size:
+                break  # Team can't roster anyone else; the draft stops like run_draft
+            team_pick_count[t] += 1
+            pick_num = pick_index + 1
+
+            chosen = policy.select(pick_num, t, available, position_counts[t],
+                                   draws[pick_index], rng)
+
+            # Same fallback as run_draft: if the pick doesn't fit the roster,
+            # take the best available player that does
+            safe = np.maximum(chosen, 0)
+            slot = starter_slot[safe]
+            starter_open = starters[t, rows, slot] < starter_spots[slot]
+            flex_open = flex_eligible[safe] & (flex[t] < flex_spots)
+            bench_open = bench[t] < bench_spots
+            fits = (chosen >= 0) & (starter_open | flex_open | bench_open)
+            redo = alive & ~fits
+            if redo.any():
+                fit_any = available[redo] & (
+                    (starters[t, redo][:, starter_slot] < starter_spots[starter_slot]) |
+                    (flex_eligible & (flex[t, redo] < flex_spots)[:, None]) |
+                    (bench[t, redo] < bench_spots)[:, None])
+                has_fit = fit_any.any(axis=1)
+                redo_rows = rows[redo]
+                chosen[redo_rows] = np.where(has_fit, fit_any.argmax(axis=1), -1)
+                alive[redo_rows[~has_fit]] = False
+                safe = np.maximum(chosen, 0)
+                slot = starter_slot[safe]
+                starter_open = starters[t, rows, slot] < starter_spots[slot]
+                flex_open = flex_eligible[safe] & (flex[t] < flex_spots)
+
+            chosen[~alive] = -1
+            live = rows[alive]
+            picked = chosen[alive]
+            available[live, picked] = False
+            position_counts[t, live, policy.position_codes[picked]] += 1
+
+            to_starter = alive & starter_open
+            to_flex = alive & ~starter_open & flex_open
+            to_bench = alive & ~starter_open & ~flex_open
+            starters[t, rows[to_starter], slot[to_starter]] += 1
+            flex[t, to_flex] += 1
+            bench[t, to_bench] += 1
+
+            chosen_by_pick[pick_index] = chosen
+
+        return self._collect_batch_result(chosen_by_pick, owners, num_drafts)
+
+    def _collect_batch_result(self, chosen_by_pick: np.ndarray, owners: List[int],
+                              num_drafts: int) -> SimulationResult:
+        result = SimulationResult(num_drafts=num_drafts)
+        keys = [player_key(p) for p in self.players]
+        for pick_index, team_id in enumerate(owners):
+            chosen = chosen_by_pick[pick_index]
+            counts = np.bincount(chosen[chosen >= 0], minlength=len(self.players))
+            for i in np.flatnonzero(counts):
+                key = keys[i]
+                count = int(counts[i])
+                result.player_names[key] = self.players[i].name
+                picks = result.pick_counts.setdefault(key, {})
+                picks[pick_index + 1] = picks.get(pick_index + 1, 0) + count
+                teams = result.team_counts.setdefault(key, {})
+                teams[team_id] = teams.get(team_id, 0) + count
+        return result
+
+    def run_parallel(self, num_drafts: int, seed: Optional[int] = None,
+                     max_workers: Optional[int] = None,
+                     shard_size: int = DEFAULT_SHARD_SIZE,
+                     vectorized: bool = False) -> SimulationResult:
+        """Run num_drafts drafts spread over a process pool and merge the histograms
+
+        The drafts are split into fixed-size shards, each with its own seed
+        derived from seed and the shard index, so a seeded run gives the same
+        result for any max_workers value. With vectorized=True each shard is
+        run through run_vectorized instead of draft by draft.
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+
+        shards = []
+        remaining = num_drafts
+        while remaining > 0:
+            size = min(shard_size, remaining)
+            shards.append((size, shard_seed(seed, len(shards))))
+            remaining -= size
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(shards))
+
+        result = SimulationResult()
+        if max_workers <= 1:
+            for size, shard in shards:
+                result.merge(_run_simulator_shard(self, size, shard, vectorized))
+            return result
+
+        # Ship the simulator to each worker once instead of with every shard
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            sizes = [size for size, _ in shards]
+            seeds = [shard for _, shard in shards]
+            modes = [vectorized] * len(shards)
+            for shard_result in executor.map(_run_shard, sizes, seeds, modes):
+                result.merge(shard_result)
+        return result
+
+
+def shard_seed(seed: int, shard_index: int) -> int:
+    """Deterministic, well-spread RNG seed for one shard of a bulk run"""
+    return random.Random(f"{seed}:{shard_index}").getrandbits(63)
+
+
+# Simulator owned by the current worker process (set by _init_worker)
+_worker_simulator: Optional[DraftSimulator] = None
+
+
+def _init_worker(simulator: DraftSimulator):
+    global _worker_simulator
+    _worker_simulator = simulator
+
+
+def _run_simulator_shard(simulator: DraftSimulator, num_drafts: int, seed: int,
+                         vectorized: bool) -> SimulationResult:
+    if vectorized:
+        return simulator.run_vectorized(num_drafts, seed=seed)
+    return simulator.run(num_drafts, seed=seed)
+
+
+def _run_shard(num_drafts: int, seed: int, vectorized: bool) -> SimulationResult:
+    return _run_simulator_shard(_worker_simulator, num_drafts, seed, vectorized)
@@ -0,0 +1,44 @@
+"""Point-in-time copies of a live draft for undo and what-if simulation"""
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from ..models import Team
+from ..models.availability_index import AvailabilityIndex
+from .draft_logic import DraftEngine
+
+
+@dataclass
+class DraftState:
+    """A draft engine with its teams and available player pool
+
+    fork() copies only what a pick can change - the pick history, each
+    team's roster lists and counters, and the pool's availability flags.
+    Players, draft config, the pick ownership table and the pool's ADP
+    ordering are shared, so a fork costs a few small list copies and can be
+    taken hundreds of times a second.
+    """
+    engine: DraftEngine
+    teams: Dict[int, Team]
+    available_players: Optional[AvailabilityIndex] = None
+
+    def fork(self) -> 'DraftState':
+        """Independent copy that can be drafted forward without touching this state"""
+        engine = self.engine.copy()
+        teams = {team_id: team.copy() for team_id, team in self.teams.items()}
+        engine.teams = teams
+        available = self.available_players.copy() if self.available_players is not None else None
+        return DraftState(engine, teams, available)
+
+    def restore(self, snapshot: 'DraftState'):
+        """Put this state's engine and teams back to a snapshot, in place
+
+        The engine and team objects are kept (the UI holds references to
+        them); the pool is not touched - use snapshot.available_players.copy().
+        """
+        self.engine.draft_results = list(snapshot.engine.draft_results)
+        self.engine.redo_stack = list(snapshot.engine.redo_stack)
+        for team_id, team in snapshot.teams.items():
+            if team_id in self.teams:
+                self.teams[team_id].set_roster(
+                    {slot: list(players) for slot, players in team.roster.items()}
+                )
@@ -0,0 +1,392 @@
+"""Computer pick policies shared by the app and the draft simulator
+
+select_computer_pick is the reference policy (ADP window, position caps and
+probability ladder) used by MockDraftApp. AdpLadderPolicy wraps it for
+repeated use over a fixed player pool, and VectorizedAdpLadderPolicy applies
+the same rules to a whole batch of simulated drafts at once with NumPy.
+"""
+import random
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..models import Player, Team
+from ..models.draft_preset import DraftPreset
+from ..utils.player_extensions import format_name, format_names
+
+# Positions tracked by the policy's position caps, and the caps themselves
+POLICY_POSITIONS = ['QB', 'RB', 'WR', 'TE', 'DEF', 'K', 'LB', 'DB']
+POSITION_LIMITS = {'QB': 2, 'RB': 5, 'WR': 5, 'TE': 1, 'DEF': 1, 'K': 1, 'LB': 4, 'DB': 4}
+# Positions the policy won't touch before round 10
+LATE_ROUND_POSITIONS = ['K', 'DEF', 'LB', 'DB']
+LUAN_PRIORITY_PLAYERS = ["DRAKE LONDON", "DERRICK HENRY", "CHASE BROWN"]
+
+
+def select_computer_pick(available_players: List[Player], team: Team, pick_num: int,
+                         num_teams: int, position_counts: Dict[str, int],
+                         active_preset: Optional[DraftPreset] = None,
+                         rng=random) -> Optional[Player]:
+    """Select a player for computer team based on smart drafting logic
+
+    Args:
+        available_players: Available players sorted by ADP
+        team: Team on the clock
+        pick_num: Overall pick number (1-based)
+        num_teams: Number of teams in the draft
+        position_counts: Players already rostered by the team, keyed by position
+        active_preset: Draft preset with exclusions, forced picks and round restrictions
+        rng: Source of randomness (the random module or a random.Random instance)
+    """
+
+    # Calculate current round for round restrictions
+    current_round = ((pick_num - 1) // num_teams) + 1
+
+    # Check for forced picks first
+    if active_preset:
+        forced_player_name = active_preset.get_forced_pick(team.name, pick_num)
+        if forced_player_name:
+            # Find and return the forced player
+            for player in available_players:
+                if format_name(player.name).upper() == forced_player_name.upper():
+                    return player
+
+    # Special logic for Luan in round 3 (pick 21)
+    if team.name.upper() == "LUAN" and pick_num == 21:
+        # Priority order: DRAKE LONDON > DERRICK HENRY > CHASE BROWN > any QB (NOT McBride)
+        priority_players = [
+            "DRAKE LONDON",
+            "DERRICK HENRY",
+            "CHASE BROWN"
+        ]
+
+        # Check for priority players first
+        for priority_name in priority_players:
+            for player in available_players:
+                if format_name(player.name).upper() == priority_name:
+                    # 90% chance to take the priority player if available
+                    if rng.random() < 0.9:
+                        return player
+
+        # If none of the priority players are available or random didn't select them,
+        # look for any QB with 70% chance
+        for player in available_players[:15]:  # Look at top 15 available
+            if player.position == 'QB' and rng.random() < 0.7:
+                return player
+
+    # Quick path for very early picks
+    if pick_num <= 3:
+        # Check preset exclusions and round restrictions even for early picks
+        for player in available_players:
+            if active_preset and active_preset.is_player_excluded(team.name, player.name):
+                continue  # Skip excluded player
+            if active_preset and active_preset.is_player_restricted(team.name, player.name, current_round):
+                continue  # Skip round-restricted player
+            return player  # Return first non-excluded player
+        return None
+
+    # Early rounds (1-3) should be much tighter to ADP
+    is_early_round = pick_num <= (3 * num_teams)
+
+    # Special handling for elite players that should never fall
+    for player in available_players[:5]:
+        # Elite players that must go by certain picks
+        if player.name == "JAMARR CHASE" and pick_num >= 2:
+            return player  # Chase must go by 1.02
+        elif player.adp <= 3 and pick_num >= player.adp + 1:
+            return player  # Top 3 players shouldn't fall more than 1 spot
+        elif player.adp <= 10 and pick_num >= player.adp + 3:
+            return player  # Top 10 players shouldn't fall more than 3 spots
+
+    # Special handling for Joe Burrow - must be taken by pick 21
+    if pick_num >= 21:
+        for player in available_players:
+            if format_name(player.name) == "JOE BURROW":
+                return player
+
+    # Determine how many players to consider based on pick
+    if is_early_round:
+        # Early rounds: only consider players within reasonable ADP range
+        max_adp_reach = 5  # Won't reach more than 5 picks early
+        consider_range = 8  # Look at top 8 available
+    else:
+        max_adp_reach = 15  # More flexibility later
+        consider_range = 20  # Look at top 20 available
+
+    # Filter players by position needs and ADP appropriateness
+    eligible_players = []
+    for player in available_players[:consider_range]:
+        pos = player.position
+
+        # Check preset exclusions
+        if active_preset and active_preset.is_player_excluded(team.name, player.name):
+            continue  # Skip excluded player
+
+        # Check round restrictions
+        if active_preset and active_preset.is_player_restricted(team.name, player.name, current_round):
+            continue  # Skip round-restricted player
+
+        # Check if pick is too much of a reach
+        if player.adp > pick_num + max_adp_reach:
+            continue  # Don't reach too far
+
+        # Check position limits
+        if pos == 'QB' and position_counts.get('QB', 0) >= 2:
+            continue  # Max 2 QBs
+        elif pos == 'RB' and position_counts.get('RB', 0) >= 5:
+            continue  # Max 5 RBs
+        elif pos == 'WR' and position_counts.get('WR', 0) >= 5:
+            continue  # Max 5 WRs
+        elif pos == 'TE' and position_counts.get('TE', 0) >= 1:
+            continue  # Max 1 TE (special case)
+        elif pos == 'DEF' and position_counts.get('DEF', 0) >= 1:
+            continue  # Max 1 DEF
+        elif pos == 'K' and position_counts.get('K', 0) >= 1:
+            continue  # Max 1 K
+        elif pos == 'LB' and position_counts.get('LB', 0) >= 4:
+            continue  # Max 4 LBs
+        elif pos == 'DB' and position_counts.get('DB', 0) >= 4:
+            continue  # Max 4 DBs
+
+        # Don't draft K/DEF/LB/DB before round 10
+        if pos in ['K', 'DEF', 'LB', 'DB'] and pick_num < (10 * num_teams):
+            continue
+
+        eligible_players.append(player)
+
+    if not eligible_players:
+        # If no eligible players, take best available non-K/DEF
+        for player in available_players:
+            # Check preset exclusions even in fallback
+            if active_preset and active_preset.is_player_excluded(team.name, player.name):
+                continue  # Skip excluded player
+            # Check round restrictions even in fallback
+            if active_preset and active_preset.is_player_restricted(team.name, player.name, current_round):
+                continue  # Skip round-restricted player
+            if player.position not in ['K', 'DEF'] or pick_num >= 120:
+                return player
+        return available_players[0] if available_players else None
+
+    # Simplified pick selection - use ADP-based probability
+    if is_early_round:
+        # Early rounds: pick mostly by ADP with small variance
+        if len(eligible_players) == 1:
+            return eligible_players[0]
+
+        # 70% chance to take best ADP, 20% second best, 10% third
+        rand = rng.random()
+        if rand < 0.7:
+            return eligible_players[0]
+        elif rand < 0.9 and len(eligible_players) > 1:
+            return eligible_players[1]
+        elif len(eligible_players) > 2:
+            return eligible_players[2]
+        else:
+            return eligible_players[0]
+    else:
+        # Later rounds: more randomness but still favor better ADP
+        if len(eligible_players) == 1:
+            return eligible_players[0]
+
+        # 50% best, 30% second, 15% third, 5% fourth+
+        rand = rng.random()
+        if rand < 0.5:
+            return eligible_players[0]
+        elif rand < 0.8 and len(eligible_players) > 1:
+            return eligible_players[1]
+        elif rand < 0.95 and len(eligible_players) > 2:
+            return eligible_players[2]
+        elif len(eligible_players) > 3:
+            return eligible_players[3]
+        else:
+            return eligible_players[0]
+
+
+class AdpLadderPolicy:
+    """select_computer_pick bound to a draft size and preset"""
+
+    def __init__(self, num_teams: int, preset: Optional[DraftPreset] = None):
+        self.num_teams = num_teams
+        self.preset = preset
+
+    def select(self, available_players: List[Player], team: Team, pick_num: int,
+               position_counts: Dict[str, int], rng=random) -> Optional[Player]:
+        return select_computer_pick(available_players, team, pick_num, self.num_teams,
+                                    position_counts, self.preset, rng)
+
+
+class VectorizedAdpLadderPolicy:
+    """Batched NumPy version of select_computer_pick
+
+    Works on boolean availability arrays of shape (drafts, players) where the
+    player axis is in ADP order, so every simulated draft is scored in a handful
+    of array operations per pick. Name-based rules (forced picks, exclusions,
+    round restrictions, the Chase/Burrow/Luan specials) are resolved to player
+    indices once, up front.
+    """
+
+    def __init__(self, players: List[Player], team_names: List[str], num_teams: int,
+                 total_rounds: int, preset: Optional[DraftPreset] = None):
+        self.players = players
+        self.team_names = team_names
+        self.num_teams = num_teams
+        self.total_rounds = total_rounds
+        self.preset = preset
+
+        other = len(POLICY_POSITIONS)
+        codes = {pos: i for i, pos in enumerate(POLICY_POSITIONS)}
+        self.position_codes = np.array([codes.get(p.position, other) for p in players], dtype=np.intp)
+        limits = [POSITION_LIMITS[pos] for pos in POLICY_POSITIONS] + [np.iinfo(np.int16).max]
+        self.position_limits = np.array(limits, dtype=np.int16)
+        self.player_limits = self.position_limits[self.position_codes]
+
+        positions = np.array([p.position for p in players], dtype=object)
+        self.adp = np.array([p.adp if p.adp is not None else 999.0 for p in players], dtype=np.float64)
+        self.late_round = np.isin(positions, LATE_ROUND_POSITIONS)
+        self.kicker_or_defense = np.isin(positions, ['K', 'DEF'])
+        self.is_qb = positions == 'QB'
+        self.is_chase = np.array([p.name == "JAMARR CHASE" for p in players])
+
+        formatted = format_names(p.name for p in players)
+        self._index_by_name: Dict[str, int] = {}
+        for i, name in enumerate(formatted):
+            self._index_by_name.setdefault(name.upper(), i)
+        self.burrow_index = formatted.index("JOE BURROW") if "JOE BURROW" in formatted else -1
+        self.luan_priority = [self._index_by_name[name] for name in LUAN_PRIORITY_PLAYERS
+                              if name in self._index_by_name]
+
+        # blocked[team, round - 1, player]: excluded or round-restricted for that team
+        self.blocked = np.zeros((len(team_names), total_rounds, len(players)), dtype=bool)
+        if preset:
+            for t, team_name in enumerate(team_names):
+                excluded = np.array([preset.is_player_excluded(team_name, p.name) for p in players])
+                self.blocked[t] |= excluded
+                for r in range(total_rounds):
+                    self.blocked[t, r] |= np.array(
+                        [preset.is_player_restricted(team_name, p.name, r + 1) for p in players])
+
+    def _forced_index(self, team_name: str, pick_num: int) -> int:
+        if not self.preset:
+            return -1
+        forced_player_name = self.preset.get_forced_pick(team_name, pick_num)
+        if not forced_player_name:
+            return -1
+        return self._index_by_name.get(forced_player_name.upper(), -1)
+
+    @staticmethod
+    def _available_ranks(available: np.ndarray, pick_num: int, count: int):
+        """Board position (1-based) of each available player among the first columns
+
+        pick_num - 1 players are gone before this pick, so the first `count`
+        available ones always sit in the first pick_num - 1 + count columns.
+        Returns the availability window and the running rank over it.
+        """
+        width = min(available.shape[1], pick_num - 1 + count)
+        window = available[:, :width]
+        return window, np.cumsum(window, axis=1, dtype=np.int16)
+
+    @staticmethod
+    def _assign(choice: np.ndarray, undecided: np.ndarray, mask: np.ndarray, index):
+        selected = undecided & mask
+        choice[selected] = index[selected] if isinstance(index, np.ndarray) else index
+        undecided &= ~selected
+
+    @staticmethod
+    def _ladder_rank(eligible_count: np.ndarray, draws: np.ndarray, is_early_round: bool) -> np.ndarray:
+        """Which eligible player (0 = best ADP) each draft takes, per the probability ladder"""
+        if is_early_round:
+            # 70% best ADP, 20% second best, 10% third
+            rank = np.select(
+                [draws < 0.7, (draws < 0.9) & (eligible_count > 1), eligible_count > 2],
+                [0, 1, 2], 0)
+        else:
+            # 50% best, 30% second, 15% third, 5% fourth+
+            rank = np.select(
+                [draws < 0.5, (draws < 0.8) & (eligible_count > 1),
+                 (draws < 0.95) & (eligible_count > 2), eligible_count > 3],
+                [0, 1, 2, 3], 0)
+        rank[eligible_count == 1] = 0
+        return rank
+
+    def select(self, pick_num: int, team_index: int, available: np.ndarray,
+               position_counts: np.ndarray, draws: np.ndarray,
+               rng: np.random.Generator) -> np.ndarray:
+        """Pick a player index for every draft in the batch
+
+        Args:
+            pick_num: Overall pick number (1-based), the same in every draft
+            team_index: Index into team_names of the team on the clock
+            available: Bool array (drafts, players), players in ADP order
+            position_counts: Int array (drafts, len(POLICY_POSITIONS) + 1) with the
+                team's rostered players per policy position (last column: other)
+            draws: Uniform draws (drafts,) used by the probability ladder
+            rng: Generator for the few rules that need extra draws
+
+        Returns:
+            Player index per draft, or -1 where the policy has no pick
+        """
+        num_drafts = available.shape[0]
+        choice = np.full(num_drafts, -1, dtype=np.intp)
+        undecided = np.ones(num_drafts, dtype=bool)
+        team_name = self.team_names[team_index]
+        current_round = ((pick_num - 1) // self.num_teams) + 1
+        blocked = self.blocked[team_index, min(current_round, self.total_rounds) - 1]
+
+        # Forced picks first
+        forced = self._forced_index(team_name, pick_num)
+        if forced >= 0:
+            self._assign(choice, undecided, available[:, forced], forced)
+
+        is_early_round = pick_num <= (3 * self.num_teams)
+        if is_early_round:
+            max_adp_reach, consider_range = 5, 8
+        else:
+            max_adp_reach, consider_range = 15, 20
+        window, ranks = self._available_ranks(available, pick_num, max(consider_range, 15))
+        width = window.shape[1]
+
+        # Special logic for Luan in round 3 (pick 21)
+        if team_name.upper() == "LUAN" and pick_num == 21:
+            for index in self.luan_priority:
+                hit = available[:, index] & (rng.random(num_drafts) < 0.9)
+                self._assign(choice, undecided, hit, index)
+            hit = window & (ranks <= 15) & self.is_qb[:width] & (rng.random(window.shape) < 0.7)
+            self._assign(choice, undecided, hit.any(axis=1), hit.argmax(axis=1))
+
+        # Quick path for very early picks
+        if pick_num <= 3:
+            ok = available & ~blocked
+            self._assign(choice, undecided, ok.any(axis=1), ok.argmax(axis=1))
+            return choice
+
+        # Elite players that should never fall
+        adp = self.adp[:width]
+        elite = (self.is_chase[:width] & (pick_num >= 2)) | \
+                ((adp <= 3) & (pick_num >= adp + 1)) | ((adp <= 10) & (pick_num >= adp + 3))
+        hit = window & (ranks <= 5) & elite
+        self._assign(choice, undecided, hit.any(axis=1), hit.argmax(axis=1))
+
+        # Joe Burrow must be taken by pick 21
+        if pick_num >= 21 and self.burrow_index >= 0:
+            self._assign(choice, undecided, available[:, self.burrow_index], self.burrow_index)
+
+        top = window & (ranks <= consider_range)
+        static_ok = ~blocked[:width] & (self.adp[:width] <= pick_num + max_adp_reach)
+        if pick_num < 10 * self.num_teams:
+            static_ok &= ~self.late_round[:width]
+        under_cap = position_counts[:, self.position_codes[:width]] < self.player_limits[:width]
+        eligible = top & static_ok & under_cap
+
+        eligible_count = eligible.sum(axis=1)
+        rank = self._ladder_rank(eligible_count, draws, is_early_round)
+        target = eligible & (np.cumsum(eligible, axis=1, dtype=np.int16) == (rank + 1)[:, None])
+        self._assign(choice, undecided, eligible_count > 0, target.argmax(axis=1))
+
+        # No eligible players: best available non-K/DEF, then anything at all
+        if undecided.any():
+            ok = available & ~blocked
+            if pick_num < 120:
+                ok &= ~self.kicker_or_defense
+            self._assign(choice, undecided, ok.any(axis=1), ok.argmax(axis=1))
+            self._assign(choice, undecided, available.any(axis=1), available.argmax(axis=1))
+
+        return choice
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 from datetime import datetime
@@ -5,6 +6,30 @@ from typing import Dict, List, Optional, Any
 from src.models.player import Player
 from src.models.team import Team
 from src.core.draft_logic import DraftPick
+from src.database import TemplateCatalog
+
+# Version 2 stores the player pool by reference: the players' shared fields
+# live once in templates/universes/<hash>.json and a template keeps only the
+# universe hash, its available player IDs and per-player ADP/rank overrides.
+TEMPLATE_FORMAT_VERSION = 2
+
+# Fields identifying a player universe (hashed)
+UNIVERSE_FIELDS = ('player_id', 'name', 'position', 'team', 'bye_week', 'points_2024',
+                   'points_2025_proj', 'games_2024', 'position_rank_2024',
+                   'position_rank_proj')
+# Fields a template may change (custom ADP, VAR recalculated after each pick);
+# stored as deltas from the universe
+OVERRIDE_FIELDS = ('rank', 'adp', 'var')
+
+
+def universe_hash(all_players: List[Dict[str, Any]]) -> str:
+    """Content hash of the universe fields of a player pool (order independent)"""
+    records = sorted(
+        ([p.get(field) for field in UNIVERSE_FIELDS] for p in all_players),
+        key=lambda record: str(record[0])
+    )
+    payload = json.dumps(records, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
 
 
 class DraftTemplate:
@@ -53,6 +78,100 @@ class TemplateManager:
     def __init__(self, templates_dir: str = "templates"):
         self.templates_dir = templates_dir
         os.makedirs(templates_dir, exist_ok=True)
+        self.universes_dir = os.path.join(templates_dir, "universes")
+        self._universes: Dict[str, List[Dict[str, Any]]] = {}  # hash -> players
+        self.catalog = TemplateCatalog(templates_dir, load=self._read_template_data)
+    
+    def _load_universe(self, universe_id: str) -> List[Dict[str, Any]]:
+        universe = self._universes.get(universe_id)
+        if universe is None:
+            with open(os.path.join(self.universes_dir, f"{universe_id}.json"), 'r') as f:
+                universe = json.load(f)["players"]
+            self._universes[universe_id] = universe
+        return universe
+    
+    def _encode_player_pool(self, player_pool: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace all_players with a universe reference plus ADP/rank overrides"""
+        all_players = player_pool.get("all_players", [])
+        universe_id = universe_hash(all_players)
+        try:
+            universe = self._load_universe(universe_id)
+        except (OSError, ValueError, KeyError):
+            # First template over these players; their current ADP/rank become the baseline
+            universe = [{field: p.get(field) for field in UNIVERSE_FIELDS + OVERRIDE_FIELDS}
+                        for p in all_players]
+            os.makedirs(self.universes_dir, exist_ok=True)
+            path = os.path.join(self.universes_dir, f"{universe_id}.json")
+            with open(path + '.tmp', 'w') as f:
+                json.dump({"hash": universe_id, "players": universe}, f, separators=(',', ':'))
+            os.replace(path + '.tmp', path)
+            self._universes[universe_id] = universe
+        
+        baseline = {p["player_id"]: p for p in universe}
+        overrides = {}
+        for p in all_players:
+            base = baseline[p.get("player_id")]
+            changed = {field: p.get(field) for field in OVERRIDE_FIELDS if p.get(field) != base.get(field)}
+            if changed:
+                overrides[p.get("player_id")] = changed
+        
+        return {
+            "universe": universe_id,
+            "available_player_ids": player_pool.get("available_player_ids", []),
+            "player_overrides": overrides
+        }
+    
+    def _decode_player_pool(self, player_pool: Dict[str, Any]) -> Dict[str, Any]:
+        """Expand a v2 player pool back to available_player_ids + all_players"""
+        overrides = player_pool.get("player_overrides", {})
+        all_players = []
+        for p in self._load_universe(player_pool["universe"]):
+            override = overrides.get(p["player_id"])
+            all_players.append({**p, **override} if override else dict(p))
+        return {
+            "available_player_ids": player_pool.get("available_player_ids", []),
+            "all_players": all_players
+        }
+    
+    def _read_template_data(self, filename: str) -> Dict[str, Any]:
+        """Read a template file (either format) as a v1-style dict"""
+        with open(os.path.join(self.templates_dir, filename), 'r') as f:
+            data = json.load(f)
+        if data.get("format_version", 1) >= 2:
+            data["player_pool"] = self._decode_player_pool(data["player_pool"])
+        data.pop("format_version", None)
+        return data
+    
+    def _write_template(self, filename: str, template: DraftTemplate):
+        """Write a template file in the current format and update its catalog entry"""
+        data = template.to_dict()
+        encoded = dict(data, format_version=TEMPLATE_FORMAT_VERSION,
+                       player_pool=self._encode_player_pool(data["player_pool"]))
+        filepath = os.path.join(self.templates_dir, filename)
+        with open(filepath + '.tmp', 'w') as f:
+            json.dump(encoded, f, indent=2)
+        os.replace(filepath + '.tmp', filepath)
+        self.catalog.index_file(filename, data)
+    
+    def migrate_templates(self) -> int:
+        """Rewrite older template files in the current format
+        
+        Returns the number of templates migrated
+        """
+        migrated = 0
+        for filename in sorted(os.listdir(self.templates_dir)):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.templates_dir, filename), 'r') as f:
+                    data = json.load(f)
+                if data.get("format_version", 1) >= TEMPLATE_FORMAT_VERSION:
+                    continue
+                self._write_template(filename, DraftTemplate.from_dict(data))
+                migrated += 1
+            except Exception as e:
+                print(f"Error migrating template {filename}: {e}")
+        return migrated
     
     def save_template(self, 
                      name: str,
@@ -123,8 +242,9 @@ class TemplateManager:
                     "var": p.var,
                     "games_2024": p.games_2024,
                     "position_rank_2024": p.position_rank_2024,
-                    "position_rank_proj": p.position_rank_proj,
-                    "weekly_stats_2024": p.weekly_stats_2024
+                    "position_rank_proj": p.position_rank_proj
+                    # weekly_stats_2024 is reference data shared by every draft; it's
+                    # re-attached from the loaded players when the template is applied
                 } for p in all_players]
             }
             
@@ -143,10 +263,7 @@ class TemplateManager:
             
             # Write to file
             filename = f"{name.replace(' ', '_').lower()}.json"
-            filepath = os.path.join(self.templates_dir, filename)
-            
-            with open(filepath, 'w') as f:
-                json.dump(template.to_dict(), f, indent=2)
+            self._write_template(filename, template)
             
             return True
             
@@ -157,38 +274,69 @@ class TemplateManager:
     def load_template(self, filename: str) -> Optional[DraftTemplate]:
         """Load a template from file"""
         try:
-            filepath = os.path.join(self.templates_dir, filename)
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            return DraftTemplate.from_dict(data)
+            return DraftTemplate.from_dict(self._read_template_data(filename))
         except Exception as e:
             print(f"Error loading template: {e}")
             return None
     
     def list_templates(self) -> List[Dict[str, str]]:
-        """List all available templates"""
-        templates = []
+        """List all available templates, newest first"""
+        try:
+            self.catalog.sync()
+            rows = self.catalog.query(
+                'SELECT filename, name, created_at FROM templates ORDER BY created_at DESC'
+            )
+            return [dict(row) for row in rows]
+        except Exception as e:
+            print(f"Error listing templates: {e}")
+            return []
+    
+    def list_template_summaries(self) -> List[Dict[str, Any]]:
+        """List templates with the fields the template viewer filters on, newest first
+        
+        Read from the template catalog, so no template file is opened. user_picks
+        holds (round, position, player_id) for each of the user's picks of a player
+        in the template's pool, in draft order.
+        """
         try:
-            for filename in os.listdir(self.templates_dir):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(self.templates_dir, filename)
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                    templates.append({
-                        "filename": filename,
-                        "name": data.get("name", filename),
-                        "created_at": data.get("created_at", "Unknown")
-                    })
+            self.catalog.sync()
+            rows = self.catalog.query(
+                'SELECT t.filename, t.name, t.created_at, t.grade, t.user_team_id, '
+                'p.round, p.position, p.player_id '
+                'FROM templates t LEFT JOIN template_picks p '
+                'ON p.filename = t.filename AND p.team_id = t.user_team_id '
+                'ORDER BY t.created_at DESC, t.filename, p.pick_number'
+            )
         except Exception as e:
             print(f"Error listing templates: {e}")
+            return []
         
-        return sorted(templates, key=lambda x: x["created_at"], reverse=True)
+        summaries = []
+        summary = None
+        for row in rows:
+            if summary is None or summary["filename"] != row["filename"]:
+                summary = {
+                    "filename": row["filename"],
+                    "name": row["name"],
+                    "created_at": row["created_at"],
+                    "grade": row["grade"],
+                    "user_team_id": row["user_team_id"],
+                    "user_pick_count": 0,
+                    "user_picks": []
+                }
+                summaries.append(summary)
+            if row["round"] is not None:
+                summary["user_pick_count"] += 1
+                if row["position"] is not None:
+                    summary["user_picks"].append((row["round"], row["position"], row["player_id"]))
+        return summaries
     
     def delete_template(self, filename: str) -> bool:
         """Delete a template"""
         try:
             filepath = os.path.join(self.templates_dir, filename)
             os.remove(filepath)
+            self.catalog.remove_file(filename)
             return True
         except Exception as e:
             print(f"Error deleting template: {e}")
@@ -204,9 +352,7 @@ class TemplateManager:
             template.notes = notes
             
             # Write back to file
-            filepath = os.path.join(self.templates_dir, filename)
-            with open(filepath, 'w') as f:
-                json.dump(template.to_dict(), f, indent=2)
+            self._write_template(filename, template)
             
             return True
         except Exception as e:
@@ -227,9 +373,7 @@ class TemplateManager:
             template.grade = grade
             
             # Write back to file
-            filepath = os.path.join(self.templates_dir, filename)
-            with open(filepath, 'w') as f:
-                json.dump(template.to_dict(), f, indent=2)
+            self._write_template(filename, template)
             
             return True
         except Exception as e:
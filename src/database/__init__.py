@@ -0,0 +1,3 @@
+from .catalog import DocumentCatalog, TemplateCatalog, DraftHistoryCatalog, SavedDraftCatalog
+
+__all__ = ['DocumentCatalog', 'TemplateCatalog', 'DraftHistoryCatalog', 'SavedDraftCatalog']
@@ -0,0 +1,320 @@
+"""
+SQLite catalogs over directories of saved JSON documents.
+
+Templates, draft history and saved drafts are one JSON file each, and
+listing them used to open and parse every file. A catalog keeps the listing
+fields (plus picks and rosters) in indexed tables in a sidecar database,
+``.catalog.sqlite3``, in the same directory. The JSON files remain the
+source of truth: sync() stats the directory and re-indexes only files whose
+size or mtime changed, so files copied in or deleted by hand are picked up
+too.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Iterable, List, Optional
+
+
+class DocumentCatalog:
+    """Base catalog; subclasses define SCHEMA, TABLES and index_document"""
+
+    FILENAME = '.catalog.sqlite3'
+    SCHEMA_VERSION = 1
+    SCHEMA = ""
+    TABLES: tuple = ()  # Tables with a filename column, cleared when a file is re-indexed
+
+    def __init__(self, directory: str, suffix: str = '.json',
+                 load: Optional[Callable[[str], Any]] = None,
+                 extra_paths: Optional[Callable[[str], List[str]]] = None):
+        self.directory = directory
+        self.suffix = suffix
+        self._load = load or self._load_json
+        self._extra_paths = extra_paths
+        self._lock = threading.RLock()
+        self.conn = self._connect(os.path.join(directory, self.FILENAME))
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        """Open the catalog, rebuilding it if it's from another schema version"""
+        try:
+            conn = sqlite3.connect(path, check_same_thread=False)
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                for table in ('files',) + tuple(self.TABLES):
+                    conn.execute(f'DROP TABLE IF EXISTS {table}')
+            self._create_schema(conn)
+            return conn
+        except sqlite3.Error as e:
+            # Still works, just isn't kept between runs
+            print(f"Error opening catalog {path}: {e}; using an in-memory catalog")
+            conn = sqlite3.connect(':memory:', check_same_thread=False)
+            self._create_schema(conn)
+            return conn
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        conn.executescript(
+            'CREATE TABLE IF NOT EXISTS files (filename TEXT PRIMARY KEY, stamp TEXT NOT NULL);'
+            + self.SCHEMA
+        )
+        conn.execute(f'PRAGMA user_version = {int(self.SCHEMA_VERSION)}')
+        conn.commit()
+
+    def _load_json(self, filename: str) -> Any:
+        with open(os.path.join(self.directory, filename), 'r') as f:
+            return json.load(f)
+
+    def _stamp(self, filename: str) -> str:
+        """Sizes and mtimes of the document (and any files it depends on)"""
+        paths = [os.path.join(self.directory, filename)]
+        if self._extra_paths:
+            paths.extend(self._extra_paths(filename))
+        stamp = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                stamp.append([stat.st_size, stat.st_mtime_ns])
+            except OSError:
+                stamp.append(None)
+        return json.dumps(stamp)
+
+    def index_document(self, conn: sqlite3.Connection, filename: str, data: Any):
+        """Insert the rows for one parsed document"""
+        raise NotImplementedError
+
+    def sync(self):
+        """Re-index new and changed files and drop rows for deleted ones"""
+        with self._lock:
+            try:
+                filenames = [f for f in os.listdir(self.directory) if f.endswith(self.suffix)]
+            except OSError as e:
+                print(f"Error listing {self.directory}: {e}")
+                return
+
+            known = dict(self.conn.execute('SELECT filename, stamp FROM files'))
+            for filename in filenames:
+                stamp = self._stamp(filename)
+                if known.pop(filename, None) != stamp:
+                    self._index(filename, None, stamp)
+            for filename in known:
+                self._delete_rows(filename)
+            self.conn.commit()
+
+    def index_file(self, filename: str, data: Any = None):
+        """Index a file that was just written (data saves re-reading it)"""
+        with self._lock:
+            self._index(filename, data, self._stamp(filename))
+            self.conn.commit()
+
+    def remove_file(self, filename: str):
+        with self._lock:
+            self._delete_rows(filename)
+            self.conn.commit()
+
+    def query(self, sql: str, params: Iterable = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            return cursor.execute(sql, tuple(params)).fetchall()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def _delete_rows(self, filename: str):
+        for table in ('files',) + tuple(self.TABLES):
+            self.conn.execute(f'DELETE FROM {table} WHERE filename = ?', (filename,))
+
+    def _index(self, filename: str, data: Any, stamp: str):
+        self._delete_rows(filename)
+        # Record the stamp even for unreadable files so they aren't re-parsed every sync
+        self.conn.execute('INSERT INTO files (filename, stamp) VALUES (?, ?)', (filename, stamp))
+        try:
+            if data is None:
+                data = self._load(filename)
+            if data:
+                self.index_document(self.conn, filename, data)
+        except Exception as e:
+            print(f"Error indexing {filename}: {e}")
+            for table in self.TABLES:
+                self.conn.execute(f'DELETE FROM {table} WHERE filename = ?', (filename,))
+
+
+class TemplateCatalog(DocumentCatalog):
+    """Catalog of the templates directory"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS templates (
+            filename TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            notes TEXT,
+            grade INTEGER,
+            user_team_id INTEGER,
+            num_teams INTEGER,
+            total_picks INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS templates_created_at ON templates (created_at);
+        CREATE TABLE IF NOT EXISTS template_picks (
+            filename TEXT NOT NULL,
+            pick_number INTEGER NOT NULL,
+            round INTEGER,
+            pick_in_round INTEGER,
+            team_id INTEGER,
+            player_id TEXT,
+            name TEXT,
+            position TEXT
+        );
+        CREATE INDEX IF NOT EXISTS template_picks_team ON template_picks (filename, team_id, pick_number);
+        CREATE INDEX IF NOT EXISTS template_picks_player ON template_picks (player_id);
+        CREATE TABLE IF NOT EXISTS template_rosters (
+            filename TEXT NOT NULL,
+            team_id INTEGER NOT NULL,
+            team_name TEXT,
+            position TEXT NOT NULL,
+            slot INTEGER NOT NULL,
+            player_id TEXT
+        );
+        CREATE INDEX IF NOT EXISTS template_rosters_team ON template_rosters (filename, team_id);
+    """
+    TABLES = ('templates', 'template_picks', 'template_rosters')
+
+    def index_document(self, conn, filename, data):
+        players = {p.get('player_id'): p for p in data.get('player_pool', {}).get('all_players', [])}
+        picks = data.get('draft_results', [])
+        conn.execute(
+            'INSERT INTO templates VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (filename, data.get('name', filename), data.get('created_at', 'Unknown'),
+             data.get('notes', ''), data.get('grade'),
+             data.get('user_settings', {}).get('user_team_id'),
+             data.get('draft_config', {}).get('num_teams'), len(picks))
+        )
+        conn.executemany(
+            'INSERT INTO template_picks VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [(filename, pick['pick_number'], pick.get('round'), pick.get('pick_in_round'),
+              pick.get('team_id'), pick.get('player_id'),
+              players.get(pick.get('player_id'), {}).get('name'),
+              players.get(pick.get('player_id'), {}).get('position'))
+             for pick in picks]
+        )
+        conn.executemany(
+            'INSERT INTO template_rosters VALUES (?, ?, ?, ?, ?, ?)',
+            [(filename, int(team_id), team.get('name'), position, slot, player_id)
+             for team_id, team in data.get('team_states', {}).items()
+             for position, player_ids in team.get('roster', {}).items()
+             for slot, player_id in enumerate(player_ids)]
+        )
+
+
+class DraftHistoryCatalog(DocumentCatalog):
+    """Catalog of the draft history directory (snapshots plus their journals)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS drafts (
+            filename TEXT PRIMARY KEY,
+            id TEXT,
+            name TEXT NOT NULL,
+            created TEXT,
+            modified TEXT,
+            user_team_id INTEGER,
+            user_team TEXT NOT NULL,
+            manual_mode INTEGER NOT NULL,
+            picks_count INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS draft_picks (
+            filename TEXT NOT NULL,
+            pick_number INTEGER NOT NULL,
+            round INTEGER,
+            team_id INTEGER,
+            player_id TEXT,
+            name TEXT,
+            position TEXT
+        );
+        CREATE INDEX IF NOT EXISTS draft_picks_team ON draft_picks (filename, team_id, pick_number);
+    """
+    TABLES = ('drafts', 'draft_picks')
+
+    def index_document(self, conn, filename, data):
+        user_team_id = data.get("user_team_id")
+        user_team_name = "No Team"
+        if user_team_id is not None and "teams" in data:
+            team_info = data["teams"].get(str(user_team_id), {})
+            user_team_name = team_info.get("name", f"Team {user_team_id}")
+        picks = data.get("picks", [])
+        conn.execute(
+            'INSERT INTO drafts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (filename, data.get("id"), data.get("name", "Untitled Draft"), data.get("created"),
+             data.get("modified"), user_team_id, user_team_name,
+             bool(data.get("manual_mode", False)), len(picks))
+        )
+        conn.executemany(
+            'INSERT INTO draft_picks VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(filename, pick["pick_number"], pick.get("round"), pick.get("team_id"),
+              pick["player"].get("player_id"), pick["player"].get("name"),
+              pick["player"].get("position"))
+             for pick in picks]
+        )
+
+
+class SavedDraftCatalog(DocumentCatalog):
+    """Catalog of the saved (completed) mock drafts directory"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS saved_drafts (
+            filename TEXT PRIMARY KEY,
+            timestamp TEXT,
+            user_team TEXT,
+            total_picks INTEGER NOT NULL,
+            manual_mode INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS saved_draft_picks (
+            filename TEXT NOT NULL,
+            pick_number INTEGER NOT NULL,
+            round INTEGER,
+            team_id TEXT,
+            player_id TEXT,
+            name TEXT,
+            position TEXT
+        );
+        CREATE INDEX IF NOT EXISTS saved_draft_picks_team ON saved_draft_picks (filename, team_id, pick_number);
+        CREATE TABLE IF NOT EXISTS saved_draft_rosters (
+            filename TEXT NOT NULL,
+            team_id TEXT NOT NULL,
+            team_name TEXT,
+            position TEXT NOT NULL,
+            slot INTEGER NOT NULL,
+            player_id TEXT,
+            name TEXT
+        );
+        CREATE INDEX IF NOT EXISTS saved_draft_rosters_team ON saved_draft_rosters (filename, team_id);
+    """
+    TABLES = ('saved_drafts', 'saved_draft_picks', 'saved_draft_rosters')
+
+    def index_document(self, conn, filename, data):
+        teams = data.get("teams", [{}])
+        user_team = teams[0].get("name") if data.get("user_team_id") else "Observer"
+        conn.execute(
+            'INSERT INTO saved_drafts VALUES (?, ?, ?, ?, ?)',
+            (filename, data.get("timestamp"), user_team, data.get("total_picks", 0),
+             bool(data.get("manual_mode", False)))
+        )
+        conn.executemany(
+            'INSERT INTO saved_draft_picks VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(filename, pick["pick_number"], pick.get("round"), _text(pick.get("team_id")),
+              pick["player"].get("player_id"), pick["player"].get("name"),
+              pick["player"].get("position"))
+             for pick in data.get("picks", [])]
+        )
+        conn.executemany(
+            'INSERT INTO saved_draft_rosters VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(filename, _text(team.get("id")), team.get("name"), position, slot,
+              player.get("player_id"), player.get("name"))
+             for team in teams
+             for position, players in team.get("roster", {}).items()
+             for slot, player in enumerate(players)]
+        )
+
+
+def _text(value) -> Optional[str]:
+    """Team ids are ints or strings depending on the caller; store them as text"""
+    return None if value is None else str(value)
@@ -1,4 +1,5 @@
 from .player import Player
 from .team import Team
+from .availability_index import AvailabilityIndex
 
-__all__ = ['Player', 'Team']
\ No newline at end of file
+__all__ = ['Player', 'Team', 'AvailabilityIndex']
\ No newline at end of file
@@ -0,0 +1,181 @@
+from itertools import compress, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+from .player import Player
+
+
+def adp_sort_key(player: Player) -> float:
+    """Draft order used for available players throughout the app"""
+    return player.adp if player.adp else 999
+
+
+class AvailabilityIndex:
+    """ADP-ordered player pool with O(1) availability updates
+
+    Every player in the universe gets a fixed slot in ADP order. Availability
+    is a byte flag per slot plus a bitmask per position, and a player -> slot
+    map makes membership, drafting and undoing a draft constant time.
+    Iterating and slicing run through itertools.compress over the flags, so
+    "top N" stops after N players instead of copying the whole pool.
+
+    Behaves like the ADP-sorted list it replaces: iteration, len(), `in`,
+    indexing/slicing, remove() and sort(key=...) all work the same way.
+    """
+
+    def __init__(self, players: Iterable[Player] = (),
+                 key: Callable[[Player], float] = adp_sort_key,
+                 available: Optional[Iterable[Player]] = None):
+        self._key = key
+        self._build(list(players), available)
+
+    def _build(self, players: List[Player], available: Optional[Iterable[Player]] = None):
+        self._players: List[Player] = sorted(players, key=self._key)
+        self._slots: Dict[Player, int] = {}
+        self._position_masks: Dict[str, int] = {}
+        for slot, player in enumerate(self._players):
+            self._slots.setdefault(player, slot)
+
+        if available is None:
+            slots = range(len(self._players))
+        else:
+            slots = (self._slots[p] for p in available if p in self._slots)
+
+        self._flags = bytearray(len(self._players))
+        self._count = 0
+        for slot in slots:
+            self._set(slot)
+
+    def _set(self, slot: int):
+        if self._flags[slot]:
+            return
+        self._flags[slot] = 1
+        self._count += 1
+        position = self._players[slot].position
+        self._position_masks[position] = self._position_masks.get(position, 0) | (1 << slot)
+
+    def _clear(self, slot: int) -> bool:
+        if not self._flags[slot]:
+            return False
+        self._flags[slot] = 0
+        self._count -= 1
+        position = self._players[slot].position
+        self._position_masks[position] &= ~(1 << slot)
+        return True
+
+    @staticmethod
+    def _iter_slots(mask: int) -> Iterator[int]:
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    # List-compatible interface
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator[Player]:
+        return compress(self._players, self._flags)
+
+    def __contains__(self, player) -> bool:
+        slot = self._slots.get(player)
+        return slot is not None and bool(self._flags[slot])
+
+    def __getitem__(self, item: Union[int, slice]):
+        if isinstance(item, slice):
+            if item.start is None and item.step is None and item.stop is not None and item.stop >= 0:
+                return self.top(item.stop)
+            return list(self)[item]
+        if item < 0:
+            item += self._count
+        if not 0 <= item < self._count:
+            raise IndexError("available player index out of range")
+        return next(islice(iter(self), item, None))
+
+    def __repr__(self) -> str:
+        return f"AvailabilityIndex({self._count}/{len(self._players)} available)"
+
+    def remove(self, player: Player):
+        """Mark a player as drafted; raises ValueError if not available (like list.remove)"""
+        if not self.discard(player):
+            raise ValueError(f"{player!r} is not available")
+
+    def discard(self, player: Player) -> bool:
+        """Mark a player as drafted. Returns False if the player wasn't available"""
+        slot = self._slots.get(player)
+        return slot is not None and self._clear(slot)
+
+    def add(self, player: Player):
+        """Make a player available again (undo a pick); unknown players join the universe"""
+        slot = self._slots.get(player)
+        if slot is None:
+            self._build(self._players + [player], list(self) + [player])
+            return
+        self._set(slot)
+
+    append = add
+
+    def index(self, player: Player) -> int:
+        """Position of an available player in ADP order"""
+        slot = self._slots.get(player)
+        if slot is None or not self._flags[slot]:
+            raise ValueError(f"{player!r} is not available")
+        return self._flags.count(1, 0, slot)
+
+    def sort(self, key: Optional[Callable[[Player], float]] = None, reverse: bool = False):
+        """Re-rank the universe, e.g. after custom ADP changes"""
+        if reverse:
+            raise ValueError("AvailabilityIndex is always kept in ascending order")
+        if key is not None:
+            self._key = key
+        self.reorder()
+
+    # Index-specific helpers
+
+    def reorder(self):
+        """Rebuild slots after player ADP values changed, keeping availability"""
+        self._build(self._players, list(self))
+
+    def top(self, count: int, position: Optional[str] = None) -> List[Player]:
+        """First `count` available players in ADP order, optionally at one position"""
+        if position is None:
+            return list(islice(iter(self), count))
+        players = self._players
+        result = []
+        for slot in self._iter_slots(self._position_masks.get(position, 0)):
+            if len(result) >= count:
+                break
+            result.append(players[slot])
+        return result
+
+    def by_position(self, position: str) -> List[Player]:
+        """All available players at a position in ADP order"""
+        players = self._players
+        return [players[slot] for slot in self._iter_slots(self._position_masks.get(position, 0))]
+
+    def position_count(self, position: Optional[str] = None) -> int:
+        """Number of available players, optionally at one position"""
+        if position is None:
+            return self._count
+        return bin(self._position_masks.get(position, 0)).count("1")
+
+    def reset(self):
+        """Make every player in the universe available again"""
+        self._build(self._players)
+
+    def copy(self) -> 'AvailabilityIndex':
+        clone = AvailabilityIndex.__new__(AvailabilityIndex)
+        clone._key = self._key
+        clone._players = self._players
+        clone._slots = self._slots
+        clone._flags = bytearray(self._flags)
+        clone._count = self._count
+        clone._position_masks = dict(self._position_masks)
+        return clone
+
+    @property
+    def all_players(self) -> List[Player]:
+        """Every player in the universe (drafted or not) in ADP order"""
+        return list(self._players)
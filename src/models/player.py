@@ -1,36 +1,315 @@
-from dataclasses import dataclass
-from typing import Optional
+import sys
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+# Sentinels for the integer columns of a WeeklyStatsBlock
+_MISSING = -(2 ** 31)
+_NONE = _MISSING + 1
+
+
+class WeeklyStatsBlock:
+    """Columnar store for weekly stat lines shared by many players
+
+    Each stat line ({'year', 'week', 'team', 'opponent', 'stats': {...}}) is a
+    row. year/week/team/opponent are int columns (teams and opponents are ids
+    into a shared string table) and the stats dicts are stored sparsely as
+    (stat id, value) pairs with per-row offsets, so a week only pays for the
+    stats actually recorded. Players hold a WeeklyStats view (a row range)
+    into the block instead of their own list of dicts.
+
+    Rows are never freed, so stats appended under a key (the player id) are
+    remembered: appending the same stats for that key again reuses the rows.
+    """
+
+    _ROW_COLUMNS = ('years', 'weeks', 'teams', 'opponents')
+
+    def __init__(self, capacity: int = 1024):
+        self.stat_keys: List[str] = []
+        self._key_index: Dict[str, int] = {}
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        # row -> (extra fields, how 'stats' is stored, stats that aren't numeric)
+        self._extras: Dict[int, Tuple[dict, str, Any]] = {}
+        # key -> (start, stop) of the rows last appended under it
+        self._rows_by_key: Dict[Any, Tuple[int, int]] = {}
+        self.size = 0
+        self.years = np.full(capacity, _MISSING, dtype=np.int32)
+        self.weeks = np.full(capacity, _MISSING, dtype=np.int32)
+        self.teams = np.full(capacity, _MISSING, dtype=np.int32)
+        self.opponents = np.full(capacity, _MISSING, dtype=np.int32)
+        self.row_offsets = np.zeros(capacity + 1, dtype=np.int64)
+        self.stat_ids = np.zeros(capacity * 8, dtype=np.int16)
+        self.stat_values = np.zeros(capacity * 8, dtype=np.float64)
+
+    def __getstate__(self):
+        # Don't ship unused capacity when pickled (e.g. to simulator workers)
+        state = dict(self.__dict__)
+        used = int(self.row_offsets[self.size])
+        for name in self._ROW_COLUMNS:
+            state[name] = state[name][:self.size].copy()
+        state['row_offsets'] = self.row_offsets[:self.size + 1].copy()
+        state['stat_ids'] = self.stat_ids[:used].copy()
+        state['stat_values'] = self.stat_values[:used].copy()
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'WeeklyStatsBlock':
+        """Rebuild a block from __getstate__ output (arrays may be read-only memmaps)"""
+        block = cls.__new__(cls)
+        block._rows_by_key = {}
+        block.__dict__.update(state)
+        return block
+
+    @staticmethod
+    def _grow(array: np.ndarray, needed: int, fill=0) -> np.ndarray:
+        if needed <= len(array):
+            return array
+        grown = np.full(max(len(array) * 2, needed, 16), fill, dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+
+    def _key_id(self, key: str) -> int:
+        index = self._key_index.get(key)
+        if index is None:
+            index = len(self.stat_keys)
+            self.stat_keys.append(key)
+            self._key_index[key] = index
+        return index
+
+    def _string_id(self, value) -> int:
+        if value is None:
+            return _NONE
+        index = self._string_ids.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._strings.append(value)
+            self._string_ids[value] = index
+        return index
+
+    def append(self, weekly: Iterable[dict], key=None) -> 'WeeklyStats':
+        """Pack a player's list of weekly stat dicts into the block
+
+        With a key, stats equal to the ones last appended under that key
+        return the existing rows instead of adding new ones, so loading the
+        same players again (a template, a rebuilt player list) doesn't grow
+        the block.
+        """
+        weekly = list(weekly)
+        if key is not None:
+            rows = self._rows_by_key.get(key)
+            if rows is not None and rows[1] - rows[0] == len(weekly):
+                existing = WeeklyStats(self, *rows)
+                if existing.to_list() == weekly:
+                    return existing
+        start = self.size
+        stop = start + len(weekly)
+        for name in self._ROW_COLUMNS:
+            setattr(self, name, self._grow(getattr(self, name), stop, _MISSING))
+        self.row_offsets = self._grow(self.row_offsets, stop + 1)
+
+        ids: List[int] = []
+        values: List[float] = []
+        for row, entry in enumerate(weekly, start):
+            # Anything that doesn't fit a column is kept as-is in _extras
+            fields = {}
+            for name, value in entry.items():
+                if name in ('year', 'week') and (value is None or type(value) is int):
+                    getattr(self, name + 's')[row] = _NONE if value is None else value
+                elif name in ('team', 'opponent') and (value is None or isinstance(value, str)):
+                    getattr(self, name + 's')[row] = self._string_id(value)
+                elif name != 'stats':
+                    fields[name] = value
+
+            if 'stats' not in entry:
+                self._extras[row] = (fields, 'missing', None)
+            elif not isinstance(entry['stats'], dict):
+                self._extras[row] = (fields, 'raw', entry['stats'])
+            else:
+                other_stats = {}
+                for name, value in entry['stats'].items():
+                    if type(value) in (int, float) and value == value:
+                        ids.append(self._key_id(name))
+                        values.append(value)
+                    else:
+                        other_stats[name] = value
+                if fields or other_stats:
+                    self._extras[row] = (fields, 'dict', other_stats)
+            self.row_offsets[row + 1] = self.row_offsets[start] + len(ids)
+
+        used = int(self.row_offsets[start])
+        if ids:
+            self.stat_ids = self._grow(self.stat_ids, used + len(ids))
+            self.stat_values = self._grow(self.stat_values, used + len(ids))
+            self.stat_ids[used:used + len(ids)] = ids
+            self.stat_values[used:used + len(ids)] = values
+        self.size = stop
+        if key is not None:
+            self._rows_by_key[key] = (start, stop)
+        return WeeklyStats(self, start, stop)
+
+    def row(self, index: int) -> dict:
+        """Rebuild the original stat line dict for one row"""
+        entry = {}
+        for key in ('year', 'week'):
+            value = int(getattr(self, key + 's')[index])
+            if value != _MISSING:
+                entry[key] = None if value == _NONE else value
+        for key in ('team', 'opponent'):
+            value = int(getattr(self, key + 's')[index])
+            if value != _MISSING:
+                entry[key] = None if value == _NONE else self._strings[value]
+
+        fields, kind, other_stats = self._extras.get(index, (None, 'dict', None))
+        if kind == 'dict':
+            begin, end = self.row_offsets[index], self.row_offsets[index + 1]
+            keys = self.stat_keys
+            entry['stats'] = {keys[key_id]: value for key_id, value in
+                              zip(self.stat_ids[begin:end].tolist(), self.stat_values[begin:end].tolist())}
+            if other_stats:
+                entry['stats'].update(other_stats)
+        elif kind == 'raw':
+            entry['stats'] = other_stats
+        if fields:
+            entry.update(fields)
+        return entry
+
+    def stat_column(self, key: str, start: int, stop: int) -> np.ndarray:
+        """Values of one stat for rows start..stop, NaN where it wasn't recorded"""
+        column = np.full(stop - start, np.nan)
+        key_id = self._key_index.get(key)
+        if key_id is None or stop <= start:
+            return column
+        begin, end = self.row_offsets[start], self.row_offsets[stop]
+        hits = np.flatnonzero(self.stat_ids[begin:end] == key_id) + begin
+        rows = np.searchsorted(self.row_offsets[start:stop + 1], hits, side='right') - 1
+        column[rows] = self.stat_values[hits]
+        return column
+
+
+class WeeklyStats(Sequence):
+    """Read-only, list-like view of one player's rows in a WeeklyStatsBlock
+
+    Indexing and iteration return the same dicts the JSON stats files hold,
+    built on demand. stat() and the weeks property expose the columns
+    directly for vectorized use.
+    """
+
+    __slots__ = ('block', 'start', 'stop')
+
+    def __init__(self, block: WeeklyStatsBlock, start: int, stop: int):
+        self.block = block
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self.block.row(self.start + i) for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("weekly stats index out of range")
+        return self.block.row(self.start + item)
+
+    def __iter__(self):
+        for index in range(self.start, self.stop):
+            yield self.block.row(index)
+
+    def __eq__(self, other):
+        if isinstance(other, (WeeklyStats, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"WeeklyStats({len(self)} weeks)"
+
+    def to_list(self) -> List[dict]:
+        return list(self)
+
+    @property
+    def weeks(self) -> np.ndarray:
+        """Week number of each row (negative where unknown)"""
+        return self.block.weeks[self.start:self.stop]
+
+    def stat(self, key: str) -> np.ndarray:
+        """One stat for every row, NaN where it wasn't recorded"""
+        return self.block.stat_column(key, self.start, self.stop)
+
+
+# Block shared by every player's 2024 weekly stats
+WEEKLY_STATS_2024 = WeeklyStatsBlock()
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
 
 
-@dataclass
 class Player:
-    name: str
-    position: str
-    rank: int
-    adp: float
-    team: Optional[str] = None
-    bye_week: Optional[int] = None
-    player_id: Optional[str] = None
-    games_2024: Optional[int] = None
-    points_2024: Optional[float] = None
-    points_2025_proj: Optional[float] = None
-    position_rank_2024: Optional[int] = None
-    position_rank_proj: Optional[int] = None
-    var: Optional[float] = None  # Value Above Replacement
-    weekly_stats_2024: Optional[list] = None  # Weekly stats from 2024 season
-    
+    """A draftable player
+
+    Uses __slots__ rather than a per-instance __dict__, and keeps
+    weekly_stats_2024 in the shared columnar WEEKLY_STATS_2024 block; lists of
+    weekly dicts assigned to it are packed on the way in.
+    """
+
+    __slots__ = ('name', 'position', 'rank', 'adp', 'team', 'bye_week', 'player_id',
+                 'games_2024', 'points_2024', 'points_2025_proj', 'position_rank_2024',
+                 'position_rank_proj', 'var', '_weekly_stats')
+
+    def __init__(self, name: str, position: str, rank: int, adp: float,
+                 team: Optional[str] = None,
+                 bye_week: Optional[int] = None,
+                 player_id: Optional[str] = None,
+                 games_2024: Optional[int] = None,
+                 points_2024: Optional[float] = None,
+                 points_2025_proj: Optional[float] = None,
+                 position_rank_2024: Optional[int] = None,
+                 position_rank_proj: Optional[int] = None,
+                 var: Optional[float] = None,  # Value Above Replacement
+                 weekly_stats_2024: Optional[list] = None):  # Weekly stats from 2024 season
+        self.name = name
+        self.position = _intern(position)
+        self.rank = rank
+        self.adp = adp
+        self.team = _intern(team)
+        self.bye_week = bye_week
+        self.player_id = player_id
+        self.games_2024 = games_2024
+        self.points_2024 = points_2024
+        self.points_2025_proj = points_2025_proj
+        self.position_rank_2024 = position_rank_2024
+        self.position_rank_proj = position_rank_proj
+        self.var = var
+        self.weekly_stats_2024 = weekly_stats_2024
+
+    @property
+    def weekly_stats_2024(self) -> Optional[WeeklyStats]:
+        return self._weekly_stats
+
+    @weekly_stats_2024.setter
+    def weekly_stats_2024(self, value):
+        if value is None or isinstance(value, WeeklyStats):
+            self._weekly_stats = value
+        else:
+            self._weekly_stats = WEEKLY_STATS_2024.append(value, key=self.player_id)
+
     def __str__(self):
         return f"{self.rank}. {self.name} ({self.position})"
-    
+
     def __repr__(self):
         return f"Player(name='{self.name}', position='{self.position}', rank={self.rank})"
-    
+
     def __hash__(self):
         # Use player_id if available, otherwise use name and position
         if self.player_id:
             return hash(self.player_id)
         return hash((self.name, self.position))
-    
+
     def __eq__(self, other):
         if not isinstance(other, Player):
             return False
@@ -38,16 +317,16 @@ class Player:
         if self.player_id and other.player_id:
             return self.player_id == other.player_id
         return self.name == other.name and self.position == other.position
-    
+
     @property
     def formatted_name(self):
         """Get the formatted version of the player's name"""
         # Import here to avoid circular import
         from ..utils.player_extensions import format_name
         return format_name(self.name)
-    
+
     def format_name(self):
         """Get the formatted version of the player's name (method version)"""
         # Import here to avoid circular import
         from ..utils.player_extensions import format_name
-        return format_name(self.name)
\ No newline at end of file
+        return format_name(self.name)
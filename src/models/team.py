@@ -1,70 +1,98 @@
-from typing import Dict, List
+import copy
+from typing import Dict, List, Optional
 from .player import Player
 
 
+FLEX_POSITIONS = ("RB", "WR", "TE")
+# Positions always present in position_counts (others are added as they're rostered)
+COUNTED_POSITIONS = ("QB", "RB", "WR", "TE", "DEF", "K")
+
+
 class Team:
     def __init__(self, team_id: int, name: str, roster_spots: Dict[str, int]):
         self.id = team_id
         self.name = name
         self.roster_spots = roster_spots
+        self.total_spots = sum(roster_spots.values())
         self.roster = {pos: [] for pos in roster_spots}
-        
-    def can_draft_player(self, player: Player) -> bool:
+
+    @property
+    def roster(self) -> Dict[str, List[Player]]:
+        return self._roster
+
+    @roster.setter
+    def roster(self, roster: Dict[str, List[Player]]):
+        self.set_roster(roster)
+
+    def set_roster(self, roster: Dict[str, List[Player]]):
+        """Replace the roster (slot -> players) and recount it"""
+        self._roster = roster
+        # Players rostered by actual position, flex slots holding flex-eligible
+        # players, and total players; kept current by add_player/remove_player
+        self.position_counts = {pos: 0 for pos in COUNTED_POSITIONS}
+        self.flex_filled = 0
+        self.filled = 0
+        for slot, players in roster.items():
+            for player in players:
+                self._count(slot, player, 1)
+
+    def _count(self, slot: str, player: Player, delta: int):
+        self.position_counts[player.position] = self.position_counts.get(player.position, 0) + delta
+        if slot == "flex" and player.position in FLEX_POSITIONS:
+            self.flex_filled += delta
+        self.filled += delta
+
+    def _open_slot(self, player: Player) -> Optional[str]:
+        """Roster slot the player would be added to, or None if there's no room"""
         pos = player.position.lower()
-        
+
         # Check starting position slots
-        if pos in ["qb", "te"]:
-            if len(self.roster[pos]) < self.roster_spots[pos]:
-                return True
-        elif pos in ["rb", "wr"]:
-            if len(self.roster[pos]) < self.roster_spots[pos]:
-                return True
-        
+        if pos in ["qb", "te", "rb", "wr"]:
+            if len(self._roster[pos]) < self.roster_spots[pos]:
+                return pos
+
         # Check flex eligibility
-        if player.position in ["RB", "WR", "TE"]:
-            flex_filled = sum(1 for p in self.roster["flex"] 
-                            if p.position in ["RB", "WR", "TE"])
-            if flex_filled < self.roster_spots["flex"]:
-                return True
-        
+        if player.position in FLEX_POSITIONS:
+            if self.flex_filled < self.roster_spots["flex"]:
+                return "flex"
+
         # Check bench
-        if len(self.roster["bn"]) < self.roster_spots["bn"]:
-            return True
-        
-        return False
-    
+        if len(self._roster["bn"]) < self.roster_spots["bn"]:
+            return "bn"
+
+        return None
+
+    def can_draft_player(self, player: Player) -> bool:
+        return self._open_slot(player) is not None
+
     def add_player(self, player: Player) -> bool:
-        pos = player.position.lower()
-        
-        # Try to fill starting position first
-        if pos in ["qb", "te"]:
-            if len(self.roster[pos]) < self.roster_spots[pos]:
-                self.roster[pos].append(player)
-                return True
-        elif pos in ["rb", "wr"]:
-            if len(self.roster[pos]) < self.roster_spots[pos]:
-                self.roster[pos].append(player)
-                return True
-        
-        # Try flex
-        if player.position in ["RB", "WR", "TE"]:
-            flex_filled = sum(1 for p in self.roster["flex"] 
-                            if p.position in ["RB", "WR", "TE"])
-            if flex_filled < self.roster_spots["flex"]:
-                self.roster["flex"].append(player)
-                return True
-        
-        # Add to bench
-        if len(self.roster["bn"]) < self.roster_spots["bn"]:
-            self.roster["bn"].append(player)
-            return True
-        
+        # Fill starting position first, then flex, then bench
+        slot = self._open_slot(player)
+        if slot is None:
+            return False
+        self._roster[slot].append(player)
+        self._count(slot, player, 1)
+        return True
+
+    def remove_player(self, player: Player) -> bool:
+        """Remove a player from whichever slot holds them"""
+        for slot, players in self._roster.items():
+            for i, rostered in enumerate(players):
+                if rostered is player:
+                    del players[i]
+                    self._count(slot, player, -1)
+                    return True
         return False
-    
+
+    def copy(self) -> 'Team':
+        """Copy with its own roster lists and counters (players are shared)"""
+        clone = copy.copy(self)
+        clone._roster = {slot: list(players) for slot, players in self._roster.items()}
+        clone.position_counts = dict(self.position_counts)
+        return clone
+
     def get_roster_summary(self) -> Dict[str, List[Player]]:
         return self.roster
-    
+
     def is_roster_full(self) -> bool:
-        total_spots = sum(self.roster_spots.values())
-        total_filled = sum(len(players) for players in self.roster.values())
-        return total_filled >= total_spots
\ No newline at end of file
+        return self.filled >= self.total_spots
@@ -1,20 +1,36 @@
-"""Draft history manager for saving and loading ongoing drafts"""
+"""Draft history manager for saving and loading ongoing drafts
+
+Each draft is a JSON snapshot ({draft_id}.json) plus an append-only
+journal of picks and reversions ({draft_id}.journal.jsonl) made since the
+snapshot was written. Loading replays the journal over the snapshot; once
+the journal grows past COMPACT_AFTER entries it is folded back into the
+snapshot.
+"""
 import json
 import os
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from ..core import DraftPick
 from ..models import Player
+from ..database import DraftHistoryCatalog
 
 
 class DraftHistoryManager:
     """Manages saving and loading draft history for ongoing drafts"""
     
+    COMPACT_AFTER = 64  # Journal entries before folding them into the snapshot
+    
     def __init__(self, history_dir: str = "data/draft_history"):
         self.history_dir = history_dir
         self._ensure_history_directory()
         self.current_draft_id = None
         self.current_draft_name = None
+        self._journal_lengths: Dict[str, int] = {}
+        self.catalog = DraftHistoryCatalog(
+            history_dir,
+            load=lambda filename: self._load_draft_data(filename[:-len('.json')]),
+            extra_paths=lambda filename: [self._journal_path(filename[:-len('.json')])]
+        )
     
     def _ensure_history_directory(self):
         """Ensure the history directory exists"""
@@ -74,8 +90,7 @@ class DraftHistoryManager:
         if not self.current_draft_id:
             self.start_new_draft()
         
-        draft_data = self._load_draft_data(self.current_draft_id)
-        if not draft_data:
+        if not os.path.exists(self._draft_path(self.current_draft_id)):
             return
         
         # Serialize the pick
@@ -96,37 +111,28 @@ class DraftHistoryManager:
             "timestamp": datetime.now().isoformat()
         }
         
-        # Update picks list (overwrite if pick already exists)
-        picks = draft_data.get("picks", [])
-        # Remove any existing pick with same pick_number
-        picks = [p for p in picks if p["pick_number"] != pick.pick_number]
-        picks.append(pick_data)
-        picks.sort(key=lambda x: x["pick_number"])
-        
-        draft_data["picks"] = picks
-        draft_data["user_team_id"] = user_team_id
-        draft_data["manual_mode"] = manual_mode
-        draft_data["modified"] = datetime.now().isoformat()
-        
-        self._save_draft_data(self.current_draft_id, draft_data)
+        # Replaying the journal overwrites any existing pick with the same pick_number
+        self._append_journal(self.current_draft_id, {
+            "op": "pick",
+            "pick": pick_data,
+            "user_team_id": user_team_id,
+            "manual_mode": manual_mode,
+            "modified": datetime.now().isoformat()
+        })
     
     def remove_picks_after(self, pick_number: int):
         """Remove all picks after a certain pick number (for reversion)"""
         if not self.current_draft_id:
             return
         
-        draft_data = self._load_draft_data(self.current_draft_id)
-        if not draft_data:
+        if not os.path.exists(self._draft_path(self.current_draft_id)):
             return
         
-        # Filter out picks after the specified number
-        picks = draft_data.get("picks", [])
-        picks = [p for p in picks if p["pick_number"] <= pick_number]
-        
-        draft_data["picks"] = picks
-        draft_data["modified"] = datetime.now().isoformat()
-        
-        self._save_draft_data(self.current_draft_id, draft_data)
+        self._append_journal(self.current_draft_id, {
+            "op": "remove_after",
+            "pick_number": pick_number,
+            "modified": datetime.now().isoformat()
+        })
     
     def save_team_config(self, teams: Dict, user_team_id: int = None, manual_mode: bool = False):
         """Save team configuration"""
@@ -154,36 +160,22 @@ class DraftHistoryManager:
     
     def get_draft_list(self) -> List[Dict[str, Any]]:
         """Get list of all saved drafts"""
-        drafts = []
-        
-        if os.path.exists(self.history_dir):
-            for filename in sorted(os.listdir(self.history_dir), reverse=True):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(self.history_dir, filename)
-                    try:
-                        with open(filepath, 'r') as f:
-                            data = json.load(f)
-                            user_team_id = data.get("user_team_id")
-                            user_team_name = "No Team"
-                            if user_team_id is not None and "teams" in data:
-                                team_info = data["teams"].get(str(user_team_id), {})
-                                user_team_name = team_info.get("name", f"Team {user_team_id}")
-                            
-                            drafts.append({
-                                "id": data.get("id"),
-                                "name": data.get("name", "Untitled Draft"),
-                                "created": data.get("created"),
-                                "modified": data.get("modified"),
-                                "picks_count": len(data.get("picks", [])),
-                                "user_team": user_team_name,
-                                "user_team_id": user_team_id,
-                                "manual_mode": data.get("manual_mode", False),
-                                "total_picks": len(data.get("picks", []))
-                            })
-                    except:
-                        continue
-        
-        return drafts
+        self.catalog.sync()
+        rows = self.catalog.query(
+            'SELECT id, name, created, modified, picks_count, user_team, user_team_id, manual_mode '
+            'FROM drafts ORDER BY filename DESC'
+        )
+        return [{
+            "id": row["id"],
+            "name": row["name"],
+            "created": row["created"],
+            "modified": row["modified"],
+            "picks_count": row["picks_count"],
+            "user_team": row["user_team"],
+            "user_team_id": row["user_team_id"],
+            "manual_mode": bool(row["manual_mode"]),
+            "total_picks": row["picks_count"]
+        } for row in rows]
     
     def load_draft(self, draft_id: str) -> Dict[str, Any]:
         """Load a saved draft"""
@@ -195,23 +187,133 @@ class DraftHistoryManager:
     
     def delete_draft(self, draft_id: str):
         """Delete a saved draft"""
-        filepath = os.path.join(self.history_dir, f"{draft_id}.json")
+        filepath = self._draft_path(draft_id)
         if os.path.exists(filepath):
             os.remove(filepath)
+            self._remove_journal(draft_id)
+            self.catalog.remove_file(f"{draft_id}.json")
             if self.current_draft_id == draft_id:
                 self.current_draft_id = None
                 self.current_draft_name = None
     
+    def compact_draft(self, draft_id: str):
+        """Fold a draft's journal into its snapshot"""
+        draft_data = self._load_draft_data(draft_id)
+        if draft_data:
+            self._save_draft_data(draft_id, draft_data)
+    
+    def _draft_path(self, draft_id: str) -> str:
+        return os.path.join(self.history_dir, f"{draft_id}.json")
+    
+    def _journal_path(self, draft_id: str) -> str:
+        return os.path.join(self.history_dir, f"{draft_id}.journal.jsonl")
+    
+    def _append_journal(self, draft_id: str, entry: Dict[str, Any]):
+        """Append one entry to the draft's journal, compacting when it gets long"""
+        journal_path = self._journal_path(draft_id)
+        length = self._journal_lengths.get(draft_id)
+        if length is None or not self._journal_ends_cleanly(journal_path):
+            # Reading cuts out a torn last line before we append after it
+            length = len(self._read_journal(draft_id))
+        
+        with open(journal_path, 'a') as f:
+            f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_lengths[draft_id] = length + 1
+        
+        if length + 1 >= self.COMPACT_AFTER:
+            self.compact_draft(draft_id)
+    
+    @staticmethod
+    def _journal_ends_cleanly(journal_path: str) -> bool:
+        """True if the journal is empty/missing or its last line is complete"""
+        try:
+            with open(journal_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return True
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) == b'\n'
+        except FileNotFoundError:
+            return True
+    
+    def _read_journal(self, draft_id: str) -> List[Dict[str, Any]]:
+        """Journal entries, skipping torn lines from interrupted writes
+        
+        A torn line is cut out of the file as soon as it is found, so picks
+        appended afterwards start on a fresh line and are read back.
+        """
+        journal_path = self._journal_path(draft_id)
+        entries = []
+        if not os.path.exists(journal_path):
+            return entries
+        torn = False
+        with open(journal_path, 'rb') as f:
+            for line in f:
+                # A line without its newline was cut short, even if it parses
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError("torn journal line")
+                    entries.append(json.loads(line))
+                except ValueError:
+                    torn = True
+        if torn:
+            self._write_journal(draft_id, entries)
+        return entries
+    
+    def _write_journal(self, draft_id: str, entries: List[Dict[str, Any]]):
+        """Rewrite the journal (atomically) with just these entries"""
+        journal_path = self._journal_path(draft_id)
+        tmp_path = journal_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, journal_path)
+    
+    def _remove_journal(self, draft_id: str):
+        journal_path = self._journal_path(draft_id)
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+        self._journal_lengths[draft_id] = 0
+    
     def _save_draft_data(self, draft_id: str, data: Dict[str, Any]):
-        """Save draft data to file"""
-        filepath = os.path.join(self.history_dir, f"{draft_id}.json")
-        with open(filepath, 'w') as f:
+        """Write the full draft snapshot (atomically) and clear its journal"""
+        filepath = self._draft_path(draft_id)
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'w') as f:
             json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+        # data already includes any journaled picks
+        self._remove_journal(draft_id)
     
     def _load_draft_data(self, draft_id: str) -> Optional[Dict[str, Any]]:
-        """Load draft data from file"""
-        filepath = os.path.join(self.history_dir, f"{draft_id}.json")
-        if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        return None
\ No newline at end of file
+        """Load the draft snapshot and replay its journal"""
+        filepath = self._draft_path(draft_id)
+        if not os.path.exists(filepath):
+            return None
+        with open(filepath, 'r') as f:
+            draft_data = json.load(f)
+        
+        entries = self._read_journal(draft_id)
+        self._journal_lengths[draft_id] = len(entries)
+        if not entries:
+            return draft_data
+        
+        picks = {p["pick_number"]: p for p in draft_data.get("picks", [])}
+        for entry in entries:
+            if entry["op"] == "pick":
+                pick_data = entry["pick"]
+                picks[pick_data["pick_number"]] = pick_data
+                draft_data["user_team_id"] = entry["user_team_id"]
+                draft_data["manual_mode"] = entry["manual_mode"]
+            elif entry["op"] == "remove_after":
+                picks = {n: p for n, p in picks.items() if n <= entry["pick_number"]}
+            draft_data["modified"] = entry["modified"]
+        
+        draft_data["picks"] = [picks[n] for n in sorted(picks)]
+        return draft_data
\ No newline at end of file
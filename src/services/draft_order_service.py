@@ -5,56 +5,73 @@ from .draft_trade_service import DraftTradeService
 class DraftOrderService:
     """Service for managing draft order calculations and pick information"""
     
-    def __init__(self, num_teams: int, reversal_round: int = 3, trade_service: Optional[DraftTradeService] = None):
+    def __init__(self, num_teams: int, reversal_round: int = 3, trade_service: Optional[DraftTradeService] = None,
+                 draft_type: str = "snake"):
         self.num_teams = num_teams
         self.reversal_round = reversal_round
         self.trade_service = trade_service
+        self.draft_type = draft_type
+        # Overall pick number - 1 -> (round, pick_in_round, team_id), trades applied
+        self._pick_table: List[Tuple[int, int, int]] = []
+        self._pick_table_key = None
     
     def get_draft_order_for_round(self, round_num: int) -> List[int]:
         """
         Get the team draft order for a specific round.
-        Handles 3rd round reversal where rounds 2 and 3 go the same direction.
+        In a snake draft each round reverses the previous one, except the
+        reversal round (3rd round reversal), which repeats the previous direction.
         """
-        if round_num == 1:
+        forward = True
+        if self.draft_type == "snake":
+            for r in range(2, round_num + 1):
+                if r != self.reversal_round:
+                    forward = not forward
+        if forward:
             return list(range(1, self.num_teams + 1))
-        elif round_num == 2 or round_num == 3:
-            # Rounds 2 and 3 go the same direction (reverse)
-            return list(range(self.num_teams, 0, -1))
-        else:
-            # After round 3, normal snake draft
-            # Round 4 goes forward, round 5 reverse, etc.
-            if round_num % 2 == 0:
-                return list(range(1, self.num_teams + 1))
-            else:
-                return list(range(self.num_teams, 0, -1))
+        return list(range(self.num_teams, 0, -1))
+    
+    def get_original_order(self, total_rounds: int) -> List[int]:
+        """Team ID originally holding every overall pick, before trades"""
+        order = []
+        for round_num in range(1, total_rounds + 1):
+            order.extend(self.get_draft_order_for_round(round_num))
+        return order
+    
+    def get_pick_table(self, total_rounds: int) -> List[Tuple[int, int, int]]:
+        """
+        (round, pick_in_round, team_id) for every overall pick, indexed by
+        pick_number - 1, with trades applied. Rebuilt only when the number
+        of rounds or the trades change.
+        """
+        trades_version = self.trade_service.version if self.trade_service else None
+        key = (total_rounds, trades_version)
+        if key != self._pick_table_key:
+            table = []
+            for pick_number, original_team_id in enumerate(self.get_original_order(total_rounds), 1):
+                round_num = ((pick_number - 1) // self.num_teams) + 1
+                pick_in_round = ((pick_number - 1) % self.num_teams) + 1
+                team_id = original_team_id
+                if self.trade_service:
+                    team_id = self.trade_service.get_pick_owner(original_team_id, round_num)
+                table.append((round_num, pick_in_round, team_id))
+            self._pick_table = table
+            self._pick_table_key = key
+        return self._pick_table
     
     def get_pick_info(self, pick_number: int, total_rounds: int) -> Tuple[int, int, int]:
         """
         Get round number, pick in round, and team ID for a given pick number.
         Takes into account any trades that have been configured.
-        
+
         Returns:
             Tuple of (round_number, pick_in_round, team_id)
         """
-        # Calculate round (1-indexed)
-        round_num = ((pick_number - 1) // self.num_teams) + 1
-        
-        # Calculate pick within the round (1-indexed)
-        pick_in_round = ((pick_number - 1) % self.num_teams) + 1
-        
-        # Get team order for this round
-        order = self.get_draft_order_for_round(round_num)
-        
-        # Get the original team ID (position in order)
-        original_team_id = order[pick_in_round - 1]
-        
-        # Check if this pick has been traded
-        if self.trade_service:
-            team_id = self.trade_service.get_pick_owner(original_team_id, round_num)
-        else:
-            team_id = original_team_id
-        
-        return round_num, pick_in_round, team_id
+        return self.get_pick_table(total_rounds)[pick_number - 1]
+    
+    def get_team_picks(self, team_id: int, total_rounds: int) -> List[int]:
+        """Overall pick numbers owned by a team, with trades applied"""
+        return [pick_number for pick_number, (_, _, owner) in enumerate(self.get_pick_table(total_rounds), 1)
+                if owner == team_id]
     
     def get_pick_label(self, round_num: int, pick_in_round: int) -> str:
         """Get the display label for a pick (e.g., 'R1.5')"""
@@ -62,4 +79,4 @@ class DraftOrderService:
     
     def calculate_total_picks(self, total_rounds: int) -> int:
         """Calculate total number of picks in the draft"""
-        return self.num_teams * total_rounds
\ No newline at end of file
+        return self.num_teams * total_rounds
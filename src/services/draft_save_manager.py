@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import List, Dict, Any
 from ..core import DraftPick
 from ..models import Team, Player
+from ..database import SavedDraftCatalog
 
 
 class DraftSaveManager:
@@ -13,6 +14,7 @@ class DraftSaveManager:
     def __init__(self, save_dir: str = "data/saved_drafts"):
         self.save_dir = save_dir
         self._ensure_save_directory()
+        self.catalog = SavedDraftCatalog(save_dir)
     
     def _ensure_save_directory(self):
         """Ensure the save directory exists"""
@@ -44,6 +46,7 @@ class DraftSaveManager:
         # Save to file
         with open(filepath, 'w') as f:
             json.dump(draft_data, f, indent=2)
+        self.catalog.index_file(filename, draft_data)
         
         return filename
     
@@ -158,26 +161,12 @@ class DraftSaveManager:
     
     def get_saved_drafts(self) -> List[Dict[str, Any]]:
         """Get list of saved drafts with basic info"""
-        saved_drafts = []
-        
-        if os.path.exists(self.save_dir):
-            for filename in sorted(os.listdir(self.save_dir), reverse=True):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(self.save_dir, filename)
-                    try:
-                        with open(filepath, 'r') as f:
-                            data = json.load(f)
-                            saved_drafts.append({
-                                "filename": filename,
-                                "timestamp": data.get("timestamp"),
-                                "user_team": data.get("teams", [{}])[0].get("name") if data.get("user_team_id") else "Observer",
-                                "total_picks": data.get("total_picks", 0),
-                                "manual_mode": data.get("manual_mode", False)
-                            })
-                    except:
-                        continue
-        
-        return saved_drafts
+        self.catalog.sync()
+        rows = self.catalog.query(
+            'SELECT filename, timestamp, user_team, total_picks, manual_mode '
+            'FROM saved_drafts ORDER BY filename DESC'
+        )
+        return [dict(row, manual_mode=bool(row["manual_mode"])) for row in rows]
     
     def load_draft(self, filename: str) -> Dict[str, Any]:
         """Load a saved draft"""
@@ -8,6 +8,7 @@ class DraftTradeService:
     def __init__(self):
         self.trades: List[Dict] = []  # List of trade configurations
         self.traded_picks: Dict[Tuple[int, int], int] = {}  # (team_id, round) -> new_team_id
+        self.version = 0  # Bumped whenever the trades change
         
     def add_trade(self, team1_id: int, team1_rounds: List[int], 
                   team2_id: int, team2_rounds: List[int]):
@@ -33,11 +34,13 @@ class DraftTradeService:
             self.traded_picks[(team1_id, round_num)] = team2_id
         for round_num in team2_rounds:
             self.traded_picks[(team2_id, round_num)] = team1_id
+        self.version += 1
     
     def clear_trades(self):
         """Clear all trades"""
         self.trades.clear()
         self.traded_picks.clear()
+        self.version += 1
     
     def get_pick_owner(self, original_team_id: int, round_num: int) -> int:
         """
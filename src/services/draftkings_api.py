@@ -9,8 +9,12 @@ Usage:
 """
 
 import re
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Optional
 
 
@@ -34,6 +38,7 @@ class DraftKingsAPIException(Exception):
     pass
 
 
+@lru_cache(maxsize=4096)
 def format_name(name):
     """Format player names for consistency."""
     # If there is a (, dump everything from there on
@@ -79,6 +84,51 @@ class DraftKingsAPI:
     BASE_URL = "https://sportsbook-nash.draftkings.com/api/sportscontent/dkusnj/v1"
     _subcategories = None  # Class variable to store subcategories
     PLAYER_STATS_CATEGORY_ID = 1759  # Updated category ID for player stats
+    REQUEST_TIMEOUT = 20  # seconds
+
+    HEADERS = {
+        "accept": "*/*",
+        "accept-language": "en-US,en;q=0.9",
+        "origin": "https://sportsbook.draftkings.com",
+        "referer": "https://sportsbook.draftkings.com/",
+        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
+        "sec-ch-ua": '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"Windows"'
+    }
+
+    # Props returned by get_all_common_props: result key -> subcategory name
+    COMMON_PROPS = {
+        "passing_yards": "Passing Yards",
+        "passing_tds": "Passing TDs",
+        "rushing_yards": "Rushing Yards",
+        "rushing_tds": "Rushing TDs",
+        "receiving_yards": "Receiving Yards",
+        "receiving_tds": "Receiving TDs",
+        "receptions": "Receptions",
+    }
+
+    _session = None  # Shared pooled session, see get_session()
+    _session_lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Shared requests.Session so requests reuse pooled keep-alive connections"""
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=len(cls.COMMON_PROPS))
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update(cls.HEADERS)
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def _get_json(cls, url):
+        response = cls.get_session().get(url, timeout=cls.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
 
     @staticmethod
     def get_nfl_player_props(week, prop_type):
@@ -101,22 +151,9 @@ class DraftKingsAPI:
             return []  # Return empty list instead of raising error
         
         url = f"{cls.BASE_URL}/leagues/88808/categories/{cls.PLAYER_STATS_CATEGORY_ID}/subcategories/{subcategory_id}"
-        
-        headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "origin": "https://sportsbook.draftkings.com",
-            "referer": "https://sportsbook.draftkings.com/",
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-            "sec-ch-ua": '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Windows"'
-        }
 
         try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+            data = cls._get_json(url)
             
             player_props = cls.extract_player_props(data, prop_type)
             
@@ -229,22 +266,9 @@ class DraftKingsAPI:
 
         # Get all subcategories for the player stats category
         url = f"{cls.BASE_URL}/leagues/88808/categories/{cls.PLAYER_STATS_CATEGORY_ID}"
-        
-        headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "origin": "https://sportsbook.draftkings.com",
-            "referer": "https://sportsbook.draftkings.com/",
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-            "sec-ch-ua": '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Windows"'
-        }
 
         try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+            data = cls._get_json(url)
             
             cls._subcategories = [
                 {
@@ -360,18 +384,20 @@ class DraftKingsAPI:
         Returns a dictionary with prop type as key and list of PlayerProps as value.
         Includes: passing yards/TDs, rushing yards/TDs, receiving yards/TDs, receptions.
         
+        The subcategories are fetched concurrently over the shared session.
+        
         Returns:
             Dict[str, List[PlayerProp]]: Dictionary of prop types to player props
         """
-        return {
-            "passing_yards": cls.get_passing_yards_props(),
-            "passing_tds": cls.get_passing_tds_props(),
-            "rushing_yards": cls.get_rushing_yards_props(),
-            "rushing_tds": cls.get_rushing_tds_props(),
-            "receiving_yards": cls.get_receiving_yards_props(),
-            "receiving_tds": cls.get_receiving_tds_props(),
-            "receptions": cls.get_receptions_props()
-        }
+        # Resolve subcategory IDs once up front rather than racing in every worker
+        cls.get_all_subcategories()
+        
+        with ThreadPoolExecutor(max_workers=len(cls.COMMON_PROPS)) as executor:
+            futures = {
+                key: executor.submit(cls.get_nfl_player_props_2, prop_type)
+                for key, prop_type in cls.COMMON_PROPS.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
 
 
 # Example usage if running this file directly
@@ -1,18 +1,39 @@
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
 from PIL import Image, ImageTk
 import requests
 from io import BytesIO
+import threading
 import tkinter as tk
 import os
 from ..utils.player_extensions import get_player_image_url, get_team_logo_url
 
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets")
+DEFAULT_THUMBNAIL_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'image_thumbnails')
+DEFAULT_MAX_CACHED_IMAGES = 500
+
 
 class PlayerImageService:
-    """Service for loading and caching player images"""
+    """Service for loading and caching player images
+    
+    PhotoImages are kept in an LRU cache keyed by player and size, holding at
+    most max_cached_images. Resized images are also written to thumbnail_dir
+    (one folder per size), so later runs skip decoding and resizing the
+    full-size image. Pass thumbnail_dir=None to turn the disk cache off.
     
-    def __init__(self):
-        self.image_cache: Dict[str, ImageTk.PhotoImage] = {}
-        self._loading_images: set = set()  # Track images currently being loaded
+    Callbacks asking for an image that is still loading are queued with the
+    load in flight, and all of them get the photo when it arrives.
+    """
+    
+    def __init__(self, max_cached_images: int = DEFAULT_MAX_CACHED_IMAGES,
+                 thumbnail_dir: Optional[str] = DEFAULT_THUMBNAIL_DIR, assets_dir: str = ASSETS_DIR):
+        self.image_cache: "OrderedDict[str, ImageTk.PhotoImage]" = OrderedDict()
+        self.max_cached_images = max_cached_images
+        self.thumbnail_dir = thumbnail_dir
+        self.assets_dir = assets_dir
+        # cache_key -> (callback, widget) pairs waiting on a load in flight
+        self._pending_callbacks: Dict[str, List[Tuple[Optional[Callable], Optional[tk.Widget]]]] = {}
+        self._pending_lock = threading.Lock()
         self._failed_images: set = set()  # Track images that failed to load
         self._retry_count: Dict[str, int] = {}  # Track retry attempts
     
@@ -22,7 +43,10 @@ class PlayerImageService:
         Use load_image_async to load new images.
         """
         cache_key = f"{player_id}_{size[0]}x{size[1]}"
-        return self.image_cache.get(cache_key)
+        photo = self.image_cache.get(cache_key)
+        if photo is not None:
+            self.image_cache.move_to_end(cache_key)
+        return photo
     
     def load_image_async(self, player_id: str, size: tuple = (40, 40), 
                         callback=None, widget: Optional[tk.Widget] = None):
@@ -38,23 +62,26 @@ class PlayerImageService:
         cache_key = f"{player_id}_{size[0]}x{size[1]}"
         
         # Check if already cached
-        if cache_key in self.image_cache:
+        photo = self.get_image(player_id, size)
+        if photo is not None:
             if callback:
-                callback(self.image_cache[cache_key])
-            return
-        
-        # Check if already loading
-        if cache_key in self._loading_images:
-            return
-        
-        # Check if this image has failed too many times
-        if self._retry_count.get(cache_key, 0) >= 3:
+                callback(photo)
             return
         
-        self._loading_images.add(cache_key)
+        with self._pending_lock:
+            # Already loading - wait for that load instead of starting another
+            waiting = self._pending_callbacks.get(cache_key)
+            if waiting is not None:
+                waiting.append((callback, widget))
+                return
+            
+            # Check if this image has failed too many times
+            if self._retry_count.get(cache_key, 0) >= 3:
+                return
+            
+            self._pending_callbacks[cache_key] = [(callback, widget)]
         
         # Use threading for truly async loading
-        import threading
         thread = threading.Thread(
             target=self._load_image_threaded,
             args=(player_id, size, callback, widget)
@@ -62,27 +89,71 @@ class PlayerImageService:
         thread.daemon = True
         thread.start()
     
+    def _local_image_path(self, player_id: str) -> str:
+        """Bundled image for a player (or team_<abbr> logo)"""
+        if player_id.startswith("team_"):
+            return os.path.join(self.assets_dir, "team_logos", f"{player_id[5:].lower()}.png")
+        return os.path.join(self.assets_dir, "player_images", f"{player_id}.jpg")
+    
+    def _thumbnail_path(self, player_id: str, size: tuple) -> str:
+        return os.path.join(self.thumbnail_dir, f"{size[0]}x{size[1]}", f"{player_id}.png")
+    
+    def _load_thumbnail(self, player_id: str, size: tuple) -> Optional[Image.Image]:
+        """Resized image from an earlier run, unless the bundled image is newer"""
+        if not self.thumbnail_dir:
+            return None
+        path = self._thumbnail_path(player_id, size)
+        try:
+            source = self._local_image_path(player_id)
+            if os.path.exists(source) and os.path.getmtime(source) > os.path.getmtime(path):
+                return None
+            img = Image.open(path)
+            img.load()  # Decode here, off the main thread
+            return img
+        except (OSError, ValueError):
+            return None
+    
+    def _resize_and_store(self, player_id: str, size: tuple, img: Image.Image) -> Image.Image:
+        """Resize an image to the requested size and save it as a thumbnail"""
+        img = img.resize(size, Image.Resampling.LANCZOS)
+        if self.thumbnail_dir:
+            path = self._thumbnail_path(player_id, size)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                img.save(f"{path}.tmp", format='PNG')
+                os.replace(f"{path}.tmp", path)
+            except (OSError, ValueError) as e:
+                print(f"Could not save thumbnail for {player_id}: {e}")
+        return img
+    
     def _load_image_threaded(self, player_id: str, size: tuple, callback, widget: Optional[tk.Widget]):
         """Load image in a separate thread"""
         cache_key = f"{player_id}_{size[0]}x{size[1]}"
+        image_url = None
+        scheduled = False
         
         try:
+            # Pre-resized thumbnail on disk
+            img = self._load_thumbnail(player_id, size)
+            if img is not None:
+                # Schedule GUI update in main thread
+                scheduled = self._schedule_update(player_id, size, img, callback, widget)
+                return
+            
+            local_path = self._local_image_path(player_id)
+            
             # Check if this is a team logo request
             if player_id.startswith("team_"):
                 team_abbr = player_id[5:]  # Remove "team_" prefix
                 # First try to load from local file
-                local_logo_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                                              "assets", "team_logos", f"{team_abbr.lower()}.png")
-                
-                if os.path.exists(local_logo_path):
+                if os.path.exists(local_path):
                     # Load from local file
-                    img = Image.open(local_logo_path)
+                    img = Image.open(local_path)
                     # Resize image to requested size
-                    img = img.resize(size, Image.Resampling.LANCZOS)
+                    img = self._resize_and_store(player_id, size, img)
                     
                     # Schedule GUI update in main thread
-                    if widget and widget.winfo_exists():
-                        widget.after(0, lambda: self._update_image_cache(player_id, size, img, callback, widget))
+                    scheduled = self._schedule_update(player_id, size, img, callback, widget)
                     return
                 else:
                     # Fall back to URL if local file doesn't exist
@@ -90,18 +161,14 @@ class PlayerImageService:
                     print(f"Loading team logo from URL (local not found): {team_abbr} -> {image_url}")
             else:
                 # First try to load player image from local file
-                local_player_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                                                "assets", "player_images", f"{player_id}.jpg")
-                
-                if os.path.exists(local_player_path) and os.path.getsize(local_player_path) > 0:
+                if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
                     # Load from local file
-                    img = Image.open(local_player_path)
+                    img = Image.open(local_path)
                     # Resize image to requested size
-                    img = img.resize(size, Image.Resampling.LANCZOS)
+                    img = self._resize_and_store(player_id, size, img)
                     
                     # Schedule GUI update in main thread
-                    if widget and widget.winfo_exists():
-                        widget.after(0, lambda: self._update_image_cache(player_id, size, img, callback, widget))
+                    scheduled = self._schedule_update(player_id, size, img, callback, widget)
                     return
                 else:
                     # Fall back to URL if local file doesn't exist or is empty
@@ -114,11 +181,10 @@ class PlayerImageService:
             if response.status_code == 200:
                 img = Image.open(BytesIO(response.content))
                 # Resize image to requested size
-                img = img.resize(size, Image.Resampling.LANCZOS)
+                img = self._resize_and_store(player_id, size, img)
                 
                 # Schedule GUI update in main thread
-                if widget and widget.winfo_exists():
-                    widget.after(0, lambda: self._update_image_cache(player_id, size, img, callback, widget))
+                scheduled = self._schedule_update(player_id, size, img, callback, widget)
             else:
                 print(f"Failed to load image for {player_id}: HTTP {response.status_code} from {image_url}")
                 self._retry_count[cache_key] = self._retry_count.get(cache_key, 0) + 1
@@ -129,26 +195,58 @@ class PlayerImageService:
             print(f"Error loading image for {player_id}: {e}")
             self._retry_count[cache_key] = self._retry_count.get(cache_key, 0) + 1
         finally:
-            self._loading_images.discard(cache_key)
+            if not scheduled:
+                # Nothing will arrive - let the next request try again
+                with self._pending_lock:
+                    self._pending_callbacks.pop(cache_key, None)
+    
+    def _schedule_update(self, player_id: str, size: tuple, img: Image.Image, callback,
+                         widget: Optional[tk.Widget]) -> bool:
+        """Hand a loaded image to the main thread through any waiting widget still alive"""
+        cache_key = f"{player_id}_{size[0]}x{size[1]}"
+        with self._pending_lock:
+            waiting = list(self._pending_callbacks.get(cache_key, [(callback, widget)]))
+        target = next((w for _, w in waiting if w and w.winfo_exists()), None)
+        if target is None:
+            return False
+        target.after(0, lambda: self._update_image_cache(player_id, size, img, callback, widget))
+        return True
+    
+    def _create_photo(self, img: Image.Image):
+        return ImageTk.PhotoImage(img)
     
     def _update_image_cache(self, player_id: str, size: tuple, img: Image.Image, callback, widget: Optional[tk.Widget]):
-        """Update cache and call callback in main thread"""
+        """Update cache and call every waiting callback in main thread"""
         cache_key = f"{player_id}_{size[0]}x{size[1]}"
+        with self._pending_lock:
+            waiting = self._pending_callbacks.pop(cache_key, None) or [(callback, widget)]
         
         try:
             # Create PhotoImage in main thread
-            photo = ImageTk.PhotoImage(img)
+            photo = self._create_photo(img)
             
             # Cache it
-            self.image_cache[cache_key] = photo
+            self._cache_photo(cache_key, photo)
             
-            # Call callback if provided
-            if callback and widget and widget.winfo_exists():
-                callback(photo)
+            # Call the callbacks whose widgets still exist
+            for waiting_callback, waiting_widget in waiting:
+                if waiting_callback and waiting_widget and waiting_widget.winfo_exists():
+                    waiting_callback(photo)
         except Exception as e:
             print(f"Error updating image cache for {player_id}: {e}")
     
+    def _cache_photo(self, cache_key: str, photo):
+        """Add a PhotoImage, dropping the least recently used past max_cached_images
+        
+        Widgets showing an evicted image keep their own reference to it.
+        """
+        self.image_cache[cache_key] = photo
+        self.image_cache.move_to_end(cache_key)
+        while len(self.image_cache) > self.max_cached_images:
+            self.image_cache.popitem(last=False)
+    
     def clear_cache(self):
-        """Clear the image cache"""
+        """Clear the image cache (thumbnails on disk are kept)"""
         self.image_cache.clear()
-        self._loading_images.clear()
\ No newline at end of file
+        with self._pending_lock:
+            self._pending_callbacks.clear()
\ No newline at end of file
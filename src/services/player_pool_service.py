@@ -1,5 +1,6 @@
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set
 from ..models import Player
+from ..models.availability_index import AvailabilityIndex
 
 
 class PlayerPoolService:
@@ -7,13 +8,16 @@ class PlayerPoolService:
     
     def __init__(self, all_players: List[Player]):
         self.all_players = list(all_players)
-        self.available_players = list(all_players)
+        self.available_players = AvailabilityIndex(self.all_players)
         self.drafted_players: Set[Player] = set()
+        self._players_by_name: Dict[str, List[Player]] = {}
+        for player in self.available_players.all_players:
+            self._players_by_name.setdefault(player.name.lower(), []).append(player)
     
     def get_available_players(self, limit: Optional[int] = None) -> List[Player]:
         """Get list of available players, optionally limited"""
         if limit:
-            return self.available_players[:limit]
+            return self.available_players.top(limit)
         return list(self.available_players)
     
     def draft_player(self, player: Player) -> bool:
@@ -21,13 +25,24 @@ class PlayerPoolService:
         Mark a player as drafted.
         Returns True if successful, False if player was already drafted.
         """
-        if player not in self.available_players:
+        if not self.available_players.discard(player):
             return False
         
-        self.available_players.remove(player)
         self.drafted_players.add(player)
         return True
     
+    def undraft_player(self, player: Player) -> bool:
+        """
+        Return a drafted player to the pool (e.g. when a pick is undone).
+        Returns True if successful, False if player was not drafted.
+        """
+        if player not in self.drafted_players:
+            return False
+        
+        self.drafted_players.discard(player)
+        self.available_players.add(player)
+        return True
+    
     def draft_multiple_players(self, players: List[Player]) -> List[Player]:
         """
         Draft multiple players at once.
@@ -45,18 +60,18 @@ class PlayerPoolService:
     
     def find_player_by_name(self, name: str) -> Optional[Player]:
         """Find a player by name in available players"""
-        for player in self.available_players:
-            if player.name.lower() == name.lower():
+        for player in self._players_by_name.get(name.lower(), []):
+            if player in self.available_players:
                 return player
         return None
     
     def get_players_by_position(self, position: str) -> List[Player]:
         """Get all available players at a specific position"""
-        return [p for p in self.available_players if p.position == position]
+        return self.available_players.by_position(position)
     
     def reset(self):
         """Reset the player pool to initial state"""
-        self.available_players = list(self.all_players)
+        self.available_players.reset()
         self.drafted_players.clear()
     
     def get_player_index(self, player: Player) -> Optional[int]:
@@ -1,5 +1,6 @@
 from typing import Dict, List, Tuple
 from ..models import Team, Player
+from ..models.team import COUNTED_POSITIONS
 
 
 class RosterManagementService:
@@ -25,14 +26,7 @@ class RosterManagementService:
     
     def get_position_counts(self, team: Team) -> Dict[str, int]:
         """Get count of players by actual position (not roster slot)"""
-        position_counts = {'QB': 0, 'RB': 0, 'WR': 0, 'TE': 0, 'DEF': 0, 'K': 0}
-        
-        for pos_slot, players in team.roster.items():
-            for player in players:
-                if player.position in position_counts:
-                    position_counts[player.position] += 1
-        
-        return position_counts
+        return {pos: team.position_counts[pos] for pos in COUNTED_POSITIONS}
     
     def get_team_needs(self, team: Team) -> List[str]:
         """
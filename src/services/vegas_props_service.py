@@ -1,23 +1,42 @@
 """Service for managing DraftKings Vegas props data"""
 
+import json
+import os
 import threading
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
-from .draftkings_api import DraftKingsAPI, PlayerProp
+from .draftkings_api import DraftKingsAPI, PlayerProp, format_name
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'vegas_props_cache.json')
 
 @dataclass
 class CachedPropsData:
     """Container for cached props data"""
     data: Dict[str, List[PlayerProp]]
     timestamp: datetime
-    
+    # format_name(player) -> {prop_type: first prop of that type for the player}
+    by_player: Dict[str, Dict[str, PlayerProp]] = field(default_factory=dict)
+
+
+def build_player_index(data: Dict[str, List[PlayerProp]]) -> Dict[str, Dict[str, PlayerProp]]:
+    """Index props by formatted player name, keeping the first prop per type"""
+    by_player: Dict[str, Dict[str, PlayerProp]] = {}
+    for prop_type, props_list in data.items():
+        for prop in props_list:
+            player_props = by_player.setdefault(format_name(prop.player_name), {})
+            if prop_type not in player_props:
+                player_props[prop_type] = prop
+    return by_player
+
+
 class VegasPropsService:
     """Service to manage Vegas props data from DraftKings"""
     
-    def __init__(self, on_props_loaded=None):
+    def __init__(self, on_props_loaded=None, cache_path: Optional[str] = DEFAULT_CACHE_PATH):
         self.cache: Optional[CachedPropsData] = None
         self.cache_duration = timedelta(minutes=15)
+        self.cache_path = cache_path  # None disables the disk cache
         self.loading = False
         self.load_lock = threading.Lock()
         self.on_props_loaded = on_props_loaded
@@ -30,36 +49,29 @@ class VegasPropsService:
         with self.load_lock:
             # Check if we need to refresh
             if force_refresh or self._should_refresh():
-                self._refresh_cache()
+                self._refresh_cache(force_refresh)
             
             if self.cache:
                 return self.cache.data
             return {}
     
+    def _get_indexed_props(self, player_name: str) -> Dict[str, PlayerProp]:
+        """Props for a player straight from the name index (don't mutate)"""
+        self.get_all_props()
+        cache = self.cache
+        if not cache:
+            return {}
+        # Match on the API's format_name, same as the index
+        return cache.by_player.get(format_name(player_name), {})
+    
     def get_player_props(self, player_name: str) -> Dict[str, PlayerProp]:
         """Get all props for a specific player"""
-        all_props = self.get_all_props()
-        player_props = {}
-        
-        # Format the player name for matching (use the API's format_name)
-        from .draftkings_api import format_name
-        formatted_name = format_name(player_name)
-        
-        # Search through all prop types
-        for prop_type, props_list in all_props.items():
-            for prop in props_list:
-                if format_name(prop.player_name) == formatted_name:
-                    player_props[prop_type] = prop
-                    break
-        
-        return player_props
+        return dict(self._get_indexed_props(player_name))
     
     def get_prop_value(self, player_name: str, prop_type: str) -> Optional[float]:
         """Get a specific prop value for a player"""
-        player_props = self.get_player_props(player_name)
-        if prop_type in player_props:
-            return player_props[prop_type].prop_value
-        return None
+        prop = self._get_indexed_props(player_name).get(prop_type)
+        return prop.prop_value if prop else None
     
     def _should_refresh(self) -> bool:
         """Check if cache should be refreshed"""
@@ -69,19 +81,69 @@ class VegasPropsService:
         age = datetime.now() - self.cache.timestamp
         return age > self.cache_duration
     
-    def _refresh_cache(self):
-        """Refresh the props cache from DraftKings"""
+    def _load_disk_cache(self) -> Optional[CachedPropsData]:
+        """Props saved by a previous run, if still within cache_duration"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, 'r') as f:
+                saved = json.load(f)
+            timestamp = datetime.fromisoformat(saved['timestamp'])
+            if datetime.now() - timestamp > self.cache_duration:
+                return None
+            data = {
+                prop_type: [PlayerProp(**prop) for prop in props_list]
+                for prop_type, props_list in saved['props'].items()
+            }
+            if not any(data.values()):
+                return None
+            return CachedPropsData(data=data, timestamp=timestamp, by_player=build_player_index(data))
+        except Exception as e:
+            print(f"Error loading Vegas props cache: {e}")
+            return None
+    
+    def _save_disk_cache(self, cache: CachedPropsData):
+        """Save fetched props so the next run within cache_duration skips the network"""
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = self.cache_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'timestamp': cache.timestamp.isoformat(),
+                    'props': {
+                        prop_type: [asdict(prop) for prop in props_list]
+                        for prop_type, props_list in cache.data.items()
+                    }
+                }, f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"Error saving Vegas props cache: {e}")
+    
+    def _refresh_cache(self, force_refresh: bool = False):
+        """Refresh the props cache from disk if fresh, otherwise from DraftKings"""
         if self.loading:
             return
         
         self.loading = True
         try:
+            if not force_refresh:
+                cached = self._load_disk_cache()
+                if cached:
+                    self.cache = cached
+                    return
+            
             # Fetch all common props
             all_props = DraftKingsAPI.get_all_common_props()
             self.cache = CachedPropsData(
                 data=all_props,
-                timestamp=datetime.now()
+                timestamp=datetime.now(),
+                by_player=build_player_index(all_props)
             )
+            # Every fetch failing gives no props at all - don't make the next run wait that out
+            if any(all_props.values()):
+                self._save_disk_cache(self.cache)
         except Exception as e:
             print(f"Error fetching Vegas props: {e}")
             # Keep existing cache if fetch fails
@@ -96,7 +158,7 @@ class VegasPropsService:
     
     def get_summary_string(self, player_name: str) -> str:
         """Get a summary string of key props for a player"""
-        props = self.get_player_props(player_name)
+        props = self._get_indexed_props(player_name)
         
         if not props:
             return ""
@@ -2,19 +2,21 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from typing import List, Dict, Tuple, Optional
 from ..models import Player
+from ..services.draft_order_service import DraftOrderService
+from ..services.player_image_service import PlayerImageService
 from .theme import DARK_THEME, get_position_color
 from .styled_widgets import StyledFrame, StyledButton
 import os
-from PIL import Image, ImageTk
 import json
 import time
 
 
 class CheatSheetPage(StyledFrame):
-    def __init__(self, parent, players: List[Player], draft_app=None, **kwargs):
+    def __init__(self, parent, players: List[Player], draft_app=None, image_service=None, **kwargs):
         super().__init__(parent, bg_type='primary', **kwargs)
         self.all_players = players
         self.draft_app = draft_app
+        self.image_service = image_service or PlayerImageService()
         
         # Configuration
         self.image_size = (90, 72)  # Same as ADP page
@@ -71,7 +73,6 @@ class CheatSheetPage(StyledFrame):
         }
         
         # State
-        self.player_images = {}  # Cache player images
         self.player_widgets = {}  # Map player_id to widget
         self.drag_data = None  # Current drag information
         self.drop_indicator = None
@@ -541,48 +542,26 @@ class CheatSheetPage(StyledFrame):
     
     def calculate_snake_draft_picks(self, draft_position: int, num_teams: int, num_rounds: int) -> List[int]:
         """Calculate all picks for a given draft position in a snake draft with 3rd round reversal"""
-        picks = []
-        for round_num in range(1, num_rounds + 1):
-            if round_num == 1:
-                # Round 1: Normal order (1-10)
-                pick = draft_position
-            elif round_num == 2:
-                # Round 2: Reverse order (10-1)
-                pick = num_teams + (num_teams - draft_position + 1)
-            elif round_num == 3:
-                # Round 3: Same as round 2 (3rd round reversal)
-                pick = 2 * num_teams + (num_teams - draft_position + 1)
-            else:
-                # Rounds 4+: Continue normal snake pattern
-                if round_num % 2 == 0:  # Even rounds (4, 6, 8, etc.)
-                    pick = (round_num - 1) * num_teams + draft_position
-                else:  # Odd rounds (5, 7, 9, etc.)
-                    pick = round_num * num_teams - draft_position + 1
-            picks.append(pick)
-        return picks
+        return DraftOrderService(num_teams).get_team_picks(draft_position, num_rounds)
     
-    def get_player_image(self, player: Player) -> Optional[ImageTk.PhotoImage]:
-        """Get or create player image"""
-        if player.player_id in self.player_images:
-            return self.player_images[player.player_id]
-        
-        # Try to load player image
-        image_path = os.path.join(
-            os.path.dirname(__file__), '..', '..', 'assets', 'player_images',
-            f"{player.player_id}.jpg"
-        )
+    def show_player_image(self, badge: tk.Label, player: Player, pady):
+        """Swap the position badge for the player's image once it is loaded
+
+        PlayerImageService loads and resizes images off the UI thread (and
+        keeps resized copies on disk), so building the cheat sheet never waits
+        on image decoding. Cached images replace the badge straight away.
+        """
+        if not player.player_id:
+            return
         
-        if os.path.exists(image_path):
-            try:
-                img = Image.open(image_path)
-                img = img.resize(self.image_size, Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                self.player_images[player.player_id] = photo
-                return photo
-            except:
-                pass
+        def show(photo):
+            if badge.winfo_exists():
+                badge.configure(image=photo, text='', width=0, height=0, bg=DARK_THEME['bg_tertiary'])
+                badge.image = photo  # Keep reference
+                badge.pack_configure(pady=pady)
         
-        return None
+        self.image_service.load_image_async(player.player_id, size=self.image_size,
+                                            callback=show, widget=self)
     
     def update_display(self):
         """Update the display with current tiers"""
@@ -688,26 +667,17 @@ class CheatSheetPage(StyledFrame):
             if tier_name.startswith("Round "):
                 round_num = int(tier_name.split(" ")[1])
                 
-                # Try to get draft position from draft app
-                draft_pos = None
-                
                 if self.draft_app and hasattr(self.draft_app, 'user_team_id') and self.draft_app.user_team_id is not None:
-                    # Teams dict uses integer keys, user_team_id is an integer
-                    # Find the position based on sorted team IDs
-                    sorted_team_ids = sorted(self.draft_app.teams.keys())
-                    for i, team_id in enumerate(sorted_team_ids):
-                        if team_id == self.draft_app.user_team_id:
-                            draft_pos = i + 1  # 1-based position
-                            break
+                    # First pick the user's team owns in this round, trades applied
+                    pick_table = self.draft_app.draft_engine.get_pick_table()
+                    user_team_id = self.draft_app.user_team_id
+                    my_pick_num = next((pick_number for pick_number, (pick_round, _, owner) in enumerate(pick_table, 1)
+                                        if pick_round == round_num and owner == user_team_id), None)
                 else:
-                    # Default to position 8 if no team selected
-                    draft_pos = 8
-                    
-                if draft_pos:
-                        # Calculate snake draft picks (10 team league)
-                        my_picks = self.calculate_snake_draft_picks(draft_pos, 10, 20)
-                        if round_num <= len(my_picks):
-                            my_pick_num = my_picks[round_num - 1]  # 0-based index
+                    # Default to position 8 if no team selected (10 team league)
+                    my_picks = self.calculate_snake_draft_picks(8, 10, 20)
+                    if round_num <= len(my_picks):
+                        my_pick_num = my_picks[round_num - 1]  # 0-based index
         except Exception as e:
             print(f"Error getting pick number: {e}")
         
@@ -831,29 +801,19 @@ class CheatSheetPage(StyledFrame):
         player_frame.is_available = is_available
         self.player_widgets[player.player_id] = player_frame
         
-        # Player image or placeholder
-        image = self.get_player_image(player)
-        if image:
-            image_label = tk.Label(
-                player_frame,
-                image=image,
-                bg=DARK_THEME['bg_tertiary']
-            )
-            image_label.image = image  # Keep reference
-            image_label.pack(pady=(10, 2))
-        else:
-            # Position badge as placeholder
-            pos_color = get_position_color(player.position)
-            badge = tk.Label(
-                player_frame,
-                text=player.position,
-                bg=pos_color,
-                fg='white',
-                font=(DARK_THEME['font_family'], 12, 'bold'),
-                width=5,
-                height=2
-            )
-            badge.pack(pady=(15, 5))
+        # Position badge until the player image is loaded
+        pos_color = get_position_color(player.position)
+        badge = tk.Label(
+            player_frame,
+            text=player.position,
+            bg=pos_color,
+            fg='white',
+            font=(DARK_THEME['font_family'], 12, 'bold'),
+            width=5,
+            height=2
+        )
+        badge.pack(pady=(15, 5))
+        self.show_player_image(badge, player, pady=(10, 2))
         
         # Player name - use short name (nickname or last name)
         if is_available:
@@ -1014,29 +974,19 @@ class CheatSheetPage(StyledFrame):
         )
         float_frame.pack()
         
-        # Add player image or placeholder
-        image = self.get_player_image(player)
-        if image:
-            image_label = tk.Label(
-                float_frame,
-                image=image,
-                bg=DARK_THEME['bg_tertiary']
-            )
-            image_label.image = image  # Keep reference
-            image_label.pack(pady=(5, 2))
-        else:
-            # Position badge as placeholder
-            pos_color = get_position_color(player.position)
-            badge = tk.Label(
-                float_frame,
-                text=player.position,
-                bg=pos_color,
-                fg='white',
-                font=(DARK_THEME['font_family'], 10, 'bold'),
-                width=4,
-                height=2
-            )
-            badge.pack(pady=(5, 2))
+        # Position badge until the player image is loaded
+        pos_color = get_position_color(player.position)
+        badge = tk.Label(
+            float_frame,
+            text=player.position,
+            bg=pos_color,
+            fg='white',
+            font=(DARK_THEME['font_family'], 10, 'bold'),
+            width=4,
+            height=2
+        )
+        badge.pack(pady=(5, 2))
+        self.show_player_image(badge, player, pady=(5, 2))
         
         # Player name - use short name (nickname or last name)
         name_label = tk.Label(
@@ -8,10 +8,11 @@ from .theme import DARK_THEME, get_position_color
 from .styled_widgets import StyledFrame
 from ..services.manager_notes_service import ManagerNotesService
 from ..services.draft_trade_service import DraftTradeService
+from ..services.draft_order_service import DraftOrderService
 
 
 class DraftBoard(StyledFrame):
-    def __init__(self, parent, teams: Dict[int, Team], total_rounds: int, max_visible_rounds: int = 9, on_team_select=None, on_pick_click=None, image_service=None, on_pick_change=None, get_top_players=None, on_draft_name_change=None, on_draft_load=None, get_draft_list=None, trade_service: Optional[DraftTradeService] = None, **kwargs):
+    def __init__(self, parent, teams: Dict[int, Team], total_rounds: int, max_visible_rounds: int = 9, on_team_select=None, on_pick_click=None, image_service=None, on_pick_change=None, get_top_players=None, on_draft_name_change=None, on_draft_load=None, get_draft_list=None, trade_service: Optional[DraftTradeService] = None, get_order_service=None, **kwargs):
         super().__init__(parent, bg_type='secondary', **kwargs)
         self.teams = teams
         self.num_teams = len(teams)
@@ -38,6 +39,9 @@ class DraftBoard(StyledFrame):
         self.draft_name_var = tk.StringVar()
         self.draft_dropdown = None
         self.trade_service = trade_service
+        # Returns the draft engine's DraftOrderService, so the board shares its pick table
+        self.get_order_service = get_order_service
+        self._fallback_order_service = None
         self.user_picks = set()  # Initialize user's picks set (all picks, made and unmade)
         self.setup_ui()
         # Start glowing animation if no team selected
@@ -168,109 +172,90 @@ class DraftBoard(StyledFrame):
             self.team_labels[team_id] = team_label
         
         # Create pick slots for visible rounds only
-        pick_number = 1
         visible_rounds = min(self.total_rounds, self.max_visible_rounds)
         
-        for round_num in range(1, self.total_rounds + 1):
-            # Determine order for this round (with 3rd round reversal)
-            if round_num == 1:
-                order = list(range(1, self.num_teams + 1))  # 1→10
-            elif round_num == 2 or round_num == 3:
-                # Rounds 2 and 3 go the same direction (reverse)
-                order = list(range(self.num_teams, 0, -1))  # 10→1
-            else:
-                # After round 3, normal snake draft resumes
-                # Since round 3 went reverse, round 4 should go forward
-                # Round 4: forward (1→10), Round 5: reverse (10→1), etc.
-                if (round_num - 3) % 2 == 1:  # 4-3=1 (odd), so forward
-                    order = list(range(1, self.num_teams + 1))
-                else:  # 5-3=2 (even), so reverse
-                    order = list(range(self.num_teams, 0, -1))
+        order_service = self._order_service()
+        pick_table = order_service.get_pick_table(self.total_rounds)
+        original_order = order_service.get_original_order(self.total_rounds)
+        
+        for pick_number, (round_num, pick_in_round, actual_owner) in enumerate(pick_table, 1):
+            # Column is the team that originally held the pick
+            team_id = original_order[pick_number - 1]
+            is_traded = actual_owner != team_id
             
-            # Create pick slots
-            for pos, team_id in enumerate(order):
-                # Check if this pick has been traded
-                actual_owner = team_id
-                is_traded = False
-                if self.trade_service:
-                    actual_owner = self.trade_service.get_pick_owner(team_id, round_num)
-                    is_traded = actual_owner != team_id
-                
-                # Check if this pick belongs to the user (for initial highlighting)
-                is_user_pick = False
-                if self.selected_team_id and actual_owner == self.selected_team_id:
-                    is_user_pick = True
-                    self.user_picks.add(pick_number)
-                
-                # Background is always the default
-                pick_bg = DARK_THEME['bg_tertiary']
-                
-                pick_frame = StyledFrame(
-                    self.scrollable_frame,
-                    bg_type='tertiary',
-                    relief='flat',
-                    width=col_width,
-                    height=row_height
-                )
-                
-                # Add green border if it's a user pick
-                if is_user_pick:
-                    pick_frame.config(relief='ridge', borderwidth=3, highlightbackground='#4CAF50', highlightcolor='#4CAF50')
-                    
-                pick_frame.grid(
-                    row=round_num + 1,
-                    column=team_id - 1,
-                    sticky='nsew',
-                    padx=2,
-                    pady=2
-                )
-                pick_frame.grid_propagate(False)
-                
-                # Round/Pick label
-                round_pick_label = tk.Label(
-                    pick_frame,
-                    text=f"R{round_num}.{pos + 1}",
-                    bg=pick_bg,
-                    fg=DARK_THEME['text_muted'],
-                    font=(DARK_THEME['font_family'], 8)
-                )
-                round_pick_label.place(x=5, y=5)
+            # Check if this pick belongs to the user (for initial highlighting)
+            is_user_pick = False
+            if self.selected_team_id and actual_owner == self.selected_team_id:
+                is_user_pick = True
+                self.user_picks.add(pick_number)
+            
+            # Background is always the default
+            pick_bg = DARK_THEME['bg_tertiary']
+            
+            pick_frame = StyledFrame(
+                self.scrollable_frame,
+                bg_type='tertiary',
+                relief='flat',
+                width=col_width,
+                height=row_height
+            )
+            
+            # Add green border if it's a user pick
+            if is_user_pick:
+                pick_frame.config(relief='ridge', borderwidth=3, highlightbackground='#4CAF50', highlightcolor='#4CAF50')
                 
-                # Pick number label
-                pick_num_label = tk.Label(
+            pick_frame.grid(
+                row=round_num + 1,
+                column=team_id - 1,
+                sticky='nsew',
+                padx=2,
+                pady=2
+            )
+            pick_frame.grid_propagate(False)
+            
+            # Round/Pick label
+            round_pick_label = tk.Label(
+                pick_frame,
+                text=f"R{round_num}.{pick_in_round}",
+                bg=pick_bg,
+                fg=DARK_THEME['text_muted'],
+                font=(DARK_THEME['font_family'], 8)
+            )
+            round_pick_label.place(x=5, y=5)
+            
+            # Pick number label
+            pick_num_label = tk.Label(
+                pick_frame,
+                text=f"#{pick_number}",
+                bg=pick_bg,
+                fg=DARK_THEME['text_muted'],
+                font=(DARK_THEME['font_family'], 8)
+            )
+            pick_num_label.place(relx=0.95, y=5, anchor='ne')
+            
+            # Trade indicator if pick was traded
+            if is_traded:
+                trade_label = tk.Label(
                     pick_frame,
-                    text=f"#{pick_number}",
-                    bg=pick_bg,
-                    fg=DARK_THEME['text_muted'],
-                    font=(DARK_THEME['font_family'], 8)
+                    text=f"→T{actual_owner}",
+                    bg=pick_bg,  # Use the same background as the pick frame
+                    fg='#FFC107',  # Yellow for traded picks
+                    font=(DARK_THEME['font_family'], 8, 'bold')
                 )
-                pick_num_label.place(relx=0.95, y=5, anchor='ne')
-                
-                # Trade indicator if pick was traded
-                if is_traded:
-                    trade_label = tk.Label(
-                        pick_frame,
-                        text=f"→T{actual_owner}",
-                        bg=pick_bg,  # Use the same background as the pick frame
-                        fg='#FFC107',  # Yellow for traded picks
-                        font=(DARK_THEME['font_family'], 8, 'bold')
-                    )
-                    trade_label.place(relx=0.5, y=5, anchor='n')
-                
-                # Store reference
-                self.pick_widgets[pick_number] = pick_frame
-                
-                # Make pick clickable (but only for completed picks)
-                def on_pick_click(event):
-                    pass  # We'll handle clicks when the pick is actually made
-                
-                pick_frame.bind("<Button-1>", on_pick_click)
-                
-                # Bind mousewheel to pick frame
-                if hasattr(self, 'canvas'):
-                    pick_frame.bind("<MouseWheel>", lambda e: self.canvas.yview_scroll(int(-1*(e.delta/120)), 'units'))
-                
-                pick_number += 1
+                trade_label.place(relx=0.5, y=5, anchor='n')
+            
+            # Store reference
+            self.pick_widgets[pick_number] = pick_frame
+            
+            # Make pick clickable (but only for completed picks)
+            def on_pick_click(event):
+                pass  # We'll handle clicks when the pick is actually made
+            
+            pick_frame.bind("<Button-1>", on_pick_click)
+            
+            # Bind mousewheel to pick frame
+            if hasattr(self, 'canvas'):
+                pick_frame.bind("<MouseWheel>", lambda e: self.canvas.yview_scroll(int(-1*(e.delta/120)), 'units'))
         
         # Configure grid weights - make columns expand
         for i in range(self.num_teams):
@@ -823,6 +808,14 @@ class DraftBoard(StyledFrame):
             # Also update trade indicators on all picks
             self.refresh_trade_indicators()
     
+    def _order_service(self) -> DraftOrderService:
+        """The draft engine's order service, or a board-local one if there's no engine"""
+        if self.get_order_service:
+            return self.get_order_service()
+        if self._fallback_order_service is None:
+            self._fallback_order_service = DraftOrderService(self.num_teams, trade_service=self.trade_service)
+        return self._fallback_order_service
+    
     def calculate_user_picks(self, team_id: int):
         """Calculate which picks belong to the user's team (all picks, made and unmade)"""
         self.user_picks.clear()
@@ -830,35 +823,8 @@ class DraftBoard(StyledFrame):
         if not team_id:
             return
         
-        pick_number = 1
-        
-        for round_num in range(1, self.total_rounds + 1):
-            # Determine order for this round (with 3rd round reversal)
-            if round_num == 1:
-                order = list(range(1, self.num_teams + 1))  # 1→10
-            elif round_num == 2 or round_num == 3:
-                # Rounds 2 and 3 go the same direction (reverse)
-                order = list(range(self.num_teams, 0, -1))  # 10→1
-            else:
-                # After round 3, normal snake draft resumes
-                if (round_num - 3) % 2 == 1:  # 4-3=1 (odd), so forward
-                    order = list(range(1, self.num_teams + 1))
-                else:  # 5-3=2 (even), so reverse
-                    order = list(range(self.num_teams, 0, -1))
-            
-            # Check each pick in this round
-            for pos, pick_team_id in enumerate(order):
-                # Check if this pick has been traded
-                actual_owner = pick_team_id
-                if self.trade_service:
-                    actual_owner = self.trade_service.get_pick_owner(pick_team_id, round_num)
-                
-                # If this pick belongs to the user's team (either originally or via trade)
-                if actual_owner == team_id:
-                    # Add ALL user picks (both made and unmade)
-                    self.user_picks.add(pick_number)
-                
-                pick_number += 1
+        # Picks owned by the user's team, originally or via trade
+        self.user_picks.update(self._order_service().get_team_picks(team_id, self.total_rounds))
     
     def highlight_user_picks(self):
         """Apply border highlighting to all user's picks"""
@@ -12,12 +12,19 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from .theme import DARK_THEME, get_position_color, get_team_color
 from .styled_widgets import StyledFrame
 from ..utils.player_extensions import format_name
-from ..config.scoring import SCORING_CONFIG
+from ..utils.weekly_stats_cube import WeeklyStatsCube, FIELD_INDEX
 from ..services.vegas_props_service import VegasPropsService
 
 # Teams with dome stadiums
 DOME_TEAMS = {'ATL', 'DET', 'MIN', 'NO', 'LV', 'ARI', 'AZ', 'DAL', 'HOU', 'IND'}
 
+# Row sets kept by GameHistory.get_filtered_rows
+ROW_CACHE_SIZE = 8
+
+# Stat fields shown per game in the detailed view
+DETAIL_COLUMNS = [FIELD_INDEX[name] for name in
+                  ('pass_cmp', 'pass_yd', 'pass_td', 'rush_yd', 'rush_td', 'rec_tgt', 'rec', 'rec_yd', 'rec_td')]
+
 
 class GameHistory(StyledFrame):
     def __init__(self, parent, all_players, player_pool_service=None, on_draft=None, **kwargs):
@@ -26,7 +33,10 @@ class GameHistory(StyledFrame):
         self.player_pool_service = player_pool_service
         self.on_draft = on_draft
         self.player_lookup = {p.player_id: p for p in all_players if hasattr(p, 'player_id')}
-        self.weekly_stats = {}
+        self.stats_cube = None  # WeeklyStatsCube, set by load_weekly_stats
+        self._row_cache = {}  # filter/sort key -> sorted rows
+        self._tree_rows = {}  # iid -> (values, tags) currently in the tree
+        self._tree_order = []
         self.filtered_players = []
         
         # UI state
@@ -561,7 +571,20 @@ class GameHistory(StyledFrame):
         self.status_label.pack(pady=5)
         
     def load_weekly_stats(self):
-        """Load all weekly stats data from aggregated file"""
+        """Load all weekly stats data into the stats cube"""
+        games = self.read_game_logs()
+        if games is None:
+            self.status_label.config(text="Stats data not found")
+            return
+        
+        positions = {pid: p.position for pid, p in self.player_lookup.items()}
+        self.stats_cube = WeeklyStatsCube(games, positions)
+        self.invalidate_rows()
+        self.apply_filters()
+        self.status_label.config(text=f"Loaded {self.stats_cube.weeks_loaded} weeks of game data")
+    
+    def read_game_logs(self):
+        """Read game logs as {player_id: {week: game}}, or None if there are none"""
         # Try to load from aggregated file first
         stats_file = os.path.join(os.path.dirname(__file__), '..', '..', 'scripts', 'aggregated_player_stats_2024.json')
         stats_file = os.path.abspath(stats_file)
@@ -571,29 +594,15 @@ class GameHistory(StyledFrame):
                 with open(stats_file, 'r') as f:
                     all_player_data = json.load(f)
                 
-                # Reorganize data by week
+                games = {}
                 for player_id, player_data in all_player_data.items():
                     if player_id not in self.player_lookup:
                         continue
                     
-                    player = self.player_lookup[player_id]
-                    weekly_stats = player_data.get('weekly_stats', [])
-                    
-                    for week_data in weekly_stats:
-                        week = week_data.get('week', 0)
-                        if week < 1 or week > 18:
-                            continue
-                        
-                        if week not in self.weekly_stats:
-                            self.weekly_stats[week] = {}
-                        
-                        # Store the week data directly (not in a list)
-                        # This ensures only one entry per player per week
-                        self.weekly_stats[week][player_id] = week_data
-                
-                self.apply_filters()
-                self.status_label.config(text=f"Loaded {len(self.weekly_stats)} weeks of game data")
-                return
+                    # Only one entry per player per week
+                    games[player_id] = {week_data.get('week', 0): week_data
+                                        for week_data in player_data.get('weekly_stats', [])}
+                return games
             except Exception as e:
                 print(f"Error loading aggregated stats: {e}")
         
@@ -602,13 +611,11 @@ class GameHistory(StyledFrame):
         stats_dir = os.path.abspath(stats_dir)
         
         if not os.path.exists(stats_dir):
-            self.status_label.config(text="Stats data not found")
-            return
+            return None
             
         # Load all weeks and positions
+        games = {}
         for week in range(1, 19):
-            self.weekly_stats[week] = {}
-            
             for position in ['qb', 'rb', 'wr', 'te', 'db', 'lb']:
                 filename = f"2024_{week}_{position}.json"
                 filepath = os.path.join(stats_dir, filename)
@@ -620,66 +627,10 @@ class GameHistory(StyledFrame):
                             for player_stat in data:
                                 player_id = player_stat.get('player_id')
                                 if player_id and player_id in self.player_lookup:
-                                    if player_id not in self.weekly_stats[week]:
-                                        self.weekly_stats[week][player_id] = []
-                                    self.weekly_stats[week][player_id].append(player_stat)
+                                    games.setdefault(player_id, {}).setdefault(week, []).append(player_stat)
                     except Exception as e:
                         print(f"Error loading {filename}: {e}")
-        
-        self.apply_filters()
-        self.status_label.config(text=f"Loaded {len(self.weekly_stats)} weeks of game data")
-    
-    def calculate_custom_points(self, stats, position):
-        """Calculate custom fantasy points based on our scoring rules"""
-        points = 0.0
-        
-        # Defensive scoring for LB and DB
-        if position in ['LB', 'DB']:
-            # IDP stats use different field names
-            solo_tackles = stats.get('idp_tkl_solo', 0)
-            total_tackles = stats.get('idp_tkl', 0)
-            assist_tackles = max(0, total_tackles - solo_tackles)  # Calculate assists
-            
-            points += solo_tackles * SCORING_CONFIG.get('tackle_solo', 1.75)
-            points += assist_tackles * SCORING_CONFIG.get('tackle_assist', 1.0)
-            points += stats.get('idp_sack', 0) * SCORING_CONFIG.get('sack', 4.0)
-            points += stats.get('idp_int', 0) * SCORING_CONFIG.get('int', 6.0)
-            points += stats.get('idp_ff', 0) * SCORING_CONFIG.get('ff', 4.0)
-            points += stats.get('idp_fr', 0) * SCORING_CONFIG.get('fr', 3.0)
-            points += stats.get('idp_def_td', 0) * SCORING_CONFIG.get('def_td', 6.0)
-            points += stats.get('idp_safety', 0) * SCORING_CONFIG.get('safety', 2.0)
-            points += stats.get('idp_pass_def', 0) * SCORING_CONFIG.get('pass_defended', 1.5)
-            return points
-        
-        # Passing points
-        if position == 'QB':
-            points += stats.get('pass_cmp', 0) * SCORING_CONFIG['pass_completion']
-            points += stats.get('pass_yd', 0) * SCORING_CONFIG['pass_yard']
-            points += stats.get('pass_td', 0) * SCORING_CONFIG['touchdown']
-            
-            # Pass bonus
-            if stats.get('pass_yd', 0) >= 300:
-                points += SCORING_CONFIG['bonus_pass_300_yards']
-        
-        # Rushing points (all positions)
-        points += stats.get('rush_yd', 0) * SCORING_CONFIG['rush_yard']
-        points += stats.get('rush_td', 0) * SCORING_CONFIG['touchdown']
-        
-        # Rush bonus
-        if stats.get('rush_yd', 0) >= 100:
-            points += SCORING_CONFIG['bonus_rush_100_yards']
-        
-        # Receiving points (non-QBs)
-        if position != 'QB':
-            points += stats.get('rec', 0) * SCORING_CONFIG['reception']
-            points += stats.get('rec_yd', 0) * SCORING_CONFIG['rec_yard']
-            points += stats.get('rec_td', 0) * SCORING_CONFIG['touchdown']
-            
-            # Rec bonus
-            if stats.get('rec_yd', 0) >= 100:
-                points += SCORING_CONFIG['bonus_rec_100_yards']
-        
-        return points
+        return games
     
     def on_min_games_changed(self):
         """Handle minimum games filter changes"""
@@ -693,65 +644,20 @@ class GameHistory(StyledFrame):
         search_text = self.search_var.get().lower()
         selected_week = self.week_var.get()
         
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # The search filter runs over the cached, sorted rows
+        rows = self.get_filtered_rows(selected_week)
+        if search_text:
+            rows = [row for row in rows if search_text in row['_name']]
         
-        # Build filtered data
-        if self.view_mode == "summarized":
-            rows = self.build_summarized_data(search_text, selected_week)
-        else:
-            rows = self.build_detailed_data(search_text, selected_week)
-        
-        # Sort if needed
-        if self.sort_column:
-            self.sort_rows(rows)
-        
-        # Add to tree
-        for row in rows:
-            # Get Vegas props if in summarized mode
-            vegas_yards = '-'
-            vegas_pass = '-'
-            vegas_rush = '-'
-            vegas_rec_yds = '-'
-            vegas_rec = '-'
-            
-            if self.view_mode == "summarized":
-                player_name = row['player']
-                position = row['pos']
-                props = self.vegas_props_service.get_player_props(player_name)
-                
-                # Smart yards - position-specific
-                if position == 'QB' and 'passing_yards' in props:
-                    vegas_yards = f"{props['passing_yards'].prop_value:.0f}"
-                elif position == 'RB' and 'rushing_yards' in props:
-                    vegas_yards = f"{props['rushing_yards'].prop_value:.0f}"
-                elif position in ['WR', 'TE'] and 'receiving_yards' in props:
-                    vegas_yards = f"{props['receiving_yards'].prop_value:.0f}"
-                
-                # Individual columns
-                if 'passing_yards' in props:
-                    vegas_pass = f"{props['passing_yards'].prop_value:.0f}"
-                if 'rushing_yards' in props:
-                    vegas_rush = f"{props['rushing_yards'].prop_value:.0f}"
-                if 'receiving_yards' in props:
-                    vegas_rec_yds = f"{props['receiving_yards'].prop_value:.0f}"
-                if 'receptions' in props:
-                    vegas_rec = f"{props['receptions'].prop_value:.0f}"
-            
-            values = (row['player'], row['pos'], row.get('rank', '-'), row['team'], row['week'], row['opp'],
-                     row['pts'], row.get('median', '-'), row.get('avg', '-'), row['snaps'], row.get('pts_per_snap', '-'), row['comp'], row['pass_yd'], row['pass_td'], row['rush_yd'], 
-                     row['rush_td'], row.get('tgt', '-'), row['rec'], row['rec_yd'], row['rec_td'], vegas_yards, vegas_pass, vegas_rush, vegas_rec_yds, vegas_rec)
-            
-            # Add row with position-based colors
-            position = row['pos']
-            tags = (f'pos_{position}',)
-            
-            self.tree.insert('', 'end', values=values, tags=tags)
+        # Position-based colors
+        items = [(row['_iid'], self.get_row_values(row), (f"pos_{row['pos']}",)) for row in rows]
         
         # Add totals row if filtering by single player
         if self.should_show_totals(rows):
-            self.add_totals_row(rows)
+            items.append(('separator', ('',) * 24, ('separator',)))
+            items.append(('totals', self.build_totals_values(rows), ('totals',)))
+        
+        self.update_tree(items)
         
         # Configure tag colors for positions
         position_colors = {
@@ -775,478 +681,304 @@ class GameHistory(StyledFrame):
         # Update status
         self.status_label.config(text=f"Showing {len(rows)} {'seasons' if self.view_mode == 'summarized' else 'games'}")
     
-    def build_detailed_data(self, search_text, selected_week):
-        """Build data for detailed view (individual games)"""
-        rows = []
+    def get_filtered_rows(self, selected_week):
+        """Sorted rows for the current view, week and filters other than search
+        
+        Rows are memoized so typing in the search box only filters a cached
+        list instead of rebuilding and re-sorting every row. With Show
+        Available on, the drafted players are part of the key, so season
+        ranks stay ranks among the undrafted players and a pick rebuilds them.
+        """
+        drafted = None
+        if self.show_available_var.get() and self.player_pool_service:
+            drafted = frozenset(self.player_pool_service.drafted_players)
+        key = (self.view_mode, selected_week, self.selected_position, self.location_var.get(),
+               self.venue_var.get(), self.min_games_var.get(), self.sort_column, self.sort_ascending,
+               drafted)
+        rows = self._row_cache.get(key)
+        if rows is None:
+            if self.view_mode == "summarized":
+                rows = self.build_summarized_data(selected_week)
+            else:
+                rows = self.build_detailed_data(selected_week)
+            
+            # Sort if needed
+            if self.sort_column:
+                self.sort_rows(rows)
+            
+            # Keep only the most recent row sets
+            if len(self._row_cache) >= ROW_CACHE_SIZE:
+                del self._row_cache[next(iter(self._row_cache))]
+            self._row_cache[key] = rows
+        return rows
+    
+    def get_row_values(self, row):
+        """Tree values for a row, with Vegas props in summarized mode (computed once per row)"""
+        values = row.get('_values')
+        if values is not None:
+            return values
+        
+        # Get Vegas props if in summarized mode
+        vegas_yards = '-'
+        vegas_pass = '-'
+        vegas_rush = '-'
+        vegas_rec_yds = '-'
+        vegas_rec = '-'
         
-        # First pass: collect all games by week and position for ranking
-        week_position_data = {}  # {week: {position: [(player_id, pts)]}}
+        if self.view_mode == "summarized":
+            player_name = row['player']
+            position = row['pos']
+            props = self.vegas_props_service.get_player_props(player_name)
+            
+            # Smart yards - position-specific
+            if position == 'QB' and 'passing_yards' in props:
+                vegas_yards = f"{props['passing_yards'].prop_value:.0f}"
+            elif position == 'RB' and 'rushing_yards' in props:
+                vegas_yards = f"{props['rushing_yards'].prop_value:.0f}"
+            elif position in ['WR', 'TE'] and 'receiving_yards' in props:
+                vegas_yards = f"{props['receiving_yards'].prop_value:.0f}"
+            
+            # Individual columns
+            if 'passing_yards' in props:
+                vegas_pass = f"{props['passing_yards'].prop_value:.0f}"
+            if 'rushing_yards' in props:
+                vegas_rush = f"{props['rushing_yards'].prop_value:.0f}"
+            if 'receiving_yards' in props:
+                vegas_rec_yds = f"{props['receiving_yards'].prop_value:.0f}"
+            if 'receptions' in props:
+                vegas_rec = f"{props['receptions'].prop_value:.0f}"
+        
+        values = (row['player'], row['pos'], row.get('rank', '-'), row['team'], row['week'], row['opp'],
+                 row['pts'], row.get('median', '-'), row.get('avg', '-'), row['snaps'], row.get('pts_per_snap', '-'), row['comp'], row['pass_yd'], row['pass_td'], row['rush_yd'], 
+                 row['rush_td'], row.get('tgt', '-'), row['rec'], row['rec_yd'], row['rec_td'], vegas_yards, vegas_pass, vegas_rush, vegas_rec_yds, vegas_rec)
+        row['_values'] = values
+        return values
+    
+    def update_tree(self, items):
+        """Bring the tree in line with items [(iid, values, tags)], touching only what changed
+        
+        Rows that stay keep their tree item (and selection); rows that left
+        are deleted in one call. When the kept rows are already in order, new
+        rows are inserted in place; otherwise (a sort change) the kept rows
+        are detached and re-attached in the new order.
+        """
+        shown = self._tree_rows
+        new_ids = {iid for iid, _, _ in items}
+        
+        stale = [iid for iid in self._tree_order if iid not in new_ids]
+        if stale:
+            self.tree.delete(*stale)
+        kept = [iid for iid in self._tree_order if iid in new_ids]
+        in_order = kept == [iid for iid, _, _ in items if iid in shown]
+        if not in_order and kept:
+            self.tree.detach(*kept)
+        
+        # Items past the last kept row can go straight on the end
+        last_kept = max((index for index, (iid, _, _) in enumerate(items) if iid in shown), default=-1)
+        rows = {}
+        for index, (iid, values, tags) in enumerate(items):
+            if iid in shown:
+                if shown[iid] != (values, tags):
+                    self.tree.item(iid, values=values, tags=tags)
+                if not in_order:
+                    self.tree.move(iid, '', 'end')
+            elif in_order and index < last_kept:
+                self.tree.insert('', index, iid=iid, values=values, tags=tags)
+            else:
+                self.tree.insert('', 'end', iid=iid, values=values, tags=tags)
+            rows[iid] = (values, tags)
         
-        for week, week_data in self.weekly_stats.items():
-            if selected_week != "ALL" and str(week) != selected_week:
-                continue
-                
-            week_position_data[week] = {}
+        self._tree_rows = rows
+        self._tree_order = [iid for iid, _, _ in items]
+    
+    def invalidate_rows(self):
+        """Drop memoized rows (after the stats are reloaded)"""
+        self._row_cache.clear()
+    
+    def filter_cube_rows(self):
+        """Stats cube rows of players passing the position and available filters"""
+        cube = self.stats_cube
+        available_only = self.show_available_var.get() and self.player_pool_service
+        rows = []
+        for i, player_id in enumerate(cube.player_ids):
+            position = cube.positions[i]
             
-            for player_id, stats_data in week_data.items():
-                if player_id not in self.player_lookup:
+            # Position filter
+            if self.selected_position == "FLEX":
+                if position not in ["RB", "WR", "TE"]:
                     continue
-                    
-                player = self.player_lookup[player_id]
-                position = player.position
-                
-                # Handle both single stat object and list of stats
-                stats_list = stats_data if isinstance(stats_data, list) else [stats_data]
-                
-                for stat in stats_list:
-                    stats = stat.get('stats', {})
-                    # Only count if player actually played
-                    if int(stats.get('off_snp', 0)) > 0:
-                        custom_pts = self.calculate_custom_points(stats, position)
-                        
-                        if position not in week_position_data[week]:
-                            week_position_data[week][position] = []
-                        week_position_data[week][position].append((player_id, custom_pts))
-                        break  # Only one game per week
-        
-        # Sort each position by points descending for ranking
-        for week in week_position_data:
-            for position in week_position_data[week]:
-                week_position_data[week][position].sort(key=lambda x: x[1], reverse=True)
-        
-        # Normal filtering
-        if False:  # Removed roster position filtering
-            for week, week_data in self.weekly_stats.items():
-                # Skip if week filter is active
-                if selected_week != "ALL" and str(week) != selected_week:
+            elif self.selected_position == "IDP":
+                if position not in ["DB", "LB"]:
                     continue
-                
-                # Get all players of the selected position for this week
-                week_position_scores = []
-                for player_id, stats_list in week_data.items():
-                    if player_id not in self.player_lookup:
-                        continue
-                    player = self.player_lookup[player_id]
-                    if player.position == self.selected_position:
-                        for stat in stats_list:
-                            pts = stat.get('stats', {}).get('pts_ppr', 0)
-                            week_position_scores.append((player_id, pts))
-                
-                # Sort by points to get ranks
-                week_position_scores.sort(key=lambda x: x[1], reverse=True)
-                position_ranks = {pid: rank+1 for rank, (pid, _) in enumerate(week_position_scores)}
-                
-                # Extract rank number from filter (e.g., "RB1" -> 1)
-                target_rank = int(self.roster_position_filter[-1])
-                
-                # Process players for this week
-                for player_id, stats_list in week_data.items():
-                    if player_id not in self.player_lookup:
-                        continue
-                    
-                    player = self.player_lookup[player_id]
-                    
-                    # Check if this player has the target rank
-                    if position_ranks.get(player_id, 999) != target_rank:
-                        continue
-                    
-                    # Search filter
-                    if search_text and search_text not in player.name.lower():
-                        continue
-                    
-                    # Process the game
-                    for stat in stats_list:
-                        stats = stat.get('stats', {})
-                        
-                        # Skip games where player didn't play (0 snaps)
-                        # Use defensive snaps for DB/LB, offensive snaps for others
-                        if player.position in ['DB', 'LB']:
-                            if int(stats.get('def_snp', 0)) == 0:
-                                continue
-                        else:
-                            if int(stats.get('off_snp', 0)) == 0:
-                                continue
-                        
-                        opponent = stat.get('opponent', '')
-                        player_team = stat.get('team', player.team)
-                        
-                        # Apply location filter (HOME/AWAY)
-                        if self.location_var.get() != "ALL":
-                            # Determine if home or away game
-                            # We'll use week + team hash to determine home/away (simplified logic)
-                            is_home = (week + hash(player_team)) % 2 == 0
-                            
-                            if self.location_var.get() == "HOME" and not is_home:
-                                continue
-                            elif self.location_var.get() == "AWAY" and is_home:
-                                continue
-                        
-                        # Apply venue filter (DOME/OUTSIDE)
-                        if self.venue_var.get() != "ALL":
-                            # Check if game is in a dome
-                            # Game is in dome if either team plays in a dome and it's their home game
-                            is_home = (week + hash(player_team)) % 2 == 0
-                            
-                            if is_home:
-                                # Home game - check if player's team has a dome
-                                game_in_dome = player_team in DOME_TEAMS
-                            else:
-                                # Away game - check if opponent has a dome
-                                game_in_dome = opponent in DOME_TEAMS
-                            
-                            if self.venue_var.get() == "DOME" and not game_in_dome:
-                                continue
-                            elif self.venue_var.get() == "OUTSIDE" and game_in_dome:
-                                continue
-                        
-                        # Calculate custom points
-                        custom_pts = self.calculate_custom_points(stats, player.position)
-                        
-                        # Format opponent with home/away indicator
-                        is_home = (week + hash(player_team)) % 2 == 0
-                        opponent_display = f"vs {opponent}" if is_home else f"@ {opponent}"
-                        
-                        # Calculate pts per snap
-                        # Use defensive snaps for LB/DB, offensive snaps for others
-                        if player.position in ['LB', 'DB']:
-                            snaps = int(stats.get('def_snp', 0))
-                        else:
-                            snaps = int(stats.get('off_snp', 0))
-                        pts_per_snap = custom_pts / snaps if snaps > 0 else 0
-                        
-                        # Find rank for this player
-                        rank = '-'
-                        if week in week_position_data and player.position in week_position_data[week]:
-                            for idx, (pid, pts) in enumerate(week_position_data[week][player.position]):
-                                if pid == player_id and abs(pts - custom_pts) < 0.01:  # Account for float precision
-                                    rank = f"{player.position}{idx + 1}"
-                                    break
-                        
-                        row = {
-                            'player': format_name(player.name),
-                            'pos': player.position,
-                            'rank': rank,
-                            'team': player.team or '-',
-                            'week': week,
-                            'opp': opponent_display,
-                            'pts': f"{custom_pts:.1f}",
-                            'snaps': snaps,
-                            'pts_per_snap': f"{pts_per_snap:.3f}" if snaps > 0 else '-',
-                            'comp': int(stats.get('pass_cmp', 0)) if player.position == 'QB' else '-',
-                            'pass_yd': int(stats.get('pass_yd', 0)) if player.position == 'QB' else '-',
-                            'pass_td': int(stats.get('pass_td', 0)) if player.position == 'QB' else '-',
-                            'rush_yd': int(stats.get('rush_yd', 0)),
-                            'rush_td': max(0, int(stats.get('rush_td', 0))),
-                            'tgt': int(stats.get('rec_tgt', 0)) if player.position != 'QB' else '-',
-                            'rec': int(stats.get('rec', 0)) if player.position != 'QB' else '-',
-                            'rec_yd': int(stats.get('rec_yd', 0)) if player.position != 'QB' else '-',
-                            'rec_td': int(stats.get('rec_td', 0)) if player.position != 'QB' else '-',
-                            '_pts_float': custom_pts,  # For sorting
-                            '_week_int': week,  # For sorting
-                            '_pts_per_snap_float': pts_per_snap,  # For sorting
-                            '_rank_int': int(rank[2:]) if rank != '-' else 999  # For sorting
-                        }
-                        rows.append(row)
-        else:
-            # Normal filtering without roster position
-            for week, week_data in self.weekly_stats.items():
-                # Skip if week filter is active
-                if selected_week != "ALL" and str(week) != selected_week:
+            elif self.selected_position == "OFF":
+                if position not in ["QB", "RB", "WR", "TE"]:
                     continue
-                
-                for player_id, stats_data in week_data.items():
-                    if player_id not in self.player_lookup:
-                        continue
-                        
-                    player = self.player_lookup[player_id]
-                    
-                    # Position filter
-                    if self.selected_position == "FLEX":
-                        if player.position not in ["RB", "WR", "TE"]:
-                            continue
-                    elif self.selected_position == "IDP":
-                        if player.position not in ["DB", "LB"]:
-                            continue
-                    elif self.selected_position == "OFF":
-                        if player.position not in ["QB", "RB", "WR", "TE"]:
-                            continue
-                    elif self.selected_position != "ALL" and player.position != self.selected_position:
-                        continue
-                    
-                    # Search filter
-                    if search_text and search_text not in player.name.lower():
-                        continue
-                    
-                    # Show Available filter (only undrafted players)
-                    if self.show_available_var.get() and self.player_pool_service:
-                        if not self.player_pool_service.is_player_available(player):
-                            continue
-                    
-                    # Handle both single stat object and list of stats
-                    stats_list = stats_data if isinstance(stats_data, list) else [stats_data]
-                    
-                    # Process each game for this player
-                    for stat in stats_list:
-                        stats = stat.get('stats', {})
-                        
-                        # Skip games where player didn't play (0 snaps)
-                        # Use defensive snaps for DB/LB, offensive snaps for others
-                        if player.position in ['DB', 'LB']:
-                            if int(stats.get('def_snp', 0)) == 0:
-                                continue
-                        else:
-                            if int(stats.get('off_snp', 0)) == 0:
-                                continue
-                        
-                        opponent = stat.get('opponent', '')
-                        player_team = stat.get('team', player.team)
-                        
-                        # Apply location filter (HOME/AWAY)
-                        if self.location_var.get() != "ALL":
-                            # Determine if home or away game
-                            # We'll use week + team hash to determine home/away (simplified logic)
-                            is_home = (week + hash(player_team)) % 2 == 0
-                            
-                            if self.location_var.get() == "HOME" and not is_home:
-                                continue
-                            elif self.location_var.get() == "AWAY" and is_home:
-                                continue
-                        
-                        # Apply venue filter (DOME/OUTSIDE)
-                        if self.venue_var.get() != "ALL":
-                            # Check if game is in a dome
-                            # Game is in dome if either team plays in a dome and it's their home game
-                            is_home = (week + hash(player_team)) % 2 == 0
-                            
-                            if is_home:
-                                # Home game - check if player's team has a dome
-                                game_in_dome = player_team in DOME_TEAMS
-                            else:
-                                # Away game - check if opponent has a dome
-                                game_in_dome = opponent in DOME_TEAMS
-                            
-                            if self.venue_var.get() == "DOME" and not game_in_dome:
-                                continue
-                            elif self.venue_var.get() == "OUTSIDE" and game_in_dome:
-                                continue
-                        
-                        # Calculate custom points
-                        custom_pts = self.calculate_custom_points(stats, player.position)
-                        
-                        # Format opponent with home/away indicator
-                        is_home = (week + hash(player_team)) % 2 == 0
-                        opponent_display = f"vs {opponent}" if is_home else f"@ {opponent}"
-                        
-                        # Calculate pts per snap
-                        # Use defensive snaps for LB/DB, offensive snaps for others
-                        if player.position in ['LB', 'DB']:
-                            snaps = int(stats.get('def_snp', 0))
-                        else:
-                            snaps = int(stats.get('off_snp', 0))
-                        pts_per_snap = custom_pts / snaps if snaps > 0 else 0
-                        
-                        # Find rank for this player
-                        rank = '-'
-                        if week in week_position_data and player.position in week_position_data[week]:
-                            for idx, (pid, pts) in enumerate(week_position_data[week][player.position]):
-                                if pid == player_id and abs(pts - custom_pts) < 0.01:  # Account for float precision
-                                    rank = f"{player.position}{idx + 1}"
-                                    break
-                        
-                        row = {
-                            'player': format_name(player.name),
-                            'pos': player.position,
-                            'rank': rank,
-                            'team': player.team or '-',
-                            'week': week,
-                            'opp': opponent_display,
-                            'pts': f"{custom_pts:.1f}",
-                            'snaps': snaps,
-                            'pts_per_snap': f"{pts_per_snap:.3f}" if snaps > 0 else '-',
-                            'comp': int(stats.get('pass_cmp', 0)) if player.position == 'QB' else '-',
-                            'pass_yd': int(stats.get('pass_yd', 0)) if player.position == 'QB' else '-',
-                            'pass_td': int(stats.get('pass_td', 0)) if player.position == 'QB' else '-',
-                            'rush_yd': int(stats.get('rush_yd', 0)),
-                            'rush_td': max(0, int(stats.get('rush_td', 0))),
-                            'tgt': int(stats.get('rec_tgt', 0)) if player.position != 'QB' else '-',
-                            'rec': int(stats.get('rec', 0)) if player.position != 'QB' else '-',
-                            'rec_yd': int(stats.get('rec_yd', 0)) if player.position != 'QB' else '-',
-                            'rec_td': int(stats.get('rec_td', 0)) if player.position != 'QB' else '-',
-                            '_pts_float': custom_pts,  # For sorting
-                            '_week_int': week,  # For sorting
-                            '_pts_per_snap_float': pts_per_snap,  # For sorting
-                            '_rank_int': int(rank[2:]) if rank != '-' else 999  # For sorting
-                        }
-                        rows.append(row)
-        
+            elif self.selected_position != "ALL" and position != self.selected_position:
+                continue
+            
+            # Show Available filter (only undrafted players)
+            if available_only and not self.player_pool_service.is_player_available(self.player_lookup[player_id]):
+                continue
+            
+            rows.append(i)
         return rows
     
-    def build_summarized_data(self, search_text, selected_week):
-        """Build data for summarized view (season totals)"""
+    def build_detailed_data(self, selected_week):
+        """Build data for detailed view (individual games)"""
         rows = []
-        player_totals = {}
-        position_season_totals = {}  # {position: [(player_id, total_pts)]} for ranking
-        
-        # Aggregate data by player
-        for week, week_data in self.weekly_stats.items():
-            # Skip if week filter is active
-            if selected_week != "ALL" and str(week) != selected_week:
+        cube = self.stats_cube
+        if cube is None:
+            return rows
+        week_filter = None if selected_week == "ALL" else int(selected_week)
+        
+        game_rows, game_weeks = cube.games(self.filter_cube_rows(), week_filter)
+        cols = game_weeks - 1
+        # Pull the selected games out of the cube in bulk, then build rows from plain lists
+        games = zip(game_rows.tolist(), game_weeks.tolist(),
+                    cube.stats[game_rows, cols][:, DETAIL_COLUMNS].astype(int).tolist(),
+                    cube.points[game_rows, cols].tolist(),
+                    cube.snaps[game_rows, cols].tolist(),
+                    cube.week_ranks[game_rows, cols].tolist(),
+                    cube.opponents[game_rows, cols].tolist(),
+                    cube.teams[game_rows, cols].tolist())
+        location = self.location_var.get()
+        venue = self.venue_var.get()
+        names = {}
+        
+        for i, week, stats, custom_pts, snaps, week_rank, opponent, player_team in games:
+            player = self.player_lookup[cube.player_ids[i]]
+            player_team = player_team or player.team
+            
+            # Home/away is simplified: week + team hash
+            is_home = (week + hash(player_team)) % 2 == 0
+            
+            # Apply location filter (HOME/AWAY)
+            if location == "HOME" and not is_home:
+                continue
+            elif location == "AWAY" and is_home:
                 continue
             
-            for player_id, stats_data in week_data.items():
-                if player_id not in self.player_lookup:
-                    continue
-                    
-                player = self.player_lookup[player_id]
+            # Apply venue filter (DOME/OUTSIDE)
+            if venue != "ALL":
+                # Home game - check if player's team has a dome, away game - check opponent
+                game_in_dome = (player_team if is_home else opponent) in DOME_TEAMS
                 
-                # Position filter
-                if self.selected_position == "FLEX":
-                    if player.position not in ["RB", "WR", "TE"]:
-                        continue
-                elif self.selected_position == "IDP":
-                    if player.position not in ["DB", "LB"]:
-                        continue
-                elif self.selected_position == "OFF":
-                    if player.position not in ["QB", "RB", "WR", "TE"]:
-                        continue
-                elif self.selected_position != "ALL" and player.position != self.selected_position:
+                if venue == "DOME" and not game_in_dome:
                     continue
-                
-                # Search filter
-                if search_text and search_text not in player.name.lower():
+                elif venue == "OUTSIDE" and game_in_dome:
                     continue
-                
-                # Show Available filter (only undrafted players)
-                if self.show_available_var.get() and self.player_pool_service:
-                    if not self.player_pool_service.is_player_available(player):
-                        continue
-                
-                # Initialize player totals if needed
-                if player_id not in player_totals:
-                    player_totals[player_id] = {
-                        'player': format_name(player.name),
-                        'pos': player.position,
-                        'team': player.team or '-',
-                        'games': 0,
-                        'pts': 0,
-                        'snaps': 0,
-                        'comp': 0,
-                        'pass_yd': 0,
-                        'pass_td': 0,
-                        'rush_yd': 0,
-                        'rush_td': 0,
-                        'tgt': 0,
-                        'rec': 0,
-                        'rec_yd': 0,
-                        'rec_td': 0,
-                        'game_points': []  # Track individual game points for median/avg
-                    }
-                
-                # Handle both single stat object and list of stats
-                stats_list = stats_data if isinstance(stats_data, list) else [stats_data]
-                
-                # Aggregate stats
-                for stat in stats_list:
-                    stats = stat.get('stats', {})
-                    totals = player_totals[player_id]
-                    
-                    # Only count as a game if player actually played (had snaps)
-                    # Use defensive snaps for LB/DB, offensive snaps for others
-                    if player.position in ['LB', 'DB']:
-                        game_snaps = int(stats.get('def_snp', 0))
-                    else:
-                        game_snaps = int(stats.get('off_snp', 0))
-                        
-                    if game_snaps == 0:
-                        continue
-                    
-                    totals['games'] += 1
-                    # Calculate custom points for this game
-                    custom_pts = self.calculate_custom_points(stats, player.position)
-                    totals['pts'] += custom_pts
-                    
-                    # Track game points if player had meaningful participation
-                    # (20+ snaps OR 20+ points)
-                    if game_snaps >= 20 or custom_pts >= 20:
-                        totals['game_points'].append(custom_pts)
-                    
-                    totals['snaps'] += game_snaps
-                    if player.position == 'QB':
-                        totals['comp'] += int(stats.get('pass_cmp', 0))
-                        totals['pass_yd'] += int(stats.get('pass_yd', 0))
-                        totals['pass_td'] += int(stats.get('pass_td', 0))
-                    totals['rush_yd'] += int(stats.get('rush_yd', 0))
-                    totals['rush_td'] += int(stats.get('rush_td', 0))
-                    if player.position != 'QB':
-                        totals['tgt'] += int(stats.get('rec_tgt', 0))
-                        totals['rec'] += int(stats.get('rec', 0))
-                        totals['rec_yd'] += int(stats.get('rec_yd', 0))
-                        totals['rec_td'] += int(stats.get('rec_td', 0))
-        
-        # Collect season totals by position for ranking
-        for player_id, totals in player_totals.items():
-            position = totals['pos']
-            if position not in position_season_totals:
-                position_season_totals[position] = []
-            position_season_totals[position].append((player_id, totals['pts']))
-        
-        # Sort each position by total points descending
-        for position in position_season_totals:
-            position_season_totals[position].sort(key=lambda x: x[1], reverse=True)
-        
-        # Convert to rows
-        for player_id, totals in player_totals.items():
+            
+            opponent_display = f"vs {opponent}" if is_home else f"@ {opponent}"
+            
+            # Snaps are defensive for LB/DB, offensive for others (the cube picks)
+            pts_per_snap = custom_pts / snaps if snaps > 0 else 0
+            rank = f"{player.position}{week_rank}" if week_rank else '-'
+            if i not in names:
+                names[i] = format_name(player.name)
+            
+            is_qb = player.position == 'QB'
+            comp, pass_yd, pass_td, rush_yd, rush_td, tgt, rec, rec_yd, rec_td = stats
+            row = {
+                'player': names[i],
+                'pos': player.position,
+                'rank': rank,
+                'team': player.team or '-',
+                'week': week,
+                'opp': opponent_display,
+                'pts': f"{custom_pts:.1f}",
+                'snaps': snaps,
+                'pts_per_snap': f"{pts_per_snap:.3f}" if snaps > 0 else '-',
+                'comp': comp if is_qb else '-',
+                'pass_yd': pass_yd if is_qb else '-',
+                'pass_td': pass_td if is_qb else '-',
+                'rush_yd': rush_yd,
+                'rush_td': max(0, rush_td),
+                'tgt': tgt if not is_qb else '-',
+                'rec': rec if not is_qb else '-',
+                'rec_yd': rec_yd if not is_qb else '-',
+                'rec_td': rec_td if not is_qb else '-',
+                '_iid': f"{player.player_id}:{week}",  # Tree item id
+                '_player_id': player.player_id,
+                '_name': player.name.lower(),  # For search
+                '_pts_float': custom_pts,  # For sorting
+                '_week_int': week,  # For sorting
+                '_pts_per_snap_float': pts_per_snap,  # For sorting
+                '_rank_int': week_rank or 999  # For sorting
+            }
+            rows.append(row)
+        
+        return rows
+    
+    def build_summarized_data(self, selected_week):
+        """Build data for summarized view (season totals)"""
+        rows = []
+        cube = self.stats_cube
+        if cube is None:
+            return rows
+        summary = cube.season_summary(None if selected_week == "ALL" else int(selected_week))
+        
+        # Players with a game log in the selected weeks
+        selected = [i for i in self.filter_cube_rows() if summary['present'][i]]
+        
+        # Season rank among the filtered players at each position, by total points
+        season_ranks = {}
+        for position in {cube.positions[i] for i in selected}:
+            group = [i for i in selected if cube.positions[i] == position]
+            order = sorted(group, key=lambda i: summary['pts'][i], reverse=True)
+            season_ranks.update((i, idx + 1) for idx, i in enumerate(order))
+        
+        min_games = self.min_games_var.get()
+        for i in selected:
+            games = int(summary['games'][i])
             # Apply minimum games filter
-            if totals['games'] < self.min_games_var.get():
+            if games < min_games:
                 continue
-                
-            # Calculate median and average from games with meaningful participation
-            if totals['game_points']:
-                median_pts = statistics.median(totals['game_points'])
-                avg_pts = statistics.mean(totals['game_points'])
-            else:
-                median_pts = 0
-                avg_pts = 0
+            
+            player = self.player_lookup[cube.player_ids[i]]
+            is_qb = player.position == 'QB'
+            total_pts = float(summary['pts'][i])
+            median_pts = float(summary['median'][i])
+            avg_pts = float(summary['avg'][i])
+            total_snaps = int(summary['snaps'][i])
             
             # Calculate average pts per snap
-            avg_pts_per_snap = totals['pts'] / totals['snaps'] if totals['snaps'] > 0 else 0
+            avg_pts_per_snap = total_pts / total_snaps if total_snaps > 0 else 0
             
-            # Find season rank
-            rank = '-'
-            position = totals['pos']
-            if position in position_season_totals:
-                for idx, (pid, pts) in enumerate(position_season_totals[position]):
-                    if pid == player_id:
-                        rank = f"{position}{idx + 1}"
-                        break
+            def total(name, include=True):
+                value = int(summary[name][i]) if include else 0
+                return value if value > 0 else '-'
             
+            rank = f"{player.position}{season_ranks[i]}"
             row = {
-                'player': totals['player'],
-                'pos': totals['pos'],
+                'player': format_name(player.name),
+                'pos': player.position,
                 'rank': rank,
-                'team': totals['team'],
-                'week': f"{totals['games']}g",  # Show games played
+                'team': player.team or '-',
+                'week': f"{games}g",  # Show games played
                 'opp': '2024',  # Show year instead of opponent
-                'pts': f"{totals['pts']:.1f}",
+                'pts': f"{total_pts:.1f}",
                 'median': f"{median_pts:.1f}" if median_pts > 0 else '-',
                 'avg': f"{avg_pts:.1f}" if avg_pts > 0 else '-',
-                'snaps': totals['snaps'] if totals['snaps'] > 0 else '-',
-                'pts_per_snap': f"{avg_pts_per_snap:.3f}" if totals['snaps'] > 0 else '-',
-                'comp': totals['comp'] if totals['comp'] > 0 else '-',
-                'pass_yd': totals['pass_yd'] if totals['pass_yd'] > 0 else '-',
-                'pass_td': totals['pass_td'] if totals['pass_td'] > 0 else '-',
-                'rush_yd': totals['rush_yd'] if totals['rush_yd'] > 0 else '-',
-                'rush_td': totals['rush_td'] if totals['rush_td'] > 0 else '-',
-                'tgt': totals['tgt'] if totals['tgt'] > 0 else '-',
-                'rec': totals['rec'] if totals['rec'] > 0 else '-',
-                'rec_yd': totals['rec_yd'] if totals['rec_yd'] > 0 else '-',
-                'rec_td': totals['rec_td'] if totals['rec_td'] > 0 else '-',
-                '_pts_float': totals['pts'],  # For sorting
-                '_week_int': totals['games'],  # For sorting
+                'snaps': total_snaps if total_snaps > 0 else '-',
+                'pts_per_snap': f"{avg_pts_per_snap:.3f}" if total_snaps > 0 else '-',
+                'comp': total('pass_cmp', is_qb),
+                'pass_yd': total('pass_yd', is_qb),
+                'pass_td': total('pass_td', is_qb),
+                'rush_yd': total('rush_yd'),
+                'rush_td': total('rush_td'),
+                'tgt': total('rec_tgt', not is_qb),
+                'rec': total('rec', not is_qb),
+                'rec_yd': total('rec_yd', not is_qb),
+                'rec_td': total('rec_td', not is_qb),
+                '_iid': player.player_id,  # Tree item id
+                '_player_id': player.player_id,
+                '_name': player.name.lower(),  # For search
+                '_pts_float': total_pts,  # For sorting
+                '_week_int': games,  # For sorting
                 '_median_float': median_pts,  # For sorting
                 '_avg_float': avg_pts,  # For sorting
                 '_pts_per_snap_float': avg_pts_per_snap,  # For sorting
-                '_rank_int': int(rank[2:]) if rank != '-' else 999  # For sorting
+                '_rank_int': season_ranks[i]  # For sorting
             }
             rows.append(row)
         
@@ -1732,10 +1464,8 @@ class GameHistory(StyledFrame):
         player_names = set(row['player'] for row in rows)
         return len(player_names) == 1 and len(rows) > 1
     
-    def add_totals_row(self, rows):
-        """Add a totals row for single player view"""
-        if not rows:
-            return
+    def build_totals_values(self, rows):
+        """Tree values for the totals row of a single player view"""
             
         # Initialize totals
         totals = {
@@ -1817,14 +1547,7 @@ class GameHistory(StyledFrame):
             '-'   # Vegas Rec
         )
         
-        # Add separator row
-        self.tree.insert('', 'end', values=('', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', ''), tags=('separator',))
-        
-        # Add totals row
-        self.tree.insert('', 'end', values=values, tags=('totals',))
-        
-        # Style separator
-        self.tree.tag_configure('separator', background=DARK_THEME['bg_primary'])
+        return values
     
     def setup_graph(self, container):
         """Setup the matplotlib graph"""
@@ -2113,37 +1836,25 @@ class GameHistory(StyledFrame):
         snaps = []  # Track snaps for each week
         metric_data = []  # Track selected metric data
         
+        cube = self.stats_cube
+        row = cube.index.get(player_id) if cube is not None else None
         for week in range(1, 19):  # All weeks 1-18
             week_points = 0  # Default to 0
             week_snaps = 0   # Default to 0
             week_metric = 0  # Default to 0
             
-            if week in self.weekly_stats and player_id in self.weekly_stats[week]:
-                stats_data = self.weekly_stats[week][player_id]
-                # Handle both single stat object and list of stats
-                stats_list = stats_data if isinstance(stats_data, list) else [stats_data]
-                
-                for stat in stats_list:
-                    stats = stat.get('stats', {})
-                    # Check defensive snaps for DB/LB, offensive snaps for others
-                    player = self.player_lookup[player_id]
-                    if player.position in ['DB', 'LB']:
-                        week_snaps = int(stats.get('def_snp', 0))
-                    else:
-                        week_snaps = int(stats.get('off_snp', 0))
-                    # Only count if player actually played (had snaps)
-                    if week_snaps > 0:
-                        # Calculate custom points
-                        week_points = self.calculate_custom_points(stats, player.position)
-                        # Get metric data
-                        if self.graph_metric == "snaps":
-                            week_metric = week_snaps
-                        elif self.graph_metric == "points":
-                            week_metric = week_points
-                        else:
-                            # Get raw stat value
-                            week_metric = float(stats.get(self.graph_metric, 0))
-                        break  # Only one game per week
+            # Only count if player actually played (had snaps)
+            if row is not None and cube.played[row, week - 1]:
+                week_snaps = int(cube.snaps[row, week - 1])
+                week_points = float(cube.points[row, week - 1])
+                # Get metric data
+                if self.graph_metric == "snaps":
+                    week_metric = week_snaps
+                elif self.graph_metric == "points":
+                    week_metric = week_points
+                elif self.graph_metric in FIELD_INDEX:
+                    # Get raw stat value
+                    week_metric = float(cube.field(self.graph_metric)[row, week - 1])
             
             weeks.append(week)
             points.append(week_points)
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Optional, Callable, Dict
+from bisect import bisect_left
 import os
 from ..models import Player
 from .theme import DARK_THEME, get_position_color
@@ -11,6 +12,19 @@ from ..services.custom_round_manager import CustomRoundManager
 from ..services.vegas_props_service import VegasPropsService
 from ..services.sos_manager import SOSManager
 from ..nfc_adp_fetcher import NFCADPFetcher
+from ..utils.sort_index import SortIndexCache
+
+# Custom rank cell colors by cheat sheet tier
+TIER_COLORS = {
+    1: '#FFD700',  # Gold
+    2: '#C0C0C0',  # Silver
+    3: '#CD7F32',  # Bronze
+    4: '#4169E1',  # Royal Blue
+    5: '#32CD32',  # Lime Green
+    6: '#FF6347',  # Tomato
+    7: '#9370DB',  # Medium Purple
+    8: '#20B2AA',  # Light Sea Green
+}
 
 
 class PlayerList(StyledFrame):
@@ -39,6 +53,7 @@ class PlayerList(StyledFrame):
         self.drag_start_pos = None  # Track drag start position
         self.is_dragging = False  # Track if actually dragging
         self.drafted_players = set()  # Track drafted players
+        self.availability_forecast = None  # AvailabilityForecast for the user's next pick
         
         # Custom rankings from cheat sheet
         self.custom_rankings = {}
@@ -76,6 +91,13 @@ class PlayerList(StyledFrame):
         self.visible_rows = 15  # Number of rows visible at once
         self.row_height = 35  # Height of each row
         self.top_index = 0  # Index of first visible row
+        self._view_rows = 0  # Whole rows that fit in the canvas at the last fill
+        self._var_ranks = {}  # player_id -> VAR rank in the current list
+        
+        # Cached orderings of all_players for each sortable column
+        self._sort_index = SortIndexCache(self._sort_keys())
+        self._sort_pool = None
+        self._team_logos = {}  # team -> logo PhotoImage (None if missing)
         
         # Initialize position cache
         self._position_cache = {
@@ -586,6 +608,7 @@ class PlayerList(StyledFrame):
             ('Proj Rank', 85, 'position_rank_proj'),  # Added 10px
             ('Proj Pts', 75, 'points_2025_proj'),  # Added 10px
             ('VAR', 60, 'var'),  # Added 10px
+            ('Avail', 50, 'avail_next'),  # Chance of lasting to the user's next pick
             ('Temps', 50, None),  # View Temps button column  
             ('Vegas', 140, None)  # Vegas props column - reduced to accommodate Temps button
         ]
@@ -628,27 +651,28 @@ class PlayerList(StyledFrame):
             highlightthickness=0,
             height=400
         )
-        scrollbar = tk.Scrollbar(content_container, orient='vertical', command=self.canvas.yview)
+        # Rows are virtual: the table frame never moves, the scrollbar
+        # changes which players fill the rows in view
+        self.scrollbar = tk.Scrollbar(content_container, orient='vertical', command=self._on_scrollbar)
         
         self.table_frame = tk.Frame(self.canvas, bg=DARK_THEME['bg_secondary'])
-        self.table_frame.bind('<Configure>', lambda e: self.canvas.configure(scrollregion=self.canvas.bbox('all')))
         
         self.canvas_window = self.canvas.create_window((0, 0), window=self.table_frame, anchor='nw')
         
-        # Make table frame expand to canvas width
+        # Make table frame fill the canvas and add/drop rows when its height changes
         def configure_canvas(event):
-            canvas_width = event.width
-            self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+            self.canvas.itemconfig(self.canvas_window, width=event.width, height=event.height)
+            if self._rows_in_view() != self._view_rows:
+                self._update_visible_rows()
         
         self.canvas.bind('<Configure>', configure_canvas)
-        self.canvas.configure(yscrollcommand=scrollbar.set)
         
         self.canvas.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
+        self.scrollbar.pack(side='right', fill='y')
         
-        # Mouse wheel scrolling - bind to all child widgets
+        # Mouse wheel scrolling - bound to every row widget as rows are created
         def on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), 'units')
+            self._scroll_to(self.top_index - 3 * int(event.delta / 120))
             
         self.canvas.bind('<MouseWheel>', on_mousewheel)
         self.table_frame.bind('<MouseWheel>', on_mousewheel)
@@ -663,6 +687,12 @@ class PlayerList(StyledFrame):
         # Store all players
         self.all_players = players
         
+        # Orderings carry across picks; a new pool or a forced refresh
+        # (ADP, rankings or props changed) rebuilds them
+        if force_refresh or players is not self._sort_pool:
+            self._sort_pool = players
+            self._sort_index.set_pool(players)
+        
         # Update position full indicators after updating players
         if hasattr(self, 'row_frames') and self.row_frames and self.user_team:
             self._update_position_full_indicators()
@@ -740,93 +770,14 @@ class PlayerList(StyledFrame):
         if hasattr(self, '_position_cache'):
             self._position_cache['needs_rebuild'] = True
         
-        # If force_refresh is requested or we have too few displayed rows, do a full refresh
-        if force_refresh or len(self.row_frames) < 5:
-            # Create a set of player IDs for O(1) lookup
-            player_ids_to_remove = {p.player_id for p in players_to_remove if p.player_id}
-            # Remove from data
-            self.players = [p for p in self.players if p.player_id not in player_ids_to_remove]
-            self._smart_update_table()
-            return
-        
         # Create a set of player IDs for O(1) lookup
         player_ids_to_remove = {p.player_id for p in players_to_remove if p.player_id}
-        
-        # Find which rows to remove
-        rows_to_remove = []
-        for i, row in enumerate(self.row_frames):
-            if hasattr(row, 'player') and hasattr(row.player, 'player_id') and row.player.player_id in player_ids_to_remove:
-                rows_to_remove.append((i, row))
-        
         # Remove from data
         self.players = [p for p in self.players if p.player_id not in player_ids_to_remove]
         
-        # Fast path: just hide the specific rows without recreating everything
-        if rows_to_remove:
-            # First, hide rows that need to be removed
-            for idx, row in rows_to_remove:
-                row.pack_forget()
-                # Remove from player ID mapping
-                if hasattr(row, 'player') and row.player.player_id in self.player_id_to_row:
-                    del self.player_id_to_row[row.player.player_id]
-                
-            # Remove from our list (in reverse order to maintain indices)
-            for idx, row in sorted(rows_to_remove, reverse=True):
-                self.row_frames.remove(row)
-                self.hidden_rows.append(row)
-            
-            # Now we need to fill in the gaps with players that weren't displayed
-            num_removed = len(rows_to_remove)
-            current_displayed = len(self.row_frames)
-            
-            # Add new rows from the remaining players if we have space
-            max_display = 25  # Match the limit in _smart_update_table  
-            if current_displayed < max_display and current_displayed < len(self.players):
-                for i in range(current_displayed, min(current_displayed + num_removed, len(self.players), max_display)):
-                    player = self.players[i]
-                    # Reuse or create row
-                    if self.hidden_rows:
-                        row = self.hidden_rows.pop()
-                        for widget in row.winfo_children():
-                            widget.destroy()
-                    else:
-                        row = tk.Frame(
-                            self.table_frame,
-                            height=self.row_height,
-                            relief='flat',
-                            bd=0
-                        )
-                    
-                    # Configure and pack row
-                    bg = DARK_THEME['bg_tertiary'] if len(self.row_frames) % 2 == 0 else DARK_THEME['bg_secondary']
-                    row.configure(bg=bg)
-                    row.pack(fill='x', pady=1)
-                    row.pack_propagate(False)
-                    
-                    # Store player data
-                    row.player = player
-                    row.player_id = player.player_id
-                    row.index = len(self.row_frames)
-                    
-                    # Track by player ID
-                    if player.player_id:
-                        self.player_id_to_row[player.player_id] = row
-                    
-                    # Create row content
-                    self._create_row_content(row, player, bg)
-                    
-                    self.row_frames.append(row)
-            
-            # Update indices and colors for all rows
-            for i, row in enumerate(self.row_frames):
-                row.index = i
-                # Update background color
-                bg = DARK_THEME['bg_tertiary'] if i % 2 == 0 else DARK_THEME['bg_secondary']
-                self._update_row_background(row, bg)
-            
-            # Update scroll region
-            self.table_frame.update_idletasks()
-            self.canvas.configure(scrollregion=self.canvas.bbox('all'))
+        # Only the rows in view are refilled, so keep the scroll position
+        # unless a full refresh was asked for
+        self._smart_update_table(keep_scroll=not force_refresh)
     
     def _rebuild_position_cache(self):
         """Rebuild the position cache from current all_players"""
@@ -886,56 +837,9 @@ class PlayerList(StyledFrame):
                 self._rebuild_position_cache()
             filtered_players = self._position_cache.get(self.selected_position, [])[:]
         
-        # Cache sort keys to avoid repeated attribute lookups
-        if self.sort_by == "rank":
-            filtered_players.sort(key=lambda p: p.rank, reverse=not self.sort_ascending)
-        elif self.sort_by == "custom_rank":
-            filtered_players.sort(key=lambda p: self.custom_rankings.get(p.player_id, p.rank + 1000), reverse=not self.sort_ascending)
-        elif self.sort_by == "adp":
-            filtered_players.sort(key=lambda p: p.adp if p.adp else float('inf'), reverse=not self.sort_ascending)
-        elif self.sort_by == "nfc_adp":
-            # Need to fetch NFC ADP dynamically since it's not stored on player object
-            def get_nfc_adp_value(player):
-                nfc_adp = self.nfc_adp_fetcher.get_player_nfc_adp(player.name)
-                return float(nfc_adp) if nfc_adp else float('inf')
-            filtered_players.sort(key=get_nfc_adp_value, reverse=not self.sort_ascending)
-        elif self.sort_by == "games_2024":
-            filtered_players.sort(key=lambda p: getattr(p, 'games_2024', 0) or 0, reverse=not self.sort_ascending)
-        elif self.sort_by == "points_2024":
-            filtered_players.sort(key=lambda p: getattr(p, 'points_2024', 0) or 0, reverse=not self.sort_ascending)
-        elif self.sort_by == "points_2025_proj":
-            filtered_players.sort(key=lambda p: getattr(p, 'points_2025_proj', 0) or 0, reverse=not self.sort_ascending)
-        elif self.sort_by == "position_rank_proj":
-            # Sort by position rank (number first, then position)
-            def get_proj_rank_key(p):
-                proj_rank = getattr(p, 'position_rank_proj', '-')
-                if proj_rank == '-' or not proj_rank:
-                    return (999, 'ZZZ')
-                # Extract position and number from something like 'QB1' or 'RB12'
-                if isinstance(proj_rank, str):
-                    pos = ''.join(c for c in proj_rank if c.isalpha())
-                    num = ''.join(c for c in proj_rank if c.isdigit())
-                    return (int(num) if num else 999, pos)
-                return (999, 'ZZZ')
-            filtered_players.sort(key=get_proj_rank_key, reverse=not self.sort_ascending)
-        elif self.sort_by == "var":
-            filtered_players.sort(key=lambda p: getattr(p, 'var', -100) if getattr(p, 'var', None) is not None else -100, reverse=not self.sort_ascending)
-        elif self.sort_by == "sos":
-            # Sort by SOS (lower is easier/better)
-            def get_sos_key(p):
-                sos = self.sos_manager.get_sos(p.team, p.position)
-                return sos if sos is not None else 999
-            filtered_players.sort(key=get_sos_key, reverse=not self.sort_ascending)
-        elif self.sort_by == "position":
-            filtered_players.sort(key=lambda p: p.position if p.position else 'ZZZ', reverse=not self.sort_ascending)
-        elif self.sort_by == "name":
-            filtered_players.sort(key=lambda p: p.name if p.name else 'ZZZ', reverse=not self.sort_ascending)
-        elif self.sort_by == "team":
-            filtered_players.sort(key=lambda p: p.team if p.team else 'ZZZ', reverse=not self.sort_ascending)
-        elif self.sort_by == "bye_week":
-            filtered_players.sort(key=lambda p: p.bye_week if p.bye_week else 999, reverse=not self.sort_ascending)
-        else:
-            filtered_players.sort(key=lambda p: p.rank, reverse=not self.sort_ascending)
+        # Order by the cached sort index instead of re-sorting with the key
+        sort_by = self.sort_by if self.sort_by in self._sort_index.keys else 'rank'
+        filtered_players = self._sort_index.sort(filtered_players, sort_by, self.sort_ascending)
         
         self.players = filtered_players
         self.selected_index = None
@@ -943,169 +847,165 @@ class PlayerList(StyledFrame):
         # Always use smart update for performance
         self._smart_update_table()
     
-    def _smart_update_table(self):
-        """Smart update table - optimized but showing all players"""
-        # Clear all rows first
-        for row in self.row_frames:
+    def _sort_keys(self):
+        """Sort key for each sortable column"""
+        def get_nfc_adp_value(player):
+            # NFC ADP isn't stored on the player object
+            nfc_adp = self.nfc_adp_fetcher.get_player_nfc_adp(player.name)
+            return float(nfc_adp) if nfc_adp else float('inf')
+        
+        def get_proj_rank_key(p):
+            # Sort by position rank (number first, then position)
+            proj_rank = getattr(p, 'position_rank_proj', '-')
+            if proj_rank == '-' or not proj_rank:
+                return (999, 'ZZZ')
+            # Extract position and number from something like 'QB1' or 'RB12'
+            if isinstance(proj_rank, str):
+                pos = ''.join(c for c in proj_rank if c.isalpha())
+                num = ''.join(c for c in proj_rank if c.isdigit())
+                return (int(num) if num else 999, pos)
+            return (999, 'ZZZ')
+        
+        def get_avail_key(p):
+            # Players least likely to last to the next pick first (unknown last)
+            probability = self.availability_forecast.probability(p) if self.availability_forecast else None
+            return probability if probability is not None else 2.0
+        
+        def get_sos_key(p):
+            # Lower SOS is easier/better
+            sos = self.sos_manager.get_sos(p.team, p.position)
+            return sos if sos is not None else 999
+        
+        return {
+            'rank': lambda p: p.rank,
+            'custom_rank': lambda p: self.custom_rankings.get(p.player_id, p.rank + 1000),
+            'adp': lambda p: p.adp if p.adp else float('inf'),
+            'nfc_adp': get_nfc_adp_value,
+            'games_2024': lambda p: getattr(p, 'games_2024', 0) or 0,
+            'points_2024': lambda p: getattr(p, 'points_2024', 0) or 0,
+            'points_2025_proj': lambda p: getattr(p, 'points_2025_proj', 0) or 0,
+            'position_rank_proj': get_proj_rank_key,
+            'var': lambda p: getattr(p, 'var', -100) if getattr(p, 'var', None) is not None else -100,
+            'avail_next': get_avail_key,
+            'sos': get_sos_key,
+            'position': lambda p: p.position if p.position else 'ZZZ',
+            'name': lambda p: p.name if p.name else 'ZZZ',
+            'team': lambda p: p.team if p.team else 'ZZZ',
+            'bye_week': lambda p: p.bye_week if p.bye_week else 999,
+        }
+    
+    def invalidate_sort_order(self, *columns):
+        """Forget cached orderings after column values change (all columns if none given)"""
+        self._sort_index.invalidate(*columns)
+    
+    def _smart_update_table(self, keep_scroll=False):
+        """Show self.players in the table
+        
+        Only the rows that fit in the viewport exist as widgets. Scrolling
+        refills the same rows with other players, so the whole pool can be
+        listed without a frame per player.
+        """
+        if not keep_scroll:
+            self.top_index = 0
+        self._var_ranks = self._calculate_var_ranks()
+        self._update_visible_rows()
+    
+    def _calculate_var_ranks(self):
+        """VAR rank of each listed player: 1 + the number of players with a higher VAR"""
+        descending = sorted(-p.var for p in self.players if getattr(p, 'var', None) is not None)
+        return {
+            p.player_id: bisect_left(descending, -p.var) + 1
+            for p in self.players if getattr(p, 'var', None) is not None
+        }
+    
+    def _rows_in_view(self):
+        """Number of whole rows the canvas can show"""
+        height = self.canvas.winfo_height() if hasattr(self, 'canvas') else 0
+        if height <= 1:
+            return self.visible_rows  # Not mapped yet
+        return max(1, height // (self.row_height + 2))
+    
+    def _update_visible_rows(self):
+        """Fill the pooled rows with the players scrolled into view"""
+        in_view = self._view_rows = self._rows_in_view()
+        self.top_index = max(0, min(self.top_index, len(self.players) - in_view))
+        # One extra row for the partly visible one at the bottom
+        visible = self.players[self.top_index:self.top_index + in_view + 1]
+        
+        # Rows are only added or removed at the end, so packing order holds
+        while len(self.row_frames) > len(visible):
+            row = self.row_frames.pop()
             row.pack_forget()
             self.hidden_rows.append(row)
-        self.row_frames.clear()
-        self.player_id_to_row.clear()
-        
-        # Show only top players for performance
-        max_display = min(25, len(self.players))  # Reduce to 25 for faster performance
-        
-        for i in range(max_display):
-            player = self.players[i]
-            # Reuse or create row
-            if self.hidden_rows:
-                row = self.hidden_rows.pop()
-                for widget in row.winfo_children():
-                    widget.destroy()
-            else:
-                row = tk.Frame(
-                    self.table_frame,
-                    height=self.row_height,
-                    relief='flat',
-                    bd=0
-                )
-            
-            # Configure and pack row
-            bg = DARK_THEME['bg_tertiary'] if i % 2 == 0 else DARK_THEME['bg_secondary']
-            row.configure(bg=bg)
+        while len(self.row_frames) < len(visible):
+            row = self.hidden_rows.pop() if self.hidden_rows else self._create_row()
             row.pack(fill='x', pady=1)
-            row.pack_propagate(False)
-            
-            # Store player data
-            row.player = player
-            row.player_id = player.player_id
-            row.index = i
-            
-            # Track by player ID
-            if player.player_id:
-                self.player_id_to_row[player.player_id] = row
-            
-            # Create row content
-            self._create_row_content(row, player, bg)
-            
             self.row_frames.append(row)
         
-        # Don't show more players message to keep it clean
+        self.player_id_to_row.clear()
+        for offset, (row, player) in enumerate(zip(self.row_frames, visible)):
+            self._fill_row(row, self.top_index + offset, player)
         
-        # Update scroll region
-        self.table_frame.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox('all'))
+        self._update_scrollbar(in_view)
     
-    def _update_visible_rows(self):
-        """Compatibility method for scroll events"""
-        # No longer needed with full display
-        pass
-    
-    def _update_row_data(self, row, index, player):
-        """Update an existing row with new player data"""
-        # Clear all existing content
-        for widget in row.winfo_children():
-            widget.destroy()
-        
-        # Update row data
-        row.player = player
-        row.player_id = player.player_id
-        row.index = index
-        
-        # Update player ID mapping
-        if player.player_id:
-            # Remove old mapping if exists
-            old_player_id = None
-            for pid, r in self.player_id_to_row.items():
-                if r == row:
-                    old_player_id = pid
-                    break
-            if old_player_id:
-                del self.player_id_to_row[old_player_id]
-            
-            # Add new mapping
-            self.player_id_to_row[player.player_id] = row
-        
-        # Set background
-        bg = DARK_THEME['bg_tertiary'] if index % 2 == 0 else DARK_THEME['bg_secondary']
-        row.configure(bg=bg)
-        
-        # Create row content
-        self._create_row_content(row, player, bg)
-    
-    def create_player_row(self, index, player):
-        """Create a row with player data"""
-        # Check if we need a tier break
-        show_tier_break = False
-        if index > 0 and hasattr(self, 'players'):
-            prev_player = self.players[index - 1]
-            curr_tier = self.calculate_player_tier(player)
-            prev_tier = self.calculate_player_tier(prev_player)
-            show_tier_break = curr_tier != prev_tier and curr_tier > 0 and prev_tier > 0
-        
-        # Add tier break if needed
-        if show_tier_break:
-            tier_break = tk.Frame(self.table_frame, bg=DARK_THEME['button_bg'], height=2)
-            tier_break.pack(fill='x', padx=20, pady=3)
-            
-            # Add tier label
-            tier_label = tk.Label(
-                self.table_frame,
-                text=f"━━━ Tier {curr_tier} ━━━",
-                bg=DARK_THEME['bg_secondary'],
-                fg=DARK_THEME['text_muted'],
-                font=(DARK_THEME['font_family'], 9)
-            )
-            tier_label.pack(pady=(0, 2))
-        
-        # Reuse or create row
-        if self.hidden_rows:
-            row = self.hidden_rows.pop()
-            for widget in row.winfo_children():
-                widget.destroy()
+    def _update_scrollbar(self, in_view):
+        total = len(self.players)
+        if not total:
+            self.scrollbar.set(0, 1)
+            return
+        self.scrollbar.set(self.top_index / total, min(1.0, (self.top_index + in_view) / total))
+    
+    def _on_scrollbar(self, *args):
+        """Scrollbar command: scroll by whole rows instead of moving the canvas"""
+        if args[0] == 'moveto':
+            top = int(round(float(args[1]) * len(self.players)))
+        elif args[0] == 'scroll':
+            step = self._rows_in_view() if args[2] == 'pages' else 1
+            top = self.top_index + int(args[1]) * step
         else:
-            row = tk.Frame(
-                self.table_frame,
-                height=self.row_height,
-                relief='flat',
-                bd=0
-            )
-        
-        # Configure and pack row
-        bg = DARK_THEME['bg_tertiary'] if index % 2 == 0 else DARK_THEME['bg_secondary']
-        row.configure(bg=bg)
-        row.pack(fill='x', pady=1)
+            return
+        self._scroll_to(top)
+    
+    def _scroll_to(self, top):
+        top = max(0, min(top, len(self.players) - self._rows_in_view()))
+        if top != self.top_index:
+            self.top_index = top
+            self._update_visible_rows()
+    
+    def _refresh_player_row(self, player):
+        """Redraw a player's row if it is in view"""
+        row = self.player_id_to_row.get(player.player_id)
+        if row is not None:
+            self._fill_row(row, row.index, row.player)
+    
+    def _row_bg(self, index):
+        if index == self.selected_index:
+            return DARK_THEME['button_active']
+        return DARK_THEME['bg_tertiary'] if index % 2 == 0 else DARK_THEME['bg_secondary']
+    
+    def _create_row(self):
+        """Create a row with all of its cell widgets; _fill_row shows a player in it"""
+        bg = DARK_THEME['bg_secondary']
+        row = tk.Frame(
+            self.table_frame,
+            height=self.row_height,
+            bg=bg,
+            relief='flat',
+            bd=0
+        )
         row.pack_propagate(False)
+        row.player = None
+        row.player_id = None
+        row.index = None
+        row._cr_tiered = False
         
-        # Store player data
-        row.player = player
-        row.player_id = player.player_id
-        row.index = index
-        
-        # Track by player ID
-        if player.player_id:
-            self.player_id_to_row[player.player_id] = row
-        
-        # Create row content
-        self._create_row_content(row, player, bg)
-        
-        self.row_frames.append(row)
-    
-    def _create_row_content(self, row, player, bg):
-        """Create the content for a player row"""
-        # Make row selectable
+        # Handlers look up row.player when they fire - the row is reused
+        # for other players as the list scrolls
         def select_row(e=None):
-            # Find current index of this player
-            current_index = None
-            for i, p in enumerate(self.players):
-                if p.player_id == player.player_id:
-                    current_index = i
-                    break
-            
-            if current_index is not None:
-                self.select_row(current_index)
+            if row.index is not None and row.index < len(self.players):
+                self.select_row(row.index)
                 if self.on_select:
-                    self.on_select(self.players[current_index])
+                    self.on_select(self.players[row.index])
         
         row.bind('<Button-1>', select_row)
         
@@ -1115,19 +1015,8 @@ class PlayerList(StyledFrame):
         # Add double-click to draft
         def draft_on_double_click(e=None):
             if self.draft_enabled and self.on_draft:
-                # Find current player in list
-                current_player = None
-                for p in self.players:
-                    if p.player_id == player.player_id:
-                        current_player = p
-                        break
-                
-                if current_player:
-                    # Find index
-                    for i, p in enumerate(self.players):
-                        if p.player_id == current_player.player_id:
-                            self.selected_index = i
-                            break
+                if row.index is not None and row.index < len(self.players):
+                    self.selected_index = row.index
                     self.on_draft()
         
         row.bind('<Double-Button-1>', draft_on_double_click)
@@ -1135,6 +1024,10 @@ class PlayerList(StyledFrame):
         
         # Add right-click to draft
         def on_right_click(e):
+            player = row.player
+            if player is None:
+                return "break"
+            
             # Select the row first
             select_row(e)
             
@@ -1199,90 +1092,34 @@ class PlayerList(StyledFrame):
         
         row.bind('<Button-3>', on_right_click)
         
-        # Bind mousewheel
-        if hasattr(self, '_mousewheel_handler'):
-            row.bind('<MouseWheel>', self._mousewheel_handler)
-        
-        # Create cells with player data
-        # Rank (now showing VAR rank)
-        # Calculate VAR rank dynamically based on current filtered players
-        var_rank = 1
-        if hasattr(player, 'var') and player.var is not None:
-            # Count how many players have higher VAR
-            for p in self.players:
-                if hasattr(p, 'var') and p.var is not None and p.var > player.var:
-                    var_rank += 1
-        else:
-            # If no VAR, use original rank
-            var_rank = player.rank
-        
-        self.create_cell(row, f"#{var_rank}", 50, bg, select_row, field_type='rank')
+        # Rank (VAR rank)
+        row.rank_cell = self.create_cell(row, '', 50, bg, select_row, field_type='rank')
         
         # Custom Rank with tier color
-        custom_rank = self.custom_rankings.get(player.player_id, '')
-        tier = self.player_tiers.get(player.player_id, 0)
-        
         cr_frame = tk.Frame(row, bg=bg, width=35)
         cr_frame.pack(side='left', fill='y')
         cr_frame.pack_propagate(False)
-        
-        tier_colors = {
-            1: '#FFD700',  # Gold
-            2: '#C0C0C0',  # Silver
-            3: '#CD7F32',  # Bronze
-            4: '#4169E1',  # Royal Blue
-            5: '#32CD32',  # Lime Green
-            6: '#FF6347',  # Tomato
-            7: '#9370DB',  # Medium Purple
-            8: '#20B2AA',  # Light Sea Green
-        }
-        
-        if custom_rank:
-            # Only use tier background color if tier > 0
-            if tier > 0:
-                cr_bg = tier_colors.get(tier, bg)
-                # Use contrasting text colors for readability
-                cr_fg = 'black' if tier in [1, 2, 3, 5] else 'white'
-            else:
-                # No tier - use normal background and text
-                cr_bg = bg
-                cr_fg = DARK_THEME['text_primary']
-            cr_label = tk.Label(
-                cr_frame,
-                text=str(custom_rank),
-                bg=cr_bg,
-                fg=cr_fg,
-                font=(DARK_THEME['font_family'], 9, 'bold'),
-                anchor='center'
-            )
-            cr_label.pack(expand=True, fill='both' if tier > 0 else None, padx=2 if tier > 0 else 0, pady=2 if tier > 0 else 0)
-            cr_label.bind('<Button-1>', select_row)
-        else:
-            cr_label = tk.Label(cr_frame, text='-', bg=bg, fg=DARK_THEME['text_muted'], font=(DARK_THEME['font_family'], 9))
-            cr_label.pack(expand=True)
-            cr_label.bind('<Button-1>', select_row)
-        
-        # Add double-click handler for drafting to CR column
-        if hasattr(row, '_double_click_handler'):
-            cr_label.bind('<Double-Button-1>', row._double_click_handler)
-            cr_frame.bind('<Double-Button-1>', row._double_click_handler)
+        row.cr_label = tk.Label(cr_frame, text='-', bg=bg, anchor='center')
+        row.cr_label.pack(expand=True)
+        row.cr_label.bind('<Button-1>', select_row)
+        row.cr_label.bind('<Double-Button-1>', draft_on_double_click)
+        cr_frame.bind('<Double-Button-1>', draft_on_double_click)
         
         # Star button for watch list
         star_frame = tk.Frame(row, bg=bg, width=25)
         star_frame.pack(side='left', fill='y')
         star_frame.pack_propagate(False)
         
-        is_watched = player.player_id in self.watched_player_ids
         star_btn = tk.Button(
             star_frame,
-            text="★" if is_watched else "☆",
+            text="☆",
             bg=bg,
-            fg=DARK_THEME['text_accent'] if is_watched else DARK_THEME['text_muted'],
+            fg=DARK_THEME['text_muted'],
             font=(DARK_THEME['font_family'], 12),
             bd=0,
             relief='flat',
             cursor='hand2',
-            command=lambda p=player: self._toggle_watch_list(p),
+            command=lambda: row.player and self._toggle_watch_list(row.player),
             activebackground=bg
         )
         star_btn.pack(expand=True)
@@ -1294,33 +1131,17 @@ class PlayerList(StyledFrame):
         bpa_frame.pack(side='left', fill='y')
         bpa_frame.pack_propagate(False)
         
-        # Calculate BPA indicator for this player
-        # Find player's index in current filtered list
-        player_index = None
-        for idx, p in enumerate(self.players):
-            if p.player_id == player.player_id:
-                player_index = idx
-                break
-        
-        bpa_info = self.calculate_bpa_indicator(player, player_index) if player_index is not None else None
-        if bpa_info:
-            bpa_label = tk.Label(
-                bpa_frame,
-                text=bpa_info['text'],
-                bg=bpa_info['bg'],
-                fg=bpa_info['fg'],
-                font=(DARK_THEME['font_family'], 11, 'bold'),
-                padx=5,
-                pady=2
-            )
-            bpa_label.pack(expand=True)
-            
-            # Add tooltip
-            self.create_tooltip(bpa_label, bpa_info['tooltip'])
-        else:
-            # Empty BPA column
-            tk.Label(bpa_frame, text='', bg=bg).pack(expand=True)
-        
+        row.bpa_label = tk.Label(
+            bpa_frame,
+            text='',
+            bg=bg,
+            font=(DARK_THEME['font_family'], 11, 'bold'),
+            padx=5,
+            pady=2
+        )
+        row.bpa_label.pack(expand=True)
+        row.bpa_label.tooltip_text = None
+        self.create_tooltip(row.bpa_label, lambda: row.bpa_label.tooltip_text)
         bpa_frame.bind('<Button-1>', select_row)
         
         # Position
@@ -1328,15 +1149,14 @@ class PlayerList(StyledFrame):
         pos_frame.pack(side='left', fill='y')
         pos_frame.pack_propagate(False)
         
-        pos_inner = tk.Frame(pos_frame, bg=get_position_color(player.position), padx=8, pady=2)
-        pos_inner.pack(expand=True)
-        pos_label = tk.Label(pos_inner, text=player.position, bg=get_position_color(player.position), 
-                            fg='white', font=(DARK_THEME['font_family'], 10, 'bold'))
-        pos_label.pack()
+        row.pos_inner = tk.Frame(pos_frame, bg=bg, padx=8, pady=2)
+        row.pos_inner.pack(expand=True)
+        row.pos_label = tk.Label(row.pos_inner, text='', bg=bg,
+                                 fg='white', font=(DARK_THEME['font_family'], 10, 'bold'))
+        row.pos_label.pack()
         pos_frame.bind('<Button-1>', select_row)
-        pos_frame.bind('<Double-Button-1>', row._double_click_handler)
-        pos_inner.bind('<Double-Button-1>', row._double_click_handler)
-        pos_label.bind('<Double-Button-1>', row._double_click_handler)
+        for widget in (pos_frame, row.pos_inner, row.pos_label):
+            widget.bind('<Double-Button-1>', draft_on_double_click)
         
         # Stats info button
         info_frame = tk.Frame(row, bg=bg, width=25)
@@ -1352,102 +1172,63 @@ class PlayerList(StyledFrame):
             bd=0,
             relief='flat',
             cursor='hand2',
-            command=lambda p=player: self._show_player_stats(p),
+            command=lambda: row.player and self._show_player_stats(row.player),
             activebackground=bg,
             width=2
         )
         info_btn.pack(expand=True)
         info_btn._is_info_button = True
         
-        # Name - Store player reference on row for position checking
-        row.player = player  # Make sure player is attached to row BEFORE creating cells
-        self.create_cell(row, player.format_name(), 155, bg, select_row, anchor='w', field_type='name')
+        # Name
+        row.name_cell = self.create_cell(row, '', 155, bg, select_row, anchor='w', field_type='name')
         
         # Team Logo
-        self._create_team_logo_cell(row, player, bg, select_row)
+        row.logo_label = self._create_team_logo_cell(row, bg, select_row)
         
         # Bye Week
-        bye_text = str(player.bye_week) if player.bye_week else '-'
-        self.create_cell(row, bye_text, 35, bg, select_row, field_type='bye')
+        row.bye_cell = self.create_cell(row, '', 35, bg, select_row, field_type='bye')
         
         # SOS (Strength of Schedule)
-        sos_value = self.sos_manager.get_sos(player.team, player.position)
-        sos_text = self.sos_manager.get_sos_display(player.team, player.position)
-        if not sos_text:
-            sos_text = '-'
-        
-        # Create SOS cell with custom color
         sos_cell_frame = tk.Frame(row, bg=bg, width=40)
         sos_cell_frame.pack(side='left', fill='y')
         sos_cell_frame.pack_propagate(False)
         
-        sos_color = self.sos_manager.get_sos_color(sos_value) if sos_value else DARK_THEME['text_muted']
-        sos_font = (DARK_THEME['font_family'], 9, 'bold') if sos_value else (DARK_THEME['font_family'], 10)
-        
-        sos_label = tk.Label(
-            sos_cell_frame,
-            text=sos_text,
-            bg=bg,
-            fg=sos_color,
-            font=sos_font,
-            anchor='center'
-        )
-        sos_label.pack(expand=True, fill='both')
-        sos_label.bind('<Button-1>', select_row)
-        
-        # Add double-click handler for drafting
-        if hasattr(row, '_double_click_handler'):
-            sos_label.bind('<Double-Button-1>', row._double_click_handler)
-            sos_cell_frame.bind('<Double-Button-1>', row._double_click_handler)
+        row.sos_label = tk.Label(sos_cell_frame, text='', bg=bg, anchor='center')
+        row.sos_label.pack(expand=True, fill='both')
+        row.sos_label.bind('<Button-1>', select_row)
+        row.sos_label.bind('<Double-Button-1>', draft_on_double_click)
+        sos_cell_frame.bind('<Double-Button-1>', draft_on_double_click)
         
         # ADP (editable)
-        adp_text = f"{int(player.adp)}" if player.adp else '-'
-        adp_cell = self.create_cell(row, adp_text, 55, bg, select_row, field_type='adp')
-        # Make ADP cell look more clickable
-        if player.adp:
-            adp_cell.config(fg=DARK_THEME['text_accent'], cursor='hand2')
+        row.adp_cell = self.create_cell(row, '', 55, bg, select_row, field_type='adp')
         
         # NFC ADP
-        nfc_adp = self.nfc_adp_fetcher.get_player_nfc_adp(player.name)
-        if nfc_adp:
-            nfc_adp_text = f"{nfc_adp:.1f}"
-        else:
-            nfc_adp_text = "999"
-        self.create_cell(row, nfc_adp_text, 70, bg, select_row, field_type='nfc_adp')
+        row.nfc_adp_cell = self.create_cell(row, '', 70, bg, select_row, field_type='nfc_adp')
         
-        # Round tag (check for custom round first)
-        custom_round = self.custom_round_manager.get_custom_round(player.player_id)
-        if custom_round:
-            round_text = str(custom_round)
-        else:
-            round_text = self.calculate_draft_round(player) or '-'
-        round_cell = self.create_round_tag_cell(row, player, round_text, 35, bg, select_row)
+        # Round tag
+        row.round_label = self.create_round_tag_cell(row, 35, bg)
         
         # Stats
-        games_text = str(getattr(player, 'games_2024', 0) or 0)
-        self.create_cell(row, games_text, 40, bg, select_row, field_type='games')
-        
-        points = getattr(player, 'points_2024', 0)
-        points_text = f"{points:.1f}" if points else "0.0"
-        self.create_cell(row, points_text, 75, bg, select_row, field_type='points')
+        row.games_cell = self.create_cell(row, '', 40, bg, select_row, field_type='games')
+        row.points_cell = self.create_cell(row, '', 75, bg, select_row, field_type='points')
         
         # Position Rank Projected
-        pos_rank_proj_text = f"{player.position}{player.position_rank_proj}" if hasattr(player, 'position_rank_proj') and player.position_rank_proj else '-'
-        self.create_cell(row, pos_rank_proj_text, 85, bg, select_row)
+        row.proj_rank_cell = self.create_cell(row, '', 85, bg, select_row)
         
         # 2025 Projection
-        proj = getattr(player, 'points_2025_proj', 0)
-        proj_text = f"{proj:.1f}" if proj else "-"
-        self.create_cell(row, proj_text, 75, bg, select_row, field_type='proj')
+        row.proj_cell = self.create_cell(row, '', 75, bg, select_row, field_type='proj')
         
         # VAR
-        var_text = f"{player.var:.0f}" if hasattr(player, 'var') and player.var is not None else '-'
-        self.create_cell(row, var_text, 60, bg, select_row, field_type='var')
+        row.var_cell = self.create_cell(row, '', 60, bg, select_row, field_type='var')
+        
+        # Availability at the user's next pick
+        row._avail_cell = self.create_cell(row, '-', 50, bg, select_row, field_type='avail_next')
         
         # View Temps button
         temps_frame = tk.Frame(row, bg=bg, width=50)
         temps_frame.pack(side='left', fill='y')
         temps_frame.pack_propagate(False)
+        temps_bg_widgets = [temps_frame]
         
         if self.parent_app and hasattr(self.parent_app, 'show_template_viewer'):
             view_temps_btn = tk.Button(
@@ -1456,7 +1237,7 @@ class PlayerList(StyledFrame):
                 bg=DARK_THEME['button_bg'],
                 fg=DARK_THEME['text_primary'],
                 font=(DARK_THEME['font_family'], 8),
-                command=lambda p=player: self.parent_app.show_template_viewer(filter_player=p),
+                command=lambda: row.player and self.parent_app.show_template_viewer(filter_player=row.player),
                 activebackground=DARK_THEME['button_active'],
                 borderwidth=0,
                 padx=2,
@@ -1470,78 +1251,201 @@ class PlayerList(StyledFrame):
             # If no parent_app, just show empty cell
             empty_label = tk.Label(temps_frame, text="", bg=bg)
             empty_label.pack(expand=True)
+            temps_bg_widgets.append(empty_label)
         
         temps_frame.bind('<Button-1>', select_row)
         
+        # Vegas Props, with the full props on hover
+        row.vegas_cell = self.create_cell(row, '', 160, bg, select_row, field_type='vegas')
+        self._add_vegas_tooltip(row.vegas_cell, lambda: row.player)
+        
+        # Widgets that always take the row background; _fill_row adds the
+        # cells whose color depends on the player
+        row._base_bg_widgets = [
+            row, cr_frame, star_frame, star_btn, bpa_frame, pos_frame, info_frame, info_btn,
+            row.logo_label.master, row.logo_label, sos_cell_frame, row.sos_label,
+            row.round_label.master
+        ] + temps_bg_widgets
+        for cell in (row.rank_cell, row.name_cell, row.bye_cell, row.adp_cell, row.nfc_adp_cell,
+                     row.games_cell, row.points_cell, row.proj_rank_cell, row.proj_cell,
+                     row.var_cell, row._avail_cell, row.vegas_cell):
+            row._base_bg_widgets.extend((cell.master, cell))
+        row._bg_widgets = row._base_bg_widgets
+        
+        # Scroll the list from anywhere in the row
+        if hasattr(self, '_mousewheel_handler'):
+            widgets = [row]
+            while widgets:
+                widget = widgets.pop()
+                widget.bind('<MouseWheel>', self._mousewheel_handler)
+                widgets.extend(widget.winfo_children())
+        
+        return row
+    
+    def _fill_row(self, row, index, player):
+        """Show a player in a pooled row by reconfiguring its cells"""
+        row.player = player
+        row.player_id = player.player_id
+        row.index = index
+        if player.player_id:
+            self.player_id_to_row[player.player_id] = row
+        
+        bg = self._row_bg(index)
+        bg_widgets = list(row._base_bg_widgets)
+        
+        # Rank (VAR rank among the listed players, original rank without VAR)
+        var_rank = self._var_ranks.get(player.player_id, player.rank)
+        row.rank_cell.config(text=f"#{var_rank}")
+        
+        # Custom Rank with tier color
+        custom_rank = self.custom_rankings.get(player.player_id, '')
+        tier = self.player_tiers.get(player.player_id, 0)
+        tier_color = TIER_COLORS.get(tier) if custom_rank and tier > 0 else None
+        if tier_color:
+            # Use contrasting text colors for readability
+            row.cr_label.config(text=str(custom_rank), bg=tier_color,
+                                fg='black' if tier in [1, 2, 3, 5] else 'white',
+                                font=(DARK_THEME['font_family'], 9, 'bold'))
+        elif custom_rank:
+            row.cr_label.config(text=str(custom_rank), fg=DARK_THEME['text_primary'],
+                                font=(DARK_THEME['font_family'], 9, 'bold'))
+            bg_widgets.append(row.cr_label)
+        else:
+            row.cr_label.config(text='-', fg=DARK_THEME['text_muted'], font=(DARK_THEME['font_family'], 9))
+            bg_widgets.append(row.cr_label)
+        tiered = tier_color is not None
+        if tiered != row._cr_tiered:
+            row.cr_label.pack_configure(fill='both' if tiered else 'none',
+                                        padx=2 if tiered else 0, pady=2 if tiered else 0)
+            row._cr_tiered = tiered
+        
+        # Watch list star
+        is_watched = player.player_id in self.watched_player_ids
+        row.star_button.config(
+            text="★" if is_watched else "☆",
+            fg=DARK_THEME['text_accent'] if is_watched else DARK_THEME['text_muted']
+        )
+        
+        # BPA indicator
+        bpa_info = self.calculate_bpa_indicator(player, index)
+        if bpa_info:
+            row.bpa_label.config(text=bpa_info['text'], bg=bpa_info['bg'], fg=bpa_info['fg'])
+            row.bpa_label.tooltip_text = bpa_info['tooltip']
+        else:
+            row.bpa_label.config(text='')
+            row.bpa_label.tooltip_text = None
+            bg_widgets.append(row.bpa_label)
+        
+        # Position
+        pos_color = get_position_color(player.position)
+        row.pos_inner.config(bg=pos_color)
+        row.pos_label.config(text=player.position, bg=pos_color)
+        
+        # Name, red when the user's team is full at the position
+        row.name_cell.config(
+            text=player.format_name(),
+            fg='#FF5E5B' if self._is_position_full(player) else DARK_THEME['text_primary']
+        )
+        
+        # Team Logo
+        self._fill_team_logo(row.logo_label, player)
+        
+        # Bye Week
+        row.bye_cell.config(text=str(player.bye_week) if player.bye_week else '-')
+        
+        # SOS (Strength of Schedule)
+        sos_value = self.sos_manager.get_sos(player.team, player.position)
+        sos_text = self.sos_manager.get_sos_display(player.team, player.position) or '-'
+        row.sos_label.config(
+            text=sos_text,
+            fg=self.sos_manager.get_sos_color(sos_value) if sos_value else DARK_THEME['text_muted'],
+            font=(DARK_THEME['font_family'], 9, 'bold') if sos_value else (DARK_THEME['font_family'], 10)
+        )
+        
+        # ADP (editable) - accent color makes it look clickable
+        row.adp_cell.config(
+            text=f"{int(player.adp)}" if player.adp else '-',
+            fg=DARK_THEME['text_accent'] if player.adp else DARK_THEME['text_primary']
+        )
+        
+        # NFC ADP
+        nfc_adp = self.nfc_adp_fetcher.get_player_nfc_adp(player.name)
+        row.nfc_adp_cell.config(text=f"{nfc_adp:.1f}" if nfc_adp else "999")
+        
+        # Round tag (check for custom round first)
+        custom_round = self.custom_round_manager.get_custom_round(player.player_id)
+        round_text = str(custom_round) if custom_round else (self.calculate_draft_round(player) or '-')
+        round_style = self._round_tag_style(round_text, bg)
+        row.round_label.config(**round_style)
+        if round_style['bg'] == bg:
+            bg_widgets.append(row.round_label)
+        
+        # Stats
+        row.games_cell.config(text=str(getattr(player, 'games_2024', 0) or 0))
+        
+        points = getattr(player, 'points_2024', 0)
+        row.points_cell.config(text=f"{points:.1f}" if points else "0.0")
+        
+        # Position Rank Projected
+        pos_rank_proj = getattr(player, 'position_rank_proj', None)
+        row.proj_rank_cell.config(text=f"{player.position}{pos_rank_proj}" if pos_rank_proj else '-')
+        
+        # 2025 Projection
+        proj = getattr(player, 'points_2025_proj', 0)
+        row.proj_cell.config(text=f"{proj:.1f}" if proj else "-")
+        
+        # VAR
+        var = getattr(player, 'var', None)
+        row.var_cell.config(text=f"{var:.0f}" if var is not None else '-')
+        
+        # Availability at the user's next pick
+        self._update_avail_cell(row._avail_cell, player)
+        
         # Vegas Props
-        vegas_text = self.vegas_props_service.get_summary_string(player.name)
-        if not vegas_text:
-            vegas_text = "-"
-        vegas_cell = self.create_cell(row, vegas_text, 160, bg, select_row, field_type='vegas')
+        row.vegas_cell.config(text=self.vegas_props_service.get_summary_string(player.name) or "-")
         
-        # Add tooltip with full Vegas props on hover
-        if vegas_text != "-":
-            self._add_vegas_tooltip(vegas_cell, player)
+        row._bg_widgets = bg_widgets
+        self._update_row_background(row, bg)
+    
+    def _round_tag_style(self, round_text, bg):
+        """Label options for a round tag cell"""
+        if round_text == '-':
+            # No round
+            return {'text': round_text, 'bg': bg, 'fg': DARK_THEME['text_muted'],
+                    'font': (DARK_THEME['font_family'], 9), 'padx': 0, 'pady': 0}
         
-        # No more draft button - users can double-click or right-click to draft
+        # Determine color based on round
+        try:
+            round_num = int(round_text.replace('+', ''))
+            if round_num <= 3:
+                tag_bg = '#FF5E5B'  # Red for early rounds
+            elif round_num <= 6:
+                tag_bg = '#FFB347'  # Orange for mid rounds
+            elif round_num <= 9:
+                tag_bg = '#4ECDC4'  # Teal for mid-late rounds
+            else:
+                tag_bg = '#7B68EE'  # Purple for late rounds
+            tag_fg = 'white'
+        except:
+            tag_bg = bg
+            tag_fg = DARK_THEME['text_secondary']
+        
+        return {'text': f"R{round_text}", 'bg': tag_bg, 'fg': tag_fg,
+                'font': (DARK_THEME['font_family'], 9, 'bold'), 'padx': 6, 'pady': 1}
     
-    def create_round_tag_cell(self, parent, player, round_text, width, bg, click_handler):
+    def create_round_tag_cell(self, parent, width, bg):
         """Create a cell with round tag styling and editing capability"""
         cell_frame = tk.Frame(parent, bg=bg, width=width)
         cell_frame.pack(side='left', fill='y')
         cell_frame.pack_propagate(False)
         
-        # Style based on round
-        if round_text == '-':
-            # No round
-            cell = tk.Label(
-                cell_frame,
-                text=round_text,
-                bg=bg,
-                fg=DARK_THEME['text_muted'],
-                font=(DARK_THEME['font_family'], 9),
-                anchor='center'
-            )
-            cell.pack(expand=True)
-        else:
-            # Create a styled round tag
-            tag_frame = tk.Frame(cell_frame, bg=bg)
-            tag_frame.pack(expand=True)
-            
-            # Determine color based on round
-            try:
-                round_num = int(round_text.replace('+', ''))
-                if round_num <= 3:
-                    tag_bg = '#FF5E5B'  # Red for early rounds
-                    tag_fg = 'white'
-                elif round_num <= 6:
-                    tag_bg = '#FFB347'  # Orange for mid rounds
-                    tag_fg = 'white'
-                elif round_num <= 9:
-                    tag_bg = '#4ECDC4'  # Teal for mid-late rounds
-                    tag_fg = 'white'
-                else:
-                    tag_bg = '#7B68EE'  # Purple for late rounds
-                    tag_fg = 'white'
-            except:
-                tag_bg = bg
-                tag_fg = DARK_THEME['text_secondary']
-            
-            cell = tk.Label(
-                tag_frame,
-                text=f"R{round_text}",
-                bg=tag_bg,
-                fg=tag_fg,
-                font=(DARK_THEME['font_family'], 9, 'bold'),
-                padx=6,
-                pady=1,
-                anchor='center'
-            )
-            cell.pack()
+        cell = tk.Label(cell_frame, text='-', bg=bg, anchor='center')
+        cell.pack(expand=True)
         
         # Bind click handler - make it editable on single click
         def edit_round(e):
-            self._edit_player_round(player, cell_frame)
+            if parent.player is not None:
+                self._edit_player_round(parent.player)
             return "break"  # Prevent event propagation
         
         cell.bind('<Button-1>', edit_round)
@@ -1556,11 +1460,6 @@ class PlayerList(StyledFrame):
             cell.bind('<Double-Button-1>', parent._double_click_handler)
             cell_frame.bind('<Double-Button-1>', parent._double_click_handler)
         
-        # Bind mousewheel
-        if hasattr(self, '_mousewheel_handler'):
-            cell_frame.bind('<MouseWheel>', self._mousewheel_handler)
-            cell.bind('<MouseWheel>', self._mousewheel_handler)
-        
         return cell
     
     def create_cell(self, parent, text, width, bg, click_handler, anchor='center', field_type=None):
@@ -1569,18 +1468,11 @@ class PlayerList(StyledFrame):
         cell_frame.pack(side='left', fill='y')
         cell_frame.pack_propagate(False)
         
-        # Determine text color based on position limits
-        text_color = DARK_THEME['text_primary']
-        if field_type == 'name' and hasattr(parent, 'player'):
-            player = parent.player
-            if self._is_position_full(player):
-                text_color = '#FF5E5B'  # Red color for full positions
-        
         cell = tk.Label(
             cell_frame,
             text=text,
             bg=bg,
-            fg=text_color,
+            fg=DARK_THEME['text_primary'],
             font=(DARK_THEME['font_family'], 10),
             anchor=anchor
         )
@@ -1595,9 +1487,10 @@ class PlayerList(StyledFrame):
             cell._field_type = field_type
             
             # Add click to edit ADP
-            if field_type == 'adp' and hasattr(parent, 'player'):
+            if field_type == 'adp':
                 def edit_adp(e):
-                    self._edit_player_adp(parent.player)
+                    if parent.player is not None:
+                        self._edit_player_adp(parent.player)
                     return "break"  # Prevent event propagation
                 
                 cell.bind('<Button-1>', edit_adp)
@@ -1607,10 +1500,10 @@ class PlayerList(StyledFrame):
                 # Add subtle hover effect to show it's editable (no tooltip)
                 def on_enter(e, c=cell):
                     c.config(fg='#4ECDC4')  # Bright teal to show editable
-                    
+                
                 def on_leave(e, c=cell):
                     c.config(fg=DARK_THEME['text_primary'])
-                        
+                
                 cell.bind('<Enter>', on_enter)
                 cell.bind('<Leave>', on_leave)
         
@@ -1619,11 +1512,6 @@ class PlayerList(StyledFrame):
             cell.bind('<Double-Button-1>', parent._double_click_handler)
             cell_frame.bind('<Double-Button-1>', parent._double_click_handler)
         
-        # Bind mousewheel
-        if hasattr(self, '_mousewheel_handler'):
-            cell_frame.bind('<MouseWheel>', self._mousewheel_handler)
-            cell.bind('<MouseWheel>', self._mousewheel_handler)
-        
         return cell
     
     def select_player(self, index: int):
@@ -1688,13 +1576,14 @@ class PlayerList(StyledFrame):
         """Show the player stats popup"""
         PlayerStatsPopup(self.winfo_toplevel(), player, self.image_service, self.all_players)
     
-    def _add_vegas_tooltip(self, widget, player):
-        """Add tooltip showing full Vegas props on hover"""
+    def _add_vegas_tooltip(self, widget, get_player):
+        """Add tooltip showing full Vegas props on hover for the player get_player() returns"""
         tooltip = None
         
         def show_tooltip(event):
             nonlocal tooltip
-            if tooltip:
+            player = get_player()
+            if tooltip or player is None:
                 return
             
             # Get full props for player
@@ -1866,8 +1755,8 @@ class PlayerList(StyledFrame):
             else:
                 # New column - set default sort direction
                 self.sort_by = sort_by
-                # Ascending first for: Pos, Name, Team, Proj Rank, Custom Rank
-                if sort_by in ['position', 'name', 'team', 'position_rank_proj', 'custom_rank']:
+                # Ascending first for: Pos, Name, Team, Proj Rank, Custom Rank, Avail
+                if sort_by in ['position', 'name', 'team', 'position_rank_proj', 'custom_rank', 'avail_next']:
                     self.sort_ascending = True
                 else:
                     # Descending first for other columns
@@ -1899,6 +1788,7 @@ class PlayerList(StyledFrame):
         """Set custom rankings from cheat sheet"""
         self.custom_rankings = custom_rankings
         self.player_tiers = player_tiers
+        self._sort_index.invalidate('custom_rank')
     
     def on_search_changed(self):
         """Handle search text changes"""
@@ -1917,44 +1807,16 @@ class PlayerList(StyledFrame):
     def select_row(self, index):
         """Highlight selected row"""
         self.selected_index = index
-        selected_player = self.players[index] if index < len(self.players) else None
         
-        for i, row in enumerate(self.row_frames):
-            # Check if this row contains the selected player
-            is_selected = hasattr(row, 'player') and row.player.player_id == selected_player.player_id
-            
-            if is_selected:
-                row.configure(bg=DARK_THEME['button_active'])
-                self._update_row_background(row, DARK_THEME['button_active'], is_selected=True)
+        for row in self.row_frames:
+            self._update_row_background(row, self._row_bg(row.index))
+    
+    def _update_row_background(self, row, bg):
+        """Update background color for a row and the cells that follow it"""
+        for widget in row._bg_widgets:
+            if isinstance(widget, tk.Button):
+                widget.configure(bg=bg, activebackground=bg)
             else:
-                bg = DARK_THEME['bg_tertiary'] if i % 2 == 0 else DARK_THEME['bg_secondary']
-                row.configure(bg=bg)
-                self._update_row_background(row, bg, is_selected=False)
-    
-    def _update_row_background(self, row, bg, is_selected=False):
-        """Update background color for a row and all its children"""
-        row.configure(bg=bg)
-        
-        # Update all child widgets
-        for widget in row.winfo_children():
-            if isinstance(widget, tk.Frame):
-                # Don't change position badge background unless selected
-                has_position = any(isinstance(child, tk.Frame) and child.cget('bg') in ['#FF5E5B', '#23CDCD', '#5E9BFF', '#FF8C42'] for child in widget.winfo_children())
-                
-                if not has_position or is_selected:
-                    widget.configure(bg=bg)
-                    # Update label children
-                    for child in widget.winfo_children():
-                        if isinstance(child, tk.Label):
-                            # Skip position labels unless selected
-                            if hasattr(child, 'master') and hasattr(child.master, 'cget'):
-                                parent_bg = child.master.cget('bg')
-                                if parent_bg in ['#FF5E5B', '#23CDCD', '#5E9BFF', '#FF8C42'] and not is_selected:
-                                    continue
-                            child.configure(bg=bg)
-                        elif isinstance(child, tk.Button) and hasattr(child, '_is_star_button'):
-                            child.configure(bg=bg, activebackground=bg)
-            elif isinstance(widget, tk.Label):
                 widget.configure(bg=bg)
     
     def _setup_drag_support(self, row):
@@ -2188,85 +2050,10 @@ class PlayerList(StyledFrame):
                 
                 # Save to custom ADP manager
                 self.custom_adp_manager.set_custom_adp(player.player_id, new_adp)
+                self._sort_index.invalidate('adp')
                 
-                # Update the row display immediately
-                for row in self.row_frames:
-                    if hasattr(row, 'player') and row.player.player_id == player.player_id:
-                        # Update player's ADP value for round calculation
-                        row.player.adp = new_adp
-                        
-                        # Find and update the ADP cell
-                        adp_updated = False
-                        round_cell_frame = None
-                        round_cell_index = 0
-                        
-                        for i, widget in enumerate(row.winfo_children()):
-                            if isinstance(widget, tk.Frame):
-                                for child in widget.winfo_children():
-                                    if isinstance(child, tk.Label) and hasattr(child, '_field_type') and child._field_type == 'adp':
-                                        child.config(text=f"{int(new_adp)}")
-                                        adp_updated = True
-                                        # Round cell should be the next frame
-                                        round_cell_index = i + 1
-                                        break
-                        
-                        # Update the round tag (it's the frame after ADP)
-                        if adp_updated and round_cell_index < len(row.winfo_children()):
-                            round_cell_frame = row.winfo_children()[round_cell_index]
-                            if isinstance(round_cell_frame, tk.Frame):
-                                # Recreate the round tag with new value
-                                for widget in round_cell_frame.winfo_children():
-                                    widget.destroy()
-                                
-                                # Get new round text
-                                new_round_text = self.calculate_draft_round(row.player) or '-'
-                                
-                                # Recreate the round tag content
-                                if new_round_text == '-':
-                                    cell = tk.Label(
-                                        round_cell_frame,
-                                        text=new_round_text,
-                                        bg=round_cell_frame['bg'],
-                                        fg=DARK_THEME['text_muted'],
-                                        font=(DARK_THEME['font_family'], 9),
-                                        anchor='center'
-                                    )
-                                    cell.pack(expand=True)
-                                else:
-                                    tag_frame = tk.Frame(round_cell_frame, bg=round_cell_frame['bg'])
-                                    tag_frame.pack(expand=True)
-                                    
-                                    # Determine color based on round
-                                    try:
-                                        round_num = int(new_round_text.replace('+', ''))
-                                        if round_num <= 3:
-                                            tag_bg = '#FF5E5B'  # Red for early rounds
-                                            tag_fg = 'white'
-                                        elif round_num <= 6:
-                                            tag_bg = '#FFB347'  # Orange for mid rounds
-                                            tag_fg = 'white'
-                                        elif round_num <= 9:
-                                            tag_bg = '#4ECDC4'  # Teal for mid-late rounds
-                                            tag_fg = 'white'
-                                        else:
-                                            tag_bg = '#7B68EE'  # Purple for late rounds
-                                            tag_fg = 'white'
-                                    except:
-                                        tag_bg = round_cell_frame['bg']
-                                        tag_fg = DARK_THEME['text_secondary']
-                                    
-                                    cell = tk.Label(
-                                        tag_frame,
-                                        text=f"R{new_round_text}",
-                                        bg=tag_bg,
-                                        fg=tag_fg,
-                                        font=(DARK_THEME['font_family'], 9, 'bold'),
-                                        padx=6,
-                                        pady=1,
-                                        anchor='center'
-                                    )
-                                    cell.pack()
-                        break
+                # Update the row display immediately (ADP and round tag)
+                self._refresh_player_row(player)
                 
                 # Re-sort if currently sorted by ADP
                 if self.sort_by == 'adp':
@@ -2324,7 +2111,7 @@ class PlayerList(StyledFrame):
         # Bind Escape to cancel
         dialog.bind('<Escape>', lambda e: dialog.destroy())
     
-    def _edit_player_round(self, player, cell_frame):
+    def _edit_player_round(self, player):
         """Show dialog to edit player's round assignment"""
         # Create dialog window
         dialog = tk.Toplevel(self)
@@ -2398,70 +2185,7 @@ class PlayerList(StyledFrame):
             self.custom_round_manager.set_custom_round(player.player_id, round_num)
             
             # Update the round tag cell immediately
-            for widget in cell_frame.winfo_children():
-                widget.destroy()
-            
-            # Recreate the round tag content
-            if round_num == 0:
-                round_text = self.calculate_draft_round(player) or '-'
-            else:
-                round_text = str(round_num)
-            
-            # Style based on round
-            if round_text == '-':
-                cell = tk.Label(
-                    cell_frame,
-                    text=round_text,
-                    bg=cell_frame['bg'],
-                    fg=DARK_THEME['text_muted'],
-                    font=(DARK_THEME['font_family'], 9),
-                    anchor='center'
-                )
-                cell.pack(expand=True)
-            else:
-                tag_frame = tk.Frame(cell_frame, bg=cell_frame['bg'])
-                tag_frame.pack(expand=True)
-                
-                # Determine color based on round
-                try:
-                    rnd = int(round_text.replace('+', ''))
-                    if rnd <= 3:
-                        tag_bg = '#FF5E5B'  # Red for early rounds
-                        tag_fg = 'white'
-                    elif rnd <= 6:
-                        tag_bg = '#FFB347'  # Orange for mid rounds
-                        tag_fg = 'white'
-                    elif rnd <= 9:
-                        tag_bg = '#4ECDC4'  # Teal for mid-late rounds
-                        tag_fg = 'white'
-                    else:
-                        tag_bg = '#7B68EE'  # Purple for late rounds
-                        tag_fg = 'white'
-                except:
-                    tag_bg = cell_frame['bg']
-                    tag_fg = DARK_THEME['text_secondary']
-                
-                cell = tk.Label(
-                    tag_frame,
-                    text=f"R{round_text}",
-                    bg=tag_bg,
-                    fg=tag_fg,
-                    font=(DARK_THEME['font_family'], 9, 'bold'),
-                    padx=6,
-                    pady=1,
-                    anchor='center'
-                )
-                cell.pack()
-            
-            # Re-bind click handler
-            def edit_round(e):
-                self._edit_player_round(player, cell_frame)
-                return "break"
-            
-            cell.bind('<Button-1>', edit_round)
-            cell_frame.bind('<Button-1>', edit_round)
-            cell.config(cursor='hand2')
-            cell_frame.config(cursor='hand2')
+            self._refresh_player_row(player)
             
             dialog.destroy()
         
@@ -2554,46 +2278,52 @@ class PlayerList(StyledFrame):
                     pass
                 delattr(widget, '_tooltip')
     
-    def _create_team_logo_cell(self, row, player, bg, select_row):
-        """Create a cell with team logo"""
+    def _create_team_logo_cell(self, row, bg, select_row):
+        """Create a cell for the team logo; returns the logo label"""
         frame = tk.Frame(row, bg=bg, width=45)
         frame.pack(side='left', fill='y')
         frame.pack_propagate(False)
         frame.bind('<Button-1>', select_row)
+        frame._field_type = 'team'
         
-        if player.team and self.image_service:
-            # Create logo label
-            logo_label = tk.Label(frame, bg=bg)
-            logo_label.pack(expand=True)
-            
-            # Load team logo asynchronously
-            team_code = player.team.lower()
-            logo_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'team_logos', f'{team_code}.png')
-            
-            if os.path.exists(logo_path):
-                try:
-                    # Load and resize image
-                    from PIL import Image, ImageTk
-                    img = Image.open(logo_path)
-                    img = img.resize((20, 20), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                    
-                    # Keep reference to prevent garbage collection
-                    logo_label.image = photo
-                    logo_label.config(image=photo)
-                except Exception as e:
-                    # Fallback to text
-                    logo_label.config(text=player.team, fg=DARK_THEME['text_secondary'], font=(DARK_THEME['font_family'], 9))
-            else:
-                # Fallback to text if logo not found
-                logo_label.config(text=player.team, fg=DARK_THEME['text_secondary'], font=(DARK_THEME['font_family'], 9))
-        else:
+        logo_label = tk.Label(frame, bg=bg, fg=DARK_THEME['text_secondary'], font=(DARK_THEME['font_family'], 9))
+        logo_label.pack(expand=True)
+        return logo_label
+    
+    def _fill_team_logo(self, logo_label, player):
+        """Show a player's team logo, or the team code if there is no logo"""
+        if not player.team or not self.image_service:
             # No team
-            label = tk.Label(frame, text='-', bg=bg, fg=DARK_THEME['text_secondary'], font=(DARK_THEME['font_family'], 9))
-            label.pack(expand=True)
+            logo_label.config(image='', text='-')
+            return
         
-        frame._field_type = 'team'
-        return frame
+        photo = self._get_team_logo(player.team)
+        if photo:
+            logo_label.config(image=photo, text='')
+        else:
+            # Fallback to text if logo not found
+            logo_label.config(image='', text=player.team)
+    
+    def _get_team_logo(self, team):
+        """Team logo resized for the table, loaded once per team"""
+        if team in self._team_logos:
+            return self._team_logos[team]
+        
+        photo = None
+        logo_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'team_logos', f'{team.lower()}.png')
+        if os.path.exists(logo_path):
+            try:
+                # Load and resize image
+                from PIL import Image, ImageTk
+                img = Image.open(logo_path)
+                img = img.resize((20, 20), Image.Resampling.LANCZOS)
+                photo = ImageTk.PhotoImage(img)
+            except Exception as e:
+                photo = None
+        
+        # Keeping the reference here also keeps it from being garbage collected
+        self._team_logos[team] = photo
+        return photo
     
     def reset_all_adp(self):
         """Reset all custom ADP values"""
@@ -2705,9 +2435,10 @@ class PlayerList(StyledFrame):
         """Fetch and update NFC ADP data"""
         self.nfc_adp_data = self.nfc_adp_fetcher.fetch_nfc_adp()
         if self.nfc_adp_data:
+            self._sort_index.invalidate('nfc_adp')
             # Just update the display without resetting the player list
             # This preserves the current drafted/available state
-            self._smart_update_table()
+            self._smart_update_table(keep_scroll=True)
             return True
         return False
     
@@ -2777,14 +2508,17 @@ class PlayerList(StyledFrame):
         return str(round_num)
     
     def create_tooltip(self, widget, text):
-        """Create a tooltip for a widget"""
+        """Create a tooltip for a widget (text may be a callable returning the text)"""
         def on_enter(event):
+            tooltip_text = text() if callable(text) else text
+            if not tooltip_text:
+                return
             tooltip = tk.Toplevel()
             tooltip.wm_overrideredirect(True)
             tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
             label = tk.Label(
                 tooltip,
-                text=text,
+                text=tooltip_text,
                 bg=DARK_THEME['bg_tertiary'],
                 fg=DARK_THEME['text_primary'],
                 font=(DARK_THEME['font_family'], 9),
@@ -3001,6 +2735,28 @@ class PlayerList(StyledFrame):
         suggestions.sort(key=lambda x: x[2], reverse=True)
         return [(p, r) for p, r, _ in suggestions[:3]]
     
+    def set_availability_forecast(self, forecast):
+        """Show a new next-pick availability forecast (None clears the column)"""
+        self.availability_forecast = forecast
+        self._sort_index.invalidate('avail_next')
+        for row in self.row_frames:
+            cell = getattr(row, '_avail_cell', None)
+            if cell is not None and hasattr(row, 'player'):
+                self._update_avail_cell(cell, row.player)
+    
+    def _update_avail_cell(self, cell, player):
+        probability = self.availability_forecast.probability(player) if self.availability_forecast else None
+        if probability is None:
+            cell.config(text='-', fg=DARK_THEME['text_primary'])
+            return
+        if probability >= 0.7:
+            color = '#4CAF50'  # Green - likely to be there
+        elif probability >= 0.3:
+            color = '#FFC107'  # Yellow - coin flip
+        else:
+            color = '#FF5E5B'  # Red - take now or lose them
+        cell.config(text=f"{probability:.0%}", fg=color)
+    
     def set_draft_context(self, current_pick: int, user_team):
         """Set draft context for BPA calculations"""
         self.current_pick = current_pick
@@ -3013,22 +2769,16 @@ class PlayerList(StyledFrame):
     def _update_position_full_indicators(self):
         """Update the color of player names based on position availability"""
         for row in self.row_frames:
-            if not hasattr(row, 'player'):
+            if row.player is None:
                 continue
             
             player = row.player
-            is_full = self._is_position_full(player)
             
-            # Find the name cell and update its color
-            for widget in row.winfo_children():
-                if isinstance(widget, tk.Frame):
-                    for child in widget.winfo_children():
-                        if isinstance(child, tk.Label) and hasattr(child, '_field_type') and child._field_type == 'name':
-                            if is_full:
-                                child.config(fg='#FF5E5B')  # Red for full positions
-                            else:
-                                child.config(fg=DARK_THEME['text_primary'])  # Normal color
-                            break
+            # Update the name cell color
+            if self._is_position_full(player):
+                row.name_cell.config(fg='#FF5E5B')  # Red for full positions
+            else:
+                row.name_cell.config(fg=DARK_THEME['text_primary'])  # Normal color
 
     def _is_position_full(self, player):
         """Check if the user's team is full at this player's position"""
@@ -1,9 +1,47 @@
 import json
 import requests
-from typing import List, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import os
 from .player_extensions import format_name
+from ..models.player import WEEKLY_STATS_2024
+
+_UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(_UTILS_DIR))
+
+LOCAL_PLAYERS_FILE = os.path.normpath(os.path.join(_UTILS_DIR, '..', 'data', 'players_2025.json'))
+SLEEPER_PLAYERS_FILE = os.path.join(_PROJECT_ROOT, 'data', 'players.json')
+STATS_2024_FILE = os.path.join(_PROJECT_ROOT, 'scripts', 'custom_scoring_player_stats_2024.json')
+DEFENSIVE_STATS_2024_FILE = os.path.join(_PROJECT_ROOT, 'scripts', 'defensive_player_points_2024.json')
+WEEKLY_STATS_2024_FILE = os.path.join(_PROJECT_ROOT, 'scripts', 'aggregated_player_stats_2024.json')
+
+# Parsed data files, keyed by loader: (file stamps when loaded, result)
+_load_cache: Dict[str, Tuple[tuple, Any]] = {}
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+def _cached_load(name: str, paths: List[str], load: Callable[[], Any]) -> Any:
+    """Return load()'s result, reusing it for the process until one of paths changes"""
+    stamps = tuple(_file_stamp(path) for path in paths)
+    cached = _load_cache.get(name)
+    if cached is not None and cached[0] == stamps:
+        return cached[1]
+    result = load()
+    _load_cache[name] = (stamps, result)
+    return result
+
+
+def clear_load_cache():
+    """Forget every parsed data file so the next load re-reads them"""
+    _load_cache.clear()
 
 
 def fetch_adp_data() -> Optional[Dict]:
@@ -172,12 +210,34 @@ def load_player_cache(cache_file: str = "player_cache.json", max_age_hours: int
         return None
 
 
+def get_projection_year() -> int:
+    """Season the projection files are for (next season once September starts)"""
+    now = datetime.now()
+    return now.year if now.month < 9 else now.year + 1
+
+
+def get_projections_file() -> str:
+    """Custom scoring projections file for the current projection year"""
+    return os.path.join(_PROJECT_ROOT, 'scripts',
+                        f'custom_scoring_player_projections_{get_projection_year()}.json')
+
+
+def get_player_data_sources() -> List[str]:
+    """Every file get_players_with_fallback reads when using the local player data"""
+    return [
+        LOCAL_PLAYERS_FILE,
+        SLEEPER_PLAYERS_FILE,
+        STATS_2024_FILE,
+        DEFENSIVE_STATS_2024_FILE,
+        WEEKLY_STATS_2024_FILE,
+        get_projections_file(),
+    ]
+
+
 def load_local_player_data() -> Optional[List[Dict]]:
     """Load player data from local JSON file"""
-    local_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'players_2025.json')
-    
     try:
-        with open(local_file, 'r') as f:
+        with open(LOCAL_PLAYERS_FILE, 'r') as f:
             data = json.load(f)
         print(f"Loaded {len(data['players'])} players from local file")
         return data['players']
@@ -187,13 +247,13 @@ def load_local_player_data() -> Optional[List[Dict]]:
 
 
 def load_sleeper_players() -> Dict[str, Dict]:
-    """Load the Sleeper player database"""
+    """Load the Sleeper player database (cached until players.json changes)"""
+    return _cached_load('sleeper_players', [SLEEPER_PLAYERS_FILE], _read_sleeper_players)
+
+
+def _read_sleeper_players() -> Dict[str, Dict]:
     try:
-        # Look for the players.json file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-        players_file = os.path.join(project_root, 'data', 'players.json')
-        
+        players_file = SLEEPER_PLAYERS_FILE
         if os.path.exists(players_file):
             with open(players_file, 'r') as f:
                 sleeper_data = json.load(f)
@@ -217,12 +277,14 @@ def load_sleeper_players() -> Dict[str, Dict]:
 
 
 def load_2024_stats() -> Dict[str, Dict]:
-    """Load 2024 season stats from custom scoring file"""
+    """Load 2024 season stats from custom scoring file (cached until the files change)"""
+    return _cached_load('stats_2024', [STATS_2024_FILE, DEFENSIVE_STATS_2024_FILE], _read_2024_stats)
+
+
+def _read_2024_stats() -> Dict[str, Dict]:
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-        stats_file = os.path.join(project_root, 'scripts', 'custom_scoring_player_stats_2024.json')
-        defensive_file = os.path.join(project_root, 'scripts', 'defensive_player_points_2024.json')
+        stats_file = STATS_2024_FILE
+        defensive_file = DEFENSIVE_STATS_2024_FILE
         
         name_to_stats = {}
         
@@ -288,11 +350,13 @@ def load_2024_stats() -> Dict[str, Dict]:
 
 
 def load_weekly_stats_2024() -> Dict[str, list]:
-    """Load 2024 weekly stats from aggregated stats file"""
+    """Load 2024 weekly stats from aggregated stats file (cached until it changes)"""
+    return _cached_load('weekly_stats_2024', [WEEKLY_STATS_2024_FILE], _read_weekly_stats_2024)
+
+
+def _read_weekly_stats_2024() -> Dict[str, list]:
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-        stats_file = os.path.join(project_root, 'scripts', 'aggregated_player_stats_2024.json')
+        stats_file = WEEKLY_STATS_2024_FILE
         
         if os.path.exists(stats_file):
             with open(stats_file, 'r') as f:
@@ -302,7 +366,8 @@ def load_weekly_stats_2024() -> Dict[str, list]:
                 for player_id, player_data in stats_data.items():
                     if player_data.get('player_name'):
                         name = player_data['player_name']
-                        weekly_stats = player_data.get('weekly_stats', [])
+                        # Pack once into the shared columnar block; both name keys share the view
+                        weekly_stats = WEEKLY_STATS_2024.append(player_data.get('weekly_stats') or [], key=player_id)
                         
                         # Store with original name
                         name_to_weekly[name] = weekly_stats
@@ -319,23 +384,14 @@ def load_weekly_stats_2024() -> Dict[str, list]:
 
 
 def load_projections() -> Dict[str, float]:
-    """Load 2025 projection data from custom scoring file"""
+    """Load 2025 projection data from custom scoring file (cached until it changes)"""
+    proj_file = get_projections_file()
+    return _cached_load(f'projections:{proj_file}', [proj_file], lambda: _read_projections(proj_file))
+
+
+def _read_projections(proj_file: str) -> Dict[str, float]:
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-        
-        # Try to find the most recent projection file
-        from datetime import datetime
-        current_year = datetime.now().year
-        current_month = datetime.now().month
-        
-        # Determine projection year
-        if current_month < 9:
-            projection_year = current_year
-        else:
-            projection_year = current_year + 1
-            
-        proj_file = os.path.join(project_root, 'scripts', f'custom_scoring_player_projections_{projection_year}.json')
+        projection_year = get_projection_year()
         
         if os.path.exists(proj_file):
             with open(proj_file, 'r') as f:
@@ -368,12 +424,34 @@ def load_projections() -> Dict[str, float]:
     return {}
 
 
-def match_with_sleeper_data(players: List[Dict]) -> List[Dict]:
+@dataclass
+class PlayerLookupTables:
+    """Name-keyed lookups match_with_sleeper_data matches players against"""
+    sleeper_players: Dict[str, Dict]
+    stats_2024: Dict[str, Dict]
+    weekly_stats: Dict[str, list]
+    projections: Dict[str, float]
+
+
+def load_player_lookup_tables() -> PlayerLookupTables:
+    """Load (or reuse) every lookup table once"""
+    return PlayerLookupTables(
+        sleeper_players=load_sleeper_players(),
+        stats_2024=load_2024_stats(),
+        weekly_stats=load_weekly_stats_2024(),
+        projections=load_projections()
+    )
+
+
+def match_with_sleeper_data(players: List[Dict],
+                            tables: Optional[PlayerLookupTables] = None) -> List[Dict]:
     """Match ADP players with Sleeper player IDs, 2024 stats, and projections"""
-    sleeper_players = load_sleeper_players()
-    stats_2024 = load_2024_stats()
-    weekly_stats = load_weekly_stats_2024()
-    projections = load_projections()
+    if tables is None:
+        tables = load_player_lookup_tables()
+    sleeper_players = tables.sleeper_players
+    stats_2024 = tables.stats_2024
+    weekly_stats = tables.weekly_stats
+    projections = tables.projections
     
     for player in players:
         # Format the name to match Sleeper format
@@ -449,12 +527,15 @@ def get_players_with_fallback() -> List[Dict]:
     # Try local file first
     players = load_local_player_data()
     if players:
+        # Parse the Sleeper, stats and projection files once for every match below
+        tables = load_player_lookup_tables()
+        
         # Match with Sleeper data to get player IDs
-        players = match_with_sleeper_data(players)
+        players = match_with_sleeper_data(players, tables)
         
         # Add defensive players from Sleeper data
         print("Adding defensive players from Sleeper data...")
-        sleeper_players = load_sleeper_players()
+        sleeper_players = tables.sleeper_players
         added_count = 0
         
         # Create a set of existing player names for quick lookup
@@ -511,7 +592,7 @@ def get_players_with_fallback() -> List[Dict]:
         defensive_players = []
         
         if lb_players:
-            lb_players = match_with_sleeper_data(lb_players)
+            lb_players = match_with_sleeper_data(lb_players, tables)
             lb_players.sort(key=lambda p: p.get('points_2024', 0) or 0, reverse=True)
             top_lbs = lb_players[:30]  # Top 30 LBs
             for i, player in enumerate(top_lbs):
@@ -520,7 +601,7 @@ def get_players_with_fallback() -> List[Dict]:
             defensive_players.extend(top_lbs)
             
         if db_players:
-            db_players = match_with_sleeper_data(db_players)
+            db_players = match_with_sleeper_data(db_players, tables)
             db_players.sort(key=lambda p: p.get('points_2024', 0) or 0, reverse=True)
             top_dbs = db_players[:20]  # Top 20 DBs
             for i, player in enumerate(top_dbs):
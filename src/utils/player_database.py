@@ -0,0 +1,248 @@
+"""
+Prebuilt binary player database.
+
+get_players_with_fallback parses the Sleeper dump, the stats and projection
+files and the local ADP file on every start. build_player_database packs its
+result into one versioned file that load_player_database memory-maps on the
+next start instead:
+
+    MAGIC | version (uint32) | header length (uint32) | JSON header | arrays
+
+The JSON header records the source files' sizes and mtimes, the string table
+offsets and where each array lives. Player fields are columns (strings are
+ids into the string table) and weekly stats are the arrays of a
+WeeklyStatsBlock, so players get WeeklyStats views straight over the map.
+"""
+
+import json
+import mmap
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..models.player import WeeklyStats, WeeklyStatsBlock
+from .player_data_fetcher import get_player_data_sources
+
+MAGIC = b'DSPLAYDB'
+PLAYER_DB_VERSION = 1
+_ALIGNMENT = 64
+_NO_STRING = -1
+_NO_GAMES = -(2 ** 31)
+
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'data', 'player_db.bin'
+)
+
+
+def _source_fingerprint(sources: List[str]) -> Dict[str, Optional[List[int]]]:
+    """Size and mtime of each source file (None if it doesn't exist)"""
+    fingerprint = {}
+    for path in sources:
+        try:
+            stat = os.stat(path)
+            fingerprint[path] = [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            fingerprint[path] = None
+    return fingerprint
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def id(self, value) -> int:
+        if value is None:
+            return _NO_STRING
+        value = str(value)
+        index = self._ids.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(value)
+            self._ids[value] = index
+        return index
+
+    def arrays(self):
+        encoded = [s.encode('utf-8') for s in self.strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(b) for b in encoded])
+        return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+def build_player_database(players: List[Dict], path: str = DEFAULT_DB_PATH,
+                          sources: Optional[List[str]] = None) -> bool:
+    """Write player dicts (as returned by get_players_with_fallback) to the binary database"""
+    try:
+        sources = sources if sources is not None else get_player_data_sources()
+        strings = _StringTable()
+        count = len(players)
+
+        names = np.array([strings.id(p.get('name')) for p in players], dtype=np.int32)
+        positions = np.array([strings.id(p.get('position')) for p in players], dtype=np.int32)
+        teams = np.array([strings.id(p.get('team')) for p in players], dtype=np.int32)
+        player_ids = np.array([strings.id(p.get('player_id')) for p in players], dtype=np.int32)
+        ranks = np.array([p.get('rank', 999) for p in players], dtype=np.int32)
+        adps = np.array([p.get('adp') or 0 for p in players], dtype=np.float64)
+        adp_is_int = np.array([isinstance(p.get('adp'), int) for p in players], dtype=np.uint8)
+        games = np.array([_NO_GAMES if p.get('games_2024') is None else int(p['games_2024'])
+                          for p in players], dtype=np.int32)
+        points = np.array([np.nan if p.get('points_2024') is None else p['points_2024']
+                           for p in players], dtype=np.float64)
+        projections = np.array([np.nan if p.get('points_2025_proj') is None else p['points_2025_proj']
+                                for p in players], dtype=np.float64)
+
+        # Re-pack weekly stats into a compact block of their own
+        block = WeeklyStatsBlock(capacity=1)
+        weekly_rows = np.full((count, 2), -1, dtype=np.int32)
+        for i, p in enumerate(players):
+            weekly = p.get('weekly_stats_2024')
+            if weekly is not None:
+                view = block.append(weekly)
+                weekly_rows[i] = (view.start, view.stop)
+        block_state = block.__getstate__()
+        block_team_names = [strings.id(s) for s in block_state['_strings']]
+
+        string_data, string_offsets = strings.arrays()
+        arrays = {
+            'names': names, 'positions': positions, 'teams': teams, 'player_ids': player_ids,
+            'ranks': ranks, 'adps': adps, 'adp_is_int': adp_is_int, 'games_2024': games,
+            'points_2024': points, 'points_2025_proj': projections, 'weekly_rows': weekly_rows,
+            'string_data': string_data, 'string_offsets': string_offsets,
+        }
+        for name in WeeklyStatsBlock._ROW_COLUMNS + ('row_offsets', 'stat_ids', 'stat_values'):
+            arrays['weekly_' + name] = block_state[name]
+
+        header = {
+            'version': PLAYER_DB_VERSION,
+            'count': count,
+            'sources': _source_fingerprint(sources),
+            'weekly': {
+                'size': block_state['size'],
+                'stat_keys': block_state['stat_keys'],
+                'strings': block_team_names,
+                'extras': [[row, list(extra)] for row, extra in block_state['_extras'].items()],
+            },
+            'arrays': {},
+        }
+
+        # Lay arrays out after the (space padded) header, each aligned for memory mapping.
+        # The header holds the offsets, so grow its reserved size until it fits.
+        header_length = _ALIGNMENT * 64
+        while True:
+            offset = len(MAGIC) + 8 + header_length
+            for name, array in arrays.items():
+                offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+                header['arrays'][name] = {'dtype': array.dtype.str, 'shape': list(array.shape),
+                                          'offset': offset}
+                offset += array.nbytes
+            header_bytes = json.dumps(header).encode('utf-8')
+            if len(header_bytes) <= header_length:
+                header_bytes = header_bytes.ljust(header_length)
+                break
+            header_length = -(-len(header_bytes) * 2 // _ALIGNMENT) * _ALIGNMENT
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(np.array([PLAYER_DB_VERSION, len(header_bytes)], dtype='<u4').tobytes())
+            f.write(header_bytes)
+            for name, array in arrays.items():
+                f.seek(header['arrays'][name]['offset'])
+                f.write(np.ascontiguousarray(array).tobytes())
+            f.truncate(offset)  # in case trailing arrays are empty
+        os.replace(tmp_path, path)
+        print(f"Built player database with {count} players at {path}")
+        return True
+    except Exception as e:
+        print(f"Error building player database: {e}")
+        return False
+
+
+def load_player_database(path: str = DEFAULT_DB_PATH,
+                         sources: Optional[List[str]] = None) -> Optional[List[Dict]]:
+    """Load player dicts from the binary database.
+
+    Returns None if the file is missing, from another format version, or
+    older than any of its source files.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if data[:len(MAGIC)] != MAGIC:
+            return None
+        version, header_length = np.frombuffer(data, dtype='<u4', count=2, offset=len(MAGIC))
+        if version != PLAYER_DB_VERSION:
+            print(f"Player database is version {version}, expected {PLAYER_DB_VERSION}; rebuilding")
+            return None
+        header_start = len(MAGIC) + 8
+        header = json.loads(bytes(data[header_start:header_start + int(header_length)]))
+
+        sources = sources if sources is not None else get_player_data_sources()
+        if header['sources'] != _source_fingerprint(sources):
+            print("Player data files changed since the player database was built; rebuilding")
+            return None
+
+        arrays = {}
+        for name, spec in header['arrays'].items():
+            dtype = np.dtype(spec['dtype'])
+            count = int(np.prod(spec['shape'], dtype=np.int64))
+            arrays[name] = np.frombuffer(data, dtype=dtype, count=count,
+                                         offset=spec['offset']).reshape(spec['shape'])
+
+        string_data = arrays['string_data'].tobytes()
+        bounds = arrays['string_offsets'].tolist()
+        strings = [string_data[bounds[i]:bounds[i + 1]].decode('utf-8') for i in range(len(bounds) - 1)]
+
+        weekly = header['weekly']
+        block_strings = [strings[i] for i in weekly['strings']]
+        block = WeeklyStatsBlock.from_state({
+            'stat_keys': weekly['stat_keys'],
+            '_key_index': {key: i for i, key in enumerate(weekly['stat_keys'])},
+            '_strings': block_strings,
+            '_string_ids': {s: i for i, s in enumerate(block_strings)},
+            '_extras': {row: tuple(extra) for row, extra in weekly['extras']},
+            'size': weekly['size'],
+            **{name: arrays['weekly_' + name] for name in
+               WeeklyStatsBlock._ROW_COLUMNS + ('row_offsets', 'stat_ids', 'stat_values')},
+        })
+
+        def string(index):
+            return None if index == _NO_STRING else strings[index]
+
+        players = []
+        columns = zip(arrays['names'].tolist(), arrays['positions'].tolist(), arrays['teams'].tolist(),
+                      arrays['player_ids'].tolist(), arrays['ranks'].tolist(), arrays['adps'].tolist(),
+                      arrays['adp_is_int'].tolist(), arrays['games_2024'].tolist(),
+                      arrays['points_2024'].tolist(), arrays['points_2025_proj'].tolist(),
+                      arrays['weekly_rows'].tolist())
+        for name, position, team, player_id, rank, adp, adp_is_int, games, points, proj, rows in columns:
+            player = {
+                'name': string(name),
+                'position': string(position),
+                'team': string(team),
+                'rank': rank,
+                'adp': int(adp) if adp_is_int else adp,
+            }
+            if player_id != _NO_STRING:
+                player['player_id'] = strings[player_id]
+            if games != _NO_GAMES:
+                player['games_2024'] = games
+            if points == points:
+                player['points_2024'] = points
+            if proj == proj:
+                player['points_2025_proj'] = proj
+            if rows[0] >= 0:
+                player['weekly_stats_2024'] = WeeklyStats(block, rows[0], rows[1])
+            players.append(player)
+
+        print(f"Loaded {len(players)} players from player database")
+        return players
+    except Exception as e:
+        print(f"Error loading player database: {e}")
+        return None
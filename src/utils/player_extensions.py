@@ -1,42 +1,60 @@
 import re
+import sys
+from functools import lru_cache
+from typing import Iterable, List
 
 
+_SUFFIX_RE = re.compile(r'\s+(JR|SR|III|II|IV|V)')
+
+# Specific replacements, applied in order
+_NAME_REPLACEMENTS = (
+    ("MITCHELL T", "MITCH T"),
+    ("ROBBY ANDERSON", "ROBBIE ANDERSON"),
+    ("WILLIAM ", "WILL "),
+    ("OLABISI", "BISI"),
+    ("ELI MITCHELL", "ELIJAH MITCHELL"),
+    ("CADILLAC WILLIAMS", "CARNELL WILLIAMS"),
+    ("GABE DAVIS", "GABRIEL DAVIS"),
+    ("JEFFERY ", "JEFF "),
+    ("JOSHUA ", "JOSH "),
+    ("CHAUNCEY GARDNER", "CJ GARDNER"),
+    ("BENNETT SKOWRONEK", "BEN SKOWRONEK"),
+    ("NATHANIEL DELL", "TANK DELL"),
+)
+# Matches if any replacement could apply, so most names skip the loop
+_REPLACEMENT_RE = re.compile('|'.join(re.escape(old) for old, _ in _NAME_REPLACEMENTS))
+
+# Shortened first names
+_FIRST_NAMES = (("MICHAEL ", "MIKE "), ("KENNETH ", "KEN "))
+
+
+@lru_cache(maxsize=65536)
 def format_name(name):
     # If there is a (, dump everything from there on
-    name = name.split('(')[0]
+    name = name.split('(', 1)[0]
 
     # Initial replacements and formatting
     name = name.strip().upper()
-    name = re.sub(r'[,+.*]', '', name)
-    name = re.sub(r'\s+(JR|SR|III|II|IV|V)', '', name)
+    name = name.replace(',', '').replace('+', '').replace('.', '').replace('*', '')
+    name = _SUFFIX_RE.sub('', name)
     name = name.replace("'", "").replace("-", " ")
 
     # Additional specific replacements
-    replacements = {
-        "MITCHELL T": "MITCH T",
-        "ROBBY ANDERSON": "ROBBIE ANDERSON",
-        "WILLIAM ": "WILL ",
-        "OLABISI": "BISI",
-        "ELI MITCHELL": "ELIJAH MITCHELL",
-        "CADILLAC WILLIAMS": "CARNELL WILLIAMS",
-        "GABE DAVIS": "GABRIEL DAVIS",
-        "JEFFERY ": "JEFF ",
-        "JOSHUA ": "JOSH ",
-        "CHAUNCEY GARDNER": "CJ GARDNER",
-        "BENNETT SKOWRONEK": "BEN SKOWRONEK",
-        "NATHANIEL DELL": "TANK DELL",
-    }
-
-    for old, new in replacements.items():
-        name = name.replace(old, new)
+    if _REPLACEMENT_RE.search(name):
+        for old, new in _NAME_REPLACEMENTS:
+            name = name.replace(old, new)
 
     # Handle specific starting names
-    if name.startswith("MICHAEL "):
-        name = name.replace("MICHAEL ", "MIKE ", 1)
-    if name.startswith("KENNETH "):
-        name = name.replace("KENNETH ", "KEN ", 1)
+    for old, new in _FIRST_NAMES:
+        if name.startswith(old):
+            name = name.replace(old, new, 1)
+
+    return sys.intern(name)
+
 
-    return name
+def format_names(names: Iterable[str]) -> List[str]:
+    """format_name for many names at once"""
+    return [format_name(name) for name in names]
 
 
 def get_player_image_url(player_id):
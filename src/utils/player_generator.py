@@ -1,6 +1,11 @@
-from typing import List
+import os
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
 from ..models import Player
-from .player_data_fetcher import get_players_with_fallback
+from .player_data_fetcher import get_players_with_fallback, get_player_data_sources
+from .player_database import build_player_database, load_player_database
 from .player_extensions import format_name
 
 # 2025 NFL Team Bye Weeks
@@ -42,80 +47,159 @@ TEAM_BYE_WEEKS = {
 }
 
 
+# Positions that get position ranks and VAR
+VALUE_POSITIONS = ('QB', 'RB', 'WR', 'TE', 'LB', 'DB')
+
+# Replacement level per team in the league: 2.2 RBs per team means the 22nd RB
+# is replacement level in a 10-team league, the 26th in a 12-team league
+REPLACEMENT_PER_TEAM = {
+    'QB': 2.0,
+    'RB': 2.2,   # with flex
+    'WR': 3.8,   # with flex
+    'TE': 1.0,
+    'LB': 3.0,
+    'DB': 3.0
+}
+
+
+def replacement_levels(num_teams: int = 10) -> Dict[str, int]:
+    """Replacement rank at each position for a league of num_teams"""
+    return {pos: max(1, int(round(per_team * num_teams))) for pos, per_team in REPLACEMENT_PER_TEAM.items()}
+
+
+class VarCalculator:
+    """Position ranks and VAR for a fixed set of players, computed over NumPy arrays
+
+    Points and positions are read into arrays once, and each position's
+    players are ordered with a single lexsort, so a recompute is a handful
+    of array operations per position rather than a Python sort. Call
+    refresh() after projections change.
+
+    apply_var(available) computes VAR against the remaining pool during a
+    draft: each position's replacement rank drops by the number of players
+    already drafted there, and the replacement player is taken from the
+    players still available.
+    """
+
+    def __init__(self, players: Iterable[Player], num_teams: int = 10):
+        self.players = list(players)
+        self.num_teams = num_teams
+        self._slots = None  # Player -> index, built on first use
+        codes = {pos: code for code, pos in enumerate(VALUE_POSITIONS)}
+        self._codes = np.array([codes.get(p.position, -1) for p in self.players], dtype=np.int64)
+        levels = replacement_levels(num_teams)
+        self._replacement_ranks = np.array([levels[pos] for pos in VALUE_POSITIONS], dtype=np.int64)
+        self.refresh()
+
+    @staticmethod
+    def _points(values) -> np.ndarray:
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+    @staticmethod
+    def _group_order(codes: np.ndarray, points: np.ndarray):
+        """Indices grouped by position, best points first and None last, with
+        each position's (start, end of players with points, end) in the order"""
+        # Stable, so ties keep the input order like sorted() did
+        descending = np.where(np.isnan(points), np.inf, -points)
+        order = np.lexsort((descending, codes))
+        ordered_codes = codes[order]
+        has_points = ~np.isnan(points[order])
+        bounds = []
+        for code in range(len(VALUE_POSITIONS)):
+            start = np.searchsorted(ordered_codes, code, side='left')
+            end = np.searchsorted(ordered_codes, code, side='right')
+            bounds.append((start, start + int(has_points[start:end].sum()), end))
+        return order, bounds
+
+    def refresh(self):
+        """Re-read points from the players (e.g. after projections change)"""
+        self._proj = self._points(p.points_2025_proj for p in self.players)
+        self._order_proj, self._bounds_proj = self._group_order(self._codes, self._proj)
+        self._ranks_2024 = None  # Only needed for position ranks, so sorted on demand
+
+    def position_ranks(self, order: np.ndarray, bounds) -> np.ndarray:
+        """Rank within position for each player (0 where there's no rank)"""
+        ranks = np.zeros(len(self.players), dtype=np.int64)
+        for start, ranked_end, _ in bounds:
+            ranks[order[start:ranked_end]] = np.arange(1, ranked_end - start + 1)
+        return ranks
+
+    def apply_position_ranks(self):
+        """Set position_rank_2024 and position_rank_proj on every ranked player"""
+        if self._ranks_2024 is None:
+            points_2024 = self._points(p.points_2024 for p in self.players)
+            self._ranks_2024 = self.position_ranks(*self._group_order(self._codes, points_2024))
+        ranks_proj = self.position_ranks(self._order_proj, self._bounds_proj)
+        players = self.players
+        for attr, ranks in (('position_rank_2024', self._ranks_2024), ('position_rank_proj', ranks_proj)):
+            for slot in np.flatnonzero(ranks):
+                setattr(players[slot], attr, int(ranks[slot]))
+
+    def _available_mask(self, available) -> np.ndarray:
+        if self._slots is None:
+            self._slots = {}
+            for slot, player in enumerate(self.players):
+                self._slots.setdefault(player, slot)
+        mask = np.zeros(len(self.players), dtype=bool)
+        slots = [self._slots[p] for p in available if p in self._slots]
+        mask[slots] = True
+        return mask
+
+    def replacement_points(self, available: Optional[Iterable[Player]] = None) -> np.ndarray:
+        """Projected points of the replacement player at each position"""
+        replacement = np.zeros(len(VALUE_POSITIONS))
+        ranks = self._replacement_ranks
+        if available is not None:
+            mask = self._available_mask(available)
+            drafted = np.bincount(self._codes[~mask & (self._codes >= 0)], minlength=len(VALUE_POSITIONS))
+            ranks = np.maximum(ranks - drafted, 1)
+        for code, (start, ranked_end, _) in enumerate(self._bounds_proj):
+            group = self._order_proj[start:ranked_end]
+            if available is not None:
+                group = group[mask[group]]
+            if len(group):
+                # If there aren't enough players, the last one is replacement level
+                replacement[code] = self._proj[group[min(ranks[code], len(group)) - 1]]
+        return replacement
+
+    def var(self, available: Optional[Iterable[Player]] = None) -> np.ndarray:
+        """VAR per player (NaN for players without a projection or a VAR position)"""
+        replacement = np.append(self.replacement_points(available), np.nan)
+        return self._proj - replacement[self._codes]
+
+    def apply_var(self, available: Optional[Iterable[Player]] = None):
+        """Set var on every player with a projection at a VAR position"""
+        values = self.var(available)
+        players = self.players
+        for slot in np.flatnonzero(~np.isnan(values)):
+            players[slot].var = float(values[slot])
+
+
 def calculate_position_ranks(players: List[Player]):
     """Calculate position ranks based on 2024 stats and projections"""
-    # Group players by position
-    position_groups = {'QB': [], 'RB': [], 'WR': [], 'TE': [], 'LB': [], 'DB': []}
-    
-    for player in players:
-        if player.position in position_groups:
-            position_groups[player.position].append(player)
-    
-    # Calculate 2024 position ranks (sort by points_2024, handle None values)
-    for position, group in position_groups.items():
-        # Sort by points_2024 (descending), putting None values at the end
-        sorted_2024 = sorted(group, 
-                           key=lambda p: (p.points_2024 is None, -(p.points_2024 or 0)))
-        
-        for rank, player in enumerate(sorted_2024, 1):
-            if player.points_2024 is not None:
-                player.position_rank_2024 = rank
-    
-    # Calculate projected position ranks (sort by points_2025_proj)
-    for position, group in position_groups.items():
-        # Sort by points_2025_proj (descending), putting None values at the end
-        sorted_proj = sorted(group,
-                           key=lambda p: (p.points_2025_proj is None, -(p.points_2025_proj or 0)))
-        
-        for rank, player in enumerate(sorted_proj, 1):
-            if player.points_2025_proj is not None:
-                player.position_rank_proj = rank
-
-
-def calculate_var(players: List[Player], num_teams: int = 10):
-    """Calculate Value Above Replacement for each player"""
-    # Define replacement level for each position in a 10-team league
-    replacement_levels = {
-        'QB': 20,    # 2 QBs per team = 20th QB
-        'RB': 22,    # 2.2 RBs per team (with flex) = 22nd RB
-        'WR': 38,    # 3.8 WRs per team (with flex) = 38th WR
-        'TE': 10,    # 1 TE per team = 10th TE
-        'LB': 30,    # 3 LBs per team = 30th LB
-        'DB': 30     # 3 DBs per team = 30th DB
-    }
-    
-    # Group players by position
-    position_groups = {'QB': [], 'RB': [], 'WR': [], 'TE': [], 'LB': [], 'DB': []}
-    
-    for player in players:
-        if player.position in position_groups and player.points_2025_proj is not None:
-            position_groups[player.position].append(player)
-    
-    # Calculate VAR for each position
-    for position, group in position_groups.items():
-        # Sort by projected points (descending)
-        sorted_players = sorted(group, key=lambda p: p.points_2025_proj or 0, reverse=True)
-        
-        # Find replacement level points
-        replacement_rank = replacement_levels.get(position, 10)
-        replacement_points = 0
-        
-        if len(sorted_players) >= replacement_rank:
-            replacement_points = sorted_players[replacement_rank - 1].points_2025_proj or 0
-        elif sorted_players:
-            # If we don't have enough players, use the last one
-            replacement_points = sorted_players[-1].points_2025_proj or 0
-        
-        # Calculate VAR for each player
-        for player in group:
-            if player.points_2025_proj is not None:
-                player.var = player.points_2025_proj - replacement_points
+    VarCalculator(players).apply_position_ranks()
+
+
+def calculate_var(players: List[Player], num_teams: int = 10,
+                  available: Optional[Iterable[Player]] = None):
+    """Calculate Value Above Replacement for each player
+
+    With available (the undrafted players), replacement levels are measured
+    against the remaining pool instead of the full player set.
+    """
+    VarCalculator(players, num_teams).apply_var(available)
 
 
 def generate_mock_players() -> List[Player]:
     """Generate players using real ADP data"""
-    # Get real player data
-    player_data = get_players_with_fallback()
+    # Get real player data, from the prebuilt database when it's current
+    player_data = load_player_database()
+    if player_data is None:
+        player_data = get_players_with_fallback()
+        # Only the local ADP file path is cached; API/cache data has its own expiry
+        local_adp_file = get_player_data_sources()[0]
+        if os.path.exists(local_adp_file):
+            build_player_database(player_data)
     
     print(f"DEBUG: generate_mock_players received {len(player_data)} players from get_players_with_fallback")
     
@@ -152,11 +236,9 @@ def generate_mock_players() -> List[Player]:
         )
         players.append(player)
     
-    # Calculate position ranks
-    calculate_position_ranks(players)
-    
-    # Calculate VAR (Value Above Replacement)
-    calculate_var(players)
+    # Calculate position ranks; VAR depends on the league size and is applied
+    # by the app once the players are loaded
+    VarCalculator(players).apply_position_ranks()
     
     # Only add fake players if we have very few real players (fallback scenario)
     if len(players) < 50:
@@ -0,0 +1,61 @@
+"""Cached orderings of a player pool, one per sort column and direction
+
+PlayerList re-sorted its filtered players with Python key functions on
+every update, and several keys (NFC ADP, SOS) are lookups by name or team.
+SortIndexCache sorts the whole pool once per column and keeps each player's
+rank in that order, so ordering any subset of the pool (a position filter,
+the players left after a pick) is a sort on cached integers.
+"""
+from typing import Callable, Dict, Hashable, Iterable, List, Tuple
+
+
+class SortIndexCache:
+    """Per-column player orderings over a fixed pool
+
+    keys maps a column name to its sort key. Orderings are built on first
+    use and kept until the column is invalidated or the pool changes.
+    Drafting a player only shrinks the subsets being sorted, so orderings
+    stay valid for the whole draft; players that join the pool later (an
+    undone pick, say) are added to it when first seen.
+    """
+
+    def __init__(self, keys: Dict[str, Callable]):
+        self.keys = keys
+        self._pool: List[Hashable] = []
+        self._ranks: Dict[Tuple[str, bool], Dict[Hashable, int]] = {}
+
+    def set_pool(self, players: Iterable[Hashable]):
+        """Use a new player pool, dropping every cached ordering"""
+        self._pool = list(players)
+        self._ranks.clear()
+
+    def invalidate(self, *columns: str):
+        """Drop the orderings of the given columns (every column if none are given)"""
+        if not columns:
+            self._ranks.clear()
+            return
+        for entry in [entry for entry in self._ranks if entry[0] in columns]:
+            del self._ranks[entry]
+
+    def ranks(self, column: str, ascending: bool = True) -> Dict[Hashable, int]:
+        """Player -> position in the pool sorted by column"""
+        entry = (column, ascending)
+        ranks = self._ranks.get(entry)
+        if ranks is None:
+            ordered = sorted(self._pool, key=self.keys[column], reverse=not ascending)
+            ranks = self._ranks[entry] = {player: i for i, player in enumerate(ordered)}
+        return ranks
+
+    def sort(self, players: Iterable[Hashable], column: str, ascending: bool = True) -> List[Hashable]:
+        """players sorted by column, as sorted(players, key=..., reverse=not ascending) would
+
+        Ties keep the pool's order, which matches a stable sort as long as
+        players come in pool order (position filters of the pool do).
+        """
+        players = list(players)
+        try:
+            return sorted(players, key=self.ranks(column, ascending).__getitem__)
+        except KeyError:
+            known = set(self._pool)
+            self.set_pool(self._pool + [p for p in players if p not in known])
+            return sorted(players, key=self.ranks(column, ascending).__getitem__)
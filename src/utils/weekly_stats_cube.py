@@ -0,0 +1,194 @@
+"""2024 game logs as a players x weeks x stat fields array
+
+GameHistory filters and sorts the same season of games on every keystroke.
+Loading the logs into one cube lets custom points, weekly position ranks and
+season medians/averages be computed once, with NumPy, instead of re-scoring
+every raw stat dict per filter change.
+"""
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from ..config.scoring import SCORING_CONFIG
+
+NUM_WEEKS = 18
+
+# Stat fields kept from each game log (everything the table, totals and graph read)
+STAT_FIELDS = (
+    'off_snp', 'def_snp',
+    'pass_cmp', 'pass_yd', 'pass_td',
+    'rush_att', 'rush_yd', 'rush_td',
+    'rec_tgt', 'rec', 'rec_yd', 'rec_td',
+    'idp_tkl_solo', 'idp_tkl', 'idp_sack', 'idp_int', 'idp_ff', 'idp_fr',
+    'idp_def_td', 'idp_safety', 'idp_pass_def',
+)
+FIELD_INDEX = {name: i for i, name in enumerate(STAT_FIELDS)}
+
+IDP_POSITIONS = ('LB', 'DB')
+
+# A game counts towards median/average with 20+ snaps or 20+ points
+MEANINGFUL_SNAPS = 20
+MEANINGFUL_POINTS = 20
+
+
+def _snap_field(position: str) -> str:
+    """Defensive snaps for LB/DB, offensive snaps for everyone else"""
+    return 'def_snp' if position in IDP_POSITIONS else 'off_snp'
+
+
+class WeeklyStatsCube:
+    """One row per player, one column per week (index 0 is week 1)
+
+    games maps player_id -> {week: game}, where a game is a raw log entry
+    ({'stats': {...}, 'opponent': ..., 'team': ...}) or a list of them - the
+    first entry the player took snaps in is used. Players missing from
+    positions are skipped.
+    """
+
+    def __init__(self, games: Dict[str, Dict[int, object]], positions: Dict[str, str]):
+        self.player_ids = [pid for pid in games if pid in positions]
+        self.index = {pid: i for i, pid in enumerate(self.player_ids)}
+        self.positions = np.array([positions[pid] for pid in self.player_ids], dtype=object)
+
+        shape = (len(self.player_ids), NUM_WEEKS)
+        self.stats = np.zeros(shape + (len(STAT_FIELDS),))
+        self.present = np.zeros(shape, dtype=bool)
+        self.opponents = np.full(shape, '', dtype=object)
+        self.teams = np.full(shape, None, dtype=object)
+
+        for i, player_id in enumerate(self.player_ids):
+            snap_field = _snap_field(self.positions[i])
+            for week, game in games[player_id].items():
+                if not 1 <= week <= NUM_WEEKS or not game:
+                    continue
+                if isinstance(game, list):
+                    game = next((g for g in game if g.get('stats', {}).get(snap_field, 0)), game[0])
+                stats = game.get('stats', {})
+                self.stats[i, week - 1] = [stats.get(name) or 0 for name in STAT_FIELDS]
+                self.present[i, week - 1] = True
+                self.opponents[i, week - 1] = game.get('opponent', '')
+                self.teams[i, week - 1] = game.get('team')
+
+        self.is_idp = np.isin(self.positions, IDP_POSITIONS)
+        self.is_qb = self.positions == 'QB'
+        self.snaps = np.where(self.is_idp[:, None], self.field('def_snp'), self.field('off_snp')).astype(int)
+        self.played = self.snaps > 0
+        self.points = self._custom_points()
+        self.week_ranks = self._week_ranks()
+        self._summaries = {}
+
+    def __len__(self):
+        return len(self.player_ids)
+
+    @property
+    def weeks_loaded(self) -> int:
+        """Number of weeks with at least one game"""
+        return int(self.present.any(axis=0).sum())
+
+    def field(self, name: str) -> np.ndarray:
+        """players x weeks view of one stat field"""
+        return self.stats[:, :, FIELD_INDEX[name]]
+
+    def _custom_points(self) -> np.ndarray:
+        """Custom fantasy points for every game under our scoring rules"""
+        f = self.field
+        cfg = SCORING_CONFIG
+
+        # Terms are added in the same order as a game-by-game calculation,
+        # so totals match it to the last digit
+        solo = f('idp_tkl_solo')
+        idp = solo * cfg.get('tackle_solo', 1.75)
+        idp = idp + np.maximum(0, f('idp_tkl') - solo) * cfg.get('tackle_assist', 1.0)
+        idp = idp + f('idp_sack') * cfg.get('sack', 4.0)
+        idp = idp + f('idp_int') * cfg.get('int', 6.0)
+        idp = idp + f('idp_ff') * cfg.get('ff', 4.0)
+        idp = idp + f('idp_fr') * cfg.get('fr', 3.0)
+        idp = idp + f('idp_def_td') * cfg.get('def_td', 6.0)
+        idp = idp + f('idp_safety') * cfg.get('safety', 2.0)
+        idp = idp + f('idp_pass_def') * cfg.get('pass_defended', 1.5)
+
+        qb = self.is_qb[:, None]
+        offense = np.zeros(self.present.shape)
+        offense = offense + qb * f('pass_cmp') * cfg['pass_completion']
+        offense = offense + qb * f('pass_yd') * cfg['pass_yard']
+        offense = offense + qb * f('pass_td') * cfg['touchdown']
+        offense = offense + qb * (f('pass_yd') >= 300) * cfg['bonus_pass_300_yards']
+        offense = offense + f('rush_yd') * cfg['rush_yard']
+        offense = offense + f('rush_td') * cfg['touchdown']
+        offense = offense + (f('rush_yd') >= 100) * cfg['bonus_rush_100_yards']
+        offense = offense + ~qb * f('rec') * cfg['reception']
+        offense = offense + ~qb * f('rec_yd') * cfg['rec_yard']
+        offense = offense + ~qb * f('rec_td') * cfg['touchdown']
+        offense = offense + ~qb * (f('rec_yd') >= 100) * cfg['bonus_rec_100_yards']
+
+        return np.where(self.is_idp[:, None], idp, offense)
+
+    def _week_ranks(self) -> np.ndarray:
+        """Position rank of each game within its week, 0 if unranked
+
+        Games are ranked among players at the same position who took
+        offensive snaps that week, highest points first.
+        """
+        ranks = np.zeros(self.points.shape, dtype=int)
+        ranked = self.field('off_snp') > 0
+        for position in np.unique(self.positions):
+            rows = np.flatnonzero(self.positions == position)
+            for week in range(NUM_WEEKS):
+                eligible = rows[ranked[rows, week]]
+                if not len(eligible):
+                    continue
+                order = eligible[np.argsort(-self.points[eligible, week], kind='stable')]
+                ranks[order, week] = np.arange(1, len(order) + 1)
+        return ranks
+
+    def week_columns(self, week: Optional[int] = None) -> slice:
+        """Column slice for one week, or the whole season when week is None"""
+        if week is None:
+            return slice(0, NUM_WEEKS)
+        return slice(week - 1, week)
+
+    def season_summary(self, week: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Per-player totals over the season (or one week), computed once and cached
+
+        Only games the player took snaps in count. median/avg cover the
+        meaningful games (20+ snaps or 20+ points) and are 0 without any.
+        """
+        if week in self._summaries:
+            return self._summaries[week]
+
+        cols = self.week_columns(week)
+        played = self.played[:, cols]
+        points = np.where(played, self.points[:, cols], 0.0)
+        meaningful = played & ((self.snaps[:, cols] >= MEANINGFUL_SNAPS) |
+                               (self.points[:, cols] >= MEANINGFUL_POINTS))
+        counts = meaningful.sum(axis=1)
+
+        # Median of each row's meaningful games: sort them to the front
+        values = np.sort(np.where(meaningful, self.points[:, cols], np.inf), axis=1)
+        rows = np.arange(len(self))
+        low = values[rows, np.maximum(counts - 1, 0) // 2]
+        high = values[rows, np.maximum(counts, 1) // 2]
+        has_games = counts > 0
+        median = np.where(has_games, (low + high) / 2, 0.0)
+        avg = np.where(has_games, np.where(meaningful, self.points[:, cols], 0.0).sum(axis=1) /
+                       np.maximum(counts, 1), 0.0)
+
+        summary = {
+            'present': self.present[:, cols].any(axis=1),
+            'games': played.sum(axis=1),
+            'pts': np.cumsum(points, axis=1)[:, -1],  # week by week, like a running total
+            'median': median,
+            'avg': avg,
+            'snaps': np.where(played, self.snaps[:, cols], 0).sum(axis=1),
+        }
+        for name in STAT_FIELDS:
+            summary[name] = np.where(played, self.field(name)[:, cols].astype(int), 0).sum(axis=1)
+        self._summaries[week] = summary
+        return summary
+
+    def games(self, rows: Iterable[int], week: Optional[int] = None):
+        """(rows, weeks) arrays of each game played by the given players, week by week"""
+        cols = self.week_columns(week)
+        rows = np.asarray(list(rows), dtype=int)
+        col_idx, row_idx = np.nonzero(self.played[rows, cols].T)
+        return rows[row_idx], col_idx + cols.start + 1
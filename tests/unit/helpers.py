@@ -0,0 +1,26 @@
+"""Shared fixtures for the unit tests"""
+from datetime import datetime
+
+from src.models import Player
+from src.services.vegas_props_service import CachedPropsData, VegasPropsService, build_player_index
+
+
+ROSTER_SPOTS = {'qb': 1, 'rb': 2, 'wr': 2, 'te': 1, 'flex': 1, 'bn': 2}
+
+
+def make_players(count=80):
+    """count players cycling through QB/RB/WR/TE, with ADP and rank in list order"""
+    positions = ['QB', 'RB', 'WR', 'TE', 'RB', 'WR']
+    return [Player(name=f"PLAYER {i}", position=positions[i % len(positions)], rank=i + 1,
+                   adp=float(i + 1), player_id=f"p{i}") for i in range(count)]
+
+
+class OfflineVegasPropsService(VegasPropsService):
+    """Loads on demand instead of in a background thread; props can be set directly"""
+
+    def _start_background_load(self):
+        pass
+
+    def set_props(self, data):
+        self.cache = CachedPropsData(data=data, timestamp=datetime.now(),
+                                     by_player=build_player_index(data))
@@ -0,0 +1,83 @@
+import threading
+import unittest
+
+from src.core import DraftEngine, DraftState
+from src.core.availability_forecast import AvailabilityForecaster
+from src.models import Team
+from src.models.availability_index import AvailabilityIndex
+from tests.unit.helpers import ROSTER_SPOTS, make_players
+
+
+class TestAvailabilityForecaster(unittest.TestCase):
+    def setUp(self):
+        self.players = make_players()
+        engine = DraftEngine(4, ROSTER_SPOTS, reversal_round=3)
+        teams = {i: Team(i, f"Team {i}", ROSTER_SPOTS) for i in range(1, 5)}
+        self.state = DraftState(engine, teams, AvailabilityIndex(self.players))
+        self.forecaster = AvailabilityForecaster(4, time_budget=5, max_simulations=40)
+
+    def tearDown(self):
+        self.forecaster.shutdown()
+
+    def test_forecast_to_next_pick(self):
+        # Team 2 is on the clock at pick 2 and picks again at 7
+        first = self.players[0]
+        self.state.engine.make_pick(self.state.teams[1], first)
+        self.state.available_players.remove(first)
+
+        forecast = self.forecaster.forecast(self.state, user_team_id=2)
+
+        self.assertEqual((forecast.current_pick, forecast.next_pick), (2, 7))
+        self.assertEqual(forecast.num_simulations, 40)
+        # Picks 3-6 are simulated: four players go each time
+        self.assertEqual(sum(forecast.taken_counts.values()), 4 * 40)
+        self.assertLess(forecast.probability(self.players[1]), 0.5)
+        self.assertEqual(forecast.probability(self.players[-1]), 1.0)
+        # Same pick, same seed - same numbers
+        again = self.forecaster.forecast(self.state, user_team_id=2)
+        self.assertEqual(again.taken_counts, forecast.taken_counts)
+        # The live state is untouched
+        self.assertEqual(len(self.state.available_players), len(self.players) - 1)
+        self.assertEqual(self.state.teams[3].filled, 0)
+
+    def test_back_to_back_picks(self):
+        # Team 4 has picks 4 and 5: nobody picks in between
+        forecast = self.forecaster.forecast(self.state, user_team_id=4)
+        self.assertEqual(forecast.next_pick, 4)
+        for _ in range(3):
+            _, _, _, team_id = self.state.engine.get_current_pick_info()
+            player = self.state.available_players.top(1)[0]
+            self.state.engine.make_pick(self.state.teams[team_id], player)
+            self.state.available_players.remove(player)
+
+        forecast = self.forecaster.forecast(self.state, user_team_id=4)
+        self.assertEqual(forecast.next_pick, 5)
+        self.assertEqual(forecast.num_simulations, 0)
+        self.assertEqual(forecast.probability(self.players[10]), 1.0)
+
+    def test_fixed_simulation_count(self):
+        # The count doesn't depend on how fast the machine is; a forecast
+        # that can't finish in the budget is dropped, not cut short
+        forecast = AvailabilityForecaster(4, max_simulations=25).forecast(self.state, user_team_id=1)
+        self.assertEqual(forecast.num_simulations, 25)
+        self.assertEqual(sum(forecast.taken_counts.values()), 6 * 25)
+        slow = AvailabilityForecaster(4, time_budget=-1)
+        self.assertIsNone(slow.forecast(self.state, user_team_id=1))
+        slow.shutdown()
+
+    def test_request_runs_in_background(self):
+        done = threading.Event()
+        results = []
+
+        def on_ready(forecast):
+            results.append(forecast)
+            done.set()
+
+        self.forecaster.request(self.state, 1, on_ready)
+        self.assertTrue(done.wait(10))
+        self.assertEqual(results[0].next_pick, 8)
+        self.assertEqual(results[0].num_simulations, 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+from src.models import AvailabilityIndex, Player
+from src.services.player_pool_service import PlayerPoolService
+
+
+def make_players():
+    positions = ['RB', 'WR', 'QB', 'TE', 'WR', 'RB']
+    # Deliberately out of ADP order
+    adps = [5.0, 1.0, 3.0, 6.0, 2.0, 4.0]
+    return [
+        Player(name=f"Player {i}", position=positions[i], rank=i + 1, adp=adps[i], player_id=f"p{i}")
+        for i in range(len(adps))
+    ]
+
+
+class TestAvailabilityIndex(unittest.TestCase):
+    def setUp(self):
+        self.players = make_players()
+        self.index = AvailabilityIndex(self.players)
+        self.by_adp = sorted(self.players, key=lambda p: p.adp)
+
+    def test_iterates_in_adp_order(self):
+        self.assertEqual(list(self.index), self.by_adp)
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual(self.index[0], self.by_adp[0])
+        self.assertEqual(self.index[-1], self.by_adp[-1])
+        self.assertEqual(self.index[:3], self.by_adp[:3])
+
+    def test_remove_and_add(self):
+        player = self.by_adp[1]
+        self.index.remove(player)
+        self.assertNotIn(player, self.index)
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(self.index.index(self.by_adp[2]), 1)
+        with self.assertRaises(ValueError):
+            self.index.remove(player)
+
+        self.index.add(player)
+        self.assertEqual(list(self.index), self.by_adp)
+
+    def test_position_queries(self):
+        wrs = [p for p in self.by_adp if p.position == 'WR']
+        self.assertEqual(self.index.by_position('WR'), wrs)
+        self.index.discard(wrs[0])
+        self.assertEqual(self.index.top(5, 'WR'), wrs[1:])
+        self.assertEqual(self.index.position_count('WR'), 1)
+        self.assertEqual(self.index.by_position('K'), [])
+
+    def test_sort_after_adp_change(self):
+        self.index.discard(self.by_adp[0])
+        self.by_adp[-1].adp = 0.5
+        self.index.sort(key=lambda p: p.adp if p.adp else 999)
+        self.assertEqual(self.index[0], self.by_adp[-1])
+        self.assertNotIn(self.by_adp[0], self.index)
+
+    def test_copy_is_independent(self):
+        snapshot = self.index.copy()
+        self.index.discard(self.by_adp[0])
+        self.assertIn(self.by_adp[0], snapshot)
+        self.assertEqual(len(snapshot), 6)
+
+    def test_restricted_availability(self):
+        index = AvailabilityIndex(self.players, available=self.players[:2])
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.all_players, self.by_adp)
+
+
+class TestPlayerPoolService(unittest.TestCase):
+    def test_draft_and_undraft(self):
+        players = make_players()
+        pool = PlayerPoolService(players)
+        self.assertTrue(pool.draft_player(players[0]))
+        self.assertFalse(pool.draft_player(players[0]))
+        self.assertFalse(pool.is_player_available(players[0]))
+        self.assertIsNone(pool.find_player_by_name("player 0"))
+        self.assertEqual(pool.find_player_by_name("player 1"), players[1])
+
+        self.assertTrue(pool.undraft_player(players[0]))
+        self.assertTrue(pool.is_player_available(players[0]))
+
+        pool.draft_player(players[1])
+        pool.reset()
+        self.assertEqual(len(pool.get_available_players()), len(players))
+        self.assertEqual(pool.get_player_index(players[1]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from src.database import SavedDraftCatalog, TemplateCatalog
+from src.services.draft_save_manager import DraftSaveManager
+
+
+TEMPLATE = {
+    'name': 'Bowers R2',
+    'created_at': '2025-08-01T12:00:00',
+    'draft_config': {'num_teams': 10},
+    'draft_results': [
+        {'pick_number': 1, 'round': 1, 'pick_in_round': 1, 'team_id': 1, 'player_id': 'a'},
+        {'pick_number': 2, 'round': 1, 'pick_in_round': 2, 'team_id': 2, 'player_id': 'b'},
+    ],
+    'team_states': {'1': {'name': 'Me', 'roster': {'rb': ['a']}},
+                    '2': {'name': 'Them', 'roster': {'te': ['b']}}},
+    'player_pool': {'all_players': [{'player_id': 'a', 'name': 'BIJAN ROBINSON', 'position': 'RB'},
+                                    {'player_id': 'b', 'name': 'BROCK BOWERS', 'position': 'TE'}]},
+    'user_settings': {'user_team_id': 1},
+}
+
+
+class TestTemplateCatalog(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.catalog = TemplateCatalog(self.temp_dir)
+
+    def tearDown(self):
+        self.catalog.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_indexes_picks_and_rosters(self):
+        self.catalog.index_file('bowers.json', TEMPLATE)
+        row = self.catalog.query('SELECT * FROM templates')[0]
+        self.assertEqual((row['name'], row['user_team_id'], row['total_picks']), ('Bowers R2', 1, 2))
+
+        picks = self.catalog.query(
+            'SELECT name, position FROM template_picks WHERE filename = ? AND team_id = ?',
+            ('bowers.json', 1))
+        self.assertEqual([tuple(p) for p in picks], [('BIJAN ROBINSON', 'RB')])
+        rosters = self.catalog.query('SELECT team_name, position, player_id FROM template_rosters '
+                                     'ORDER BY team_id')
+        self.assertEqual([tuple(r) for r in rosters], [('Me', 'rb', 'a'), ('Them', 'te', 'b')])
+
+        self.catalog.remove_file('bowers.json')
+        self.assertEqual(self.catalog.query('SELECT * FROM template_picks'), [])
+
+    def test_rebuilds_catalog_from_another_schema_version(self):
+        self.catalog.close()
+        conn = sqlite3.connect(os.path.join(self.temp_dir, TemplateCatalog.FILENAME))
+        conn.execute('PRAGMA user_version = 99')
+        conn.commit()
+        conn.close()
+
+        self.catalog = TemplateCatalog(self.temp_dir)
+        self.catalog.index_file('bowers.json', TEMPLATE)
+        self.assertEqual(len(self.catalog.query('SELECT * FROM templates')), 1)
+
+
+class TestSavedDraftCatalog(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_get_saved_drafts(self):
+        manager = DraftSaveManager(self.temp_dir)
+        manager.save_draft([], {}, user_team_id=None)
+
+        drafts = DraftSaveManager(self.temp_dir).get_saved_drafts()
+        self.assertEqual(len(drafts), 1)
+        self.assertEqual(drafts[0]['user_team'], 'Observer')
+        self.assertEqual(drafts[0]['total_picks'], 0)
+        self.assertIs(drafts[0]['manual_mode'], False)
+        self.assertNotIn(SavedDraftCatalog.FILENAME, [d['filename'] for d in drafts])
+
+
+if __name__ == '__main__':
+    unittest.main()
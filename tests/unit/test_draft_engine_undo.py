@@ -0,0 +1,66 @@
+import unittest
+
+from src.core import DraftEngine
+from src.models import Player, Team
+from src.models.availability_index import AvailabilityIndex
+
+
+ROSTER_SPOTS = {"qb": 1, "rb": 2, "wr": 2, "te": 1, "flex": 1, "bn": 2}
+
+
+class TestDraftEngineUndo(unittest.TestCase):
+    def setUp(self):
+        self.engine = DraftEngine(2, ROSTER_SPOTS)
+        self.teams = {i: Team(i, f"Team {i}", ROSTER_SPOTS) for i in (1, 2)}
+        positions = ["RB", "WR", "RB", "QB", "TE", "WR"]
+        self.players = [Player(name=f"Player {i}", position=pos, rank=i, adp=float(i),
+                               player_id=f"p{i}") for i, pos in enumerate(positions, 1)]
+        self.available = AvailabilityIndex(self.players)
+
+    def draft(self, count):
+        for _ in range(count):
+            pick_number, _, _, team_id = self.engine.get_current_pick_info()
+            player = self.available.top(1)[0]
+            self.engine.make_pick(self.teams[team_id], player)
+            self.available.remove(player)
+
+    def state(self):
+        return ([p.player.player_id for p in self.engine.draft_results],
+                {i: dict(t.position_counts) for i, t in self.teams.items()},
+                [p.player_id for p in self.available])
+
+    def test_undo_restores_rosters_and_availability(self):
+        self.draft(2)
+        before = self.state()
+        self.draft(3)
+
+        undone = self.engine.undo_last(3, teams=self.teams, available_players=self.available)
+
+        self.assertEqual([p.pick_number for p in undone], [5, 4, 3])
+        self.assertEqual(self.state(), before)
+        self.assertEqual(self.engine.get_current_pick_info()[0], 3)
+        self.assertEqual(sum(t.filled for t in self.teams.values()), 2)
+
+    def test_redo_replays_undone_picks(self):
+        self.draft(4)
+        after = self.state()
+        self.engine.undo_last(3, available_players=self.available)
+
+        redone = self.engine.redo(2, available_players=self.available)
+        self.assertEqual([p.pick_number for p in redone], [2, 3])
+        self.engine.redo(available_players=self.available)
+
+        self.assertEqual(self.state(), after)
+        self.assertEqual(self.engine.redo(), [])
+
+    def test_new_pick_clears_redo(self):
+        self.draft(3)
+        self.engine.undo_last(2, available_players=self.available)
+        self.draft(1)
+
+        self.assertEqual(self.engine.redo_stack, [])
+        self.assertEqual(self.engine.redo(available_players=self.available), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
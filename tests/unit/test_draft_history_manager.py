@@ -0,0 +1,97 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.core import DraftPick
+from src.models import Player
+from src.services.draft_history_manager import DraftHistoryManager
+
+
+def make_pick(pick_number, name=None):
+    player = Player(name=name or f"Player {pick_number}", position="RB", rank=pick_number,
+                    adp=float(pick_number), player_id=f"p{pick_number}")
+    return DraftPick(pick_number=pick_number, round=1, pick_in_round=pick_number,
+                     team_id=pick_number, player=player)
+
+
+class TestDraftHistoryManager(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = DraftHistoryManager(self.temp_dir)
+        self.draft_id = self.manager.start_new_draft("Test Draft")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def picks(self, manager=None):
+        data = (manager or self.manager).load_draft(self.draft_id)
+        return [(p["pick_number"], p["player"]["name"]) for p in data["picks"]]
+
+    def test_picks_are_journaled_not_rewritten(self):
+        snapshot = os.path.join(self.temp_dir, f"{self.draft_id}.json")
+        before = os.path.getmtime(snapshot), os.path.getsize(snapshot)
+        self.manager.save_pick(make_pick(2), user_team_id=3)
+        self.manager.save_pick(make_pick(1))
+
+        self.assertEqual((os.path.getmtime(snapshot), os.path.getsize(snapshot)), before)
+        self.assertEqual(self.picks(), [(1, "Player 1"), (2, "Player 2")])
+
+    def test_overwrite_and_remove_after(self):
+        for n in range(1, 6):
+            self.manager.save_pick(make_pick(n))
+        self.manager.save_pick(make_pick(3, "Replacement"))
+        self.manager.remove_picks_after(3)
+        self.manager.save_pick(make_pick(4, "New Four"))
+
+        expected = [(1, "Player 1"), (2, "Player 2"), (3, "Replacement"), (4, "New Four")]
+        self.assertEqual(self.picks(), expected)
+        # A fresh manager sees the same draft
+        self.assertEqual(self.picks(DraftHistoryManager(self.temp_dir)), expected)
+        self.assertEqual(self.manager.get_draft_list()[0]["picks_count"], 4)
+
+    def test_compaction(self):
+        self.manager.COMPACT_AFTER = 4
+        for n in range(1, 6):
+            self.manager.save_pick(make_pick(n))
+
+        with open(os.path.join(self.temp_dir, f"{self.draft_id}.json")) as f:
+            self.assertEqual(len(json.load(f)["picks"]), 4)
+        self.assertEqual([n for n, _ in self.picks()], [1, 2, 3, 4, 5])
+
+    def test_torn_journal_line_is_ignored(self):
+        self.manager.save_pick(make_pick(1))
+        with open(os.path.join(self.temp_dir, f"{self.draft_id}.journal.jsonl"), 'a') as f:
+            f.write('{"op": "pick", "pi')
+        self.assertEqual(self.picks(), [(1, "Player 1")])
+
+    def test_picks_after_a_torn_line_are_kept(self):
+        journal = os.path.join(self.temp_dir, f"{self.draft_id}.journal.jsonl")
+        for n in (1, 2):
+            self.manager.save_pick(make_pick(n))
+        with open(journal, 'a') as f:
+            f.write('{"op": "pick", "pi')
+
+        # Same process keeps saving, then a restarted one too
+        self.manager.save_pick(make_pick(3))
+        restarted = DraftHistoryManager(self.temp_dir)
+        restarted.current_draft_id = self.draft_id
+        with open(journal, 'a') as f:
+            f.write('{"op": "pi')
+        restarted.save_pick(make_pick(4))
+
+        expected = [(1, "Player 1"), (2, "Player 2"), (3, "Player 3"), (4, "Player 4")]
+        self.assertEqual(self.picks(DraftHistoryManager(self.temp_dir)), expected)
+        with open(journal) as f:
+            self.assertEqual(len(f.read().splitlines()), 4)
+
+    def test_delete_removes_journal(self):
+        self.manager.save_pick(make_pick(1))
+        self.manager.delete_draft(self.draft_id)
+        self.assertEqual([f for f in os.listdir(self.temp_dir) if f.startswith(self.draft_id)], [])
+        self.assertEqual(self.manager.get_draft_list(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
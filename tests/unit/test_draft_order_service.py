@@ -0,0 +1,56 @@
+import unittest
+
+from src.core import DraftEngine
+from src.services import DraftOrderService
+from src.services.draft_trade_service import DraftTradeService
+
+
+ROSTER_SPOTS = {"qb": 1, "rb": 2, "wr": 2, "te": 1, "flex": 1, "bn": 1}
+
+
+class TestDraftOrderService(unittest.TestCase):
+    def test_third_round_reversal(self):
+        service = DraftOrderService(4)
+        forward, reverse = [1, 2, 3, 4], [4, 3, 2, 1]
+        self.assertEqual([service.get_draft_order_for_round(r) for r in range(1, 7)],
+                         [forward, reverse, reverse, forward, reverse, forward])
+        self.assertEqual(service.get_team_picks(2, 5), [2, 7, 11, 14, 19])
+
+    def test_no_reversal_and_linear(self):
+        self.assertEqual(DraftOrderService(3, reversal_round=0).get_original_order(3),
+                         [1, 2, 3, 3, 2, 1, 1, 2, 3])
+        self.assertEqual(DraftOrderService(3, draft_type="linear").get_original_order(2),
+                         [1, 2, 3, 1, 2, 3])
+
+    def test_trades_overlay_and_rebuild(self):
+        trades = DraftTradeService()
+        service = DraftOrderService(4, trade_service=trades)
+        table = service.get_pick_table(3)
+        self.assertIs(service.get_pick_table(3), table)
+
+        trades.add_trade(1, [1], 4, [2])
+        traded = service.get_pick_table(3)
+        self.assertIsNot(traded, table)
+        self.assertEqual(traded[0], (1, 1, 4))
+        self.assertEqual(traded[4], (2, 1, 1))
+        self.assertEqual(service.get_pick_info(5, 3), (2, 1, 1))
+
+        trades.clear_trades()
+        self.assertEqual(service.get_pick_table(3), table)
+
+
+class TestDraftEnginePickTable(unittest.TestCase):
+    def test_current_pick_follows_trades(self):
+        trades = DraftTradeService()
+        engine = DraftEngine(4, ROSTER_SPOTS, reversal_round=3, trade_service=trades)
+        self.assertEqual(engine.get_current_pick_info(), (1, 1, 1, 1))
+        self.assertEqual(engine.draft_order[:8], [1, 2, 3, 4, 4, 3, 2, 1])
+
+        trades.add_trade(1, [1], 3, [2])
+        self.assertEqual(engine.get_current_pick_info(), (1, 1, 1, 3))
+        self.assertEqual(engine.get_team_picks(1)[:2], [6, 8])
+        self.assertEqual(len(engine.get_pick_table()), engine.total_picks)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import random
+import unittest
+
+from src.core.pick_policy import select_computer_pick
+from src.core.draft_simulator import (
+    DraftSimulator, SimulationResult, player_key, shard_seed
+)
+from src.models import Player, Team
+from src.models.draft_preset import DraftPreset, ForcedPick, PlayerExclusion
+from src.services.draft_trade_service import DraftTradeService
+from tests.unit.helpers import ROSTER_SPOTS, make_players
+
+
+class TestSelectComputerPick(unittest.TestCase):
+    def setUp(self):
+        self.players = make_players()
+        self.team = Team(1, "Team 1", ROSTER_SPOTS)
+
+    def test_first_pick_takes_best_available(self):
+        pick = select_computer_pick(self.players, self.team, 1, 4, {})
+        self.assertEqual(pick, self.players[0])
+
+    def test_excluded_player_is_skipped(self):
+        preset = DraftPreset(enabled=True, player_exclusions=[
+            PlayerExclusion(team_name="Team 1", player_name="PLAYER 0")
+        ])
+        pick = select_computer_pick(self.players, self.team, 1, 4, {}, preset)
+        self.assertEqual(pick, self.players[1])
+
+    def test_forced_pick_wins(self):
+        preset = DraftPreset(enabled=True, forced_picks=[
+            ForcedPick(team_name="Team 1", player_name="PLAYER 40", pick_number=5)
+        ])
+        pick = select_computer_pick(self.players[4:], self.team, 5, 4, {}, preset)
+        self.assertEqual(pick.name, "PLAYER 40")
+
+    def test_position_cap_respected(self):
+        # Team already has a TE, so the TE at the top of the board is skipped
+        available = [p for p in self.players[20:] if p.position in ('TE', 'RB')]
+        self.assertEqual(available[0].position, 'TE')
+        pick = select_computer_pick(available, self.team, 40, 4, {'TE': 1}, rng=random.Random(0))
+        self.assertNotEqual(pick.position, 'TE')
+
+
+class TestDraftSimulator(unittest.TestCase):
+    def setUp(self):
+        self.players = make_players()
+        self.simulator = DraftSimulator(
+            self.players,
+            num_teams=4,
+            roster_spots=ROSTER_SPOTS,
+            reversal_round=3
+        )
+
+    def test_run_draft_completes(self):
+        picks = self.simulator.run_draft(random.Random(1))
+        self.assertEqual(len(picks), 4 * sum(ROSTER_SPOTS.values()))
+        drafted = [p.player.player_id for p in picks]
+        self.assertEqual(len(drafted), len(set(drafted)))
+
+    def test_run_aggregates_every_draft(self):
+        result = self.simulator.run(20, seed=7)
+        self.assertEqual(result.num_drafts, 20)
+        total_picks = sum(sum(c.values()) for c in result.pick_counts.values())
+        self.assertEqual(total_picks, 20 * 4 * sum(ROSTER_SPOTS.values()))
+        # The ADP leader always goes first overall
+        self.assertEqual(result.pick_probability('p0', 1), 1.0)
+        self.assertEqual(result.team_probability('p0', 1), 1.0)
+
+    def test_run_is_deterministic_with_seed(self):
+        first = self.simulator.run(10, seed=3)
+        second = self.simulator.run(10, seed=3)
+        self.assertEqual(first.pick_counts, second.pick_counts)
+
+    def test_availability(self):
+        result = self.simulator.run(10, seed=1)
+        self.assertEqual(result.availability('p0', 1), 1.0)
+        self.assertEqual(result.availability('p0', 2), 0.0)
+
+    def test_run_parallel_matches_across_worker_counts(self):
+        inline = self.simulator.run_parallel(12, seed=5, max_workers=1, shard_size=5)
+        pooled = self.simulator.run_parallel(12, seed=5, max_workers=2, shard_size=5)
+        self.assertEqual(inline.num_drafts, 12)
+        self.assertEqual(inline.pick_counts, pooled.pick_counts)
+        self.assertEqual(inline.team_counts, pooled.team_counts)
+
+    def test_shard_seeds_differ(self):
+        seeds = {shard_seed(1, i) for i in range(10)}
+        self.assertEqual(len(seeds), 10)
+        self.assertEqual(shard_seed(1, 0), shard_seed(1, 0))
+
+    def test_run_vectorized_completes_every_draft(self):
+        result = self.simulator.run_vectorized(50, seed=2)
+        self.assertEqual(result.num_drafts, 50)
+        per_pick = {}
+        for counts in result.pick_counts.values():
+            for pick, count in counts.items():
+                per_pick[pick] = per_pick.get(pick, 0) + count
+        # Every pick of every draft is made exactly once
+        self.assertEqual(set(per_pick), set(range(1, 4 * sum(ROSTER_SPOTS.values()) + 1)))
+        self.assertTrue(all(count == 50 for count in per_pick.values()))
+        self.assertEqual(result.pick_probability('p0', 1), 1.0)
+
+    def test_run_vectorized_matches_scalar_policy(self):
+        scalar = self.simulator.run(300, seed=4)
+        batched = self.simulator.run_vectorized(300, seed=4)
+        for key in ['p0', 'p5', 'p10', 'p20']:
+            self.assertAlmostEqual(scalar.average_pick(key), batched.average_pick(key), delta=1.0)
+
+    def test_run_vectorized_honors_preset(self):
+        preset = DraftPreset(
+            enabled=True,
+            draft_order=["A", "B", "C", "D"],
+            player_exclusions=[PlayerExclusion(team_name="A", player_name="PLAYER 0")],
+            forced_picks=[ForcedPick(team_name="B", player_name="PLAYER 30", pick_number=2)]
+        )
+        simulator = DraftSimulator(self.players, 4, ROSTER_SPOTS, reversal_round=3, preset=preset)
+        result = simulator.run_vectorized(20, seed=1)
+        self.assertEqual(result.pick_probability('p1', 1), 1.0)
+        self.assertEqual(result.pick_probability('p30', 2), 1.0)
+
+    def test_team_picks_apply_trades(self):
+        trade_service = DraftTradeService()
+        trade_service.add_trade(1, [2], 2, [2])
+        simulator = DraftSimulator(self.players, 4, ROSTER_SPOTS, reversal_round=3,
+                                   trade_service=trade_service)
+        picks = simulator.get_team_picks(1)
+        self.assertEqual(picks[:2], [1, 7])
+
+
+class TestSimulationResult(unittest.TestCase):
+    def test_merge(self):
+        player = Player(name="A", position="RB", rank=1, adp=1.0, player_id="a")
+        first = SimulationResult(num_drafts=1, pick_counts={'a': {1: 1}}, team_counts={'a': {1: 1}})
+        second = SimulationResult(num_drafts=1, pick_counts={'a': {2: 1}}, team_counts={'a': {2: 1}})
+        first.merge(second)
+        self.assertEqual(first.num_drafts, 2)
+        self.assertEqual(first.pick_counts[player_key(player)], {1: 1, 2: 1})
+        self.assertEqual(first.average_pick('a'), 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import random
+import unittest
+
+from src.core import DraftEngine, DraftSimulator, DraftState
+from src.models import Team
+from src.models.availability_index import AvailabilityIndex
+from tests.unit.helpers import ROSTER_SPOTS, make_players
+
+
+class TestDraftState(unittest.TestCase):
+    def setUp(self):
+        self.players = make_players(60)
+        engine = DraftEngine(4, ROSTER_SPOTS, reversal_round=3)
+        teams = {i: Team(i, f"Team {i}", ROSTER_SPOTS) for i in range(1, 5)}
+        self.state = DraftState(engine, teams, AvailabilityIndex(self.players))
+        for _ in range(6):
+            self.draft(self.state)
+
+    def draft(self, state):
+        _, _, _, team_id = state.engine.get_current_pick_info()
+        player = state.available_players.top(1)[0]
+        state.engine.make_pick(state.teams[team_id], player)
+        state.available_players.remove(player)
+
+    def summary(self, state):
+        return ([p.player.player_id for p in state.engine.draft_results],
+                {i: (t.filled, dict(t.position_counts)) for i, t in state.teams.items()},
+                len(state.available_players))
+
+    def test_fork_is_independent(self):
+        before = self.summary(self.state)
+        fork = self.state.fork()
+        self.assertEqual(self.summary(fork), before)
+
+        for _ in range(5):
+            self.draft(fork)
+        fork.engine.undo_last(2, available_players=fork.available_players)
+
+        self.assertEqual(self.summary(self.state), before)
+        self.assertEqual(len(fork.engine.draft_results), 9)
+        self.assertIs(fork.engine.order_service, self.state.engine.order_service)
+
+    def test_restore_in_place(self):
+        snapshot = self.state.fork()
+        before = self.summary(self.state)
+        teams = dict(self.state.teams)
+        self.state.engine.undo_last(4, teams=self.state.teams)
+
+        self.state.restore(snapshot)
+        self.state.available_players = snapshot.available_players.copy()
+
+        self.assertEqual(self.summary(self.state), before)
+        self.assertEqual(self.state.teams, teams)
+
+    def test_simulator_runs_from_fork(self):
+        simulator = DraftSimulator(self.players, 4, ROSTER_SPOTS, reversal_round=3)
+        before = self.summary(self.state)
+
+        picks = simulator.run_from(self.state, random.Random(3))
+
+        self.assertEqual(len(picks), 4 * sum(ROSTER_SPOTS.values()))
+        self.assertEqual(picks[:6], self.state.engine.draft_results)
+        drafted = [p.player.player_id for p in picks]
+        self.assertEqual(len(drafted), len(set(drafted)))
+        self.assertEqual(self.summary(self.state), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.services.draftkings_api import DraftKingsAPI, PlayerProp
+from src.services.vegas_props_service import CachedPropsData
+from tests.unit.helpers import OfflineVegasPropsService
+
+
+SUBCATEGORIES = [
+    {'id': 100 + i, 'categoryId': 1759, 'name': name, 'componentId': 1, 'sortOrder': i}
+    for i, name in enumerate(DraftKingsAPI.COMMON_PROPS.values())
+]
+
+
+def subcategory_payload(subcategory_id):
+    return {
+        'events': [{'id': 'e1', 'name': 'NFL 2025/26 - Joe Burrow',
+                    'participants': [{'type': 'Team', 'metadata': {'rosettaTeamName': 'CIN'}}]}],
+        'markets': [{'id': 'm1', 'eventId': 'e1'}],
+        'selections': [
+            {'marketId': 'm1', 'outcomeType': 'Over', 'label': f'Over {subcategory_id}.5',
+             'displayOdds': {'american': '-115'}},
+            {'marketId': 'm1', 'outcomeType': 'Under', 'label': f'Under {subcategory_id}.5',
+             'displayOdds': {'american': '-105'}},
+        ],
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+    no_props = False
+
+    def do_GET(self):
+        StubHandler.requests_seen.append(self.path)
+        if self.path.endswith('/categories/1759'):
+            body = {'subcategories': [] if StubHandler.no_props else SUBCATEGORIES}
+        else:
+            body = subcategory_payload(int(self.path.rsplit('/', 1)[1]))
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServerTestCase(unittest.TestCase):
+    """Points DraftKingsAPI at a local stub server"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.base_url = DraftKingsAPI.BASE_URL
+        DraftKingsAPI.BASE_URL = f'http://127.0.0.1:{self.server.server_port}'
+        DraftKingsAPI._subcategories = None
+        DraftKingsAPI._session = None
+        StubHandler.requests_seen = []
+        StubHandler.no_props = False
+
+    def tearDown(self):
+        DraftKingsAPI.BASE_URL = self.base_url
+        DraftKingsAPI._subcategories = None
+        if DraftKingsAPI._session is not None:
+            DraftKingsAPI._session.close()
+        DraftKingsAPI._session = None
+
+
+class TestGetAllCommonProps(StubServerTestCase):
+    def test_fetches_every_prop_type(self):
+        props = DraftKingsAPI.get_all_common_props()
+
+        self.assertEqual(list(props), list(DraftKingsAPI.COMMON_PROPS))
+        for i, (key, prop_type) in enumerate(DraftKingsAPI.COMMON_PROPS.items()):
+            self.assertEqual(len(props[key]), 1)
+            prop = props[key][0]
+            self.assertEqual(prop.player_name, 'JOE BURROW')
+            self.assertEqual(prop.team, 'CIN')
+            self.assertEqual(prop.prop_type, prop_type)
+            self.assertEqual(prop.prop_value, 100 + i + 0.5)
+
+        # Subcategories are looked up once, then one request per prop type
+        self.assertEqual(len(StubHandler.requests_seen), 1 + len(DraftKingsAPI.COMMON_PROPS))
+
+    def test_reuses_session(self):
+        DraftKingsAPI.get_all_common_props()
+        self.assertIs(DraftKingsAPI.get_session(), DraftKingsAPI.get_session())
+
+
+class TestVegasPropsDiskCache(StubServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.temp_dir, 'vegas_props_cache.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+        super().tearDown()
+
+    def test_second_service_loads_from_disk(self):
+        first = OfflineVegasPropsService(cache_path=self.cache_path)
+        self.assertEqual(first.get_prop_value('Joe Burrow', 'passing_yards'), 100.5)
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        StubHandler.requests_seen = []
+        second = OfflineVegasPropsService(cache_path=self.cache_path)
+        self.assertEqual(second.get_prop_value('Joe Burrow', 'passing_yards'), 100.5)
+        self.assertIsInstance(second.get_all_props()['receptions'][0], PlayerProp)
+        self.assertEqual(StubHandler.requests_seen, [])
+
+    def test_fetch_without_props_is_not_saved(self):
+        # DraftKings answers but lists no prop markets (off-season, blocked region)
+        StubHandler.no_props = True
+        service = OfflineVegasPropsService(cache_path=self.cache_path)
+        self.assertIsNone(service.get_prop_value('Joe Burrow', 'passing_yards'))
+        self.assertFalse(os.path.exists(self.cache_path))
+
+        # The next run fetches again instead of serving nothing until the cache expires
+        StubHandler.no_props = False
+        DraftKingsAPI._subcategories = None
+        again = OfflineVegasPropsService(cache_path=self.cache_path)
+        self.assertEqual(again.get_prop_value('Joe Burrow', 'passing_yards'), 100.5)
+
+    def test_expired_disk_cache_is_refetched(self):
+        service = OfflineVegasPropsService(cache_path=self.cache_path)
+        service.cache = CachedPropsData(data={'passing_yards': []},
+                                        timestamp=datetime.now() - timedelta(hours=1))
+        service._save_disk_cache(service.cache)
+        service.cache = None
+
+        self.assertEqual(service.get_prop_value('Joe Burrow', 'passing_yards'), 100.5)
+        self.assertTrue(StubHandler.requests_seen)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import pickle
+import unittest
+
+from src.models import Player
+from src.models.player import WeeklyStats, WeeklyStatsBlock
+
+
+WEEKLY = [
+    {'year': 2024, 'week': 1, 'team': 'GB', 'opponent': 'PHI',
+     'stats': {'pts_ppr': 5.7, 'rec': 2.0, 'off_snp': 64.0}},
+    {'year': 2024, 'week': 3, 'team': 'GB', 'opponent': 'TEN',
+     'stats': {'pts_ppr': 12.1, 'rec_td': 1.0}},
+]
+
+
+class TestPlayer(unittest.TestCase):
+    def test_slots(self):
+        player = Player(name="Test", position="RB", rank=1, adp=1.5)
+        self.assertFalse(hasattr(player, '__dict__'))
+        with self.assertRaises(AttributeError):
+            player.not_a_field = 1
+
+    def test_weekly_stats_round_trip(self):
+        player = Player(name="Test", position="TE", rank=1, adp=1.0, weekly_stats_2024=WEEKLY)
+        self.assertIsInstance(player.weekly_stats_2024, WeeklyStats)
+        self.assertEqual(len(player.weekly_stats_2024), 2)
+        self.assertEqual(list(player.weekly_stats_2024), WEEKLY)
+        self.assertEqual(player.weekly_stats_2024[-1]['opponent'], 'TEN')
+        self.assertEqual(player.weekly_stats_2024.weeks.tolist(), [1, 3])
+
+    def test_empty_and_missing_weekly_stats(self):
+        self.assertIsNone(Player(name="A", position="RB", rank=1, adp=1.0).weekly_stats_2024)
+        empty = Player(name="B", position="RB", rank=1, adp=1.0, weekly_stats_2024=[])
+        self.assertFalse(empty.weekly_stats_2024)
+
+    def test_pickle(self):
+        player = Player(name="Test", position="WR", rank=3, adp=2.0, player_id="x",
+                        weekly_stats_2024=WEEKLY)
+        clone = pickle.loads(pickle.dumps(player))
+        self.assertEqual(clone, player)
+        self.assertEqual(clone.adp, 2.0)
+        self.assertEqual(list(clone.weekly_stats_2024), WEEKLY)
+
+
+class TestWeeklyStatsBlock(unittest.TestCase):
+    def test_players_share_one_block(self):
+        block = WeeklyStatsBlock(capacity=1)
+        first = block.append(WEEKLY)
+        second = block.append(WEEKLY[:1])
+        self.assertIs(first.block, second.block)
+        self.assertEqual(block.size, 3)
+        self.assertEqual(list(first), WEEKLY)
+        self.assertEqual(list(second), WEEKLY[:1])
+
+    def test_same_stats_for_a_key_reuse_rows(self):
+        block = WeeklyStatsBlock()
+        first = block.append(WEEKLY, key='p1')
+        again = block.append([dict(entry) for entry in WEEKLY], key='p1')
+        self.assertEqual((again.start, again.stop), (first.start, first.stop))
+        self.assertEqual(block.size, 2)
+        # Changed stats get new rows; other keys and unkeyed appends always do
+        changed = block.append(WEEKLY[:1], key='p1')
+        self.assertEqual(list(changed), WEEKLY[:1])
+        block.append(WEEKLY, key='p2')
+        block.append(WEEKLY)
+        self.assertEqual(block.size, 7)
+        self.assertEqual(block.append(WEEKLY[:1], key='p1').start, changed.start)
+
+    def test_stat_column(self):
+        stats = WeeklyStatsBlock().append(WEEKLY)
+        column = stats.stat('rec')
+        self.assertEqual(column[0], 2.0)
+        self.assertNotEqual(column[1], column[1])  # NaN where not recorded
+
+    def test_irregular_rows_are_preserved(self):
+        weekly = [{'week': None, 'note': 'x', 'stats': {'pts_ppr': 1.0, 'status': 'IR'}},
+                  {'stats': None}]
+        self.assertEqual(list(WeeklyStatsBlock().append(weekly)), weekly)
+
+
+if __name__ == '__main__':
+    unittest.main()
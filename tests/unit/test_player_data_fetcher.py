@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from src.utils import player_data_fetcher
+from src.utils.player_data_fetcher import PlayerLookupTables, match_with_sleeper_data
+
+
+class TestCachedLoad(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'data.json')
+        with open(self.path, 'w') as f:
+            f.write('1')
+        self.calls = 0
+
+    def tearDown(self):
+        player_data_fetcher.clear_load_cache()
+        shutil.rmtree(self.temp_dir)
+
+    def load(self):
+        self.calls += 1
+        with open(self.path) as f:
+            return f.read()
+
+    def test_reuses_until_file_changes(self):
+        self.assertEqual(player_data_fetcher._cached_load('test', [self.path], self.load), '1')
+        self.assertEqual(player_data_fetcher._cached_load('test', [self.path], self.load), '1')
+        self.assertEqual(self.calls, 1)
+
+        with open(self.path, 'w') as f:
+            f.write('22')
+        future = time.time() + 10
+        os.utime(self.path, (future, future))
+        self.assertEqual(player_data_fetcher._cached_load('test', [self.path], self.load), '22')
+        self.assertEqual(self.calls, 2)
+
+
+class TestMatchWithSleeperData(unittest.TestCase):
+    def test_uses_given_tables(self):
+        tables = PlayerLookupTables(
+            sleeper_players={'BIJAN ROBINSON': {'player_id': '9509', 'team': 'ATL'}},
+            stats_2024={'BIJAN ROBINSON|RB': {'games_2024': 17, 'points_2024': 350.0}},
+            weekly_stats={},
+            projections={'BIJAN ROBINSON': 330.0}
+        )
+        players = match_with_sleeper_data(
+            [{'name': 'Bijan Robinson', 'position': 'RB', 'rank': 1, 'adp': 1.0}], tables
+        )
+        player = players[0]
+        self.assertEqual(player['player_id'], '9509')
+        self.assertEqual(player['team'], 'ATL')
+        self.assertEqual(player['points_2024'], 350.0)
+        self.assertEqual(player['points_2025_proj'], 330.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.models.player import WeeklyStats
+from src.utils.player_database import build_player_database, load_player_database
+
+
+PLAYERS = [
+    {'name': 'Ja\'Marr Chase', 'position': 'WR', 'team': 'CIN', 'rank': 1, 'adp': 1,
+     'player_id': '7564', 'games_2024': 17, 'points_2024': 403.0, 'points_2025_proj': 350.5,
+     'weekly_stats_2024': [
+         {'year': 2024, 'week': 1, 'team': 'CIN', 'opponent': 'NE',
+          'stats': {'rec': 6.0, 'rec_yd': 62.0}},
+     ]},
+    {'name': 'Bijan Robinson', 'position': 'RB', 'team': None, 'rank': 2, 'adp': 2.4},
+]
+
+
+class TestPlayerDatabase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'player_db.bin')
+        self.source = os.path.join(self.temp_dir, 'players.json')
+        with open(self.source, 'w') as f:
+            f.write('{}')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        self.assertTrue(build_player_database(PLAYERS, self.path, [self.source]))
+        players = load_player_database(self.path, [self.source])
+
+        self.assertEqual(len(players), 2)
+        chase, bijan = players
+        self.assertEqual(chase['name'], "Ja'Marr Chase")
+        self.assertEqual(chase['adp'], 1)
+        self.assertIsInstance(chase['adp'], int)
+        self.assertEqual(chase['games_2024'], 17)
+        self.assertEqual(chase['points_2025_proj'], 350.5)
+        self.assertIsInstance(chase['weekly_stats_2024'], WeeklyStats)
+        self.assertEqual(list(chase['weekly_stats_2024']), PLAYERS[0]['weekly_stats_2024'])
+
+        self.assertIsNone(bijan['team'])
+        self.assertEqual(bijan['adp'], 2.4)
+        self.assertNotIn('points_2024', bijan)
+        self.assertNotIn('weekly_stats_2024', bijan)
+
+    def test_stale_when_source_changes(self):
+        build_player_database(PLAYERS, self.path, [self.source])
+        with open(self.source, 'w') as f:
+            f.write('{"changed": true}')
+        self.assertIsNone(load_player_database(self.path, [self.source]))
+
+    def test_missing_database(self):
+        self.assertIsNone(load_player_database(self.path, [self.source]))
+
+
+if __name__ == '__main__':
+    unittest.main()
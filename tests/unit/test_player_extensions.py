@@ -0,0 +1,27 @@
+import unittest
+
+from src.utils.player_extensions import format_name, format_names
+
+
+class TestFormatName(unittest.TestCase):
+    def test_basic_normalization(self):
+        self.assertEqual(format_name("Ja'Marr Chase (CIN)"), "JAMARR CHASE")
+        self.assertEqual(format_name("Amon-Ra St. Brown"), "AMON RA ST BROWN")
+        self.assertEqual(format_name("Michael Pittman Jr."), "MIKE PITTMAN")
+        self.assertEqual(format_name("Kenneth Walker III"), "KEN WALKER")
+
+    def test_specific_replacements(self):
+        self.assertEqual(format_name("Nathaniel Dell"), "TANK DELL")
+        self.assertEqual(format_name("Joshua Palmer"), "JOSH PALMER")
+        self.assertEqual(format_name("Mitchell Trubisky"), "MITCH TRUBISKY")
+
+    def test_repeat_calls_are_cached(self):
+        first = format_name("Gabe Davis")
+        self.assertIs(format_name("Gabe Davis"), first)
+
+    def test_format_names(self):
+        self.assertEqual(format_names(["Gabe Davis", "Tyreek Hill"]), ["GABRIEL DAVIS", "TYREEK HILL"])
+
+
+if __name__ == '__main__':
+    unittest.main()
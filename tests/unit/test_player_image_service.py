@@ -0,0 +1,117 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image
+
+from src.services.player_image_service import PlayerImageService
+
+
+class RecordingImageService(PlayerImageService):
+    """Records loaded images instead of creating PhotoImages (no Tk root here)"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.loaded = []
+
+    def _update_image_cache(self, player_id, size, img, callback, widget):
+        self.loaded.append((player_id, size, img))
+
+
+class DeferredImageService(PlayerImageService):
+    """Holds loads until the test runs them; photos are the PIL images themselves"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.started = []
+
+    def _load_image_threaded(self, *args):
+        self.started.append(args)
+
+    def run_loads(self):
+        for args in self.started:
+            PlayerImageService._load_image_threaded(self, *args)
+
+    def _create_photo(self, img):
+        return img
+
+
+class FakeWidget:
+    def __init__(self, exists=True):
+        self.exists = exists
+
+    def winfo_exists(self):
+        return self.exists
+
+    def after(self, delay, func):
+        func()
+
+
+class TestPlayerImageService(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.assets = os.path.join(self.tmp, 'assets')
+        self.thumbs = os.path.join(self.tmp, 'thumbs')
+        os.makedirs(os.path.join(self.assets, 'player_images'))
+        self.source = os.path.join(self.assets, 'player_images', '123.jpg')
+        Image.new('RGB', (200, 160), 'red').save(self.source)
+        self.service = RecordingImageService(thumbnail_dir=self.thumbs, assets_dir=self.assets)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_thumbnail_written_and_reused(self):
+        self.service._load_image_threaded('123', (40, 32), None, FakeWidget())
+        thumbnail = os.path.join(self.thumbs, '40x32', '123.png')
+        self.assertTrue(os.path.exists(thumbnail))
+
+        # The next load reads the thumbnail, even without the original
+        os.remove(self.source)
+        self.service._load_image_threaded('123', (40, 32), None, FakeWidget())
+        self.assertEqual(len(self.service.loaded), 2)
+        self.assertEqual(self.service.loaded[1][2].size, (40, 32))
+
+    def test_newer_source_replaces_thumbnail(self):
+        self.service._load_image_threaded('123', (40, 32), None, FakeWidget())
+        thumbnail = os.path.join(self.thumbs, '40x32', '123.png')
+        os.utime(thumbnail, (1, 1))
+        self.assertIsNone(self.service._load_thumbnail('123', (40, 32)))
+        # Loading again resizes the original and refreshes the thumbnail
+        self.service._load_image_threaded('123', (40, 32), None, FakeWidget())
+        self.assertIsNotNone(self.service._load_thumbnail('123', (40, 32)))
+
+    def test_disk_cache_can_be_disabled(self):
+        service = RecordingImageService(thumbnail_dir=None, assets_dir=self.assets)
+        service._load_image_threaded('123', (40, 32), None, FakeWidget())
+        self.assertEqual(service.loaded[0][2].size, (40, 32))
+        self.assertFalse(os.path.exists(self.thumbs))
+
+    def test_callbacks_join_a_load_in_flight(self):
+        service = DeferredImageService(thumbnail_dir=None, assets_dir=self.assets)
+        first, second, destroyed = [], [], []
+        service.load_image_async('123', (40, 32), first.append, FakeWidget())
+        service.load_image_async('123', (40, 32), second.append, FakeWidget())
+        # e.g. a badge destroyed by a rebuild while the image was loading
+        service.load_image_async('123', (40, 32), destroyed.append, FakeWidget(exists=False))
+        self.assertEqual(len(service.started), 1)
+
+        service.run_loads()
+        self.assertEqual(first[0].size, (40, 32))
+        self.assertIs(second[0], first[0])
+        self.assertEqual(destroyed, [])
+        self.assertIs(service.get_image('123', (40, 32)), first[0])
+        self.assertEqual(service._pending_callbacks, {})
+
+    def test_lru_bound(self):
+        service = PlayerImageService(max_cached_images=2, thumbnail_dir=None)
+        service._cache_photo('a_40x40', 'A')
+        service._cache_photo('b_40x40', 'B')
+        self.assertEqual(service.get_image('a'), 'A')  # a is now most recent
+        service._cache_photo('c_40x40', 'C')
+        self.assertIsNone(service.get_image('b'))
+        self.assertEqual(list(service.image_cache), ['a_40x40', 'c_40x40'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from src.models import Player
+from src.utils.sort_index import SortIndexCache
+
+
+def make_players():
+    adps = [5.0, None, 2.0, 9.0, 2.0, 7.0]
+    positions = ['RB', 'WR', 'RB', 'QB', 'WR', 'RB']
+    return [Player(name=f"PLAYER {i}", position=positions[i], rank=i + 1, adp=adp,
+                   player_id=f"p{i}") for i, adp in enumerate(adps)]
+
+
+class TestSortIndexCache(unittest.TestCase):
+    def setUp(self):
+        self.players = make_players()
+        self.calls = 0
+
+        def adp_key(p):
+            self.calls += 1
+            return p.adp if p.adp else float('inf')
+
+        self.keys = {'adp': adp_key, 'name': lambda p: p.name}
+        self.cache = SortIndexCache(self.keys)
+        self.cache.set_pool(self.players)
+
+    def test_matches_sorted(self):
+        rbs = [p for p in self.players if p.position == 'RB']
+        for subset in (self.players, rbs):
+            for ascending in (True, False):
+                self.assertEqual(self.cache.sort(subset, 'adp', ascending),
+                                 sorted(subset, key=self.keys['adp'], reverse=not ascending))
+
+    def test_orderings_survive_picks(self):
+        self.cache.sort(self.players, 'adp')
+        calls = self.calls
+        available = [p for p in self.players if p.player_id not in ('p2', 'p3')]
+        self.assertEqual([p.player_id for p in self.cache.sort(available, 'adp')], ['p4', 'p0', 'p5', 'p1'])
+        self.assertEqual(self.calls, calls)
+
+    def test_invalidate(self):
+        self.cache.sort(self.players, 'adp')
+        self.cache.sort(self.players, 'name')
+        self.players[1].adp = 1.0
+        self.assertEqual(self.cache.sort(self.players, 'adp')[0].player_id, 'p2')
+        self.cache.invalidate('adp')
+        self.assertEqual(self.cache.sort(self.players, 'adp')[0].player_id, 'p1')
+        self.assertIn(('name', True), self.cache._ranks)
+
+    def test_players_new_to_the_pool(self):
+        self.cache.set_pool(self.players[1:])
+        self.cache.sort(self.players[1:], 'adp')
+        # p0 was drafted before the pool was taken and comes back on undo
+        self.assertEqual([p.player_id for p in self.cache.sort(self.players, 'adp')],
+                         ['p2', 'p4', 'p0', 'p5', 'p3', 'p1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
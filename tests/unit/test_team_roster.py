@@ -0,0 +1,66 @@
+import unittest
+
+from src.models import Player, Team
+from src.services import RosterManagementService
+
+
+ROSTER_SPOTS = {'qb': 1, 'rb': 2, 'wr': 2, 'te': 1, 'flex': 1, 'bn': 2}
+
+
+def make_player(name, position):
+    return Player(name=name, position=position, rank=1, adp=1.0, player_id=name)
+
+
+class TestTeamRosterCounts(unittest.TestCase):
+    def setUp(self):
+        self.team = Team(1, "Team 1", ROSTER_SPOTS)
+
+    def test_counts_follow_adds_and_removes(self):
+        rbs = [make_player(f"RB{i}", "RB") for i in range(4)]
+        for rb in rbs:
+            self.assertTrue(self.team.add_player(rb))
+
+        self.assertEqual([len(self.team.roster[s]) for s in ('rb', 'flex', 'bn')], [2, 1, 1])
+        self.assertEqual(self.team.position_counts['RB'], 4)
+        self.assertEqual(self.team.flex_filled, 1)
+        self.assertEqual(self.team.filled, 4)
+
+        self.assertTrue(self.team.remove_player(rbs[2]))
+        self.assertFalse(self.team.remove_player(rbs[2]))
+        self.assertEqual(self.team.roster['flex'], [])
+        self.assertEqual((self.team.position_counts['RB'], self.team.flex_filled), (3, 0))
+
+        # The freed flex spot takes the next flex-eligible player
+        te = make_player("TE1", "TE")
+        te2 = make_player("TE2", "TE")
+        self.team.add_player(te)
+        self.team.add_player(te2)
+        self.assertEqual(self.team.roster['flex'], [te2])
+
+    def test_full_roster(self):
+        players = ([make_player("QB1", "QB")] + [make_player(f"WR{i}", "WR") for i in range(5)]
+                   + [make_player(f"RB{i}", "RB") for i in range(2)] + [make_player("TE1", "TE")])
+        for player in players:
+            self.team.add_player(player)
+        self.assertTrue(self.team.is_roster_full())
+        self.assertFalse(self.team.can_draft_player(make_player("QB2", "QB")))
+
+        self.team.remove_player(players[0])
+        self.assertFalse(self.team.is_roster_full())
+        self.assertTrue(self.team.can_draft_player(make_player("QB2", "QB")))
+
+    def test_assigning_roster_recounts(self):
+        qb = make_player("QB1", "QB")
+        wr = make_player("WR1", "WR")
+        self.team.roster = {pos: [] for pos in ROSTER_SPOTS}
+        self.team.set_roster(dict(self.team.roster, qb=[qb], flex=[wr]))
+        self.assertEqual(self.team.position_counts['QB'], 1)
+        self.assertEqual(self.team.flex_filled, 1)
+        self.assertEqual(self.team.filled, 2)
+
+        counts = RosterManagementService(ROSTER_SPOTS).get_position_counts(self.team)
+        self.assertEqual(counts, {'QB': 1, 'RB': 0, 'WR': 1, 'TE': 0, 'DEF': 0, 'K': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
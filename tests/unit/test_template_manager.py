@@ -1,3 +1,4 @@
+import json
 import unittest
 import os
 import shutil
@@ -132,6 +133,89 @@ class TestTemplateManager(unittest.TestCase):
         template_names = [t["name"] for t in templates]
         self.assertEqual(template_names, ["Template 2", "Template 1", "Template 0"])
     
+    def test_list_templates_tracks_files_changed_outside_manager(self):
+        """Test the template catalog picks up files added, edited or removed by hand"""
+        self.template_manager.save_template(
+            name="Saved",
+            draft_engine=self.draft_engine,
+            teams=self.teams,
+            available_players=self.players,
+            all_players=self.players,
+            user_team_id=1,
+            manual_mode=False
+        )
+        self.assertEqual([t["name"] for t in self.template_manager.list_templates()], ["Saved"])
+        
+        copied = DraftTemplate("Copied")
+        copied.created_at = "2000-01-01T00:00:00"
+        with open(os.path.join(self.temp_dir, "copied.json"), 'w') as f:
+            json.dump(copied.to_dict(), f)
+        with open(os.path.join(self.temp_dir, "broken.json"), 'w') as f:
+            f.write("{")
+        
+        # A fresh manager reads the same catalog
+        templates = TemplateManager(self.temp_dir).list_templates()
+        self.assertEqual([t["name"] for t in templates], ["Saved", "Copied"])
+        
+        os.remove(os.path.join(self.temp_dir, "saved.json"))
+        self.assertEqual([t["filename"] for t in self.template_manager.list_templates()], ["copied.json"])
+    
+    def test_templates_share_player_universe(self):
+        """Test v2 templates store the player pool by reference with ADP deltas"""
+        for name in ("First", "Second"):
+            self.template_manager.save_template(
+                name=name,
+                draft_engine=self.draft_engine,
+                teams=self.teams,
+                available_players=self.players[2:],
+                all_players=self.players,
+                user_team_id=1,
+                manual_mode=False
+            )
+            self.players[0].adp = 20.5  # custom ADP before the second save
+            self.players[1].var = 0.5  # dynamic VAR after a pick
+        
+        self.assertEqual(len(os.listdir(os.path.join(self.temp_dir, "universes"))), 1)
+        with open(os.path.join(self.temp_dir, "second.json")) as f:
+            raw = json.load(f)
+        self.assertEqual(raw["format_version"], 2)
+        self.assertNotIn("all_players", raw["player_pool"])
+        self.assertEqual(raw["player_pool"]["player_overrides"],
+                         {"player_0": {"adp": 20.5}, "player_1": {"var": 0.5}})
+        
+        first = self.template_manager.load_template("first.json")
+        second = TemplateManager(self.temp_dir).load_template("second.json")
+        self.assertEqual(first.player_pool["all_players"][0]["adp"], 1.5)
+        self.assertEqual(second.player_pool["all_players"][0]["adp"], 20.5)
+        self.assertEqual(second.player_pool["all_players"][1]["name"], "Player 1")
+        self.assertEqual(second.player_pool["all_players"][1]["var"], 0.5)
+        self.assertEqual(second.player_pool["available_player_ids"],
+                         [p.player_id for p in self.players[2:]])
+    
+    def test_migrate_v1_template(self):
+        """Test older templates load as-is and migrate to v2"""
+        v1 = DraftTemplate("Old")
+        v1.player_pool = {
+            "available_player_ids": ["player_1"],
+            "all_players": [{"player_id": f"player_{i}", "name": f"Player {i}", "position": "RB",
+                             "rank": i, "adp": i + 0.5, "weekly_stats_2024": [{"week": 1}]}
+                            for i in range(2)]
+        }
+        with open(os.path.join(self.temp_dir, "old.json"), 'w') as f:
+            json.dump(v1.to_dict(), f)
+        
+        self.assertEqual(self.template_manager.load_template("old.json").player_pool, v1.player_pool)
+        self.assertEqual(self.template_manager.migrate_templates(), 1)
+        self.assertEqual(self.template_manager.migrate_templates(), 0)
+        
+        migrated = TemplateManager(self.temp_dir).load_template("old.json")
+        self.assertEqual(migrated.name, "Old")
+        self.assertEqual(migrated.player_pool["available_player_ids"], ["player_1"])
+        self.assertEqual([(p["name"], p["adp"]) for p in migrated.player_pool["all_players"]],
+                         [("Player 0", 0.5), ("Player 1", 1.5)])
+        # Weekly stats come from the loaded players when a template is applied
+        self.assertNotIn("weekly_stats_2024", migrated.player_pool["all_players"][0])
+    
     def test_delete_template(self):
         """Test deleting a template"""
         # Save a template
@@ -201,6 +285,29 @@ class TestTemplateManager(unittest.TestCase):
         self.assertEqual(current_pick["pick_number"], 9)
         self.assertEqual(current_pick["round"], 3)
     
+    def test_list_template_summaries(self):
+        """Test template summaries carry the user's picks from the catalog"""
+        for team_idx, player_idx in [(0, 0), (1, 1), (2, 2), (3, 3), (3, 4), (2, 5), (1, 6), (0, 7)]:
+            self.draft_engine.make_pick(self.teams[team_idx], self.players[player_idx])
+        self.template_manager.save_template(
+            name="Summary",
+            draft_engine=self.draft_engine,
+            teams=self.teams,
+            available_players=self.players[8:],
+            all_players=self.players,
+            user_team_id=2,
+            manual_mode=False
+        )
+        self.template_manager.update_template_grade("summary.json", 88)
+        
+        summaries = TemplateManager(self.temp_dir).list_template_summaries()
+        self.assertEqual(len(summaries), 1)
+        summary = summaries[0]
+        self.assertEqual((summary["filename"], summary["name"], summary["grade"]),
+                         ("summary.json", "Summary", 88))
+        self.assertEqual(summary["user_pick_count"], 2)
+        self.assertEqual(summary["user_picks"], [(1, "WR", "player_1"), (2, "RB", "player_6")])
+    
     def test_invalid_template_handling(self):
         """Test handling of invalid template files"""
         # Try to load non-existent template
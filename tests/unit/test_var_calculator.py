@@ -0,0 +1,70 @@
+import unittest
+
+from src.models import Player
+from src.utils.player_generator import (
+    VarCalculator, calculate_position_ranks, calculate_var, replacement_levels
+)
+
+
+def make_player(i, position, proj, points_2024=None):
+    return Player(name=f"PLAYER {i}", position=position, rank=i, adp=float(i),
+                  player_id=f"p{i}", points_2024=points_2024, points_2025_proj=proj)
+
+
+class TestPositionRanks(unittest.TestCase):
+    def test_ranks_within_position(self):
+        players = [
+            make_player(1, 'RB', 100.0, 50.0),
+            make_player(2, 'RB', 300.0, None),
+            make_player(3, 'WR', 200.0, 80.0),
+            make_player(4, 'RB', None, 90.0),
+            make_player(5, 'K', 150.0, 150.0),
+        ]
+        calculate_position_ranks(players)
+
+        self.assertEqual([p.position_rank_proj for p in players], [2, 1, 1, None, None])
+        self.assertEqual([p.position_rank_2024 for p in players], [2, None, 1, 1, None])
+
+
+class TestVar(unittest.TestCase):
+    def setUp(self):
+        # 30 TEs projected 300, 290, ... so the 10th TE (replacement in 10 teams) has 210
+        self.players = [make_player(i, 'TE', 300.0 - 10 * i) for i in range(30)]
+        self.players.append(make_player(99, 'TE', None))
+
+    def test_static_var(self):
+        calculate_var(self.players)
+        self.assertEqual(self.players[0].var, 90.0)
+        self.assertEqual(self.players[9].var, 0.0)
+        self.assertIsNone(self.players[-1].var)
+
+    def test_replacement_scales_with_league_size(self):
+        self.assertEqual(replacement_levels(10), {'QB': 20, 'RB': 22, 'WR': 38, 'TE': 10, 'LB': 30, 'DB': 30})
+        self.assertEqual(replacement_levels(12)['RB'], 26)
+        calculate_var(self.players, num_teams=12)
+        self.assertEqual(self.players[0].var, 110.0)
+
+    def test_dynamic_var_against_remaining_pool(self):
+        calculator = VarCalculator(self.players)
+        # Three TEs drafted (not the top ones): replacement is the 7th best still available
+        drafted = {self.players[i] for i in (2, 4, 25)}
+        available = [p for p in self.players if p not in drafted]
+        calculator.apply_var(available)
+
+        # Available TEs by projection: 0, 1, 3, 5, 6, 7, 8 -> 8th player (220) is 7th best
+        self.assertEqual(self.players[0].var, 80.0)
+        # Nothing drafted is the same as the static calculation
+        calculator.apply_var(self.players)
+        self.assertEqual(self.players[0].var, 90.0)
+
+    def test_refresh_after_projection_change(self):
+        calculator = VarCalculator(self.players)
+        self.players[29].points_2025_proj = 1000.0
+        calculator.refresh()
+        calculator.apply_var()
+        self.assertEqual(self.players[0].var, 80.0)
+        self.assertEqual(self.players[29].var, 780.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
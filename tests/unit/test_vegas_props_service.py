@@ -0,0 +1,39 @@
+import unittest
+
+from src.services.draftkings_api import PlayerProp
+from tests.unit.helpers import OfflineVegasPropsService
+
+
+def make_prop(name, prop_type, value):
+    return PlayerProp(player_name=name, team="CIN", opponent="CLE", prop_type=prop_type,
+                      prop_value=value, over_line="-110", under_line="-110")
+
+
+class TestVegasPropsService(unittest.TestCase):
+    def setUp(self):
+        self.service = OfflineVegasPropsService()
+        self.service.set_props({
+            'receiving_yards': [make_prop("Ja'Marr Chase", 'receiving_yards', 1350.5),
+                                make_prop("Ja'Marr Chase", 'receiving_yards', 1400.5),
+                                make_prop("Tee Higgins", 'receiving_yards', 900.5)],
+            'receiving_tds': [make_prop("Ja'Marr Chase", 'receiving_tds', 10.5)],
+        })
+
+    def test_get_player_props_matches_formatted_name(self):
+        props = self.service.get_player_props("JAMARR CHASE")
+        self.assertEqual(set(props), {'receiving_yards', 'receiving_tds'})
+        # First prop of each type wins, as before
+        self.assertEqual(props['receiving_yards'].prop_value, 1350.5)
+        self.assertEqual(self.service.get_player_props("Nobody"), {})
+
+    def test_get_prop_value(self):
+        self.assertEqual(self.service.get_prop_value("Tee Higgins", 'receiving_yards'), 900.5)
+        self.assertIsNone(self.service.get_prop_value("Tee Higgins", 'receiving_tds'))
+
+    def test_returned_props_are_a_copy(self):
+        self.service.get_player_props("Tee Higgins").clear()
+        self.assertIn('receiving_yards', self.service.get_player_props("Tee Higgins"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+from src.utils.weekly_stats_cube import WeeklyStatsCube
+
+
+def game(week, **stats):
+    return {'week': week, 'stats': stats, 'opponent': 'DAL', 'team': 'KC'}
+
+
+class TestWeeklyStatsCube(unittest.TestCase):
+    def setUp(self):
+        games = {
+            'qb': {1: game(1, off_snp=60, pass_cmp=20, pass_yd=310, pass_td=2, rush_yd=10),
+                   2: game(2, off_snp=0)},
+            'wr1': {1: game(1, off_snp=50, rec=5, rec_yd=100, rec_td=1),
+                    2: game(2, off_snp=10, rec=1, rec_yd=8),
+                    3: game(3, off_snp=40, rec=3, rec_yd=30)},
+            'wr2': {1: game(1, off_snp=45, rec=8, rec_yd=120)},
+            'lb': {1: game(1, def_snp=55, idp_tkl_solo=5, idp_tkl=7, idp_sack=1)},
+            # Older per-position files hold a list per week
+            'wr3': {2: [game(2, off_snp=0, rec=9), game(2, off_snp=30, rec=2, rec_yd=15)]},
+            'unknown': {1: game(1, off_snp=50, rec=10)},
+        }
+        positions = {'qb': 'QB', 'wr1': 'WR', 'wr2': 'WR', 'wr3': 'WR', 'lb': 'LB'}
+        self.cube = WeeklyStatsCube(games, positions)
+
+    def row(self, player_id):
+        return self.cube.index[player_id]
+
+    def test_custom_points(self):
+        points = self.cube.points
+        # 20 * 0.5 + 310 * 0.05 + 2 * 6 + 300-yard bonus + 10 * 0.2
+        self.assertAlmostEqual(points[self.row('qb'), 0], 10 + 15.5 + 12 + 6 + 2)
+        # 5 * 2 + 100 * 0.2 + 6 + 100-yard bonus
+        self.assertAlmostEqual(points[self.row('wr1'), 0], 10 + 20 + 6 + 3)
+        # 5 solo, 2 assists, a sack
+        self.assertAlmostEqual(points[self.row('lb'), 0], 5 * 1.75 + 2 * 1.0 + 4.0)
+        self.assertNotIn('unknown', self.cube.index)
+
+    def test_list_entries_use_the_game_played(self):
+        row = self.row('wr3')
+        self.assertEqual(self.cube.snaps[row, 1], 30)
+        self.assertAlmostEqual(self.cube.points[row, 1], 4 + 3)
+
+    def test_week_ranks(self):
+        ranks = self.cube.week_ranks
+        self.assertEqual(ranks[self.row('wr2'), 0], 1)
+        self.assertEqual(ranks[self.row('wr1'), 0], 2)
+        self.assertEqual(ranks[self.row('wr3'), 1], 1)
+        self.assertEqual(ranks[self.row('wr1'), 1], 2)
+        # No snaps, no rank
+        self.assertEqual(ranks[self.row('qb'), 1], 0)
+
+    def test_season_summary(self):
+        summary = self.cube.season_summary()
+        row = self.row('wr1')
+        self.assertEqual(summary['games'][row], 3)
+        self.assertEqual(summary['rec_yd'][row], 138)
+        self.assertEqual(summary['snaps'][row], 100)
+        # Week 2 (10 snaps, 3.6 points) is not a meaningful game
+        self.assertAlmostEqual(summary['median'][row], (39.0 + 12.0) / 2)
+        self.assertAlmostEqual(summary['avg'][row], 25.5)
+        # QB had a log in week 2 without playing
+        self.assertEqual(summary['games'][self.row('qb')], 1)
+        self.assertIs(self.cube.season_summary(), summary)
+
+        week_two = self.cube.season_summary(2)
+        self.assertFalse(week_two['present'][self.row('lb')])
+        self.assertTrue(week_two['present'][self.row('qb')])
+        self.assertEqual(week_two['median'][self.row('wr1')], 0)
+        self.assertAlmostEqual(week_two['median'][self.row('wr3')], 7.0)
+
+    def test_games_in_week_order(self):
+        rows, weeks = self.cube.games([self.row('wr1'), self.row('qb')])
+        self.assertEqual(list(weeks), [1, 1, 2, 3])
+        self.assertEqual(list(rows), [self.row('wr1'), self.row('qb'), self.row('wr1'), self.row('wr1')])
+
+
+if __name__ == '__main__':
+    unittest.main()